@@ -0,0 +1,82 @@
+import sys
+import time
+
+from comum import analisar
+from antlr4 import InputStream, CommonTokenStream, PredictionMode
+from antlr4.PredictionContext import PredictionContextCache
+from antlr4.dfa.DFA import DFA
+from CLexer import CLexer
+from CParser import CParser
+
+# Tempo de análise sintática de fontes grandes gerados: a predição LL
+# padrão do ANTLR (com recuperação de erros) contra a análise em dois
+# estágios de main.analisar_fluxo (SLL + BailErrorStrategy, LL só se o SLL
+# falhar). Antes de cada medida os caches de DFA do parser são descartados,
+# como numa execução nova de main.py.
+#
+# Uso: python benchmarks/analise.py [N_FUNCOES ...]
+
+FUNCAO = """
+int f{k}(int a, int b) {{
+    int v[10];
+    int i = 0;
+    int s = 0;
+    for (i = 0; i < LIMITE; i = i + 1) {{
+        v[i] = a * i + b - (i % 3);
+        if (v[i] <= 5 && a != b || -a == b) {{
+            s = s + v[i] * 2 - -1;
+        }} else {{
+            s = s - v[i];
+        }}
+    }}
+    switch (s % 4) {{
+        case 0: s = s + 1; break;
+        case 1: s = s + f{anterior}(a, b - 1); break;
+        default: s = s - 1;
+    }}
+    while (s == 0) {{ s = s + 1; }}
+    printf("%d\\n", s);
+    return s + v[0];
+}}
+"""
+
+
+def gerar(n):
+    partes = ["#include <stdio.h>", "#define LIMITE 10", "int total = 0;"]
+    partes += [FUNCAO.format(k=k, anterior=max(k - 1, 0)) for k in range(n)]
+    partes.append("int main() {\n    total = f0(1, 2);\n    return 0;\n}")
+    return "\n".join(partes)
+
+
+def descartar_dfa():
+    CParser.decisionsToDFA = [DFA(estado, i) for i, estado in enumerate(CParser.atn.decisionToState)]
+    CParser.sharedContextCache = PredictionContextCache()
+
+
+def analisar_ll(fonte):
+    parser = CParser(CommonTokenStream(CLexer(InputStream(fonte))))
+    parser._interp.predictionMode = PredictionMode.LL
+    return parser.program()
+
+
+def medir(analisador, fonte):
+    descartar_dfa()
+    inicio = time.perf_counter()
+    arvore = analisador(fonte)
+    return time.perf_counter() - inicio, arvore
+
+
+def main(argv):
+    tamanhos = [int(n) for n in argv[1:]] or [25, 100, 200]
+    print("Análise sintática (léxico + parser):")
+    for n in tamanhos:
+        fonte = gerar(n)
+        tempo_ll, arvore_ll = medir(analisar_ll, fonte)
+        tempo_sll, arvore_sll = medir(analisar, fonte)
+        iguais = arvore_ll.toStringTree(recog=CParser) == arvore_sll.toStringTree(recog=CParser)
+        print(f"  {n:4d} funções, {fonte.count(chr(10)) + 1:6d} linhas: LL {tempo_ll:7.3f} s  "
+              f"SLL/LL {tempo_sll:7.3f} s  ({tempo_ll / tempo_sll:4.1f}x)  árvores iguais: {iguais}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
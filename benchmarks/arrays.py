@@ -0,0 +1,47 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Programa com arrays grandes (int, double e char): mede o tempo de preencher
+# e percorrer os arrays em cada motor e, numa segunda execução, o pico de
+# memória (com tracemalloc, que deixa a execução bem mais lenta).
+#
+# Uso: python benchmarks/arrays.py [N] [motor ...]
+
+PROGRAMA = """
+int main() {
+    int a[N_ELEM];
+    double d[N_ELEM];
+    char s[N_ELEM];
+    int i = 0;
+    int soma = 0;
+    double total = 0.0;
+    for (i = 0; i < N_ELEM; i = i + 1) {
+        a[i] = i % 100;
+        d[i] = i * 0.5;
+        s[i] = 'x';
+    }
+    s[N_ELEM - 1] = 'y';
+    for (i = 0; i < N_ELEM; i = i + 1) {
+        soma = soma + a[i];
+        total = total + d[i];
+    }
+    printf("%d %.1f %c\\n", soma, total, s[0]);
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 100000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_ELEM", str(n)))
+    print(f"Arrays int, double e char de {n} elementos:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        _, pico, _ = executar(motor, tree, medir_memoria=True)
+        print(f"  {motor:8s} {tempo:8.3f} s  pico {pico / 1024 / 1024:7.2f} MiB  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
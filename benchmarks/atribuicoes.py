@@ -0,0 +1,56 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Programa dominado por atribuições: variáveis int e double, elementos de
+# arrays, campos de struct e valores de retorno, todos com tipo conhecido na
+# compilação. Mede o custo das conversões de tipo de cada atribuição em cada
+# motor.
+#
+# Uso: python benchmarks/atribuicoes.py [N] [motor ...]
+
+PROGRAMA = """
+struct Acumulador { int total; double media; };
+
+int quadrado(int v) {
+    return v * v;
+}
+
+int main() {
+    int i;
+    int k = 0;
+    int soma = 0;
+    double x = 0.0;
+    double escala = 0.5;
+    int v[64];
+    double w[64];
+    struct Acumulador a;
+    a.total = 0;
+    a.media = 0.0;
+    for (i = 0; i < N_VOLTAS; i = i + 1) {
+        k = i % 64;
+        v[k] = i;
+        w[k] = x;
+        x = x + escala;
+        soma = soma + quadrado(k);
+        a.total = (a.total) + 1;
+        a.media = x / 2;
+    }
+    printf("%d %f %d %f %d\\n", soma, x, a.total, a.media, v[10]);
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 30000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_VOLTAS", str(n)))
+    print(f"{n} voltas de um laço com atribuições de int, double, arrays, campos e retornos:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
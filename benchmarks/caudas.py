@@ -0,0 +1,54 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Recursão em cauda profunda: uma soma de 1 a N escrita como chamada em cauda
+# e o mdc de Euclides repetido num laço. Nos motores compilados a chamada em
+# cauda reusa o quadro, então a profundidade não depende da pilha do Python;
+# o visitor estoura o limite de recursão já com poucas centenas de níveis.
+#
+# Uso: python benchmarks/caudas.py [N] [motor ...]
+
+PROGRAMA = """
+int soma_ate(int n, int acumulado) {
+    if (n == 0) {
+        return acumulado;
+    }
+    return soma_ate(n - 1, acumulado + n);
+}
+
+int mdc(int a, int b) {
+    if (b == 0) {
+        return a;
+    }
+    return mdc(b, a % b);
+}
+
+int main() {
+    int i;
+    int total = 0;
+    for (i = 1; i < N_VOLTAS; i = i + 1) {
+        total = total + mdc(i * 7919, 104729 % i + i);
+    }
+    printf("%d %d\\n", soma_ate(N_VOLTAS, 0), total);
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 50000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_VOLTAS", str(n)))
+    print(f"soma em cauda com {n} níveis e {n} mdc recursivos:")
+    for motor in motores:
+        try:
+            tempo, _, saida = executar(motor, tree)
+        except RecursionError:
+            print(f"  {motor:8s} limite de recursão do Python excedido")
+            continue
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
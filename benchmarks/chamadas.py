@@ -0,0 +1,68 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Laço dominado por chamadas a funções folha pequenas (um único return sem
+# chamadas). Mede cada motor compilado com a expansão em linha desativada
+# (--inline 0) e com o limite padrão; no visitor as chamadas são sempre
+# chamadas.
+#
+# Uso: python benchmarks/chamadas.py [N] [motor ...]
+
+PROGRAMA = """
+struct Ponto { int x; int y; };
+
+int quadrado(int x) {
+    return x * x;
+}
+
+int maximo(int a, int b) {
+    return (a > b) * a + (a <= b) * b;
+}
+
+double media(double a, double b) {
+    return (a + b) / 2;
+}
+
+int norma(struct Ponto p) {
+    return quadrado_x(p) + (p.y) * (p.y);
+}
+
+int quadrado_x(struct Ponto p) {
+    return (p.x) * (p.x);
+}
+
+int main() {
+    int i;
+    int total = 0;
+    double m = 0.0;
+    struct Ponto p;
+    p.x = 3;
+    p.y = 4;
+    for (i = 0; i < N_VOLTAS; i = i + 1) {
+        total = total + quadrado(i % 100) - maximo(i % 7, 3) + quadrado_x(p);
+        m = media(m, i);
+    }
+    printf("%d %.3f %d\\n", total, m, norma(p));
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_VOLTAS", str(n)))
+    print(f"{n} voltas de um laço com chamadas a funções folha pequenas:")
+    for motor in motores:
+        if motor == "visitor":
+            tempo, _, saida = executar(motor, tree)
+            print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+            continue
+        sem, _, saida = executar(motor, tree, limite_expansao=0)
+        com, _, _ = executar(motor, tree)
+        print(f"  {motor:8s} {sem:8.3f} s sem expansão  {com:8.3f} s com expansão  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
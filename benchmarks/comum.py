@@ -0,0 +1,80 @@
+import contextlib
+import io
+import os
+import sys
+import time
+import tracemalloc
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(os.path.join(RAIZ, "src"))
+sys.path.append(os.path.join(RAIZ, "gramatica"))
+
+from antlr4 import InputStream
+from main import analisar_fluxo
+from interpretador import Interpretador
+from motor_closures import MotorClosures
+from inicializacao import resolver_e_analisar
+from expansao import LIMITE_PADRAO
+from maquina_virtual import CompiladorBytecode, MaquinaVirtual
+from transpilador import Transpilador, ProgramaPython
+
+# Funções comuns aos scripts de benchmark: análise de um fonte C em memória
+# e execução de main em um dos motores, medindo só a execução (a análise
+# sintática e a compilação ficam fora do tempo).
+
+MOTORES = ["visitor", "closure", "bytecode", "python"]
+
+
+def analisar(fonte):
+    return analisar_fluxo(InputStream(fonte))
+
+
+def preparar(motor, tree, saida=None, limite_expansao=LIMITE_PADRAO, memorizacao=None):
+    # Devolve uma função sem argumentos que executa main no motor pedido e
+    # descarrega a saída do programa.
+    interpretador = Interpretador(saida)
+    resolucao = None
+    if motor != "visitor" or memorizacao is not None:
+        resolucao = resolver_e_analisar(tree, limite_expansao)
+    if motor == "bytecode":
+        vm = MaquinaVirtual(CompiladorBytecode().compilar(tree, resolucao), interpretador, memorizacao=memorizacao)
+        vm.inicializar()
+        executar_main = vm.executar_main
+    elif motor == "python":
+        programa = ProgramaPython(Transpilador("benchmark.c").transpilar(tree, resolucao), "benchmark.c", interpretador,
+                                  memorizacao)
+        programa.inicializar()
+        executar_main = programa.executar_main
+    else:
+        if memorizacao is not None and motor == "visitor":
+            for nome in resolucao.memorizaveis:
+                interpretador.memorizadas[nome] = memorizacao.cache(nome)
+        interpretador.visit(tree)
+        if motor == "closure":
+            executar_main = MotorClosures(interpretador, resolucao, memorizacao).executar_main
+        else:
+            executar_main = lambda: interpretador.visit(interpretador.funcoes["main"].block())
+
+    def rodar():
+        executar_main()
+        interpretador.saida.descarregar()
+    return rodar
+
+
+def executar(motor, tree, medir_memoria=False, saida=None, limite_expansao=LIMITE_PADRAO, memorizacao=None):
+    # Executa main e devolve (tempo em segundos, pico de memória em bytes ou
+    # None, saída do programa). `saida` é a SaidaBufferizada do programa (por
+    # padrão, a do Interpretador); `limite_expansao` é o --inline e
+    # `memorizacao`, os caches do --memoize.
+    with contextlib.redirect_stdout(io.StringIO()) as texto:
+        rodar = preparar(motor, tree, saida, limite_expansao, memorizacao)
+        if medir_memoria:
+            tracemalloc.start()
+        inicio = time.perf_counter()
+        rodar()
+        tempo = time.perf_counter() - inicio
+        pico = None
+        if medir_memoria:
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    return tempo, pico, texto.getvalue().strip()
@@ -0,0 +1,69 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Laços dominados por condições: guardas com && e || (em que o curto-circuito
+# evita avaliar o lado direito), comparações simples em if/while/for e o
+# valor de && / || usado como expressão.
+#
+# Uso: python benchmarks/condicoes.py [N] [motor ...]
+
+PROGRAMA = """
+int custo = 0;
+
+int caro(int v) {
+    custo = custo + 1;
+    return v;
+}
+
+int main() {
+    int a[100];
+    int i = 0;
+    int j = 0;
+    int n = 0;
+    int pares = 0;
+    int achou = 0;
+    int r = 0;
+
+    for (i = 0; i < 100; i = i + 1) {
+        a[i] = i + 1;
+    }
+    a[99] = 0;
+
+    for (r = 0; r < N_REP; r = r + 1) {
+        i = 0;
+        while (i < 100 && a[i] != 0) {
+            i = i + 1;
+        }
+        n = n + i;
+
+        for (j = 0; j < 100; j = j + 1) {
+            if (j % 2 == 0 || caro(j) == 0) {
+                pares = pares + 1;
+            }
+            if (j == 200 && caro(j) == 0) {
+                pares = 0;
+            }
+        }
+
+        achou = achou + (i == 99 && a[0] == 1);
+    }
+
+    printf("%d %d %d %d\\n", n, pares, achou, custo);
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 20
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_REP", str(n)))
+    print(f"{n} repetições de busca com guarda &&, if com || e &&:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
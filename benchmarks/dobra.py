@@ -0,0 +1,46 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Programa dominado por expressões constantes: literais, macros usadas dentro
+# de uma função e subexpressões só de constantes. Mede a carga única de cada
+# expressão dobrada nos motores compilados e, no visitor, o pool de literais
+# e a macro visível em todas as funções.
+#
+# Uso: python benchmarks/dobra.py [N] [motor ...]
+
+PROGRAMA = """
+#define BASE 1000
+#define ESCALA (BASE - 10 * 90 + 2 * 3)
+#define DESLOCAMENTO 7
+
+int passo(int x) {
+    return x % ESCALA + DESLOCAMENTO * 2 - (BASE - 999);
+}
+
+int main() {
+    int i;
+    int total = 0;
+    double media = 0.0;
+    for (i = 0; i < N_VOLTAS; i = i + 1) {
+        total = total + passo(i) * (3 + 4) - ESCALA % 10;
+        media = media + 0.5 * (BASE + 1) / (ESCALA * 2.0);
+    }
+    printf("%d %.3f\\n", total, media);
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 5000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_VOLTAS", str(n)))
+    print(f"{n} voltas de um laço com expressões constantes e macros:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
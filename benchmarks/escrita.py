@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+from comum import MOTORES, analisar, preparar
+from saida import SaidaBufferizada, MODOS
+
+# Programa dominado por printf e puts, com a saída indo para os.devnull
+# (como num redirecionamento para arquivo), em cada modo de buffer da
+# SaidaBufferizada e com uma saída que chama print() a cada comando, como
+# o interpretador fazia antes.
+#
+# Uso: python benchmarks/escrita.py [N] [motor ...]
+
+PROGRAMA = """
+int main() {
+    int i = 0;
+    for (i = 0; i < N_LINHAS; i = i + 1) {
+        printf("%d ", i);
+        printf("%d\\\\n", i * 2);
+        if (i % 10 == 0) {
+            puts("dezena");
+        }
+    }
+    return 0;
+}
+"""
+
+
+class SaidaPrint:
+    # Referência: uma chamada a print() por printf/puts, sem buffer próprio.
+    def escrever(self, texto):
+        print(texto, end="")
+
+    def descarregar(self):
+        sys.stdout.flush()
+
+
+def medir(motor, tree, saida):
+    with open(os.devnull, "w") as destino, redirect_stdout(destino):
+        rodar = preparar(motor, tree, saida)
+        inicio = time.perf_counter()
+        rodar()
+        return time.perf_counter() - inicio
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    motores = argv[2:] or [m for m in MOTORES if m != "visitor"]
+    tree = analisar(PROGRAMA.replace("N_LINHAS", str(n)))
+    print(f"{n} voltas com dois printf e um puts a cada dez (saída em {os.devnull}):")
+    for motor in motores:
+        tempos = [("print()", medir(motor, tree, SaidaPrint()))]
+        tempos += [(modo, medir(motor, tree, SaidaBufferizada(modo))) for modo in MODOS]
+        print(f"  {motor:8s} " + "  ".join(f"{nome} {tempo:6.3f} s" for nome, tempo in tempos))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+from comum import MOTORES, analisar, preparar
+from saida import SaidaBufferizada
+
+# Programa dominado por printf com formatos variados (largura, precisão,
+# flags, %x, %c, %s de array de char e texto sem especificadores), com a
+# saída indo para os.devnull. Mede a aplicação do plano de formatação
+# compilado uma vez por printf.
+#
+# Uso: python benchmarks/formatos.py [N] [motor ...]
+
+PROGRAMA = """
+int main() {
+    int i = 0;
+    float x = 0.0;
+    char nome[8] = "abc";
+    char letras[4] = "wxyz";
+    for (i = 0; i < N_LINHAS; i = i + 1) {
+        x = i / 3.0;
+        printf("%5d|%-4d|%05.2f|%x\\n", i, i % 7, x, i);
+        printf("[%c] [%8s] %d%%\\n", letras[i % 4], nome, i % 100);
+        printf("linha sem especificadores\\n");
+    }
+    return 0;
+}
+"""
+
+
+def medir(motor, tree):
+    with open(os.devnull, "w") as destino, redirect_stdout(destino):
+        rodar = preparar(motor, tree, SaidaBufferizada("full"))
+        inicio = time.perf_counter()
+        rodar()
+        return time.perf_counter() - inicio
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_LINHAS", str(n)))
+    print(f"{n} voltas com três printf formatados (saída em {os.devnull}):")
+    for motor in motores:
+        print(f"  {motor:8s} {medir(motor, tree):8.3f} s")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
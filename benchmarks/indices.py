@@ -0,0 +1,61 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Programa dominado por acessos a arrays dentro de laços contados: um com
+# limite constante e array local de tamanho conhecido (provado na análise de
+# faixa) e um com limite num parâmetro (decidido pela guarda na entrada do
+# laço). Mede os acessos sem a verificação de índice nos motores compilados.
+#
+# Uso: python benchmarks/indices.py [N] [motor ...]
+
+PROGRAMA = """
+#define TAMANHO 1000
+int pesos[1000];
+
+int produto(int n) {
+    int i;
+    int s = 0;
+    for (i = 0; i < n; i = i + 1) {
+        s = s + pesos[i] * pesos[n - 1 - i];
+    }
+    return s;
+}
+
+int main() {
+    int v[1000];
+    int i;
+    int volta;
+    int total = 0;
+    for (i = 0; i < TAMANHO; i = i + 1) {
+        pesos[i] = i % 7;
+    }
+    for (volta = 0; volta < N_VOLTAS; volta = volta + 1) {
+        for (i = 0; i < TAMANHO; i = i + 1) {
+            v[i] = pesos[i] + volta;
+        }
+        i = 1;
+        while (i < TAMANHO) {
+            total = total + v[i] - v[i - 1];
+            i = i + 1;
+        }
+        total = total + produto(TAMANHO);
+    }
+    printf("%d\\n", total);
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 10
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_VOLTAS", str(n)))
+    print(f"{n} voltas de laços contados sobre arrays de 1000 posições:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
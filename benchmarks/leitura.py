@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+
+from comum import MOTORES, analisar, preparar
+
+# Programa dominado por scanf: lê N inteiros (um scanf("%d") por valor) e
+# uma linha com gets, com a entrada vindo de um arquivo (como num
+# redirecionamento "< entrada.txt"), no formato de juízes de programação
+# competitiva: a quantidade na primeira linha e depois os valores.
+#
+# Uso: python benchmarks/leitura.py [N] [motor ...]
+
+PROGRAMA = """
+int main() {
+    int n = 0;
+    int i = 0;
+    int x = 0;
+    int soma = 0;
+    char fim[16];
+    scanf("%d", &n);
+    for (i = 0; i < n; i = i + 1) {
+        scanf("%d", &x);
+        soma = soma + x;
+    }
+    gets(fim);
+    printf("%d %s\\n", soma, fim);
+    return 0;
+}
+"""
+
+
+def medir(motor, tree, caminho):
+    stdin = sys.stdin
+    with open(caminho) as entrada, open(os.devnull, "w") as destino, redirect_stdout(destino):
+        sys.stdin = entrada
+        try:
+            rodar = preparar(motor, tree)
+            inicio = time.perf_counter()
+            rodar()
+            return time.perf_counter() - inicio
+        finally:
+            sys.stdin = stdin
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as arquivo:
+        arquivo.write(f"{n}\n")
+        arquivo.write("".join(f"{i % 1000 - 500}\n" for i in range(n)))
+        arquivo.write("fim\n")
+    try:
+        print(f"{n} inteiros lidos com scanf, um por linha:")
+        for motor in motores:
+            print(f"  {motor:8s} {medir(motor, tree, arquivo.name):8.3f} s")
+    finally:
+        os.remove(arquivo.name)
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,48 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Programa dominado por leituras de variáveis locais e globais, todas
+# inicializadas antes do laço. Mede a leitura sem a verificação de slot vazio
+# que a análise de inicialização permite nos motores compilados.
+#
+# Uso: python benchmarks/leituras.py [N] [motor ...]
+
+PROGRAMA = """
+int passo = 3;
+int limite = 1000;
+
+int main() {
+    int i;
+    int a = 1;
+    int b = 2;
+    int c = 0;
+    int total = 0;
+    for (i = 0; i < N_VOLTAS; i = i + 1) {
+        c = a + b + passo;
+        if (c > limite) {
+            a = b;
+        } else {
+            a = c - b;
+        }
+        b = a + passo;
+        total = total + a + b + c;
+    }
+    printf("%d %d %d %d\\n", a, b, c, total);
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 30000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_VOLTAS", str(n)))
+    print(f"{n} voltas de um laço com leituras de variáveis inicializadas:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,49 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+from pureza import Memorizacao
+
+# Funções puras recursivas exponenciais: fibonacci e combinações pela
+# relação de Pascal, escritas sem memorização. Mede cada motor sem e com
+# --memoize, que reduz as chamadas a uma por argumento distinto.
+#
+# Uso: python benchmarks/puras.py [N] [motor ...]
+
+PROGRAMA = """
+int fib(int n) {
+    if (n < 2) {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+int comb(int n, int k) {
+    if (k == 0 || k == n) {
+        return 1;
+    }
+    return comb(n - 1, k - 1) + comb(n - 1, k);
+}
+
+int main() {
+    printf("%d %d\\n", fib(N_ARG), comb(N_ARG, N_ARG / 2));
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 16
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_ARG", str(n)))
+    print(f"fib({n}) e comb({n}, {n // 2}) recursivos:")
+    for motor in motores:
+        sem, _, saida = executar(motor, tree)
+        memorizacao = Memorizacao()
+        com, _, _ = executar(motor, tree, memorizacao=memorizacao)
+        chamadas = sum(cache.acertos + cache.falhas for cache in memorizacao.caches.values())
+        print(f"  {motor:8s} {sem:8.3f} s sem memorização  {com:8.3f} s com ({chamadas} consultas ao cache)  "
+              f"saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
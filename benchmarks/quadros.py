@@ -0,0 +1,91 @@
+import sys
+import tracemalloc
+
+from comum import analisar, executar
+from motor_closures import Quadro
+from resolvedor import Resolvedor, NAO_INICIALIZADA
+from tabela_simbolos import TabelaSimbolos
+
+# Compara a alocação por chamada de função entre a representação antiga
+# (uma TabelaSimbolos por chamada, com um dicionário por variável) e o
+# Quadro do motor de closures (lista plana de valores), e o tempo e o pico
+# de memória de um programa recursivo nos dois motores.
+#
+# Uso: python benchmarks/quadros.py [N]
+
+PROGRAMA = """
+int fatorial(int n) {
+    int r = 1;
+    if (n == 0) { return 1; }
+    r = n * fatorial(n - 1);
+    return r;
+}
+
+int fib(int n) {
+    int a = 0;
+    int b = 0;
+    if (n == 0 || n == 1) { return n; }
+    a = fib(n - 1);
+    b = fib(n - 2);
+    return a + b;
+}
+
+int main() {
+    int f = fatorial(20);
+    int x = fib(N_FIB);
+    printf("%d %d\\n", f, x);
+    return 0;
+}
+"""
+
+REPETICOES = 10000
+
+
+def medir_alocacao(criar):
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    vivos = [criar() for _ in range(REPETICOES)]
+    depois = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    estatisticas = depois.compare_to(antes, "filename")
+    total = sum(e.size_diff for e in estatisticas)
+    blocos = sum(e.count_diff for e in estatisticas)
+    del vivos
+    return total / REPETICOES, blocos / REPETICOES
+
+
+def quadro_tabela(pai):
+    # Chamada de fib(n) como o visitor a representa: tabela nova com os
+    # dicionários de variáveis, macros, structs e unions, e um registro por
+    # variável.
+    tabela = TabelaSimbolos(parent=pai)
+    tabela.adicionar_variavel("n", "int", 10)
+    tabela.adicionar_variavel("a", "int", 0)
+    tabela.adicionar_variavel("b", "int", 0)
+    return tabela
+
+
+def main(argv):
+    n_fib = int(argv[1]) if len(argv) > 1 else 16
+    tree = analisar(PROGRAMA.replace("N_FIB", str(n_fib)))
+
+    resolucao = Resolvedor().resolver(tree)
+    global_tabela = TabelaSimbolos()
+    fib = resolucao.funcoes["fib"]
+    vazios = [NAO_INICIALIZADA] * (fib.n_locais - fib.n_parametros)
+
+    bytes_tabela, blocos_tabela = medir_alocacao(lambda: quadro_tabela(global_tabela))
+    bytes_quadro, blocos_quadro = medir_alocacao(lambda: Quadro(fib, [10] + vazios))
+    print("Alocação por chamada de fib(n) (parâmetro n, locais a e b):")
+    print(f"  TabelaSimbolos + registros: {bytes_tabela:8.0f} bytes em {blocos_tabela:5.1f} blocos")
+    print(f"  Quadro (__slots__)        : {bytes_quadro:8.0f} bytes em {blocos_quadro:5.1f} blocos")
+    print()
+
+    print(f"fatorial(20) + fib({n_fib}):")
+    for nome in ("visitor", "closure"):
+        tempo, pico, saida = executar(nome, tree, medir_memoria=True)
+        print(f"  {nome:8s} {tempo:8.3f} s  pico de memória {pico / 1024:9.1f} KiB  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
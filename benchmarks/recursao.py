@@ -0,0 +1,52 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Recursão profunda que não é em cauda: fatorial(N) módulo um primo e a
+# profundidade de uma cadeia de N chamadas. Só o motor bytecode mantém a
+# pilha de chamadas fora da pilha do Python (limitada pela memória, não pelo
+# limite de recursão); nos demais motores a recursão profunda estoura o
+# limite do Python.
+#
+# Uso: python benchmarks/recursao.py [N] [motor ...]
+
+PROGRAMA = """
+int fatorial(int n) {
+    if (n <= 1) {
+        return 1;
+    }
+    return n * fatorial(n - 1) % 1000000007;
+}
+
+int profundidade(int n) {
+    int abaixo;
+    if (n == 0) {
+        return 0;
+    }
+    abaixo = profundidade(n - 1);
+    return abaixo + 1;
+}
+
+int main() {
+    printf("%d %d\\n", fatorial(N_NIVEIS), profundidade(N_NIVEIS));
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_NIVEIS", str(n)))
+    print(f"recursão com {n} níveis (limite de recursão do Python: {sys.getrecursionlimit()}):")
+    for motor in motores:
+        try:
+            tempo, _, saida = executar(motor, tree)
+        except RecursionError:
+            print(f"  {motor:8s} limite de recursão do Python excedido")
+            continue
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
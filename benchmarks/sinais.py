@@ -0,0 +1,102 @@
+import sys
+import timeit
+
+from comum import MOTORES, analisar, executar
+from interpretador import RETORNO
+
+# Programas com muitas chamadas, returns e breaks, executados em cada motor;
+# e uma comparação direta do custo de encerrar uma chamada com uma exceção
+# (mecanismo usado antes para return e break) e com um sinal de conclusão.
+#
+# Uso: python benchmarks/sinais.py [N] [motor ...]
+
+PROGRAMA = """
+int fib(int n) {
+    if (n < 2) { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+
+int primeiro_divisor(int n) {
+    int d = 2;
+    while (d * d <= n) {
+        if (n % d == 0) { return d; }
+        d = d + 1;
+    }
+    return n;
+}
+
+int main() {
+    int i = 0;
+    int soma = 0;
+    int j = 0;
+    printf("%d\\n", fib(N_FIB));
+    for (i = 2; i < N_LACO; i = i + 1) {
+        soma = soma + primeiro_divisor(i);
+    }
+    printf("%d\\n", soma);
+    for (i = 0; i < N_LACO; i = i + 1) {
+        j = 0;
+        while (1) {
+            j = j + 1;
+            if (j == 3) { break; }
+        }
+    }
+    printf("%d\\n", j);
+    return 0;
+}
+"""
+
+
+class _Retorno(Exception):
+    def __init__(self, value):
+        self.value = value
+
+
+class _Quadro:
+    __slots__ = ("retorno",)
+
+
+def _corpo_com_excecao(n):
+    raise _Retorno(n)
+
+
+def _chamar_com_excecao(n):
+    try:
+        _corpo_com_excecao(n)
+    except _Retorno as re:
+        return re.value
+
+
+def _corpo_com_sinal(quadro, n):
+    quadro.retorno = n
+    return RETORNO
+
+
+def _chamar_com_sinal(n):
+    quadro = _Quadro()
+    if _corpo_com_sinal(quadro, n) is RETORNO:
+        return quadro.retorno
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 15
+    motores = argv[2:] or MOTORES
+
+    repeticoes = 1000000
+    excecao = min(timeit.repeat(lambda: _chamar_com_excecao(1), number=repeticoes, repeat=3))
+    sinal = min(timeit.repeat(lambda: _chamar_com_sinal(1), number=repeticoes, repeat=3))
+    print("Custo de um return (chamada + retorno de valor):")
+    print(f"  exceção : {excecao / repeticoes * 1e9:7.1f} ns")
+    print(f"  sinal   : {sinal / repeticoes * 1e9:7.1f} ns")
+    print()
+
+    fonte = PROGRAMA.replace("N_FIB", str(n)).replace("N_LACO", str(n * 200))
+    tree = analisar(fonte)
+    print(f"fib({n}), {n * 200} chamadas com return no meio do laço, {n * 200} breaks:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {' '.join(saida.split())}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,62 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Programa com muitas structs: declara N structs (o fonte é gerado, já que a
+# linguagem só cria uma struct por declaração), preenche os campos de cada
+# uma e depois roda um laço dominado por leituras e escritas de campos,
+# inclusive de um sub-struct (c.canto.x). Mede o tempo em cada motor e, numa
+# segunda execução, o pico de memória (com tracemalloc).
+#
+# Uso: python benchmarks/structs.py [N] [motor ...]
+
+CABECALHO = """
+struct Ponto { int x; int y; double peso; };
+struct Caixa { struct Ponto canto; int n; };
+
+int main() {
+    struct Caixa c;
+    struct Ponto q;
+    struct Ponto r;
+    int i = 0;
+    int soma = 0;
+"""
+
+LACO = """
+    c.canto = r;
+    c.canto.x = 0;
+    c.n = 0;
+    q.y = 3;
+    for (i = 0; i < 20000; i = i + 1) {
+        q.x = i % 100;
+        soma = soma + (q.x) * (q.y);
+        c.canto.x = (c.canto.x) + (q.x);
+        c.n = (c.n) + 1;
+    }
+    printf("%d %d %d %d\\n", soma, c.canto.x, c.n, p0.x);
+    return 0;
+}
+"""
+
+
+def gerar(n):
+    linhas = [CABECALHO]
+    for k in range(n):
+        linhas.append(f"    struct Ponto p{k};\n    p{k}.x = {k};\n    p{k}.y = {k % 7};\n    p{k}.peso = 0.5;\n")
+    linhas.append(LACO)
+    return "".join(linhas)
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 200
+    motores = argv[2:] or MOTORES
+    tree = analisar(gerar(n))
+    print(f"{n} structs declaradas e um laço de 20000 iterações com acesso a campos:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        _, pico, _ = executar(motor, tree, medir_memoria=True)
+        print(f"  {motor:8s} {tempo:8.3f} s  pico {pico / 1024 / 1024:7.2f} MiB  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
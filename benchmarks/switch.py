@@ -0,0 +1,100 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Switch com muitos rótulos constantes dentro de um laço: mede o despacho
+# pela tabela de saltos (o custo não depende de qual case é escolhido) e o
+# fall-through entre blocos sem break.
+#
+# Uso: python benchmarks/switch.py [N] [motor ...]
+
+PROGRAMA = """
+#define ULTIMO 15
+
+int main() {
+    int i = 0;
+    int soma = 0;
+    int queda = 0;
+    for (i = 0; i < N_LACO; i = i + 1) {
+        switch (i % 20) {
+            case 0:
+                soma = soma + 0;
+                break;
+            case 1:
+                soma = soma + 1;
+                break;
+            case 2:
+                soma = soma + 2;
+                break;
+            case 3:
+                soma = soma + 3;
+                break;
+            case 4:
+                soma = soma + 4;
+                break;
+            case 5:
+                soma = soma + 5;
+                break;
+            case 6:
+                soma = soma + 6;
+                break;
+            case 7:
+                soma = soma + 7;
+                break;
+            case 8:
+                soma = soma + 8;
+                break;
+            case 9:
+                soma = soma + 9;
+                break;
+            case 10:
+                soma = soma + 10;
+                break;
+            case 11:
+                soma = soma + 11;
+                break;
+            case 12:
+                soma = soma + 12;
+                break;
+            case 13:
+                soma = soma + 13;
+                break;
+            case 14:
+                soma = soma + 14;
+                break;
+            case ULTIMO:
+                soma = soma + 15;
+                break;
+            default:
+                soma = soma + 1;
+        }
+        switch (i % 4) {
+            case 0:
+                queda = queda + 1;
+            case 1:
+                queda = queda + 1;
+            case 2:
+                queda = queda + 1;
+                break;
+            default:
+                queda = queda - 1;
+        }
+    }
+    printf("%d %d\\n", soma, queda);
+    return 0;
+}
+"""
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 20000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_LACO", str(n)))
+    print(f"{n} voltas com um switch de 16 cases + default e um switch com fall-through:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        print(f"  {motor:8s} {tempo:8.3f} s  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+from comum import MOTORES, analisar, preparar
+from saida import SaidaBufferizada
+
+# Impressão repetida de um buffer de char grande (4 KB) com printf("%s") e
+# puts, que só é alterado de tempos em tempos; a saída vai para os.devnull.
+#
+# Uso: python benchmarks/textos.py [N] [motor ...]
+
+PROGRAMA = """
+int main() {
+    char buffer[4096] = "TEXTO";
+    int i = 0;
+    for (i = 0; i < N_VOLTAS; i = i + 1) {
+        printf("%s\\n", buffer);
+        puts(buffer);
+        if (i % 100 == 0) {
+            buffer[0] = 'y';
+        }
+    }
+    return 0;
+}
+""".replace("TEXTO", "x" * 4000)
+
+
+def medir(motor, tree):
+    with open(os.devnull, "w") as destino, redirect_stdout(destino):
+        rodar = preparar(motor, tree, SaidaBufferizada("full"))
+        inicio = time.perf_counter()
+        rodar()
+        return time.perf_counter() - inicio
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 5000
+    motores = argv[2:] or MOTORES
+    tree = analisar(PROGRAMA.replace("N_VOLTAS", str(n)))
+    print(f"{n} voltas imprimindo um buffer de 4 KB com printf('%s') e puts (saída em {os.devnull}):")
+    for motor in motores:
+        print(f"  {motor:8s} {medir(motor, tree):8.3f} s")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,55 @@
+import sys
+
+from comum import MOTORES, analisar, executar
+
+# Programa com muitas unions: declara N unions (fonte gerado, como em
+# structs.py), escreve um membro de cada uma e depois roda um laço que
+# alterna escritas e leituras de membros int e double. Mede o tempo em cada
+# motor e, numa segunda execução, o pico de memória (com tracemalloc).
+#
+# Uso: python benchmarks/unioes.py [N] [motor ...]
+
+CABECALHO = """
+union Dado { int i; double d; char c; };
+
+int main() {
+    union Dado u;
+    int i = 0;
+    int soma = 0;
+    double total = 0.0;
+"""
+
+LACO = """
+    for (i = 0; i < 20000; i = i + 1) {
+        u.i = i % 100;
+        soma = soma + (u.i);
+        u.d = i * 0.5;
+        total = total + (u.d);
+    }
+    printf("%d %.1f %d\\n", soma, total, v0.i);
+    return 0;
+}
+"""
+
+
+def gerar(n):
+    linhas = [CABECALHO]
+    for k in range(n):
+        linhas.append(f"    union Dado v{k};\n    v{k}.i = {k};\n")
+    linhas.append(LACO)
+    return "".join(linhas)
+
+
+def main(argv):
+    n = int(argv[1]) if len(argv) > 1 else 200
+    motores = argv[2:] or MOTORES
+    tree = analisar(gerar(n))
+    print(f"{n} unions declaradas e um laço de 20000 iterações com acesso a membros:")
+    for motor in motores:
+        tempo, _, saida = executar(motor, tree)
+        _, pico, _ = executar(motor, tree, medir_memoria=True)
+        print(f"  {motor:8s} {tempo:8.3f} s  pico {pico / 1024 / 1024:7.2f} MiB  saída: {saida}")
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,31 @@
+#include <stdio.h>
+#include<sys-x.h>
+
+// ================================
+// Comparações com < e > na mesma linha, que o lexer não pode confundir
+// com o nome de arquivo de um #include
+// ================================
+
+int main() {
+    int a = 1;
+    int b = 2;
+    int c = 5;
+    int d = 3;
+    int i;
+
+    if (a<b&&c>d) {
+        printf("a<b&&c>d\n");
+    }
+
+    if ((a<b)==(b>a)) {
+        printf("(a<b)==(b>a)\n");
+    }
+
+    for (i = 0; i<3; i = i + 1) {
+        if (i>0 && a<c) {
+            printf("i = %d\n", i);
+        }
+    }
+
+    return 0;
+}
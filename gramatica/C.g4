@@ -4,13 +4,15 @@ grammar C;
 program : (directive | functionDef | structDef | unionDef | statement)* EOF ;
 
 directive 
-    : '#include' IncludeFile
+    : IncludeFile
     | '#define' Identifier expression
     ;
 
-// Inclui arquivos como <stdio.h> ou "file.h"
+// Inclui arquivos como <stdio.h>. A diretiva inteira é um único token, então
+// '<' e '>' só delimitam um nome de arquivo logo depois de #include, nunca
+// comparações como a<b&&c>d
 IncludeFile
-    : '<' ~[<>]+ '>'       // Para arquivos delimitados por < e >
+    : '#include' [ \t]* '<' ~[>\r\n]+ '>'
     ;
 
 functionDef 
@@ -41,10 +43,6 @@ statement
     | 'return' expression? ';'
     ;
 
-returnStatement 
-    : 'return' expression? ';'
-    ;
-
 block 
     : '{' statement* '}'
     ;
@@ -140,12 +138,11 @@ expression
     | expression ('<' | '<=' | '>' | '>=') expression
     | expression ('==' | '!=') expression
     | expression ('&&' | '||') expression
-    | Identifier
     | Number
     | StringLiteral
     | CharLiteral
     | expression '.' Identifier
-    | Identifier ('[' expression ']')*
+    | Identifier ('[' expression ']')*   // também o identificador simples
     | functionCall
     ;
 
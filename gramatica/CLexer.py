@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,0,66,543,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,65,547,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
         19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
@@ -20,190 +20,192 @@ def serializedATN():
         45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
         52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,2,58,7,
         58,2,59,7,59,2,60,7,60,2,61,7,61,2,62,7,62,2,63,7,63,2,64,7,64,2,
-        65,7,65,2,66,7,66,2,67,7,67,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,
-        1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,3,1,3,1,4,1,4,1,4,1,4,
-        1,4,1,4,1,4,1,5,1,5,1,6,1,6,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,9,
-        1,9,1,9,1,9,1,9,1,9,1,9,1,10,1,10,1,11,1,11,1,12,1,12,1,13,1,13,
-        1,14,1,14,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,
-        1,17,1,17,1,17,1,18,1,18,1,18,1,19,1,19,1,19,1,19,1,20,1,20,1,20,
-        1,20,1,20,1,20,1,20,1,21,1,21,1,21,1,21,1,21,1,21,1,22,1,22,1,22,
-        1,22,1,22,1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,
-        1,25,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,27,
-        1,27,1,28,1,28,1,28,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,30,1,30,
-        1,31,1,31,1,32,1,32,1,33,1,33,1,34,1,34,1,35,1,35,1,36,1,36,1,36,
-        1,37,1,37,1,38,1,38,1,38,1,39,1,39,1,39,1,40,1,40,1,40,1,41,1,41,
-        1,41,1,42,1,42,1,42,1,43,1,43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,
-        1,44,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,1,46,1,46,
-        1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,1,47,1,47,1,47,1,47,1,48,
-        1,48,1,48,1,48,1,48,1,48,1,49,1,49,1,49,1,49,1,49,1,50,1,50,1,50,
-        1,50,1,50,1,50,1,50,1,50,1,50,1,51,1,51,1,51,1,51,1,51,1,51,1,51,
-        1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,52,1,52,1,52,1,52,1,52,1,52,
-        1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,53,1,53,1,53,1,53,1,53,1,53,
-        1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,54,1,54,1,54,1,54,
+        65,7,65,2,66,7,66,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,0,1,1,1,1,1,2,1,
+        2,1,3,1,3,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,5,1,5,1,6,1,6,1,7,1,7,1,
+        7,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,10,1,10,1,11,
+        1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,14,1,15,1,15,1,15,1,15,1,15,
+        1,16,1,16,1,16,1,16,1,16,1,16,1,17,1,17,1,17,1,18,1,18,1,18,1,18,
+        1,19,1,19,1,19,1,19,1,19,1,19,1,19,1,20,1,20,1,20,1,20,1,20,1,20,
+        1,21,1,21,1,21,1,21,1,21,1,22,1,22,1,23,1,23,1,23,1,23,1,23,1,23,
+        1,23,1,23,1,24,1,24,1,24,1,24,1,24,1,24,1,24,1,25,1,25,1,25,1,25,
+        1,25,1,25,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,28,1,28,1,28,1,28,
+        1,28,1,29,1,29,1,30,1,30,1,31,1,31,1,32,1,32,1,33,1,33,1,34,1,34,
+        1,35,1,35,1,35,1,36,1,36,1,37,1,37,1,37,1,38,1,38,1,38,1,39,1,39,
+        1,39,1,40,1,40,1,40,1,41,1,41,1,41,1,42,1,42,1,42,1,42,1,43,1,43,
+        1,43,1,43,1,43,1,43,1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,
+        1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,45,1,46,1,46,1,46,
+        1,46,1,46,1,47,1,47,1,47,1,47,1,47,1,47,1,48,1,48,1,48,1,48,1,48,
+        1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,49,1,50,1,50,1,50,1,50,
+        1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,50,1,51,1,51,1,51,
+        1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,51,1,52,1,52,1,52,
+        1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,52,1,53,
+        1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,1,53,
         1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,54,1,55,1,55,1,55,
-        1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,56,
-        1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,1,56,
-        1,57,1,57,1,57,1,57,1,57,1,58,1,58,4,58,447,8,58,11,58,12,58,448,
-        1,58,1,58,1,59,4,59,454,8,59,11,59,12,59,455,1,59,1,59,4,59,460,
-        8,59,11,59,12,59,461,3,59,464,8,59,1,60,1,60,1,60,1,60,1,61,1,61,
-        1,61,5,61,473,8,61,10,61,12,61,476,9,61,1,61,1,61,1,61,1,61,1,61,
-        5,61,483,8,61,10,61,12,61,486,9,61,1,61,3,61,489,8,61,1,62,1,62,
-        1,62,1,62,1,62,1,62,1,62,1,62,1,62,1,62,3,62,501,8,62,1,63,1,63,
-        1,64,1,64,5,64,507,8,64,10,64,12,64,510,9,64,1,65,4,65,513,8,65,
-        11,65,12,65,514,1,65,1,65,1,66,1,66,1,66,1,66,5,66,523,8,66,10,66,
-        12,66,526,9,66,1,66,1,66,1,67,1,67,1,67,1,67,5,67,534,8,67,10,67,
-        12,67,537,9,67,1,67,1,67,1,67,1,67,1,67,1,535,0,68,1,1,3,2,5,3,7,
-        4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,
-        16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,
-        27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,
-        38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,
-        49,99,50,101,51,103,52,105,53,107,54,109,55,111,56,113,57,115,58,
-        117,59,119,60,121,61,123,62,125,0,127,0,129,63,131,64,133,65,135,
-        66,1,0,10,2,0,60,60,62,62,1,0,48,57,3,0,10,10,13,13,39,39,2,0,34,
-        34,92,92,8,0,34,34,47,47,92,92,98,98,102,102,110,110,114,114,116,
-        116,3,0,48,57,65,70,97,102,3,0,65,90,95,95,97,122,4,0,48,57,65,90,
-        95,95,97,122,3,0,9,10,13,13,32,32,2,0,10,10,13,13,554,0,1,1,0,0,
-        0,0,3,1,0,0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,
-        13,1,0,0,0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,
-        23,1,0,0,0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,
-        33,1,0,0,0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,
-        43,1,0,0,0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,
-        53,1,0,0,0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,
-        63,1,0,0,0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,
-        73,1,0,0,0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,
-        83,1,0,0,0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,
-        93,1,0,0,0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,
-        0,103,1,0,0,0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,111,1,
-        0,0,0,0,113,1,0,0,0,0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,0,0,0,0,
-        121,1,0,0,0,0,123,1,0,0,0,0,129,1,0,0,0,0,131,1,0,0,0,0,133,1,0,
-        0,0,0,135,1,0,0,0,1,137,1,0,0,0,3,146,1,0,0,0,5,154,1,0,0,0,7,156,
-        1,0,0,0,9,158,1,0,0,0,11,165,1,0,0,0,13,167,1,0,0,0,15,169,1,0,0,
-        0,17,171,1,0,0,0,19,177,1,0,0,0,21,184,1,0,0,0,23,186,1,0,0,0,25,
-        188,1,0,0,0,27,190,1,0,0,0,29,192,1,0,0,0,31,194,1,0,0,0,33,197,
-        1,0,0,0,35,202,1,0,0,0,37,208,1,0,0,0,39,211,1,0,0,0,41,215,1,0,
-        0,0,43,222,1,0,0,0,45,228,1,0,0,0,47,233,1,0,0,0,49,235,1,0,0,0,
-        51,243,1,0,0,0,53,250,1,0,0,0,55,256,1,0,0,0,57,258,1,0,0,0,59,263,
-        1,0,0,0,61,268,1,0,0,0,63,270,1,0,0,0,65,272,1,0,0,0,67,274,1,0,
-        0,0,69,276,1,0,0,0,71,278,1,0,0,0,73,280,1,0,0,0,75,283,1,0,0,0,
-        77,285,1,0,0,0,79,288,1,0,0,0,81,291,1,0,0,0,83,294,1,0,0,0,85,297,
-        1,0,0,0,87,300,1,0,0,0,89,304,1,0,0,0,91,310,1,0,0,0,93,317,1,0,
-        0,0,95,329,1,0,0,0,97,334,1,0,0,0,99,340,1,0,0,0,101,345,1,0,0,0,
-        103,354,1,0,0,0,105,368,1,0,0,0,107,381,1,0,0,0,109,396,1,0,0,0,
-        111,410,1,0,0,0,113,420,1,0,0,0,115,439,1,0,0,0,117,444,1,0,0,0,
-        119,453,1,0,0,0,121,465,1,0,0,0,123,488,1,0,0,0,125,500,1,0,0,0,
-        127,502,1,0,0,0,129,504,1,0,0,0,131,512,1,0,0,0,133,518,1,0,0,0,
-        135,529,1,0,0,0,137,138,5,35,0,0,138,139,5,105,0,0,139,140,5,110,
-        0,0,140,141,5,99,0,0,141,142,5,108,0,0,142,143,5,117,0,0,143,144,
-        5,100,0,0,144,145,5,101,0,0,145,2,1,0,0,0,146,147,5,35,0,0,147,148,
-        5,100,0,0,148,149,5,101,0,0,149,150,5,102,0,0,150,151,5,105,0,0,
-        151,152,5,110,0,0,152,153,5,101,0,0,153,4,1,0,0,0,154,155,5,40,0,
-        0,155,6,1,0,0,0,156,157,5,41,0,0,157,8,1,0,0,0,158,159,5,115,0,0,
-        159,160,5,116,0,0,160,161,5,114,0,0,161,162,5,117,0,0,162,163,5,
-        99,0,0,163,164,5,116,0,0,164,10,1,0,0,0,165,166,5,123,0,0,166,12,
-        1,0,0,0,167,168,5,125,0,0,168,14,1,0,0,0,169,170,5,59,0,0,170,16,
-        1,0,0,0,171,172,5,117,0,0,172,173,5,110,0,0,173,174,5,105,0,0,174,
-        175,5,111,0,0,175,176,5,110,0,0,176,18,1,0,0,0,177,178,5,114,0,0,
-        178,179,5,101,0,0,179,180,5,116,0,0,180,181,5,117,0,0,181,182,5,
-        114,0,0,182,183,5,110,0,0,183,20,1,0,0,0,184,185,5,61,0,0,185,22,
-        1,0,0,0,186,187,5,91,0,0,187,24,1,0,0,0,188,189,5,93,0,0,189,26,
-        1,0,0,0,190,191,5,44,0,0,191,28,1,0,0,0,192,193,5,46,0,0,193,30,
-        1,0,0,0,194,195,5,105,0,0,195,196,5,102,0,0,196,32,1,0,0,0,197,198,
-        5,101,0,0,198,199,5,108,0,0,199,200,5,115,0,0,200,201,5,101,0,0,
-        201,34,1,0,0,0,202,203,5,119,0,0,203,204,5,104,0,0,204,205,5,105,
-        0,0,205,206,5,108,0,0,206,207,5,101,0,0,207,36,1,0,0,0,208,209,5,
-        100,0,0,209,210,5,111,0,0,210,38,1,0,0,0,211,212,5,102,0,0,212,213,
-        5,111,0,0,213,214,5,114,0,0,214,40,1,0,0,0,215,216,5,115,0,0,216,
-        217,5,119,0,0,217,218,5,105,0,0,218,219,5,116,0,0,219,220,5,99,0,
-        0,220,221,5,104,0,0,221,42,1,0,0,0,222,223,5,98,0,0,223,224,5,114,
-        0,0,224,225,5,101,0,0,225,226,5,97,0,0,226,227,5,107,0,0,227,44,
-        1,0,0,0,228,229,5,99,0,0,229,230,5,97,0,0,230,231,5,115,0,0,231,
-        232,5,101,0,0,232,46,1,0,0,0,233,234,5,58,0,0,234,48,1,0,0,0,235,
-        236,5,100,0,0,236,237,5,101,0,0,237,238,5,102,0,0,238,239,5,97,0,
-        0,239,240,5,117,0,0,240,241,5,108,0,0,241,242,5,116,0,0,242,50,1,
-        0,0,0,243,244,5,112,0,0,244,245,5,114,0,0,245,246,5,105,0,0,246,
-        247,5,110,0,0,247,248,5,116,0,0,248,249,5,102,0,0,249,52,1,0,0,0,
-        250,251,5,115,0,0,251,252,5,99,0,0,252,253,5,97,0,0,253,254,5,110,
-        0,0,254,255,5,102,0,0,255,54,1,0,0,0,256,257,5,38,0,0,257,56,1,0,
-        0,0,258,259,5,103,0,0,259,260,5,101,0,0,260,261,5,116,0,0,261,262,
-        5,115,0,0,262,58,1,0,0,0,263,264,5,112,0,0,264,265,5,117,0,0,265,
-        266,5,116,0,0,266,267,5,115,0,0,267,60,1,0,0,0,268,269,5,45,0,0,
-        269,62,1,0,0,0,270,271,5,42,0,0,271,64,1,0,0,0,272,273,5,47,0,0,
-        273,66,1,0,0,0,274,275,5,37,0,0,275,68,1,0,0,0,276,277,5,43,0,0,
-        277,70,1,0,0,0,278,279,5,60,0,0,279,72,1,0,0,0,280,281,5,60,0,0,
-        281,282,5,61,0,0,282,74,1,0,0,0,283,284,5,62,0,0,284,76,1,0,0,0,
-        285,286,5,62,0,0,286,287,5,61,0,0,287,78,1,0,0,0,288,289,5,61,0,
-        0,289,290,5,61,0,0,290,80,1,0,0,0,291,292,5,33,0,0,292,293,5,61,
-        0,0,293,82,1,0,0,0,294,295,5,38,0,0,295,296,5,38,0,0,296,84,1,0,
-        0,0,297,298,5,124,0,0,298,299,5,124,0,0,299,86,1,0,0,0,300,301,5,
-        105,0,0,301,302,5,110,0,0,302,303,5,116,0,0,303,88,1,0,0,0,304,305,
-        5,102,0,0,305,306,5,108,0,0,306,307,5,111,0,0,307,308,5,97,0,0,308,
-        309,5,116,0,0,309,90,1,0,0,0,310,311,5,100,0,0,311,312,5,111,0,0,
-        312,313,5,117,0,0,313,314,5,98,0,0,314,315,5,108,0,0,315,316,5,101,
-        0,0,316,92,1,0,0,0,317,318,5,108,0,0,318,319,5,111,0,0,319,320,5,
-        110,0,0,320,321,5,103,0,0,321,322,5,32,0,0,322,323,5,100,0,0,323,
-        324,5,111,0,0,324,325,5,117,0,0,325,326,5,98,0,0,326,327,5,108,0,
-        0,327,328,5,101,0,0,328,94,1,0,0,0,329,330,5,99,0,0,330,331,5,104,
-        0,0,331,332,5,97,0,0,332,333,5,114,0,0,333,96,1,0,0,0,334,335,5,
-        115,0,0,335,336,5,104,0,0,336,337,5,111,0,0,337,338,5,114,0,0,338,
-        339,5,116,0,0,339,98,1,0,0,0,340,341,5,108,0,0,341,342,5,111,0,0,
-        342,343,5,110,0,0,343,344,5,103,0,0,344,100,1,0,0,0,345,346,5,117,
-        0,0,346,347,5,110,0,0,347,348,5,115,0,0,348,349,5,105,0,0,349,350,
-        5,103,0,0,350,351,5,110,0,0,351,352,5,101,0,0,352,353,5,100,0,0,
-        353,102,1,0,0,0,354,355,5,117,0,0,355,356,5,110,0,0,356,357,5,115,
-        0,0,357,358,5,105,0,0,358,359,5,103,0,0,359,360,5,110,0,0,360,361,
-        5,101,0,0,361,362,5,100,0,0,362,363,5,32,0,0,363,364,5,99,0,0,364,
-        365,5,104,0,0,365,366,5,97,0,0,366,367,5,114,0,0,367,104,1,0,0,0,
-        368,369,5,117,0,0,369,370,5,110,0,0,370,371,5,115,0,0,371,372,5,
-        105,0,0,372,373,5,103,0,0,373,374,5,110,0,0,374,375,5,101,0,0,375,
-        376,5,100,0,0,376,377,5,32,0,0,377,378,5,105,0,0,378,379,5,110,0,
-        0,379,380,5,116,0,0,380,106,1,0,0,0,381,382,5,117,0,0,382,383,5,
-        110,0,0,383,384,5,115,0,0,384,385,5,105,0,0,385,386,5,103,0,0,386,
-        387,5,110,0,0,387,388,5,101,0,0,388,389,5,100,0,0,389,390,5,32,0,
-        0,390,391,5,115,0,0,391,392,5,104,0,0,392,393,5,111,0,0,393,394,
-        5,114,0,0,394,395,5,116,0,0,395,108,1,0,0,0,396,397,5,117,0,0,397,
-        398,5,110,0,0,398,399,5,115,0,0,399,400,5,105,0,0,400,401,5,103,
-        0,0,401,402,5,110,0,0,402,403,5,101,0,0,403,404,5,100,0,0,404,405,
-        5,32,0,0,405,406,5,108,0,0,406,407,5,111,0,0,407,408,5,110,0,0,408,
-        409,5,103,0,0,409,110,1,0,0,0,410,411,5,108,0,0,411,412,5,111,0,
-        0,412,413,5,110,0,0,413,414,5,103,0,0,414,415,5,32,0,0,415,416,5,
-        108,0,0,416,417,5,111,0,0,417,418,5,110,0,0,418,419,5,103,0,0,419,
-        112,1,0,0,0,420,421,5,117,0,0,421,422,5,110,0,0,422,423,5,115,0,
-        0,423,424,5,105,0,0,424,425,5,103,0,0,425,426,5,110,0,0,426,427,
-        5,101,0,0,427,428,5,100,0,0,428,429,5,32,0,0,429,430,5,108,0,0,430,
-        431,5,111,0,0,431,432,5,110,0,0,432,433,5,103,0,0,433,434,5,32,0,
-        0,434,435,5,108,0,0,435,436,5,111,0,0,436,437,5,110,0,0,437,438,
-        5,103,0,0,438,114,1,0,0,0,439,440,5,118,0,0,440,441,5,111,0,0,441,
-        442,5,105,0,0,442,443,5,100,0,0,443,116,1,0,0,0,444,446,5,60,0,0,
-        445,447,8,0,0,0,446,445,1,0,0,0,447,448,1,0,0,0,448,446,1,0,0,0,
-        448,449,1,0,0,0,449,450,1,0,0,0,450,451,5,62,0,0,451,118,1,0,0,0,
-        452,454,7,1,0,0,453,452,1,0,0,0,454,455,1,0,0,0,455,453,1,0,0,0,
-        455,456,1,0,0,0,456,463,1,0,0,0,457,459,5,46,0,0,458,460,7,1,0,0,
-        459,458,1,0,0,0,460,461,1,0,0,0,461,459,1,0,0,0,461,462,1,0,0,0,
-        462,464,1,0,0,0,463,457,1,0,0,0,463,464,1,0,0,0,464,120,1,0,0,0,
-        465,466,5,39,0,0,466,467,8,2,0,0,467,468,5,39,0,0,468,122,1,0,0,
-        0,469,474,5,34,0,0,470,473,3,125,62,0,471,473,8,3,0,0,472,470,1,
-        0,0,0,472,471,1,0,0,0,473,476,1,0,0,0,474,472,1,0,0,0,474,475,1,
-        0,0,0,475,477,1,0,0,0,476,474,1,0,0,0,477,489,5,34,0,0,478,484,5,
-        34,0,0,479,483,8,3,0,0,480,481,5,92,0,0,481,483,9,0,0,0,482,479,
-        1,0,0,0,482,480,1,0,0,0,483,486,1,0,0,0,484,482,1,0,0,0,484,485,
-        1,0,0,0,485,487,1,0,0,0,486,484,1,0,0,0,487,489,5,34,0,0,488,469,
-        1,0,0,0,488,478,1,0,0,0,489,124,1,0,0,0,490,491,5,92,0,0,491,501,
-        7,4,0,0,492,493,5,92,0,0,493,494,5,117,0,0,494,495,1,0,0,0,495,496,
-        3,127,63,0,496,497,3,127,63,0,497,498,3,127,63,0,498,499,3,127,63,
-        0,499,501,1,0,0,0,500,490,1,0,0,0,500,492,1,0,0,0,501,126,1,0,0,
-        0,502,503,7,5,0,0,503,128,1,0,0,0,504,508,7,6,0,0,505,507,7,7,0,
-        0,506,505,1,0,0,0,507,510,1,0,0,0,508,506,1,0,0,0,508,509,1,0,0,
-        0,509,130,1,0,0,0,510,508,1,0,0,0,511,513,7,8,0,0,512,511,1,0,0,
-        0,513,514,1,0,0,0,514,512,1,0,0,0,514,515,1,0,0,0,515,516,1,0,0,
-        0,516,517,6,65,0,0,517,132,1,0,0,0,518,519,5,47,0,0,519,520,5,47,
-        0,0,520,524,1,0,0,0,521,523,8,9,0,0,522,521,1,0,0,0,523,526,1,0,
-        0,0,524,522,1,0,0,0,524,525,1,0,0,0,525,527,1,0,0,0,526,524,1,0,
-        0,0,527,528,6,66,0,0,528,134,1,0,0,0,529,530,5,47,0,0,530,531,5,
-        42,0,0,531,535,1,0,0,0,532,534,9,0,0,0,533,532,1,0,0,0,534,537,1,
-        0,0,0,535,536,1,0,0,0,535,533,1,0,0,0,536,538,1,0,0,0,537,535,1,
-        0,0,0,538,539,5,42,0,0,539,540,5,47,0,0,540,541,1,0,0,0,541,542,
-        6,67,0,0,542,136,1,0,0,0,15,0,448,455,461,463,472,474,482,484,488,
-        500,508,514,524,535,1,6,0,0
+        1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,1,55,
+        1,55,1,55,1,55,1,56,1,56,1,56,1,56,1,56,1,57,1,57,1,57,1,57,1,57,
+        1,57,1,57,1,57,1,57,1,57,5,57,444,8,57,10,57,12,57,447,9,57,1,57,
+        1,57,4,57,451,8,57,11,57,12,57,452,1,57,1,57,1,58,4,58,458,8,58,
+        11,58,12,58,459,1,58,1,58,4,58,464,8,58,11,58,12,58,465,3,58,468,
+        8,58,1,59,1,59,1,59,1,59,1,60,1,60,1,60,5,60,477,8,60,10,60,12,60,
+        480,9,60,1,60,1,60,1,60,1,60,1,60,5,60,487,8,60,10,60,12,60,490,
+        9,60,1,60,3,60,493,8,60,1,61,1,61,1,61,1,61,1,61,1,61,1,61,1,61,
+        1,61,1,61,3,61,505,8,61,1,62,1,62,1,63,1,63,5,63,511,8,63,10,63,
+        12,63,514,9,63,1,64,4,64,517,8,64,11,64,12,64,518,1,64,1,64,1,65,
+        1,65,1,65,1,65,5,65,527,8,65,10,65,12,65,530,9,65,1,65,1,65,1,66,
+        1,66,1,66,1,66,5,66,538,8,66,10,66,12,66,541,9,66,1,66,1,66,1,66,
+        1,66,1,66,1,539,0,67,1,1,3,2,5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,
+        10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,35,18,37,19,39,20,41,
+        21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,57,29,59,30,61,31,63,
+        32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,79,40,81,41,83,42,85,
+        43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,101,51,103,52,105,53,
+        107,54,109,55,111,56,113,57,115,58,117,59,119,60,121,61,123,0,125,
+        0,127,62,129,63,131,64,133,65,1,0,11,2,0,9,9,32,32,3,0,10,10,13,
+        13,62,62,1,0,48,57,3,0,10,10,13,13,39,39,2,0,34,34,92,92,8,0,34,
+        34,47,47,92,92,98,98,102,102,110,110,114,114,116,116,3,0,48,57,65,
+        70,97,102,3,0,65,90,95,95,97,122,4,0,48,57,65,90,95,95,97,122,3,
+        0,9,10,13,13,32,32,2,0,10,10,13,13,559,0,1,1,0,0,0,0,3,1,0,0,0,0,
+        5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,
+        1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,
+        1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,
+        1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,
+        1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,
+        1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,
+        1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,
+        1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,
+        1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,
+        1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,
+        105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,111,1,0,0,0,0,113,1,0,
+        0,0,0,115,1,0,0,0,0,117,1,0,0,0,0,119,1,0,0,0,0,121,1,0,0,0,0,127,
+        1,0,0,0,0,129,1,0,0,0,0,131,1,0,0,0,0,133,1,0,0,0,1,135,1,0,0,0,
+        3,143,1,0,0,0,5,145,1,0,0,0,7,147,1,0,0,0,9,154,1,0,0,0,11,156,1,
+        0,0,0,13,158,1,0,0,0,15,160,1,0,0,0,17,166,1,0,0,0,19,173,1,0,0,
+        0,21,175,1,0,0,0,23,177,1,0,0,0,25,179,1,0,0,0,27,181,1,0,0,0,29,
+        183,1,0,0,0,31,186,1,0,0,0,33,191,1,0,0,0,35,197,1,0,0,0,37,200,
+        1,0,0,0,39,204,1,0,0,0,41,211,1,0,0,0,43,217,1,0,0,0,45,222,1,0,
+        0,0,47,224,1,0,0,0,49,232,1,0,0,0,51,239,1,0,0,0,53,245,1,0,0,0,
+        55,247,1,0,0,0,57,252,1,0,0,0,59,257,1,0,0,0,61,259,1,0,0,0,63,261,
+        1,0,0,0,65,263,1,0,0,0,67,265,1,0,0,0,69,267,1,0,0,0,71,269,1,0,
+        0,0,73,272,1,0,0,0,75,274,1,0,0,0,77,277,1,0,0,0,79,280,1,0,0,0,
+        81,283,1,0,0,0,83,286,1,0,0,0,85,289,1,0,0,0,87,293,1,0,0,0,89,299,
+        1,0,0,0,91,306,1,0,0,0,93,318,1,0,0,0,95,323,1,0,0,0,97,329,1,0,
+        0,0,99,334,1,0,0,0,101,343,1,0,0,0,103,357,1,0,0,0,105,370,1,0,0,
+        0,107,385,1,0,0,0,109,399,1,0,0,0,111,409,1,0,0,0,113,428,1,0,0,
+        0,115,433,1,0,0,0,117,457,1,0,0,0,119,469,1,0,0,0,121,492,1,0,0,
+        0,123,504,1,0,0,0,125,506,1,0,0,0,127,508,1,0,0,0,129,516,1,0,0,
+        0,131,522,1,0,0,0,133,533,1,0,0,0,135,136,5,35,0,0,136,137,5,100,
+        0,0,137,138,5,101,0,0,138,139,5,102,0,0,139,140,5,105,0,0,140,141,
+        5,110,0,0,141,142,5,101,0,0,142,2,1,0,0,0,143,144,5,40,0,0,144,4,
+        1,0,0,0,145,146,5,41,0,0,146,6,1,0,0,0,147,148,5,115,0,0,148,149,
+        5,116,0,0,149,150,5,114,0,0,150,151,5,117,0,0,151,152,5,99,0,0,152,
+        153,5,116,0,0,153,8,1,0,0,0,154,155,5,123,0,0,155,10,1,0,0,0,156,
+        157,5,125,0,0,157,12,1,0,0,0,158,159,5,59,0,0,159,14,1,0,0,0,160,
+        161,5,117,0,0,161,162,5,110,0,0,162,163,5,105,0,0,163,164,5,111,
+        0,0,164,165,5,110,0,0,165,16,1,0,0,0,166,167,5,114,0,0,167,168,5,
+        101,0,0,168,169,5,116,0,0,169,170,5,117,0,0,170,171,5,114,0,0,171,
+        172,5,110,0,0,172,18,1,0,0,0,173,174,5,61,0,0,174,20,1,0,0,0,175,
+        176,5,91,0,0,176,22,1,0,0,0,177,178,5,93,0,0,178,24,1,0,0,0,179,
+        180,5,44,0,0,180,26,1,0,0,0,181,182,5,46,0,0,182,28,1,0,0,0,183,
+        184,5,105,0,0,184,185,5,102,0,0,185,30,1,0,0,0,186,187,5,101,0,0,
+        187,188,5,108,0,0,188,189,5,115,0,0,189,190,5,101,0,0,190,32,1,0,
+        0,0,191,192,5,119,0,0,192,193,5,104,0,0,193,194,5,105,0,0,194,195,
+        5,108,0,0,195,196,5,101,0,0,196,34,1,0,0,0,197,198,5,100,0,0,198,
+        199,5,111,0,0,199,36,1,0,0,0,200,201,5,102,0,0,201,202,5,111,0,0,
+        202,203,5,114,0,0,203,38,1,0,0,0,204,205,5,115,0,0,205,206,5,119,
+        0,0,206,207,5,105,0,0,207,208,5,116,0,0,208,209,5,99,0,0,209,210,
+        5,104,0,0,210,40,1,0,0,0,211,212,5,98,0,0,212,213,5,114,0,0,213,
+        214,5,101,0,0,214,215,5,97,0,0,215,216,5,107,0,0,216,42,1,0,0,0,
+        217,218,5,99,0,0,218,219,5,97,0,0,219,220,5,115,0,0,220,221,5,101,
+        0,0,221,44,1,0,0,0,222,223,5,58,0,0,223,46,1,0,0,0,224,225,5,100,
+        0,0,225,226,5,101,0,0,226,227,5,102,0,0,227,228,5,97,0,0,228,229,
+        5,117,0,0,229,230,5,108,0,0,230,231,5,116,0,0,231,48,1,0,0,0,232,
+        233,5,112,0,0,233,234,5,114,0,0,234,235,5,105,0,0,235,236,5,110,
+        0,0,236,237,5,116,0,0,237,238,5,102,0,0,238,50,1,0,0,0,239,240,5,
+        115,0,0,240,241,5,99,0,0,241,242,5,97,0,0,242,243,5,110,0,0,243,
+        244,5,102,0,0,244,52,1,0,0,0,245,246,5,38,0,0,246,54,1,0,0,0,247,
+        248,5,103,0,0,248,249,5,101,0,0,249,250,5,116,0,0,250,251,5,115,
+        0,0,251,56,1,0,0,0,252,253,5,112,0,0,253,254,5,117,0,0,254,255,5,
+        116,0,0,255,256,5,115,0,0,256,58,1,0,0,0,257,258,5,45,0,0,258,60,
+        1,0,0,0,259,260,5,42,0,0,260,62,1,0,0,0,261,262,5,47,0,0,262,64,
+        1,0,0,0,263,264,5,37,0,0,264,66,1,0,0,0,265,266,5,43,0,0,266,68,
+        1,0,0,0,267,268,5,60,0,0,268,70,1,0,0,0,269,270,5,60,0,0,270,271,
+        5,61,0,0,271,72,1,0,0,0,272,273,5,62,0,0,273,74,1,0,0,0,274,275,
+        5,62,0,0,275,276,5,61,0,0,276,76,1,0,0,0,277,278,5,61,0,0,278,279,
+        5,61,0,0,279,78,1,0,0,0,280,281,5,33,0,0,281,282,5,61,0,0,282,80,
+        1,0,0,0,283,284,5,38,0,0,284,285,5,38,0,0,285,82,1,0,0,0,286,287,
+        5,124,0,0,287,288,5,124,0,0,288,84,1,0,0,0,289,290,5,105,0,0,290,
+        291,5,110,0,0,291,292,5,116,0,0,292,86,1,0,0,0,293,294,5,102,0,0,
+        294,295,5,108,0,0,295,296,5,111,0,0,296,297,5,97,0,0,297,298,5,116,
+        0,0,298,88,1,0,0,0,299,300,5,100,0,0,300,301,5,111,0,0,301,302,5,
+        117,0,0,302,303,5,98,0,0,303,304,5,108,0,0,304,305,5,101,0,0,305,
+        90,1,0,0,0,306,307,5,108,0,0,307,308,5,111,0,0,308,309,5,110,0,0,
+        309,310,5,103,0,0,310,311,5,32,0,0,311,312,5,100,0,0,312,313,5,111,
+        0,0,313,314,5,117,0,0,314,315,5,98,0,0,315,316,5,108,0,0,316,317,
+        5,101,0,0,317,92,1,0,0,0,318,319,5,99,0,0,319,320,5,104,0,0,320,
+        321,5,97,0,0,321,322,5,114,0,0,322,94,1,0,0,0,323,324,5,115,0,0,
+        324,325,5,104,0,0,325,326,5,111,0,0,326,327,5,114,0,0,327,328,5,
+        116,0,0,328,96,1,0,0,0,329,330,5,108,0,0,330,331,5,111,0,0,331,332,
+        5,110,0,0,332,333,5,103,0,0,333,98,1,0,0,0,334,335,5,117,0,0,335,
+        336,5,110,0,0,336,337,5,115,0,0,337,338,5,105,0,0,338,339,5,103,
+        0,0,339,340,5,110,0,0,340,341,5,101,0,0,341,342,5,100,0,0,342,100,
+        1,0,0,0,343,344,5,117,0,0,344,345,5,110,0,0,345,346,5,115,0,0,346,
+        347,5,105,0,0,347,348,5,103,0,0,348,349,5,110,0,0,349,350,5,101,
+        0,0,350,351,5,100,0,0,351,352,5,32,0,0,352,353,5,99,0,0,353,354,
+        5,104,0,0,354,355,5,97,0,0,355,356,5,114,0,0,356,102,1,0,0,0,357,
+        358,5,117,0,0,358,359,5,110,0,0,359,360,5,115,0,0,360,361,5,105,
+        0,0,361,362,5,103,0,0,362,363,5,110,0,0,363,364,5,101,0,0,364,365,
+        5,100,0,0,365,366,5,32,0,0,366,367,5,105,0,0,367,368,5,110,0,0,368,
+        369,5,116,0,0,369,104,1,0,0,0,370,371,5,117,0,0,371,372,5,110,0,
+        0,372,373,5,115,0,0,373,374,5,105,0,0,374,375,5,103,0,0,375,376,
+        5,110,0,0,376,377,5,101,0,0,377,378,5,100,0,0,378,379,5,32,0,0,379,
+        380,5,115,0,0,380,381,5,104,0,0,381,382,5,111,0,0,382,383,5,114,
+        0,0,383,384,5,116,0,0,384,106,1,0,0,0,385,386,5,117,0,0,386,387,
+        5,110,0,0,387,388,5,115,0,0,388,389,5,105,0,0,389,390,5,103,0,0,
+        390,391,5,110,0,0,391,392,5,101,0,0,392,393,5,100,0,0,393,394,5,
+        32,0,0,394,395,5,108,0,0,395,396,5,111,0,0,396,397,5,110,0,0,397,
+        398,5,103,0,0,398,108,1,0,0,0,399,400,5,108,0,0,400,401,5,111,0,
+        0,401,402,5,110,0,0,402,403,5,103,0,0,403,404,5,32,0,0,404,405,5,
+        108,0,0,405,406,5,111,0,0,406,407,5,110,0,0,407,408,5,103,0,0,408,
+        110,1,0,0,0,409,410,5,117,0,0,410,411,5,110,0,0,411,412,5,115,0,
+        0,412,413,5,105,0,0,413,414,5,103,0,0,414,415,5,110,0,0,415,416,
+        5,101,0,0,416,417,5,100,0,0,417,418,5,32,0,0,418,419,5,108,0,0,419,
+        420,5,111,0,0,420,421,5,110,0,0,421,422,5,103,0,0,422,423,5,32,0,
+        0,423,424,5,108,0,0,424,425,5,111,0,0,425,426,5,110,0,0,426,427,
+        5,103,0,0,427,112,1,0,0,0,428,429,5,118,0,0,429,430,5,111,0,0,430,
+        431,5,105,0,0,431,432,5,100,0,0,432,114,1,0,0,0,433,434,5,35,0,0,
+        434,435,5,105,0,0,435,436,5,110,0,0,436,437,5,99,0,0,437,438,5,108,
+        0,0,438,439,5,117,0,0,439,440,5,100,0,0,440,441,5,101,0,0,441,445,
+        1,0,0,0,442,444,7,0,0,0,443,442,1,0,0,0,444,447,1,0,0,0,445,443,
+        1,0,0,0,445,446,1,0,0,0,446,448,1,0,0,0,447,445,1,0,0,0,448,450,
+        5,60,0,0,449,451,8,1,0,0,450,449,1,0,0,0,451,452,1,0,0,0,452,450,
+        1,0,0,0,452,453,1,0,0,0,453,454,1,0,0,0,454,455,5,62,0,0,455,116,
+        1,0,0,0,456,458,7,2,0,0,457,456,1,0,0,0,458,459,1,0,0,0,459,457,
+        1,0,0,0,459,460,1,0,0,0,460,467,1,0,0,0,461,463,5,46,0,0,462,464,
+        7,2,0,0,463,462,1,0,0,0,464,465,1,0,0,0,465,463,1,0,0,0,465,466,
+        1,0,0,0,466,468,1,0,0,0,467,461,1,0,0,0,467,468,1,0,0,0,468,118,
+        1,0,0,0,469,470,5,39,0,0,470,471,8,3,0,0,471,472,5,39,0,0,472,120,
+        1,0,0,0,473,478,5,34,0,0,474,477,3,123,61,0,475,477,8,4,0,0,476,
+        474,1,0,0,0,476,475,1,0,0,0,477,480,1,0,0,0,478,476,1,0,0,0,478,
+        479,1,0,0,0,479,481,1,0,0,0,480,478,1,0,0,0,481,493,5,34,0,0,482,
+        488,5,34,0,0,483,487,8,4,0,0,484,485,5,92,0,0,485,487,9,0,0,0,486,
+        483,1,0,0,0,486,484,1,0,0,0,487,490,1,0,0,0,488,486,1,0,0,0,488,
+        489,1,0,0,0,489,491,1,0,0,0,490,488,1,0,0,0,491,493,5,34,0,0,492,
+        473,1,0,0,0,492,482,1,0,0,0,493,122,1,0,0,0,494,495,5,92,0,0,495,
+        505,7,5,0,0,496,497,5,92,0,0,497,498,5,117,0,0,498,499,1,0,0,0,499,
+        500,3,125,62,0,500,501,3,125,62,0,501,502,3,125,62,0,502,503,3,125,
+        62,0,503,505,1,0,0,0,504,494,1,0,0,0,504,496,1,0,0,0,505,124,1,0,
+        0,0,506,507,7,6,0,0,507,126,1,0,0,0,508,512,7,7,0,0,509,511,7,8,
+        0,0,510,509,1,0,0,0,511,514,1,0,0,0,512,510,1,0,0,0,512,513,1,0,
+        0,0,513,128,1,0,0,0,514,512,1,0,0,0,515,517,7,9,0,0,516,515,1,0,
+        0,0,517,518,1,0,0,0,518,516,1,0,0,0,518,519,1,0,0,0,519,520,1,0,
+        0,0,520,521,6,64,0,0,521,130,1,0,0,0,522,523,5,47,0,0,523,524,5,
+        47,0,0,524,528,1,0,0,0,525,527,8,10,0,0,526,525,1,0,0,0,527,530,
+        1,0,0,0,528,526,1,0,0,0,528,529,1,0,0,0,529,531,1,0,0,0,530,528,
+        1,0,0,0,531,532,6,65,0,0,532,132,1,0,0,0,533,534,5,47,0,0,534,535,
+        5,42,0,0,535,539,1,0,0,0,536,538,9,0,0,0,537,536,1,0,0,0,538,541,
+        1,0,0,0,539,540,1,0,0,0,539,537,1,0,0,0,540,542,1,0,0,0,541,539,
+        1,0,0,0,542,543,5,42,0,0,543,544,5,47,0,0,544,545,1,0,0,0,545,546,
+        6,66,0,0,546,134,1,0,0,0,16,0,445,452,459,465,467,476,478,486,488,
+        492,504,512,518,528,539,1,6,0,0
     ]
 
 class CLexer(Lexer):
@@ -269,28 +271,27 @@ class CLexer(Lexer):
     T__54 = 55
     T__55 = 56
     T__56 = 57
-    T__57 = 58
-    IncludeFile = 59
-    Number = 60
-    CharLiteral = 61
-    StringLiteral = 62
-    Identifier = 63
-    WS = 64
-    COMMENT = 65
-    MULTILINE_COMMENT = 66
+    IncludeFile = 58
+    Number = 59
+    CharLiteral = 60
+    StringLiteral = 61
+    Identifier = 62
+    WS = 63
+    COMMENT = 64
+    MULTILINE_COMMENT = 65
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
     modeNames = [ "DEFAULT_MODE" ]
 
     literalNames = [ "<INVALID>",
-            "'#include'", "'#define'", "'('", "')'", "'struct'", "'{'", 
-            "'}'", "';'", "'union'", "'return'", "'='", "'['", "']'", "','", 
-            "'.'", "'if'", "'else'", "'while'", "'do'", "'for'", "'switch'", 
-            "'break'", "'case'", "':'", "'default'", "'printf'", "'scanf'", 
-            "'&'", "'gets'", "'puts'", "'-'", "'*'", "'/'", "'%'", "'+'", 
-            "'<'", "'<='", "'>'", "'>='", "'=='", "'!='", "'&&'", "'||'", 
-            "'int'", "'float'", "'double'", "'long double'", "'char'", "'short'", 
+            "'#define'", "'('", "')'", "'struct'", "'{'", "'}'", "';'", 
+            "'union'", "'return'", "'='", "'['", "']'", "','", "'.'", "'if'", 
+            "'else'", "'while'", "'do'", "'for'", "'switch'", "'break'", 
+            "'case'", "':'", "'default'", "'printf'", "'scanf'", "'&'", 
+            "'gets'", "'puts'", "'-'", "'*'", "'/'", "'%'", "'+'", "'<'", 
+            "'<='", "'>'", "'>='", "'=='", "'!='", "'&&'", "'||'", "'int'", 
+            "'float'", "'double'", "'long double'", "'char'", "'short'", 
             "'long'", "'unsigned'", "'unsigned char'", "'unsigned int'", 
             "'unsigned short'", "'unsigned long'", "'long long'", "'unsigned long long'", 
             "'void'" ]
@@ -308,9 +309,9 @@ class CLexer(Lexer):
                   "T__38", "T__39", "T__40", "T__41", "T__42", "T__43", 
                   "T__44", "T__45", "T__46", "T__47", "T__48", "T__49", 
                   "T__50", "T__51", "T__52", "T__53", "T__54", "T__55", 
-                  "T__56", "T__57", "IncludeFile", "Number", "CharLiteral", 
-                  "StringLiteral", "ESCAPED_CHAR", "HEX", "Identifier", 
-                  "WS", "COMMENT", "MULTILINE_COMMENT" ]
+                  "T__56", "IncludeFile", "Number", "CharLiteral", "StringLiteral", 
+                  "ESCAPED_CHAR", "HEX", "Identifier", "WS", "COMMENT", 
+                  "MULTILINE_COMMENT" ]
 
     grammarFileName = "C.g4"
 
@@ -62,15 +62,6 @@ class CListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by CParser#returnStatement.
-    def enterReturnStatement(self, ctx:CParser.ReturnStatementContext):
-        pass
-
-    # Exit a parse tree produced by CParser#returnStatement.
-    def exitReturnStatement(self, ctx:CParser.ReturnStatementContext):
-        pass
-
-
     # Enter a parse tree produced by CParser#block.
     def enterBlock(self, ctx:CParser.BlockContext):
         pass
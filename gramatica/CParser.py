@@ -10,166 +10,162 @@ else:
 
 def serializedATN():
     return [
-        4,1,66,432,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        4,1,65,422,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
         6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
         2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,19,2,20,
         7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,26,7,26,
-        2,27,7,27,2,28,7,28,2,29,7,29,2,30,7,30,1,0,1,0,1,0,1,0,1,0,5,0,
-        68,8,0,10,0,12,0,71,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,3,1,80,8,1,1,
-        2,1,2,1,2,1,2,3,2,86,8,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,5,3,95,8,3,
-        10,3,12,3,98,9,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,5,4,107,8,4,10,4,12,
-        4,110,9,4,1,4,1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,
-        5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,3,5,133,8,5,1,5,3,5,136,8,5,1,6,1,
-        6,3,6,140,8,6,1,6,1,6,1,7,1,7,5,7,146,8,7,10,7,12,7,149,9,7,1,7,
-        1,7,1,8,1,8,1,8,3,8,156,8,8,1,8,1,8,3,8,160,8,8,1,8,1,8,1,9,1,9,
-        3,9,166,8,9,1,9,1,9,1,10,1,10,3,10,172,8,10,1,11,1,11,1,11,1,11,
-        5,11,178,8,11,10,11,12,11,181,9,11,1,11,1,11,1,12,1,12,1,12,5,12,
-        188,8,12,10,12,12,12,191,9,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,
+        2,27,7,27,2,28,7,28,2,29,7,29,1,0,1,0,1,0,1,0,1,0,5,0,66,8,0,10,
+        0,12,0,69,9,0,1,0,1,0,1,1,1,1,1,1,1,1,3,1,77,8,1,1,2,1,2,1,2,1,2,
+        3,2,83,8,2,1,2,1,2,1,2,1,3,1,3,1,3,1,3,5,3,92,8,3,10,3,12,3,95,9,
+        3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,5,4,104,8,4,10,4,12,4,107,9,4,1,4,
+        1,4,1,4,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,1,5,
+        1,5,1,5,1,5,1,5,3,5,130,8,5,1,5,3,5,133,8,5,1,6,1,6,5,6,137,8,6,
+        10,6,12,6,140,9,6,1,6,1,6,1,7,1,7,1,7,3,7,147,8,7,1,7,1,7,3,7,151,
+        8,7,1,7,1,7,1,8,1,8,3,8,157,8,8,1,8,1,8,1,9,1,9,3,9,163,8,9,1,10,
+        1,10,1,10,1,10,5,10,169,8,10,10,10,12,10,172,9,10,1,10,1,10,1,11,
+        1,11,1,11,5,11,179,8,11,10,11,12,11,182,9,11,1,11,1,11,1,11,1,11,
+        1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,3,11,196,8,11,1,12,1,12,
         1,12,1,12,1,12,1,12,1,12,3,12,205,8,12,1,13,1,13,1,13,1,13,1,13,
-        1,13,1,13,3,13,214,8,13,1,14,1,14,1,14,1,14,1,14,1,14,1,15,1,15,
-        1,15,1,15,1,15,1,15,1,15,1,15,1,16,1,16,1,16,1,16,1,17,1,17,1,17,
-        1,17,3,17,238,8,17,1,17,1,17,3,17,242,8,17,1,17,1,17,3,17,246,8,
-        17,1,17,1,17,1,17,1,18,1,18,1,18,1,18,1,18,1,18,1,18,5,18,258,8,
-        18,10,18,12,18,261,9,18,1,18,1,18,1,19,1,19,1,19,1,20,1,20,1,20,
-        1,20,1,21,1,21,1,21,1,22,1,22,5,22,277,8,22,10,22,12,22,280,9,22,
-        1,22,3,22,283,8,22,1,23,1,23,5,23,287,8,23,10,23,12,23,290,9,23,
-        1,23,3,23,293,8,23,1,24,1,24,1,24,3,24,298,8,24,1,24,1,24,1,25,1,
-        25,1,25,1,25,1,25,3,25,307,8,25,1,26,1,26,1,26,1,26,1,26,5,26,314,
-        8,26,10,26,12,26,317,9,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,5,26,
-        326,8,26,10,26,12,26,329,9,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,
-        1,26,1,26,3,26,340,8,26,1,26,3,26,343,8,26,1,27,1,27,1,27,1,27,1,
-        27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,5,27,361,
-        8,27,10,27,12,27,364,9,27,1,27,3,27,367,8,27,1,27,1,27,1,27,1,27,
-        1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,27,
-        1,27,5,27,387,8,27,10,27,12,27,390,9,27,1,28,1,28,1,28,5,28,395,
-        8,28,10,28,12,28,398,9,28,1,29,1,29,1,29,1,29,1,29,1,29,5,29,406,
-        8,29,10,29,12,29,409,9,29,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,
-        1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,30,3,30,430,
-        8,30,1,30,0,1,54,31,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,
-        34,36,38,40,42,44,46,48,50,52,54,56,58,60,0,5,1,0,32,34,2,0,31,31,
-        35,35,1,0,36,39,1,0,40,41,1,0,42,43,482,0,69,1,0,0,0,2,79,1,0,0,
-        0,4,81,1,0,0,0,6,90,1,0,0,0,8,102,1,0,0,0,10,135,1,0,0,0,12,137,
-        1,0,0,0,14,143,1,0,0,0,16,152,1,0,0,0,18,163,1,0,0,0,20,171,1,0,
-        0,0,22,173,1,0,0,0,24,204,1,0,0,0,26,206,1,0,0,0,28,215,1,0,0,0,
-        30,221,1,0,0,0,32,229,1,0,0,0,34,233,1,0,0,0,36,250,1,0,0,0,38,264,
-        1,0,0,0,40,267,1,0,0,0,42,271,1,0,0,0,44,274,1,0,0,0,46,284,1,0,
-        0,0,48,294,1,0,0,0,50,301,1,0,0,0,52,342,1,0,0,0,54,366,1,0,0,0,
-        56,391,1,0,0,0,58,399,1,0,0,0,60,429,1,0,0,0,62,68,3,2,1,0,63,68,
-        3,4,2,0,64,68,3,6,3,0,65,68,3,8,4,0,66,68,3,10,5,0,67,62,1,0,0,0,
-        67,63,1,0,0,0,67,64,1,0,0,0,67,65,1,0,0,0,67,66,1,0,0,0,68,71,1,
-        0,0,0,69,67,1,0,0,0,69,70,1,0,0,0,70,72,1,0,0,0,71,69,1,0,0,0,72,
-        73,5,0,0,1,73,1,1,0,0,0,74,75,5,1,0,0,75,80,5,59,0,0,76,77,5,2,0,
-        0,77,78,5,63,0,0,78,80,3,54,27,0,79,74,1,0,0,0,79,76,1,0,0,0,80,
-        3,1,0,0,0,81,82,3,60,30,0,82,83,5,63,0,0,83,85,5,3,0,0,84,86,3,58,
-        29,0,85,84,1,0,0,0,85,86,1,0,0,0,86,87,1,0,0,0,87,88,5,4,0,0,88,
-        89,3,14,7,0,89,5,1,0,0,0,90,91,5,5,0,0,91,92,5,63,0,0,92,96,5,6,
-        0,0,93,95,3,16,8,0,94,93,1,0,0,0,95,98,1,0,0,0,96,94,1,0,0,0,96,
-        97,1,0,0,0,97,99,1,0,0,0,98,96,1,0,0,0,99,100,5,7,0,0,100,101,5,
-        8,0,0,101,7,1,0,0,0,102,103,5,9,0,0,103,104,5,63,0,0,104,108,5,6,
-        0,0,105,107,3,16,8,0,106,105,1,0,0,0,107,110,1,0,0,0,108,106,1,0,
-        0,0,108,109,1,0,0,0,109,111,1,0,0,0,110,108,1,0,0,0,111,112,5,7,
-        0,0,112,113,5,8,0,0,113,9,1,0,0,0,114,136,3,16,8,0,115,136,3,24,
-        12,0,116,136,3,26,13,0,117,136,3,28,14,0,118,136,3,30,15,0,119,136,
-        3,34,17,0,120,136,3,36,18,0,121,122,3,48,24,0,122,123,5,8,0,0,123,
-        136,1,0,0,0,124,125,3,52,26,0,125,126,5,8,0,0,126,136,1,0,0,0,127,
-        136,5,8,0,0,128,136,3,14,7,0,129,136,3,38,19,0,130,132,5,10,0,0,
-        131,133,3,54,27,0,132,131,1,0,0,0,132,133,1,0,0,0,133,134,1,0,0,
-        0,134,136,5,8,0,0,135,114,1,0,0,0,135,115,1,0,0,0,135,116,1,0,0,
-        0,135,117,1,0,0,0,135,118,1,0,0,0,135,119,1,0,0,0,135,120,1,0,0,
-        0,135,121,1,0,0,0,135,124,1,0,0,0,135,127,1,0,0,0,135,128,1,0,0,
-        0,135,129,1,0,0,0,135,130,1,0,0,0,136,11,1,0,0,0,137,139,5,10,0,
-        0,138,140,3,54,27,0,139,138,1,0,0,0,139,140,1,0,0,0,140,141,1,0,
-        0,0,141,142,5,8,0,0,142,13,1,0,0,0,143,147,5,6,0,0,144,146,3,10,
-        5,0,145,144,1,0,0,0,146,149,1,0,0,0,147,145,1,0,0,0,147,148,1,0,
-        0,0,148,150,1,0,0,0,149,147,1,0,0,0,150,151,5,7,0,0,151,15,1,0,0,
-        0,152,153,3,60,30,0,153,155,5,63,0,0,154,156,3,18,9,0,155,154,1,
-        0,0,0,155,156,1,0,0,0,156,159,1,0,0,0,157,158,5,11,0,0,158,160,3,
-        20,10,0,159,157,1,0,0,0,159,160,1,0,0,0,160,161,1,0,0,0,161,162,
-        5,8,0,0,162,17,1,0,0,0,163,165,5,12,0,0,164,166,5,60,0,0,165,164,
-        1,0,0,0,165,166,1,0,0,0,166,167,1,0,0,0,167,168,5,13,0,0,168,19,
-        1,0,0,0,169,172,3,54,27,0,170,172,3,22,11,0,171,169,1,0,0,0,171,
-        170,1,0,0,0,172,21,1,0,0,0,173,174,5,6,0,0,174,179,3,54,27,0,175,
-        176,5,14,0,0,176,178,3,54,27,0,177,175,1,0,0,0,178,181,1,0,0,0,179,
-        177,1,0,0,0,179,180,1,0,0,0,180,182,1,0,0,0,181,179,1,0,0,0,182,
-        183,5,7,0,0,183,23,1,0,0,0,184,189,5,63,0,0,185,186,5,15,0,0,186,
-        188,5,63,0,0,187,185,1,0,0,0,188,191,1,0,0,0,189,187,1,0,0,0,189,
-        190,1,0,0,0,190,192,1,0,0,0,191,189,1,0,0,0,192,193,5,11,0,0,193,
-        194,3,54,27,0,194,195,5,8,0,0,195,205,1,0,0,0,196,197,5,63,0,0,197,
-        198,5,12,0,0,198,199,3,54,27,0,199,200,5,13,0,0,200,201,5,11,0,0,
-        201,202,3,54,27,0,202,203,5,8,0,0,203,205,1,0,0,0,204,184,1,0,0,
-        0,204,196,1,0,0,0,205,25,1,0,0,0,206,207,5,16,0,0,207,208,5,3,0,
-        0,208,209,3,54,27,0,209,210,5,4,0,0,210,213,3,10,5,0,211,212,5,17,
-        0,0,212,214,3,10,5,0,213,211,1,0,0,0,213,214,1,0,0,0,214,27,1,0,
-        0,0,215,216,5,18,0,0,216,217,5,3,0,0,217,218,3,54,27,0,218,219,5,
-        4,0,0,219,220,3,10,5,0,220,29,1,0,0,0,221,222,5,19,0,0,222,223,3,
-        10,5,0,223,224,5,18,0,0,224,225,5,3,0,0,225,226,3,54,27,0,226,227,
-        5,4,0,0,227,228,5,8,0,0,228,31,1,0,0,0,229,230,5,63,0,0,230,231,
-        5,11,0,0,231,232,3,54,27,0,232,33,1,0,0,0,233,234,5,20,0,0,234,237,
-        5,3,0,0,235,238,3,16,8,0,236,238,3,32,16,0,237,235,1,0,0,0,237,236,
-        1,0,0,0,237,238,1,0,0,0,238,239,1,0,0,0,239,241,5,8,0,0,240,242,
-        3,54,27,0,241,240,1,0,0,0,241,242,1,0,0,0,242,243,1,0,0,0,243,245,
-        5,8,0,0,244,246,3,32,16,0,245,244,1,0,0,0,245,246,1,0,0,0,246,247,
-        1,0,0,0,247,248,5,4,0,0,248,249,3,10,5,0,249,35,1,0,0,0,250,251,
-        5,21,0,0,251,252,5,3,0,0,252,253,3,54,27,0,253,254,5,4,0,0,254,259,
-        5,6,0,0,255,258,3,44,22,0,256,258,3,46,23,0,257,255,1,0,0,0,257,
-        256,1,0,0,0,258,261,1,0,0,0,259,257,1,0,0,0,259,260,1,0,0,0,260,
-        262,1,0,0,0,261,259,1,0,0,0,262,263,5,7,0,0,263,37,1,0,0,0,264,265,
-        5,22,0,0,265,266,5,8,0,0,266,39,1,0,0,0,267,268,5,23,0,0,268,269,
-        3,54,27,0,269,270,5,24,0,0,270,41,1,0,0,0,271,272,5,25,0,0,272,273,
-        5,24,0,0,273,43,1,0,0,0,274,278,3,40,20,0,275,277,3,10,5,0,276,275,
-        1,0,0,0,277,280,1,0,0,0,278,276,1,0,0,0,278,279,1,0,0,0,279,282,
-        1,0,0,0,280,278,1,0,0,0,281,283,3,38,19,0,282,281,1,0,0,0,282,283,
-        1,0,0,0,283,45,1,0,0,0,284,288,3,42,21,0,285,287,3,10,5,0,286,285,
-        1,0,0,0,287,290,1,0,0,0,288,286,1,0,0,0,288,289,1,0,0,0,289,292,
-        1,0,0,0,290,288,1,0,0,0,291,293,3,38,19,0,292,291,1,0,0,0,292,293,
-        1,0,0,0,293,47,1,0,0,0,294,295,5,63,0,0,295,297,5,3,0,0,296,298,
-        3,56,28,0,297,296,1,0,0,0,297,298,1,0,0,0,298,299,1,0,0,0,299,300,
-        5,4,0,0,300,49,1,0,0,0,301,306,5,63,0,0,302,303,5,12,0,0,303,304,
-        3,54,27,0,304,305,5,13,0,0,305,307,1,0,0,0,306,302,1,0,0,0,306,307,
-        1,0,0,0,307,51,1,0,0,0,308,309,5,26,0,0,309,310,5,3,0,0,310,315,
-        5,62,0,0,311,312,5,14,0,0,312,314,3,54,27,0,313,311,1,0,0,0,314,
-        317,1,0,0,0,315,313,1,0,0,0,315,316,1,0,0,0,316,318,1,0,0,0,317,
-        315,1,0,0,0,318,343,5,4,0,0,319,320,5,27,0,0,320,321,5,3,0,0,321,
-        327,5,62,0,0,322,323,5,14,0,0,323,324,5,28,0,0,324,326,3,50,25,0,
-        325,322,1,0,0,0,326,329,1,0,0,0,327,325,1,0,0,0,327,328,1,0,0,0,
-        328,330,1,0,0,0,329,327,1,0,0,0,330,343,5,4,0,0,331,332,5,29,0,0,
-        332,333,5,3,0,0,333,334,5,63,0,0,334,343,5,4,0,0,335,336,5,30,0,
-        0,336,339,5,3,0,0,337,340,5,62,0,0,338,340,3,54,27,0,339,337,1,0,
-        0,0,339,338,1,0,0,0,340,341,1,0,0,0,341,343,5,4,0,0,342,308,1,0,
-        0,0,342,319,1,0,0,0,342,331,1,0,0,0,342,335,1,0,0,0,343,53,1,0,0,
-        0,344,345,6,27,-1,0,345,346,5,3,0,0,346,347,3,54,27,0,347,348,5,
-        4,0,0,348,367,1,0,0,0,349,350,5,31,0,0,350,367,3,54,27,13,351,367,
-        5,63,0,0,352,367,5,60,0,0,353,367,5,62,0,0,354,367,5,61,0,0,355,
-        362,5,63,0,0,356,357,5,12,0,0,357,358,3,54,27,0,358,359,5,13,0,0,
-        359,361,1,0,0,0,360,356,1,0,0,0,361,364,1,0,0,0,362,360,1,0,0,0,
-        362,363,1,0,0,0,363,367,1,0,0,0,364,362,1,0,0,0,365,367,3,48,24,
-        0,366,344,1,0,0,0,366,349,1,0,0,0,366,351,1,0,0,0,366,352,1,0,0,
-        0,366,353,1,0,0,0,366,354,1,0,0,0,366,355,1,0,0,0,366,365,1,0,0,
-        0,367,388,1,0,0,0,368,369,10,12,0,0,369,370,7,0,0,0,370,387,3,54,
-        27,13,371,372,10,11,0,0,372,373,7,1,0,0,373,387,3,54,27,12,374,375,
-        10,10,0,0,375,376,7,2,0,0,376,387,3,54,27,11,377,378,10,9,0,0,378,
-        379,7,3,0,0,379,387,3,54,27,10,380,381,10,8,0,0,381,382,7,4,0,0,
-        382,387,3,54,27,9,383,384,10,3,0,0,384,385,5,15,0,0,385,387,5,63,
-        0,0,386,368,1,0,0,0,386,371,1,0,0,0,386,374,1,0,0,0,386,377,1,0,
-        0,0,386,380,1,0,0,0,386,383,1,0,0,0,387,390,1,0,0,0,388,386,1,0,
-        0,0,388,389,1,0,0,0,389,55,1,0,0,0,390,388,1,0,0,0,391,396,3,54,
-        27,0,392,393,5,14,0,0,393,395,3,54,27,0,394,392,1,0,0,0,395,398,
-        1,0,0,0,396,394,1,0,0,0,396,397,1,0,0,0,397,57,1,0,0,0,398,396,1,
-        0,0,0,399,400,3,60,30,0,400,407,5,63,0,0,401,402,5,14,0,0,402,403,
-        3,60,30,0,403,404,5,63,0,0,404,406,1,0,0,0,405,401,1,0,0,0,406,409,
-        1,0,0,0,407,405,1,0,0,0,407,408,1,0,0,0,408,59,1,0,0,0,409,407,1,
-        0,0,0,410,430,5,44,0,0,411,430,5,45,0,0,412,430,5,46,0,0,413,430,
-        5,47,0,0,414,430,5,48,0,0,415,430,5,49,0,0,416,430,5,50,0,0,417,
-        430,5,51,0,0,418,430,5,52,0,0,419,430,5,53,0,0,420,430,5,54,0,0,
-        421,430,5,55,0,0,422,430,5,56,0,0,423,430,5,57,0,0,424,425,5,5,0,
-        0,425,430,5,63,0,0,426,427,5,9,0,0,427,430,5,63,0,0,428,430,5,58,
-        0,0,429,410,1,0,0,0,429,411,1,0,0,0,429,412,1,0,0,0,429,413,1,0,
-        0,0,429,414,1,0,0,0,429,415,1,0,0,0,429,416,1,0,0,0,429,417,1,0,
-        0,0,429,418,1,0,0,0,429,419,1,0,0,0,429,420,1,0,0,0,429,421,1,0,
-        0,0,429,422,1,0,0,0,429,423,1,0,0,0,429,424,1,0,0,0,429,426,1,0,
-        0,0,429,428,1,0,0,0,430,61,1,0,0,0,40,67,69,79,85,96,108,132,135,
-        139,147,155,159,165,171,179,189,204,213,237,241,245,257,259,278,
-        282,288,292,297,306,315,327,339,342,362,366,386,388,396,407,429
+        1,13,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,15,1,15,1,15,1,15,
+        1,16,1,16,1,16,1,16,3,16,229,8,16,1,16,1,16,3,16,233,8,16,1,16,1,
+        16,3,16,237,8,16,1,16,1,16,1,16,1,17,1,17,1,17,1,17,1,17,1,17,1,
+        17,5,17,249,8,17,10,17,12,17,252,9,17,1,17,1,17,1,18,1,18,1,18,1,
+        19,1,19,1,19,1,19,1,20,1,20,1,20,1,21,1,21,5,21,268,8,21,10,21,12,
+        21,271,9,21,1,21,3,21,274,8,21,1,22,1,22,5,22,278,8,22,10,22,12,
+        22,281,9,22,1,22,3,22,284,8,22,1,23,1,23,1,23,3,23,289,8,23,1,23,
+        1,23,1,24,1,24,1,24,1,24,1,24,3,24,298,8,24,1,25,1,25,1,25,1,25,
+        1,25,5,25,305,8,25,10,25,12,25,308,9,25,1,25,1,25,1,25,1,25,1,25,
+        1,25,1,25,5,25,317,8,25,10,25,12,25,320,9,25,1,25,1,25,1,25,1,25,
+        1,25,1,25,1,25,1,25,1,25,3,25,331,8,25,1,25,3,25,334,8,25,1,26,1,
+        26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,
+        26,5,26,351,8,26,10,26,12,26,354,9,26,1,26,3,26,357,8,26,1,26,1,
+        26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,
+        26,1,26,1,26,1,26,5,26,377,8,26,10,26,12,26,380,9,26,1,27,1,27,1,
+        27,5,27,385,8,27,10,27,12,27,388,9,27,1,28,1,28,1,28,1,28,1,28,1,
+        28,5,28,396,8,28,10,28,12,28,399,9,28,1,29,1,29,1,29,1,29,1,29,1,
+        29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,
+        29,3,29,420,8,29,1,29,0,1,52,30,0,2,4,6,8,10,12,14,16,18,20,22,24,
+        26,28,30,32,34,36,38,40,42,44,46,48,50,52,54,56,58,0,5,1,0,31,33,
+        2,0,30,30,34,34,1,0,35,38,1,0,39,40,1,0,41,42,471,0,67,1,0,0,0,2,
+        76,1,0,0,0,4,78,1,0,0,0,6,87,1,0,0,0,8,99,1,0,0,0,10,132,1,0,0,0,
+        12,134,1,0,0,0,14,143,1,0,0,0,16,154,1,0,0,0,18,162,1,0,0,0,20,164,
+        1,0,0,0,22,195,1,0,0,0,24,197,1,0,0,0,26,206,1,0,0,0,28,212,1,0,
+        0,0,30,220,1,0,0,0,32,224,1,0,0,0,34,241,1,0,0,0,36,255,1,0,0,0,
+        38,258,1,0,0,0,40,262,1,0,0,0,42,265,1,0,0,0,44,275,1,0,0,0,46,285,
+        1,0,0,0,48,292,1,0,0,0,50,333,1,0,0,0,52,356,1,0,0,0,54,381,1,0,
+        0,0,56,389,1,0,0,0,58,419,1,0,0,0,60,66,3,2,1,0,61,66,3,4,2,0,62,
+        66,3,6,3,0,63,66,3,8,4,0,64,66,3,10,5,0,65,60,1,0,0,0,65,61,1,0,
+        0,0,65,62,1,0,0,0,65,63,1,0,0,0,65,64,1,0,0,0,66,69,1,0,0,0,67,65,
+        1,0,0,0,67,68,1,0,0,0,68,70,1,0,0,0,69,67,1,0,0,0,70,71,5,0,0,1,
+        71,1,1,0,0,0,72,77,5,58,0,0,73,74,5,1,0,0,74,75,5,62,0,0,75,77,3,
+        52,26,0,76,72,1,0,0,0,76,73,1,0,0,0,77,3,1,0,0,0,78,79,3,58,29,0,
+        79,80,5,62,0,0,80,82,5,2,0,0,81,83,3,56,28,0,82,81,1,0,0,0,82,83,
+        1,0,0,0,83,84,1,0,0,0,84,85,5,3,0,0,85,86,3,12,6,0,86,5,1,0,0,0,
+        87,88,5,4,0,0,88,89,5,62,0,0,89,93,5,5,0,0,90,92,3,14,7,0,91,90,
+        1,0,0,0,92,95,1,0,0,0,93,91,1,0,0,0,93,94,1,0,0,0,94,96,1,0,0,0,
+        95,93,1,0,0,0,96,97,5,6,0,0,97,98,5,7,0,0,98,7,1,0,0,0,99,100,5,
+        8,0,0,100,101,5,62,0,0,101,105,5,5,0,0,102,104,3,14,7,0,103,102,
+        1,0,0,0,104,107,1,0,0,0,105,103,1,0,0,0,105,106,1,0,0,0,106,108,
+        1,0,0,0,107,105,1,0,0,0,108,109,5,6,0,0,109,110,5,7,0,0,110,9,1,
+        0,0,0,111,133,3,14,7,0,112,133,3,22,11,0,113,133,3,24,12,0,114,133,
+        3,26,13,0,115,133,3,28,14,0,116,133,3,32,16,0,117,133,3,34,17,0,
+        118,119,3,46,23,0,119,120,5,7,0,0,120,133,1,0,0,0,121,122,3,50,25,
+        0,122,123,5,7,0,0,123,133,1,0,0,0,124,133,5,7,0,0,125,133,3,12,6,
+        0,126,133,3,36,18,0,127,129,5,9,0,0,128,130,3,52,26,0,129,128,1,
+        0,0,0,129,130,1,0,0,0,130,131,1,0,0,0,131,133,5,7,0,0,132,111,1,
+        0,0,0,132,112,1,0,0,0,132,113,1,0,0,0,132,114,1,0,0,0,132,115,1,
+        0,0,0,132,116,1,0,0,0,132,117,1,0,0,0,132,118,1,0,0,0,132,121,1,
+        0,0,0,132,124,1,0,0,0,132,125,1,0,0,0,132,126,1,0,0,0,132,127,1,
+        0,0,0,133,11,1,0,0,0,134,138,5,5,0,0,135,137,3,10,5,0,136,135,1,
+        0,0,0,137,140,1,0,0,0,138,136,1,0,0,0,138,139,1,0,0,0,139,141,1,
+        0,0,0,140,138,1,0,0,0,141,142,5,6,0,0,142,13,1,0,0,0,143,144,3,58,
+        29,0,144,146,5,62,0,0,145,147,3,16,8,0,146,145,1,0,0,0,146,147,1,
+        0,0,0,147,150,1,0,0,0,148,149,5,10,0,0,149,151,3,18,9,0,150,148,
+        1,0,0,0,150,151,1,0,0,0,151,152,1,0,0,0,152,153,5,7,0,0,153,15,1,
+        0,0,0,154,156,5,11,0,0,155,157,5,59,0,0,156,155,1,0,0,0,156,157,
+        1,0,0,0,157,158,1,0,0,0,158,159,5,12,0,0,159,17,1,0,0,0,160,163,
+        3,52,26,0,161,163,3,20,10,0,162,160,1,0,0,0,162,161,1,0,0,0,163,
+        19,1,0,0,0,164,165,5,5,0,0,165,170,3,52,26,0,166,167,5,13,0,0,167,
+        169,3,52,26,0,168,166,1,0,0,0,169,172,1,0,0,0,170,168,1,0,0,0,170,
+        171,1,0,0,0,171,173,1,0,0,0,172,170,1,0,0,0,173,174,5,6,0,0,174,
+        21,1,0,0,0,175,180,5,62,0,0,176,177,5,14,0,0,177,179,5,62,0,0,178,
+        176,1,0,0,0,179,182,1,0,0,0,180,178,1,0,0,0,180,181,1,0,0,0,181,
+        183,1,0,0,0,182,180,1,0,0,0,183,184,5,10,0,0,184,185,3,52,26,0,185,
+        186,5,7,0,0,186,196,1,0,0,0,187,188,5,62,0,0,188,189,5,11,0,0,189,
+        190,3,52,26,0,190,191,5,12,0,0,191,192,5,10,0,0,192,193,3,52,26,
+        0,193,194,5,7,0,0,194,196,1,0,0,0,195,175,1,0,0,0,195,187,1,0,0,
+        0,196,23,1,0,0,0,197,198,5,15,0,0,198,199,5,2,0,0,199,200,3,52,26,
+        0,200,201,5,3,0,0,201,204,3,10,5,0,202,203,5,16,0,0,203,205,3,10,
+        5,0,204,202,1,0,0,0,204,205,1,0,0,0,205,25,1,0,0,0,206,207,5,17,
+        0,0,207,208,5,2,0,0,208,209,3,52,26,0,209,210,5,3,0,0,210,211,3,
+        10,5,0,211,27,1,0,0,0,212,213,5,18,0,0,213,214,3,10,5,0,214,215,
+        5,17,0,0,215,216,5,2,0,0,216,217,3,52,26,0,217,218,5,3,0,0,218,219,
+        5,7,0,0,219,29,1,0,0,0,220,221,5,62,0,0,221,222,5,10,0,0,222,223,
+        3,52,26,0,223,31,1,0,0,0,224,225,5,19,0,0,225,228,5,2,0,0,226,229,
+        3,14,7,0,227,229,3,30,15,0,228,226,1,0,0,0,228,227,1,0,0,0,228,229,
+        1,0,0,0,229,230,1,0,0,0,230,232,5,7,0,0,231,233,3,52,26,0,232,231,
+        1,0,0,0,232,233,1,0,0,0,233,234,1,0,0,0,234,236,5,7,0,0,235,237,
+        3,30,15,0,236,235,1,0,0,0,236,237,1,0,0,0,237,238,1,0,0,0,238,239,
+        5,3,0,0,239,240,3,10,5,0,240,33,1,0,0,0,241,242,5,20,0,0,242,243,
+        5,2,0,0,243,244,3,52,26,0,244,245,5,3,0,0,245,250,5,5,0,0,246,249,
+        3,42,21,0,247,249,3,44,22,0,248,246,1,0,0,0,248,247,1,0,0,0,249,
+        252,1,0,0,0,250,248,1,0,0,0,250,251,1,0,0,0,251,253,1,0,0,0,252,
+        250,1,0,0,0,253,254,5,6,0,0,254,35,1,0,0,0,255,256,5,21,0,0,256,
+        257,5,7,0,0,257,37,1,0,0,0,258,259,5,22,0,0,259,260,3,52,26,0,260,
+        261,5,23,0,0,261,39,1,0,0,0,262,263,5,24,0,0,263,264,5,23,0,0,264,
+        41,1,0,0,0,265,269,3,38,19,0,266,268,3,10,5,0,267,266,1,0,0,0,268,
+        271,1,0,0,0,269,267,1,0,0,0,269,270,1,0,0,0,270,273,1,0,0,0,271,
+        269,1,0,0,0,272,274,3,36,18,0,273,272,1,0,0,0,273,274,1,0,0,0,274,
+        43,1,0,0,0,275,279,3,40,20,0,276,278,3,10,5,0,277,276,1,0,0,0,278,
+        281,1,0,0,0,279,277,1,0,0,0,279,280,1,0,0,0,280,283,1,0,0,0,281,
+        279,1,0,0,0,282,284,3,36,18,0,283,282,1,0,0,0,283,284,1,0,0,0,284,
+        45,1,0,0,0,285,286,5,62,0,0,286,288,5,2,0,0,287,289,3,54,27,0,288,
+        287,1,0,0,0,288,289,1,0,0,0,289,290,1,0,0,0,290,291,5,3,0,0,291,
+        47,1,0,0,0,292,297,5,62,0,0,293,294,5,11,0,0,294,295,3,52,26,0,295,
+        296,5,12,0,0,296,298,1,0,0,0,297,293,1,0,0,0,297,298,1,0,0,0,298,
+        49,1,0,0,0,299,300,5,25,0,0,300,301,5,2,0,0,301,306,5,61,0,0,302,
+        303,5,13,0,0,303,305,3,52,26,0,304,302,1,0,0,0,305,308,1,0,0,0,306,
+        304,1,0,0,0,306,307,1,0,0,0,307,309,1,0,0,0,308,306,1,0,0,0,309,
+        334,5,3,0,0,310,311,5,26,0,0,311,312,5,2,0,0,312,318,5,61,0,0,313,
+        314,5,13,0,0,314,315,5,27,0,0,315,317,3,48,24,0,316,313,1,0,0,0,
+        317,320,1,0,0,0,318,316,1,0,0,0,318,319,1,0,0,0,319,321,1,0,0,0,
+        320,318,1,0,0,0,321,334,5,3,0,0,322,323,5,28,0,0,323,324,5,2,0,0,
+        324,325,5,62,0,0,325,334,5,3,0,0,326,327,5,29,0,0,327,330,5,2,0,
+        0,328,331,5,61,0,0,329,331,3,52,26,0,330,328,1,0,0,0,330,329,1,0,
+        0,0,331,332,1,0,0,0,332,334,5,3,0,0,333,299,1,0,0,0,333,310,1,0,
+        0,0,333,322,1,0,0,0,333,326,1,0,0,0,334,51,1,0,0,0,335,336,6,26,
+        -1,0,336,337,5,2,0,0,337,338,3,52,26,0,338,339,5,3,0,0,339,357,1,
+        0,0,0,340,341,5,30,0,0,341,357,3,52,26,12,342,357,5,59,0,0,343,357,
+        5,61,0,0,344,357,5,60,0,0,345,352,5,62,0,0,346,347,5,11,0,0,347,
+        348,3,52,26,0,348,349,5,12,0,0,349,351,1,0,0,0,350,346,1,0,0,0,351,
+        354,1,0,0,0,352,350,1,0,0,0,352,353,1,0,0,0,353,357,1,0,0,0,354,
+        352,1,0,0,0,355,357,3,46,23,0,356,335,1,0,0,0,356,340,1,0,0,0,356,
+        342,1,0,0,0,356,343,1,0,0,0,356,344,1,0,0,0,356,345,1,0,0,0,356,
+        355,1,0,0,0,357,378,1,0,0,0,358,359,10,11,0,0,359,360,7,0,0,0,360,
+        377,3,52,26,12,361,362,10,10,0,0,362,363,7,1,0,0,363,377,3,52,26,
+        11,364,365,10,9,0,0,365,366,7,2,0,0,366,377,3,52,26,10,367,368,10,
+        8,0,0,368,369,7,3,0,0,369,377,3,52,26,9,370,371,10,7,0,0,371,372,
+        7,4,0,0,372,377,3,52,26,8,373,374,10,3,0,0,374,375,5,14,0,0,375,
+        377,5,62,0,0,376,358,1,0,0,0,376,361,1,0,0,0,376,364,1,0,0,0,376,
+        367,1,0,0,0,376,370,1,0,0,0,376,373,1,0,0,0,377,380,1,0,0,0,378,
+        376,1,0,0,0,378,379,1,0,0,0,379,53,1,0,0,0,380,378,1,0,0,0,381,386,
+        3,52,26,0,382,383,5,13,0,0,383,385,3,52,26,0,384,382,1,0,0,0,385,
+        388,1,0,0,0,386,384,1,0,0,0,386,387,1,0,0,0,387,55,1,0,0,0,388,386,
+        1,0,0,0,389,390,3,58,29,0,390,397,5,62,0,0,391,392,5,13,0,0,392,
+        393,3,58,29,0,393,394,5,62,0,0,394,396,1,0,0,0,395,391,1,0,0,0,396,
+        399,1,0,0,0,397,395,1,0,0,0,397,398,1,0,0,0,398,57,1,0,0,0,399,397,
+        1,0,0,0,400,420,5,43,0,0,401,420,5,44,0,0,402,420,5,45,0,0,403,420,
+        5,46,0,0,404,420,5,47,0,0,405,420,5,48,0,0,406,420,5,49,0,0,407,
+        420,5,50,0,0,408,420,5,51,0,0,409,420,5,52,0,0,410,420,5,53,0,0,
+        411,420,5,54,0,0,412,420,5,55,0,0,413,420,5,56,0,0,414,415,5,4,0,
+        0,415,420,5,62,0,0,416,417,5,8,0,0,417,420,5,62,0,0,418,420,5,57,
+        0,0,419,400,1,0,0,0,419,401,1,0,0,0,419,402,1,0,0,0,419,403,1,0,
+        0,0,419,404,1,0,0,0,419,405,1,0,0,0,419,406,1,0,0,0,419,407,1,0,
+        0,0,419,408,1,0,0,0,419,409,1,0,0,0,419,410,1,0,0,0,419,411,1,0,
+        0,0,419,412,1,0,0,0,419,413,1,0,0,0,419,414,1,0,0,0,419,416,1,0,
+        0,0,419,418,1,0,0,0,420,59,1,0,0,0,39,65,67,76,82,93,105,129,132,
+        138,146,150,156,162,170,180,195,204,228,232,236,248,250,269,273,
+        279,283,288,297,306,318,330,333,352,356,376,378,386,397,419
     ]
 
 class CParser ( Parser ):
@@ -182,15 +178,15 @@ class CParser ( Parser ):
 
     sharedContextCache = PredictionContextCache()
 
-    literalNames = [ "<INVALID>", "'#include'", "'#define'", "'('", "')'", 
-                     "'struct'", "'{'", "'}'", "';'", "'union'", "'return'", 
-                     "'='", "'['", "']'", "','", "'.'", "'if'", "'else'", 
-                     "'while'", "'do'", "'for'", "'switch'", "'break'", 
-                     "'case'", "':'", "'default'", "'printf'", "'scanf'", 
-                     "'&'", "'gets'", "'puts'", "'-'", "'*'", "'/'", "'%'", 
-                     "'+'", "'<'", "'<='", "'>'", "'>='", "'=='", "'!='", 
-                     "'&&'", "'||'", "'int'", "'float'", "'double'", "'long double'", 
-                     "'char'", "'short'", "'long'", "'unsigned'", "'unsigned char'", 
+    literalNames = [ "<INVALID>", "'#define'", "'('", "')'", "'struct'", 
+                     "'{'", "'}'", "';'", "'union'", "'return'", "'='", 
+                     "'['", "']'", "','", "'.'", "'if'", "'else'", "'while'", 
+                     "'do'", "'for'", "'switch'", "'break'", "'case'", "':'", 
+                     "'default'", "'printf'", "'scanf'", "'&'", "'gets'", 
+                     "'puts'", "'-'", "'*'", "'/'", "'%'", "'+'", "'<'", 
+                     "'<='", "'>'", "'>='", "'=='", "'!='", "'&&'", "'||'", 
+                     "'int'", "'float'", "'double'", "'long double'", "'char'", 
+                     "'short'", "'long'", "'unsigned'", "'unsigned char'", 
                      "'unsigned int'", "'unsigned short'", "'unsigned long'", 
                      "'long long'", "'unsigned long long'", "'void'" ]
 
@@ -208,9 +204,9 @@ class CParser ( Parser ):
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                      "<INVALID>", "<INVALID>", "<INVALID>", "IncludeFile", 
-                      "Number", "CharLiteral", "StringLiteral", "Identifier", 
-                      "WS", "COMMENT", "MULTILINE_COMMENT" ]
+                      "<INVALID>", "<INVALID>", "IncludeFile", "Number", 
+                      "CharLiteral", "StringLiteral", "Identifier", "WS", 
+                      "COMMENT", "MULTILINE_COMMENT" ]
 
     RULE_program = 0
     RULE_directive = 1
@@ -218,40 +214,39 @@ class CParser ( Parser ):
     RULE_structDef = 3
     RULE_unionDef = 4
     RULE_statement = 5
-    RULE_returnStatement = 6
-    RULE_block = 7
-    RULE_varDecl = 8
-    RULE_arraySize = 9
-    RULE_init = 10
-    RULE_initializerList = 11
-    RULE_assignment = 12
-    RULE_ifStatement = 13
-    RULE_whileStatement = 14
-    RULE_doWhileStatement = 15
-    RULE_forHeaderAssignment = 16
-    RULE_forStatement = 17
-    RULE_switchStatement = 18
-    RULE_breakStatement = 19
-    RULE_caseLabel = 20
-    RULE_defaultLabel = 21
-    RULE_caseBlock = 22
-    RULE_defaultBlock = 23
-    RULE_functionCall = 24
-    RULE_scanfParam = 25
-    RULE_inputOutputStatement = 26
-    RULE_expression = 27
-    RULE_argumentList = 28
-    RULE_paramList = 29
-    RULE_type = 30
+    RULE_block = 6
+    RULE_varDecl = 7
+    RULE_arraySize = 8
+    RULE_init = 9
+    RULE_initializerList = 10
+    RULE_assignment = 11
+    RULE_ifStatement = 12
+    RULE_whileStatement = 13
+    RULE_doWhileStatement = 14
+    RULE_forHeaderAssignment = 15
+    RULE_forStatement = 16
+    RULE_switchStatement = 17
+    RULE_breakStatement = 18
+    RULE_caseLabel = 19
+    RULE_defaultLabel = 20
+    RULE_caseBlock = 21
+    RULE_defaultBlock = 22
+    RULE_functionCall = 23
+    RULE_scanfParam = 24
+    RULE_inputOutputStatement = 25
+    RULE_expression = 26
+    RULE_argumentList = 27
+    RULE_paramList = 28
+    RULE_type = 29
 
     ruleNames =  [ "program", "directive", "functionDef", "structDef", "unionDef", 
-                   "statement", "returnStatement", "block", "varDecl", "arraySize", 
-                   "init", "initializerList", "assignment", "ifStatement", 
-                   "whileStatement", "doWhileStatement", "forHeaderAssignment", 
-                   "forStatement", "switchStatement", "breakStatement", 
-                   "caseLabel", "defaultLabel", "caseBlock", "defaultBlock", 
-                   "functionCall", "scanfParam", "inputOutputStatement", 
-                   "expression", "argumentList", "paramList", "type" ]
+                   "statement", "block", "varDecl", "arraySize", "init", 
+                   "initializerList", "assignment", "ifStatement", "whileStatement", 
+                   "doWhileStatement", "forHeaderAssignment", "forStatement", 
+                   "switchStatement", "breakStatement", "caseLabel", "defaultLabel", 
+                   "caseBlock", "defaultBlock", "functionCall", "scanfParam", 
+                   "inputOutputStatement", "expression", "argumentList", 
+                   "paramList", "type" ]
 
     EOF = Token.EOF
     T__0=1
@@ -311,15 +306,14 @@ class CParser ( Parser ):
     T__54=55
     T__55=56
     T__56=57
-    T__57=58
-    IncludeFile=59
-    Number=60
-    CharLiteral=61
-    StringLiteral=62
-    Identifier=63
-    WS=64
-    COMMENT=65
-    MULTILINE_COMMENT=66
+    IncludeFile=58
+    Number=59
+    CharLiteral=60
+    StringLiteral=61
+    Identifier=62
+    WS=63
+    COMMENT=64
+    MULTILINE_COMMENT=65
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -402,44 +396,44 @@ class CParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 69
+            self.state = 67
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & -8646928874917263514) != 0):
-                self.state = 67
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 5188137975547855794) != 0):
+                self.state = 65
                 self._errHandler.sync(self)
                 la_ = self._interp.adaptivePredict(self._input,0,self._ctx)
                 if la_ == 1:
-                    self.state = 62
+                    self.state = 60
                     self.directive()
                     pass
 
                 elif la_ == 2:
-                    self.state = 63
+                    self.state = 61
                     self.functionDef()
                     pass
 
                 elif la_ == 3:
-                    self.state = 64
+                    self.state = 62
                     self.structDef()
                     pass
 
                 elif la_ == 4:
-                    self.state = 65
+                    self.state = 63
                     self.unionDef()
                     pass
 
                 elif la_ == 5:
-                    self.state = 66
+                    self.state = 64
                     self.statement()
                     pass
 
 
-                self.state = 71
+                self.state = 69
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 72
+            self.state = 70
             self.match(CParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -492,23 +486,21 @@ class CParser ( Parser ):
         localctx = CParser.DirectiveContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_directive)
         try:
-            self.state = 79
+            self.state = 76
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [1]:
+            if token in [58]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 74
-                self.match(CParser.T__0)
-                self.state = 75
+                self.state = 72
                 self.match(CParser.IncludeFile)
                 pass
-            elif token in [2]:
+            elif token in [1]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 76
-                self.match(CParser.T__1)
-                self.state = 77
+                self.state = 73
+                self.match(CParser.T__0)
+                self.state = 74
                 self.match(CParser.Identifier)
-                self.state = 78
+                self.state = 75
                 self.expression(0)
                 pass
             else:
@@ -572,23 +564,23 @@ class CParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 81
+            self.state = 78
             self.type_()
-            self.state = 82
+            self.state = 79
             self.match(CParser.Identifier)
-            self.state = 83
-            self.match(CParser.T__2)
-            self.state = 85
+            self.state = 80
+            self.match(CParser.T__1)
+            self.state = 82
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 576443160117379616) != 0):
-                self.state = 84
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 288221580058689808) != 0):
+                self.state = 81
                 self.paramList()
 
 
-            self.state = 87
-            self.match(CParser.T__3)
-            self.state = 88
+            self.state = 84
+            self.match(CParser.T__2)
+            self.state = 85
             self.block()
         except RecognitionException as re:
             localctx.exception = re
@@ -643,26 +635,26 @@ class CParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 90
-            self.match(CParser.T__4)
-            self.state = 91
+            self.state = 87
+            self.match(CParser.T__3)
+            self.state = 88
             self.match(CParser.Identifier)
-            self.state = 92
-            self.match(CParser.T__5)
-            self.state = 96
+            self.state = 89
+            self.match(CParser.T__4)
+            self.state = 93
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 576443160117379616) != 0):
-                self.state = 93
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 288221580058689808) != 0):
+                self.state = 90
                 self.varDecl()
-                self.state = 98
+                self.state = 95
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 99
+            self.state = 96
+            self.match(CParser.T__5)
+            self.state = 97
             self.match(CParser.T__6)
-            self.state = 100
-            self.match(CParser.T__7)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -716,26 +708,26 @@ class CParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 102
-            self.match(CParser.T__8)
-            self.state = 103
+            self.state = 99
+            self.match(CParser.T__7)
+            self.state = 100
             self.match(CParser.Identifier)
-            self.state = 104
-            self.match(CParser.T__5)
-            self.state = 108
+            self.state = 101
+            self.match(CParser.T__4)
+            self.state = 105
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 576443160117379616) != 0):
-                self.state = 105
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 288221580058689808) != 0):
+                self.state = 102
                 self.varDecl()
-                self.state = 110
+                self.state = 107
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 111
+            self.state = 108
+            self.match(CParser.T__5)
+            self.state = 109
             self.match(CParser.T__6)
-            self.state = 112
-            self.match(CParser.T__7)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -826,99 +818,99 @@ class CParser ( Parser ):
         self.enterRule(localctx, 10, self.RULE_statement)
         self._la = 0 # Token type
         try:
-            self.state = 135
+            self.state = 132
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,7,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 114
+                self.state = 111
                 self.varDecl()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 115
+                self.state = 112
                 self.assignment()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 116
+                self.state = 113
                 self.ifStatement()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 117
+                self.state = 114
                 self.whileStatement()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 118
+                self.state = 115
                 self.doWhileStatement()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 119
+                self.state = 116
                 self.forStatement()
                 pass
 
             elif la_ == 7:
                 self.enterOuterAlt(localctx, 7)
-                self.state = 120
+                self.state = 117
                 self.switchStatement()
                 pass
 
             elif la_ == 8:
                 self.enterOuterAlt(localctx, 8)
-                self.state = 121
+                self.state = 118
                 self.functionCall()
-                self.state = 122
-                self.match(CParser.T__7)
+                self.state = 119
+                self.match(CParser.T__6)
                 pass
 
             elif la_ == 9:
                 self.enterOuterAlt(localctx, 9)
-                self.state = 124
+                self.state = 121
                 self.inputOutputStatement()
-                self.state = 125
-                self.match(CParser.T__7)
+                self.state = 122
+                self.match(CParser.T__6)
                 pass
 
             elif la_ == 10:
                 self.enterOuterAlt(localctx, 10)
-                self.state = 127
-                self.match(CParser.T__7)
+                self.state = 124
+                self.match(CParser.T__6)
                 pass
 
             elif la_ == 11:
                 self.enterOuterAlt(localctx, 11)
-                self.state = 128
+                self.state = 125
                 self.block()
                 pass
 
             elif la_ == 12:
                 self.enterOuterAlt(localctx, 12)
-                self.state = 129
+                self.state = 126
                 self.breakStatement()
                 pass
 
             elif la_ == 13:
                 self.enterOuterAlt(localctx, 13)
-                self.state = 130
-                self.match(CParser.T__9)
-                self.state = 132
+                self.state = 127
+                self.match(CParser.T__8)
+                self.state = 129
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                if (((_la) & ~0x3f) == 0 and ((1 << _la) & -1152921502459363320) != 0):
-                    self.state = 131
+                if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8646911285625094148) != 0):
+                    self.state = 128
                     self.expression(0)
 
 
-                self.state = 134
-                self.match(CParser.T__7)
+                self.state = 131
+                self.match(CParser.T__6)
                 pass
 
 
@@ -931,65 +923,6 @@ class CParser ( Parser ):
         return localctx
 
 
-    class ReturnStatementContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-        def expression(self):
-            return self.getTypedRuleContext(CParser.ExpressionContext,0)
-
-
-        def getRuleIndex(self):
-            return CParser.RULE_returnStatement
-
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterReturnStatement" ):
-                listener.enterReturnStatement(self)
-
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitReturnStatement" ):
-                listener.exitReturnStatement(self)
-
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitReturnStatement" ):
-                return visitor.visitReturnStatement(self)
-            else:
-                return visitor.visitChildren(self)
-
-
-
-
-    def returnStatement(self):
-
-        localctx = CParser.ReturnStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 12, self.RULE_returnStatement)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 137
-            self.match(CParser.T__9)
-            self.state = 139
-            self._errHandler.sync(self)
-            _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -1152921502459363320) != 0):
-                self.state = 138
-                self.expression(0)
-
-
-            self.state = 141
-            self.match(CParser.T__7)
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
     class BlockContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -1027,24 +960,24 @@ class CParser ( Parser ):
     def block(self):
 
         localctx = CParser.BlockContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 14, self.RULE_block)
+        self.enterRule(localctx, 12, self.RULE_block)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 143
-            self.match(CParser.T__5)
-            self.state = 147
+            self.state = 134
+            self.match(CParser.T__4)
+            self.state = 138
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & -8646928874917263520) != 0):
-                self.state = 144
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 4899907599396144048) != 0):
+                self.state = 135
                 self.statement()
-                self.state = 149
+                self.state = 140
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 150
-            self.match(CParser.T__6)
+            self.state = 141
+            self.match(CParser.T__5)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1099,34 +1032,34 @@ class CParser ( Parser ):
     def varDecl(self):
 
         localctx = CParser.VarDeclContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 16, self.RULE_varDecl)
+        self.enterRule(localctx, 14, self.RULE_varDecl)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 152
+            self.state = 143
             self.type_()
-            self.state = 153
+            self.state = 144
             self.match(CParser.Identifier)
-            self.state = 155
+            self.state = 146
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==12:
-                self.state = 154
+            if _la==11:
+                self.state = 145
                 self.arraySize()
 
 
-            self.state = 159
+            self.state = 150
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==11:
-                self.state = 157
-                self.match(CParser.T__10)
-                self.state = 158
+            if _la==10:
+                self.state = 148
+                self.match(CParser.T__9)
+                self.state = 149
                 self.init()
 
 
-            self.state = 161
-            self.match(CParser.T__7)
+            self.state = 152
+            self.match(CParser.T__6)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1169,22 +1102,22 @@ class CParser ( Parser ):
     def arraySize(self):
 
         localctx = CParser.ArraySizeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 18, self.RULE_arraySize)
+        self.enterRule(localctx, 16, self.RULE_arraySize)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 163
-            self.match(CParser.T__11)
-            self.state = 165
+            self.state = 154
+            self.match(CParser.T__10)
+            self.state = 156
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==60:
-                self.state = 164
+            if _la==59:
+                self.state = 155
                 self.match(CParser.Number)
 
 
-            self.state = 167
-            self.match(CParser.T__12)
+            self.state = 158
+            self.match(CParser.T__11)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1232,19 +1165,19 @@ class CParser ( Parser ):
     def init(self):
 
         localctx = CParser.InitContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 20, self.RULE_init)
+        self.enterRule(localctx, 18, self.RULE_init)
         try:
-            self.state = 171
+            self.state = 162
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [3, 31, 60, 61, 62, 63]:
+            if token in [2, 30, 59, 60, 61, 62]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 169
+                self.state = 160
                 self.expression(0)
                 pass
-            elif token in [6]:
+            elif token in [5]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 170
+                self.state = 161
                 self.initializerList()
                 pass
             else:
@@ -1296,28 +1229,28 @@ class CParser ( Parser ):
     def initializerList(self):
 
         localctx = CParser.InitializerListContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 22, self.RULE_initializerList)
+        self.enterRule(localctx, 20, self.RULE_initializerList)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 173
-            self.match(CParser.T__5)
-            self.state = 174
+            self.state = 164
+            self.match(CParser.T__4)
+            self.state = 165
             self.expression(0)
-            self.state = 179
+            self.state = 170
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==14:
-                self.state = 175
-                self.match(CParser.T__13)
-                self.state = 176
+            while _la==13:
+                self.state = 166
+                self.match(CParser.T__12)
+                self.state = 167
                 self.expression(0)
-                self.state = 181
+                self.state = 172
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 182
-            self.match(CParser.T__6)
+            self.state = 173
+            self.match(CParser.T__5)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1370,52 +1303,52 @@ class CParser ( Parser ):
     def assignment(self):
 
         localctx = CParser.AssignmentContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 24, self.RULE_assignment)
+        self.enterRule(localctx, 22, self.RULE_assignment)
         self._la = 0 # Token type
         try:
-            self.state = 204
+            self.state = 195
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,15,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 184
+                self.state = 175
                 self.match(CParser.Identifier)
-                self.state = 189
+                self.state = 180
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==15:
-                    self.state = 185
-                    self.match(CParser.T__14)
-                    self.state = 186
+                while _la==14:
+                    self.state = 176
+                    self.match(CParser.T__13)
+                    self.state = 177
                     self.match(CParser.Identifier)
-                    self.state = 191
+                    self.state = 182
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 192
-                self.match(CParser.T__10)
-                self.state = 193
+                self.state = 183
+                self.match(CParser.T__9)
+                self.state = 184
                 self.expression(0)
-                self.state = 194
-                self.match(CParser.T__7)
+                self.state = 185
+                self.match(CParser.T__6)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 196
+                self.state = 187
                 self.match(CParser.Identifier)
-                self.state = 197
-                self.match(CParser.T__11)
-                self.state = 198
-                self.expression(0)
-                self.state = 199
-                self.match(CParser.T__12)
-                self.state = 200
+                self.state = 188
                 self.match(CParser.T__10)
-                self.state = 201
+                self.state = 189
                 self.expression(0)
-                self.state = 202
-                self.match(CParser.T__7)
+                self.state = 190
+                self.match(CParser.T__11)
+                self.state = 191
+                self.match(CParser.T__9)
+                self.state = 192
+                self.expression(0)
+                self.state = 193
+                self.match(CParser.T__6)
                 pass
 
 
@@ -1469,26 +1402,26 @@ class CParser ( Parser ):
     def ifStatement(self):
 
         localctx = CParser.IfStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 26, self.RULE_ifStatement)
+        self.enterRule(localctx, 24, self.RULE_ifStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 206
-            self.match(CParser.T__15)
-            self.state = 207
-            self.match(CParser.T__2)
-            self.state = 208
+            self.state = 197
+            self.match(CParser.T__14)
+            self.state = 198
+            self.match(CParser.T__1)
+            self.state = 199
             self.expression(0)
-            self.state = 209
-            self.match(CParser.T__3)
-            self.state = 210
+            self.state = 200
+            self.match(CParser.T__2)
+            self.state = 201
             self.statement()
-            self.state = 213
+            self.state = 204
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,16,self._ctx)
             if la_ == 1:
-                self.state = 211
-                self.match(CParser.T__16)
-                self.state = 212
+                self.state = 202
+                self.match(CParser.T__15)
+                self.state = 203
                 self.statement()
 
 
@@ -1539,18 +1472,18 @@ class CParser ( Parser ):
     def whileStatement(self):
 
         localctx = CParser.WhileStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 28, self.RULE_whileStatement)
+        self.enterRule(localctx, 26, self.RULE_whileStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 215
-            self.match(CParser.T__17)
-            self.state = 216
-            self.match(CParser.T__2)
-            self.state = 217
+            self.state = 206
+            self.match(CParser.T__16)
+            self.state = 207
+            self.match(CParser.T__1)
+            self.state = 208
             self.expression(0)
-            self.state = 218
-            self.match(CParser.T__3)
-            self.state = 219
+            self.state = 209
+            self.match(CParser.T__2)
+            self.state = 210
             self.statement()
         except RecognitionException as re:
             localctx.exception = re
@@ -1599,23 +1532,23 @@ class CParser ( Parser ):
     def doWhileStatement(self):
 
         localctx = CParser.DoWhileStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 30, self.RULE_doWhileStatement)
+        self.enterRule(localctx, 28, self.RULE_doWhileStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 221
-            self.match(CParser.T__18)
-            self.state = 222
-            self.statement()
-            self.state = 223
+            self.state = 212
             self.match(CParser.T__17)
-            self.state = 224
-            self.match(CParser.T__2)
-            self.state = 225
+            self.state = 213
+            self.statement()
+            self.state = 214
+            self.match(CParser.T__16)
+            self.state = 215
+            self.match(CParser.T__1)
+            self.state = 216
             self.expression(0)
-            self.state = 226
-            self.match(CParser.T__3)
-            self.state = 227
-            self.match(CParser.T__7)
+            self.state = 217
+            self.match(CParser.T__2)
+            self.state = 218
+            self.match(CParser.T__6)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1662,14 +1595,14 @@ class CParser ( Parser ):
     def forHeaderAssignment(self):
 
         localctx = CParser.ForHeaderAssignmentContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 32, self.RULE_forHeaderAssignment)
+        self.enterRule(localctx, 30, self.RULE_forHeaderAssignment)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 229
+            self.state = 220
             self.match(CParser.Identifier)
-            self.state = 230
-            self.match(CParser.T__10)
-            self.state = 231
+            self.state = 221
+            self.match(CParser.T__9)
+            self.state = 222
             self.expression(0)
         except RecognitionException as re:
             localctx.exception = re
@@ -1729,52 +1662,52 @@ class CParser ( Parser ):
     def forStatement(self):
 
         localctx = CParser.ForStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 34, self.RULE_forStatement)
+        self.enterRule(localctx, 32, self.RULE_forStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 233
-            self.match(CParser.T__19)
-            self.state = 234
-            self.match(CParser.T__2)
-            self.state = 237
+            self.state = 224
+            self.match(CParser.T__18)
+            self.state = 225
+            self.match(CParser.T__1)
+            self.state = 228
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [5, 9, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 58]:
-                self.state = 235
+            if token in [4, 8, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57]:
+                self.state = 226
                 self.varDecl()
                 pass
-            elif token in [63]:
-                self.state = 236
+            elif token in [62]:
+                self.state = 227
                 self.forHeaderAssignment()
                 pass
-            elif token in [8]:
+            elif token in [7]:
                 pass
             else:
                 pass
-            self.state = 239
-            self.match(CParser.T__7)
-            self.state = 241
+            self.state = 230
+            self.match(CParser.T__6)
+            self.state = 232
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -1152921502459363320) != 0):
-                self.state = 240
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8646911285625094148) != 0):
+                self.state = 231
                 self.expression(0)
 
 
-            self.state = 243
-            self.match(CParser.T__7)
-            self.state = 245
+            self.state = 234
+            self.match(CParser.T__6)
+            self.state = 236
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==63:
-                self.state = 244
+            if _la==62:
+                self.state = 235
                 self.forHeaderAssignment()
 
 
-            self.state = 247
-            self.match(CParser.T__3)
-            self.state = 248
+            self.state = 238
+            self.match(CParser.T__2)
+            self.state = 239
             self.statement()
         except RecognitionException as re:
             localctx.exception = re
@@ -1833,44 +1766,44 @@ class CParser ( Parser ):
     def switchStatement(self):
 
         localctx = CParser.SwitchStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 36, self.RULE_switchStatement)
+        self.enterRule(localctx, 34, self.RULE_switchStatement)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 250
-            self.match(CParser.T__20)
-            self.state = 251
-            self.match(CParser.T__2)
-            self.state = 252
+            self.state = 241
+            self.match(CParser.T__19)
+            self.state = 242
+            self.match(CParser.T__1)
+            self.state = 243
             self.expression(0)
-            self.state = 253
-            self.match(CParser.T__3)
-            self.state = 254
-            self.match(CParser.T__5)
-            self.state = 259
+            self.state = 244
+            self.match(CParser.T__2)
+            self.state = 245
+            self.match(CParser.T__4)
+            self.state = 250
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==23 or _la==25:
-                self.state = 257
+            while _la==22 or _la==24:
+                self.state = 248
                 self._errHandler.sync(self)
                 token = self._input.LA(1)
-                if token in [23]:
-                    self.state = 255
+                if token in [22]:
+                    self.state = 246
                     self.caseBlock()
                     pass
-                elif token in [25]:
-                    self.state = 256
+                elif token in [24]:
+                    self.state = 247
                     self.defaultBlock()
                     pass
                 else:
                     raise NoViableAltException(self)
 
-                self.state = 261
+                self.state = 252
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 262
-            self.match(CParser.T__6)
+            self.state = 253
+            self.match(CParser.T__5)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1911,13 +1844,13 @@ class CParser ( Parser ):
     def breakStatement(self):
 
         localctx = CParser.BreakStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 38, self.RULE_breakStatement)
+        self.enterRule(localctx, 36, self.RULE_breakStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 264
-            self.match(CParser.T__21)
-            self.state = 265
-            self.match(CParser.T__7)
+            self.state = 255
+            self.match(CParser.T__20)
+            self.state = 256
+            self.match(CParser.T__6)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1961,15 +1894,15 @@ class CParser ( Parser ):
     def caseLabel(self):
 
         localctx = CParser.CaseLabelContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 40, self.RULE_caseLabel)
+        self.enterRule(localctx, 38, self.RULE_caseLabel)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 267
-            self.match(CParser.T__22)
-            self.state = 268
+            self.state = 258
+            self.match(CParser.T__21)
+            self.state = 259
             self.expression(0)
-            self.state = 269
-            self.match(CParser.T__23)
+            self.state = 260
+            self.match(CParser.T__22)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2010,13 +1943,13 @@ class CParser ( Parser ):
     def defaultLabel(self):
 
         localctx = CParser.DefaultLabelContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 42, self.RULE_defaultLabel)
+        self.enterRule(localctx, 40, self.RULE_defaultLabel)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 271
-            self.match(CParser.T__24)
-            self.state = 272
+            self.state = 262
             self.match(CParser.T__23)
+            self.state = 263
+            self.match(CParser.T__22)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2071,28 +2004,28 @@ class CParser ( Parser ):
     def caseBlock(self):
 
         localctx = CParser.CaseBlockContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 44, self.RULE_caseBlock)
+        self.enterRule(localctx, 42, self.RULE_caseBlock)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 274
+            self.state = 265
             self.caseLabel()
-            self.state = 278
+            self.state = 269
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,23,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 275
+                    self.state = 266
                     self.statement() 
-                self.state = 280
+                self.state = 271
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,23,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,22,self._ctx)
 
-            self.state = 282
+            self.state = 273
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==22:
-                self.state = 281
+            if _la==21:
+                self.state = 272
                 self.breakStatement()
 
 
@@ -2150,28 +2083,28 @@ class CParser ( Parser ):
     def defaultBlock(self):
 
         localctx = CParser.DefaultBlockContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 46, self.RULE_defaultBlock)
+        self.enterRule(localctx, 44, self.RULE_defaultBlock)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 284
+            self.state = 275
             self.defaultLabel()
-            self.state = 288
+            self.state = 279
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,25,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,24,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
-                    self.state = 285
+                    self.state = 276
                     self.statement() 
-                self.state = 290
+                self.state = 281
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,25,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,24,self._ctx)
 
-            self.state = 292
+            self.state = 283
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==22:
-                self.state = 291
+            if _la==21:
+                self.state = 282
                 self.breakStatement()
 
 
@@ -2221,24 +2154,24 @@ class CParser ( Parser ):
     def functionCall(self):
 
         localctx = CParser.FunctionCallContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 48, self.RULE_functionCall)
+        self.enterRule(localctx, 46, self.RULE_functionCall)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 294
+            self.state = 285
             self.match(CParser.Identifier)
-            self.state = 295
-            self.match(CParser.T__2)
-            self.state = 297
+            self.state = 286
+            self.match(CParser.T__1)
+            self.state = 288
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & -1152921502459363320) != 0):
-                self.state = 296
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8646911285625094148) != 0):
+                self.state = 287
                 self.argumentList()
 
 
-            self.state = 299
-            self.match(CParser.T__3)
+            self.state = 290
+            self.match(CParser.T__2)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -2285,22 +2218,22 @@ class CParser ( Parser ):
     def scanfParam(self):
 
         localctx = CParser.ScanfParamContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 50, self.RULE_scanfParam)
+        self.enterRule(localctx, 48, self.RULE_scanfParam)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 301
+            self.state = 292
             self.match(CParser.Identifier)
-            self.state = 306
+            self.state = 297
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if _la==12:
-                self.state = 302
-                self.match(CParser.T__11)
-                self.state = 303
+            if _la==11:
+                self.state = 293
+                self.match(CParser.T__10)
+                self.state = 294
                 self.expression(0)
-                self.state = 304
-                self.match(CParser.T__12)
+                self.state = 295
+                self.match(CParser.T__11)
 
 
         except RecognitionException as re:
@@ -2362,93 +2295,93 @@ class CParser ( Parser ):
     def inputOutputStatement(self):
 
         localctx = CParser.InputOutputStatementContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 52, self.RULE_inputOutputStatement)
+        self.enterRule(localctx, 50, self.RULE_inputOutputStatement)
         self._la = 0 # Token type
         try:
-            self.state = 342
+            self.state = 333
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [26]:
+            if token in [25]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 308
-                self.match(CParser.T__25)
-                self.state = 309
-                self.match(CParser.T__2)
-                self.state = 310
+                self.state = 299
+                self.match(CParser.T__24)
+                self.state = 300
+                self.match(CParser.T__1)
+                self.state = 301
                 self.match(CParser.StringLiteral)
-                self.state = 315
+                self.state = 306
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==14:
-                    self.state = 311
-                    self.match(CParser.T__13)
-                    self.state = 312
+                while _la==13:
+                    self.state = 302
+                    self.match(CParser.T__12)
+                    self.state = 303
                     self.expression(0)
-                    self.state = 317
+                    self.state = 308
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 318
-                self.match(CParser.T__3)
+                self.state = 309
+                self.match(CParser.T__2)
                 pass
-            elif token in [27]:
+            elif token in [26]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 319
-                self.match(CParser.T__26)
-                self.state = 320
-                self.match(CParser.T__2)
-                self.state = 321
+                self.state = 310
+                self.match(CParser.T__25)
+                self.state = 311
+                self.match(CParser.T__1)
+                self.state = 312
                 self.match(CParser.StringLiteral)
-                self.state = 327
+                self.state = 318
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while _la==14:
-                    self.state = 322
-                    self.match(CParser.T__13)
-                    self.state = 323
-                    self.match(CParser.T__27)
-                    self.state = 324
+                while _la==13:
+                    self.state = 313
+                    self.match(CParser.T__12)
+                    self.state = 314
+                    self.match(CParser.T__26)
+                    self.state = 315
                     self.scanfParam()
-                    self.state = 329
+                    self.state = 320
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
-                self.state = 330
-                self.match(CParser.T__3)
+                self.state = 321
+                self.match(CParser.T__2)
                 pass
-            elif token in [29]:
+            elif token in [28]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 331
-                self.match(CParser.T__28)
-                self.state = 332
-                self.match(CParser.T__2)
-                self.state = 333
+                self.state = 322
+                self.match(CParser.T__27)
+                self.state = 323
+                self.match(CParser.T__1)
+                self.state = 324
                 self.match(CParser.Identifier)
-                self.state = 334
-                self.match(CParser.T__3)
+                self.state = 325
+                self.match(CParser.T__2)
                 pass
-            elif token in [30]:
+            elif token in [29]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 335
-                self.match(CParser.T__29)
-                self.state = 336
-                self.match(CParser.T__2)
-                self.state = 339
+                self.state = 326
+                self.match(CParser.T__28)
+                self.state = 327
+                self.match(CParser.T__1)
+                self.state = 330
                 self._errHandler.sync(self)
-                la_ = self._interp.adaptivePredict(self._input,31,self._ctx)
+                la_ = self._interp.adaptivePredict(self._input,30,self._ctx)
                 if la_ == 1:
-                    self.state = 337
+                    self.state = 328
                     self.match(CParser.StringLiteral)
                     pass
 
                 elif la_ == 2:
-                    self.state = 338
+                    self.state = 329
                     self.expression(0)
                     pass
 
 
-                self.state = 341
-                self.match(CParser.T__3)
+                self.state = 332
+                self.match(CParser.T__2)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -2476,9 +2409,6 @@ class CParser ( Parser ):
                 return self.getTypedRuleContext(CParser.ExpressionContext,i)
 
 
-        def Identifier(self):
-            return self.getToken(CParser.Identifier, 0)
-
         def Number(self):
             return self.getToken(CParser.Number, 0)
 
@@ -2488,6 +2418,9 @@ class CParser ( Parser ):
         def CharLiteral(self):
             return self.getToken(CParser.CharLiteral, 0)
 
+        def Identifier(self):
+            return self.getToken(CParser.Identifier, 0)
+
         def functionCall(self):
             return self.getTypedRuleContext(CParser.FunctionCallContext,0)
 
@@ -2516,195 +2449,190 @@ class CParser ( Parser ):
         _parentState = self.state
         localctx = CParser.ExpressionContext(self, self._ctx, _parentState)
         _prevctx = localctx
-        _startState = 54
-        self.enterRecursionRule(localctx, 54, self.RULE_expression, _p)
+        _startState = 52
+        self.enterRecursionRule(localctx, 52, self.RULE_expression, _p)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 366
+            self.state = 356
             self._errHandler.sync(self)
-            la_ = self._interp.adaptivePredict(self._input,34,self._ctx)
+            la_ = self._interp.adaptivePredict(self._input,33,self._ctx)
             if la_ == 1:
-                self.state = 345
-                self.match(CParser.T__2)
-                self.state = 346
+                self.state = 336
+                self.match(CParser.T__1)
+                self.state = 337
                 self.expression(0)
-                self.state = 347
-                self.match(CParser.T__3)
+                self.state = 338
+                self.match(CParser.T__2)
                 pass
 
             elif la_ == 2:
-                self.state = 349
-                self.match(CParser.T__30)
-                self.state = 350
-                self.expression(13)
+                self.state = 340
+                self.match(CParser.T__29)
+                self.state = 341
+                self.expression(12)
                 pass
 
             elif la_ == 3:
-                self.state = 351
-                self.match(CParser.Identifier)
-                pass
-
-            elif la_ == 4:
-                self.state = 352
+                self.state = 342
                 self.match(CParser.Number)
                 pass
 
-            elif la_ == 5:
-                self.state = 353
+            elif la_ == 4:
+                self.state = 343
                 self.match(CParser.StringLiteral)
                 pass
 
-            elif la_ == 6:
-                self.state = 354
+            elif la_ == 5:
+                self.state = 344
                 self.match(CParser.CharLiteral)
                 pass
 
-            elif la_ == 7:
-                self.state = 355
+            elif la_ == 6:
+                self.state = 345
                 self.match(CParser.Identifier)
-                self.state = 362
+                self.state = 352
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,33,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
                 while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                     if _alt==1:
-                        self.state = 356
-                        self.match(CParser.T__11)
-                        self.state = 357
+                        self.state = 346
+                        self.match(CParser.T__10)
+                        self.state = 347
                         self.expression(0)
-                        self.state = 358
-                        self.match(CParser.T__12) 
-                    self.state = 364
+                        self.state = 348
+                        self.match(CParser.T__11) 
+                    self.state = 354
                     self._errHandler.sync(self)
-                    _alt = self._interp.adaptivePredict(self._input,33,self._ctx)
+                    _alt = self._interp.adaptivePredict(self._input,32,self._ctx)
 
                 pass
 
-            elif la_ == 8:
-                self.state = 365
+            elif la_ == 7:
+                self.state = 355
                 self.functionCall()
                 pass
 
 
             self._ctx.stop = self._input.LT(-1)
-            self.state = 388
+            self.state = 378
             self._errHandler.sync(self)
-            _alt = self._interp.adaptivePredict(self._input,36,self._ctx)
+            _alt = self._interp.adaptivePredict(self._input,35,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
                 if _alt==1:
                     if self._parseListeners is not None:
                         self.triggerExitRuleEvent()
                     _prevctx = localctx
-                    self.state = 386
+                    self.state = 376
                     self._errHandler.sync(self)
-                    la_ = self._interp.adaptivePredict(self._input,35,self._ctx)
+                    la_ = self._interp.adaptivePredict(self._input,34,self._ctx)
                     if la_ == 1:
                         localctx = CParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 368
-                        if not self.precpred(self._ctx, 12):
+                        self.state = 358
+                        if not self.precpred(self._ctx, 11):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 12)")
-                        self.state = 369
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 11)")
+                        self.state = 359
                         _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 30064771072) != 0)):
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 15032385536) != 0)):
                             self._errHandler.recoverInline(self)
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 370
-                        self.expression(13)
+                        self.state = 360
+                        self.expression(12)
                         pass
 
                     elif la_ == 2:
                         localctx = CParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 371
-                        if not self.precpred(self._ctx, 11):
+                        self.state = 361
+                        if not self.precpred(self._ctx, 10):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 11)")
-                        self.state = 372
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 10)")
+                        self.state = 362
                         _la = self._input.LA(1)
-                        if not(_la==31 or _la==35):
+                        if not(_la==30 or _la==34):
                             self._errHandler.recoverInline(self)
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 373
-                        self.expression(12)
+                        self.state = 363
+                        self.expression(11)
                         pass
 
                     elif la_ == 3:
                         localctx = CParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 374
-                        if not self.precpred(self._ctx, 10):
+                        self.state = 364
+                        if not self.precpred(self._ctx, 9):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 10)")
-                        self.state = 375
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 9)")
+                        self.state = 365
                         _la = self._input.LA(1)
-                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 1030792151040) != 0)):
+                        if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 515396075520) != 0)):
                             self._errHandler.recoverInline(self)
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 376
-                        self.expression(11)
+                        self.state = 366
+                        self.expression(10)
                         pass
 
                     elif la_ == 4:
                         localctx = CParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 377
-                        if not self.precpred(self._ctx, 9):
+                        self.state = 367
+                        if not self.precpred(self._ctx, 8):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 9)")
-                        self.state = 378
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 8)")
+                        self.state = 368
                         _la = self._input.LA(1)
-                        if not(_la==40 or _la==41):
+                        if not(_la==39 or _la==40):
                             self._errHandler.recoverInline(self)
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 379
-                        self.expression(10)
+                        self.state = 369
+                        self.expression(9)
                         pass
 
                     elif la_ == 5:
                         localctx = CParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 380
-                        if not self.precpred(self._ctx, 8):
+                        self.state = 370
+                        if not self.precpred(self._ctx, 7):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 8)")
-                        self.state = 381
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 7)")
+                        self.state = 371
                         _la = self._input.LA(1)
-                        if not(_la==42 or _la==43):
+                        if not(_la==41 or _la==42):
                             self._errHandler.recoverInline(self)
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 382
-                        self.expression(9)
+                        self.state = 372
+                        self.expression(8)
                         pass
 
                     elif la_ == 6:
                         localctx = CParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 383
+                        self.state = 373
                         if not self.precpred(self._ctx, 3):
                             from antlr4.error.Errors import FailedPredicateException
                             raise FailedPredicateException(self, "self.precpred(self._ctx, 3)")
-                        self.state = 384
-                        self.match(CParser.T__14)
-                        self.state = 385
+                        self.state = 374
+                        self.match(CParser.T__13)
+                        self.state = 375
                         self.match(CParser.Identifier)
                         pass
 
              
-                self.state = 390
+                self.state = 380
                 self._errHandler.sync(self)
-                _alt = self._interp.adaptivePredict(self._input,36,self._ctx)
+                _alt = self._interp.adaptivePredict(self._input,35,self._ctx)
 
         except RecognitionException as re:
             localctx.exception = re
@@ -2752,21 +2680,21 @@ class CParser ( Parser ):
     def argumentList(self):
 
         localctx = CParser.ArgumentListContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 56, self.RULE_argumentList)
+        self.enterRule(localctx, 54, self.RULE_argumentList)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 391
+            self.state = 381
             self.expression(0)
-            self.state = 396
+            self.state = 386
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==14:
-                self.state = 392
-                self.match(CParser.T__13)
-                self.state = 393
+            while _la==13:
+                self.state = 382
+                self.match(CParser.T__12)
+                self.state = 383
                 self.expression(0)
-                self.state = 398
+                self.state = 388
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2822,25 +2750,25 @@ class CParser ( Parser ):
     def paramList(self):
 
         localctx = CParser.ParamListContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 58, self.RULE_paramList)
+        self.enterRule(localctx, 56, self.RULE_paramList)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 399
+            self.state = 389
             self.type_()
-            self.state = 400
+            self.state = 390
             self.match(CParser.Identifier)
-            self.state = 407
+            self.state = 397
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while _la==14:
-                self.state = 401
-                self.match(CParser.T__13)
-                self.state = 402
+            while _la==13:
+                self.state = 391
+                self.match(CParser.T__12)
+                self.state = 392
                 self.type_()
-                self.state = 403
+                self.state = 393
                 self.match(CParser.Identifier)
-                self.state = 409
+                self.state = 399
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
@@ -2886,99 +2814,99 @@ class CParser ( Parser ):
     def type_(self):
 
         localctx = CParser.TypeContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 60, self.RULE_type)
+        self.enterRule(localctx, 58, self.RULE_type)
         try:
-            self.state = 429
+            self.state = 419
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [44]:
+            if token in [43]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 410
+                self.state = 400
+                self.match(CParser.T__42)
+                pass
+            elif token in [44]:
+                self.enterOuterAlt(localctx, 2)
+                self.state = 401
                 self.match(CParser.T__43)
                 pass
             elif token in [45]:
-                self.enterOuterAlt(localctx, 2)
-                self.state = 411
+                self.enterOuterAlt(localctx, 3)
+                self.state = 402
                 self.match(CParser.T__44)
                 pass
             elif token in [46]:
-                self.enterOuterAlt(localctx, 3)
-                self.state = 412
+                self.enterOuterAlt(localctx, 4)
+                self.state = 403
                 self.match(CParser.T__45)
                 pass
             elif token in [47]:
-                self.enterOuterAlt(localctx, 4)
-                self.state = 413
+                self.enterOuterAlt(localctx, 5)
+                self.state = 404
                 self.match(CParser.T__46)
                 pass
             elif token in [48]:
-                self.enterOuterAlt(localctx, 5)
-                self.state = 414
+                self.enterOuterAlt(localctx, 6)
+                self.state = 405
                 self.match(CParser.T__47)
                 pass
             elif token in [49]:
-                self.enterOuterAlt(localctx, 6)
-                self.state = 415
+                self.enterOuterAlt(localctx, 7)
+                self.state = 406
                 self.match(CParser.T__48)
                 pass
             elif token in [50]:
-                self.enterOuterAlt(localctx, 7)
-                self.state = 416
+                self.enterOuterAlt(localctx, 8)
+                self.state = 407
                 self.match(CParser.T__49)
                 pass
             elif token in [51]:
-                self.enterOuterAlt(localctx, 8)
-                self.state = 417
+                self.enterOuterAlt(localctx, 9)
+                self.state = 408
                 self.match(CParser.T__50)
                 pass
             elif token in [52]:
-                self.enterOuterAlt(localctx, 9)
-                self.state = 418
+                self.enterOuterAlt(localctx, 10)
+                self.state = 409
                 self.match(CParser.T__51)
                 pass
             elif token in [53]:
-                self.enterOuterAlt(localctx, 10)
-                self.state = 419
+                self.enterOuterAlt(localctx, 11)
+                self.state = 410
                 self.match(CParser.T__52)
                 pass
             elif token in [54]:
-                self.enterOuterAlt(localctx, 11)
-                self.state = 420
+                self.enterOuterAlt(localctx, 12)
+                self.state = 411
                 self.match(CParser.T__53)
                 pass
             elif token in [55]:
-                self.enterOuterAlt(localctx, 12)
-                self.state = 421
+                self.enterOuterAlt(localctx, 13)
+                self.state = 412
                 self.match(CParser.T__54)
                 pass
             elif token in [56]:
-                self.enterOuterAlt(localctx, 13)
-                self.state = 422
-                self.match(CParser.T__55)
-                pass
-            elif token in [57]:
                 self.enterOuterAlt(localctx, 14)
-                self.state = 423
-                self.match(CParser.T__56)
+                self.state = 413
+                self.match(CParser.T__55)
                 pass
-            elif token in [5]:
+            elif token in [4]:
                 self.enterOuterAlt(localctx, 15)
-                self.state = 424
-                self.match(CParser.T__4)
-                self.state = 425
+                self.state = 414
+                self.match(CParser.T__3)
+                self.state = 415
                 self.match(CParser.Identifier)
                 pass
-            elif token in [9]:
+            elif token in [8]:
                 self.enterOuterAlt(localctx, 16)
-                self.state = 426
-                self.match(CParser.T__8)
-                self.state = 427
+                self.state = 416
+                self.match(CParser.T__7)
+                self.state = 417
                 self.match(CParser.Identifier)
                 pass
-            elif token in [58]:
+            elif token in [57]:
                 self.enterOuterAlt(localctx, 17)
-                self.state = 428
-                self.match(CParser.T__57)
+                self.state = 418
+                self.match(CParser.T__56)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -2996,7 +2924,7 @@ class CParser ( Parser ):
     def sempred(self, localctx:RuleContext, ruleIndex:int, predIndex:int):
         if self._predicates == None:
             self._predicates = dict()
-        self._predicates[27] = self.expression_sempred
+        self._predicates[26] = self.expression_sempred
         pred = self._predicates.get(ruleIndex, None)
         if pred is None:
             raise Exception("No predicate with index:" + str(ruleIndex))
@@ -3005,23 +2933,23 @@ class CParser ( Parser ):
 
     def expression_sempred(self, localctx:ExpressionContext, predIndex:int):
             if predIndex == 0:
-                return self.precpred(self._ctx, 12)
+                return self.precpred(self._ctx, 11)
          
 
             if predIndex == 1:
-                return self.precpred(self._ctx, 11)
+                return self.precpred(self._ctx, 10)
          
 
             if predIndex == 2:
-                return self.precpred(self._ctx, 10)
+                return self.precpred(self._ctx, 9)
          
 
             if predIndex == 3:
-                return self.precpred(self._ctx, 9)
+                return self.precpred(self._ctx, 8)
          
 
             if predIndex == 4:
-                return self.precpred(self._ctx, 8)
+                return self.precpred(self._ctx, 7)
          
 
             if predIndex == 5:
@@ -39,11 +39,6 @@ class CVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by CParser#returnStatement.
-    def visitReturnStatement(self, ctx:CParser.ReturnStatementContext):
-        return self.visitChildren(ctx)
-
-
     # Visit a parse tree produced by CParser#block.
     def visitBlock(self, ctx:CParser.BlockContext):
         return self.visitChildren(ctx)
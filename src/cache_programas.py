@@ -0,0 +1,166 @@
+import hashlib
+import os
+import pickle
+import shutil
+import stat
+import time
+
+from CLexer import serializedATN as atn_lexer
+from CParser import serializedATN as atn_parser
+
+# Cache em disco da forma rebaixada de um programa, já pronta para executar:
+# o bytecode (motor bytecode, serializado com pickle) ou o código Python
+# gerado (motor python). A chave combina o conteúdo do fonte C, a versão da
+# gramática (os ATNs do lexer e do parser gerados) e a versão do motor (o
+# hash das fontes dos módulos que produzem o programa rebaixado), de modo que
+# mudar qualquer um dos três invalida a entrada. Numa execução com acerto
+# não há análise léxica, sintática nem compilação.
+#
+# Carregar uma entrada executa código Python (pickle.loads, ou o exec do
+# código gerado), então o cache fica num diretório do usuário, nunca ao lado
+# do fonte: um diretório vindo junto com um projeto baixado poderia trazer
+# entradas com a chave de um fonte conhecido. Em POSIX o diretório é criado
+# só com permissão para o dono e não é usado se pertencer a outro usuário
+# ou puder ser escrito por outros. Se não for possível ler ou gravar no
+# diretório, o programa roda sem o cache.
+
+NOME_DIRETORIO = "intercptor"
+
+ARQUIVO_ESTATISTICAS = "estatisticas.txt"
+
+VERSAO_GRAMATICA = hashlib.sha256(repr((atn_lexer(), atn_parser())).encode("ascii")).hexdigest()[:16]
+
+# Módulos de que depende o programa rebaixado: o do motor e os das análises
+# da carga e das rotinas cujos resultados entram no bytecode ou no código
+# gerado.
+MODULOS_MOTOR = {"bytecode": "maquina_virtual", "python": "transpilador"}
+MODULOS_COMPILACAO = ("resolvedor", "tipagem", "inicializacao", "limites", "constantes", "expansao", "cauda",
+                      "pureza", "vetores", "registros", "formatacao", "entrada", "interpretador")
+
+
+def _versao_fontes(modulos):
+    resumo = hashlib.sha256()
+    for modulo in modulos:
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), modulo + ".py"), "rb") as f:
+            resumo.update(f.read())
+    return resumo.hexdigest()[:16]
+
+
+VERSOES_MOTOR = {motor: _versao_fontes((modulo,) + MODULOS_COMPILACAO) for motor, modulo in MODULOS_MOTOR.items()}
+
+EXTENSOES = {"python": "py", "bytecode": "pickle"}
+
+
+def diretorio_padrao():
+    # $XDG_CACHE_HOME/intercptor, %LOCALAPPDATA%\intercptor no Windows ou
+    # ~/.cache/intercptor.
+    base = os.environ.get("XDG_CACHE_HOME", "")
+    if not os.path.isabs(base):
+        base = os.environ.get("LOCALAPPDATA", "") if os.name == "nt" else ""
+    if not os.path.isabs(base):
+        base = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, NOME_DIRETORIO)
+
+
+class CacheProgramas:
+    def __init__(self, ativo=True, estatisticas=False, diretorio=None):
+        # estatisticas: mantém os totais acumulados (--cache-stats).
+        self.diretorio = diretorio if diretorio is not None else diretorio_padrao()
+        self.ativo = ativo
+        self.estatisticas = estatisticas
+        self.acertos = 0
+        self.falhas = 0
+        self.tempo_carga = 0.0
+        self.tempo_geracao = 0.0
+
+    def _caminho(self, fonte_c, motor, versao):
+        chave = hashlib.sha256("\0".join((motor, versao, VERSAO_GRAMATICA, fonte_c)).encode("utf-8")).hexdigest()
+        return os.path.join(self.diretorio, f"{motor}-{chave}.{EXTENSOES[motor]}")
+
+    def _confiavel(self):
+        # Só o dono pode ter gravado as entradas do diretório.
+        if os.name != "posix":
+            return True
+        try:
+            estado = os.stat(self.diretorio)
+        except OSError:
+            return False
+        return estado.st_uid == os.getuid() and not estado.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    def _criar_diretorio(self):
+        os.makedirs(self.diretorio, mode=0o700, exist_ok=True)
+        if not self._confiavel():
+            raise PermissionError(f"diretório do cache não confiável: {self.diretorio}")
+
+    def carregar(self, fonte_c, motor, versao):
+        # Devolve o programa guardado, ou None (falha) se não houver entrada
+        # válida; uma entrada corrompida conta como falha e será regravada.
+        if not self.ativo:
+            return None
+        inicio = time.perf_counter()
+        programa = None
+        if self._confiavel():
+            try:
+                with open(self._caminho(fonte_c, motor, versao), "rb") as f:
+                    dados = f.read()
+                programa = dados.decode("utf-8") if motor == "python" else pickle.loads(dados)
+            except Exception:
+                programa = None
+        self.tempo_carga += time.perf_counter() - inicio
+        if programa is None:
+            self.falhas += 1
+        else:
+            self.acertos += 1
+        if self.estatisticas:
+            self._registrar(programa is not None)
+        return programa
+
+    def salvar(self, fonte_c, motor, versao, programa):
+        if not self.ativo:
+            return
+        caminho = self._caminho(fonte_c, motor, versao)
+        dados = programa.encode("utf-8") if motor == "python" else pickle.dumps(programa, pickle.HIGHEST_PROTOCOL)
+        temporario = caminho + ".tmp"
+        try:
+            self._criar_diretorio()
+            with open(temporario, "wb") as f:
+                f.write(dados)
+            os.replace(temporario, caminho)
+        except OSError:
+            # Sem permissão ou sem espaço: o programa só não fica em cache.
+            pass
+
+    def limpar(self):
+        shutil.rmtree(self.diretorio, ignore_errors=True)
+
+    def _ler_totais(self):
+        try:
+            with open(os.path.join(self.diretorio, ARQUIVO_ESTATISTICAS), encoding="utf-8") as f:
+                acertos, falhas = (int(campo) for campo in f.read().split())
+        except (OSError, ValueError):
+            acertos, falhas = 0, 0
+        return acertos, falhas
+
+    def _registrar(self, acerto):
+        # Contagem acumulada de todas as execuções que usaram este diretório.
+        acertos, falhas = self._ler_totais()
+        if acerto:
+            acertos += 1
+        else:
+            falhas += 1
+        try:
+            self._criar_diretorio()
+            with open(os.path.join(self.diretorio, ARQUIVO_ESTATISTICAS), "w", encoding="utf-8") as f:
+                f.write(f"{acertos} {falhas}\n")
+        except OSError:
+            pass
+
+    def resumo(self):
+        if not self.ativo:
+            return "cache: desativado"
+        acertos, falhas = self._ler_totais()
+        if self.acertos:
+            situacao = f"acerto, carga em {self.tempo_carga * 1000:.1f} ms"
+        else:
+            situacao = f"falha, análise e compilação em {self.tempo_geracao * 1000:.1f} ms"
+        return f"cache: {situacao} (total em {self.diretorio}: {acertos} acertos, {falhas} falhas)"
@@ -0,0 +1,92 @@
+from collections import namedtuple
+
+from antlr4.tree.Tree import TerminalNode
+
+from CParser import CParser
+from resolvedor import LOCAL
+
+# Chamadas em cauda de uma função a ela mesma, reconhecidas depois da
+# expansão em linha:
+#
+#   return f(argumentos);
+#
+# dentro de f, com o número certo de argumentos e f definida uma única vez.
+# Os motores compilados não criam um quadro novo para elas: os argumentos são
+# avaliados, viram os novos valores dos parâmetros (None deixa o slot vazio,
+# como na chamada), os demais locais voltam a ficar vazios e a execução
+# recomeça do início da função. O valor do return da última volta é o que a
+# cadeia de chamadas devolveria, então a pilha não cresce com a recursão.
+
+# `definicao` é o FunctionDefContext de f, `argumentos` as expressões da
+# chamada e `em_laco` diz se o return está dentro de um laço ou switch. Um
+# reinício é `limpo` quando toda leitura de variável local que não é
+# parâmetro é segura (resolucao.leituras_seguras): nenhuma volta consegue ver
+# o valor que a anterior deixou, mesmo sem esvaziar os locais.
+ChamadaCauda = namedtuple("ChamadaCauda", ["definicao", "argumentos", "em_laco", "limpo"])
+
+_LACOS = (CParser.WhileStatementContext, CParser.DoWhileStatementContext,
+          CParser.ForStatementContext, CParser.SwitchStatementContext)
+
+
+def _sem_parenteses(ctx):
+    while ctx.getChildCount() == 3 and ctx.getChild(0).getText() == '(':
+        ctx = ctx.getChild(1)
+    return ctx
+
+
+class Cauda:
+    def __init__(self, resolucao):
+        self.resolucao = resolucao
+        self._definicao = None
+        self._escopo = None
+        self._limpo = True
+
+    def analisar(self, tree):
+        definicoes = {}
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                definicoes.setdefault(filho.Identifier().getText(), []).append(filho)
+        for nome, ctxs in definicoes.items():
+            if len(ctxs) != 1:
+                continue
+            self._definicao = ctxs[0]
+            self._escopo = self.resolucao.funcoes[nome]
+            self._limpo = self._leituras_seguras(ctxs[0].block())
+            self._percorrer(ctxs[0].block(), False)
+        self._definicao = self._escopo = None
+
+    def _percorrer(self, ctx, em_laco):
+        if isinstance(ctx, TerminalNode) or isinstance(ctx, CParser.ExpressionContext):
+            return
+        if isinstance(ctx, CParser.StatementContext) and ctx.getChild(0).getText() == 'return':
+            self._return(ctx, em_laco)
+            return
+        em_laco = em_laco or isinstance(ctx, _LACOS)
+        for i in range(ctx.getChildCount()):
+            self._percorrer(ctx.getChild(i), em_laco)
+
+    def _return(self, ctx, em_laco):
+        if ctx.expression() is None:
+            return
+        expressao = _sem_parenteses(ctx.expression())
+        if expressao.getChildCount() != 1 or not isinstance(expressao.getChild(0), CParser.FunctionCallContext):
+            return
+        chamada = expressao.getChild(0)
+        if chamada.Identifier().getText() != self._escopo.nome:
+            return
+        argumentos = chamada.argumentList().expression() if chamada.argumentList() is not None else []
+        if len(argumentos) != self._escopo.n_parametros:
+            return
+        self.resolucao.caudas[ctx] = ChamadaCauda(self._definicao, argumentos, em_laco, self._limpo)
+
+    def _leituras_seguras(self, ctx):
+        if isinstance(ctx, TerminalNode):
+            return True
+        if isinstance(ctx, CParser.ExpressionContext) and ctx.Identifier() is not None:
+            token = ctx.Identifier() if ctx.getChildCount() != 3 or ctx.getChild(1).getText() != '.' else None
+            endereco = self.resolucao.enderecos.get(token) if token is not None else None
+            if (endereco is not None and endereco.escopo == LOCAL and endereco.indice >= self._escopo.n_parametros
+                    and token not in self.resolucao.leituras_seguras):
+                return False
+        return all(self._leituras_seguras(ctx.getChild(i)) for i in range(ctx.getChildCount()))
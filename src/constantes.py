@@ -0,0 +1,158 @@
+import math
+import operator
+
+from antlr4.tree.Tree import TerminalNode
+
+from CParser import CParser
+from formatacao import decodificar_literal
+from resolvedor import MACRO
+
+# Dobra de constantes na carga, executada depois da análise de
+# inicialização. Toda expressão cujo valor não depende da execução tem o
+# valor calculado uma única vez e guardado em resolucao.constantes (o pool
+# de literais, expressão -> valor); os motores compilados emitem para ela uma
+# única carga de constante. São constantes:
+#
+#   os literais numéricos, de caractere e de string;
+#   as macros, substituídas pelo valor do #define dentro e fora das funções,
+#   quando definidas uma única vez e lidas sempre depois do #define
+#   (resolucao.leituras_seguras);
+#   as operações aritméticas, de comparação e lógicas (&& e || também quando
+#   só o operando da esquerda é constante e decide o resultado) e o sinal
+#   sobre constantes.
+#
+# O valor é calculado com os mesmos operadores do Python que os motores
+# usariam na execução. Uma operação que falharia (divisão por zero, tipos
+# incompatíveis) ou daria um float infinito fica para a execução, que
+# reporta o erro como antes.
+
+OPERACOES = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+# Resultado de uma operação que pode ir para o pool.
+_TIPOS_DOBRADOS = (int, float, bool)
+
+_VARIAVEL = object()
+
+
+class Constantes:
+    def __init__(self, resolucao):
+        self.resolucao = resolucao
+        self.constantes = resolucao.constantes
+        # nome -> expressão do #define, só para as macros definidas uma vez.
+        self._macros = {}
+        self._variaveis = set()
+        self._em_curso = set()
+
+    def analisar(self, tree):
+        definicoes = {}
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.DirectiveContext) and filho.getChild(0).getText() == '#define':
+                definicoes.setdefault(filho.Identifier().getText(), []).append(filho.expression())
+        self._macros = {nome: expressoes[0] for nome, expressoes in definicoes.items()
+                        if len(expressoes) == 1 and expressoes[0] is not None}
+        self._percorrer(tree)
+
+    def _percorrer(self, ctx):
+        if isinstance(ctx, TerminalNode):
+            return
+        if isinstance(ctx, CParser.ExpressionContext):
+            self._valor(ctx)
+        for i in range(ctx.getChildCount()):
+            self._percorrer(ctx.getChild(i))
+
+    def _valor(self, ctx):
+        # Valor constante de `ctx` ou _VARIAVEL, calculado uma vez por nó.
+        if ctx in self.constantes:
+            return self.constantes[ctx]
+        if ctx in self._variaveis:
+            return _VARIAVEL
+        valor = self._calcular(ctx)
+        if valor is _VARIAVEL or (type(valor) is float and not math.isfinite(valor)):
+            self._variaveis.add(ctx)
+            return _VARIAVEL
+        self.constantes[ctx] = valor
+        return valor
+
+    def _calcular(self, ctx):
+        child_count = ctx.getChildCount()
+
+        if child_count == 1:
+            if ctx.Number() is not None:
+                texto = ctx.Number().getText()
+                return float(texto) if '.' in texto else int(texto)
+            if ctx.CharLiteral() is not None:
+                return ctx.CharLiteral().getText().strip("'")
+            if ctx.StringLiteral() is not None:
+                return decodificar_literal(ctx.StringLiteral().getText())
+            if ctx.Identifier() is not None:
+                return self._macro(ctx.Identifier())
+            return _VARIAVEL
+
+        if child_count == 3 and ctx.getChild(0).getText() == '(':
+            return self._valor(ctx.getChild(1))
+
+        if child_count == 2:
+            operando = self._valor(ctx.getChild(1))
+            if operando is _VARIAVEL:
+                return _VARIAVEL
+            if ctx.getChild(0).getText() == '!':
+                return not operando
+            if ctx.getChild(0).getText() == '-':
+                return self._aplicar(operator.neg, operando)
+            return _VARIAVEL
+
+        if child_count == 3 and isinstance(ctx.getChild(0), CParser.ExpressionContext):
+            op = ctx.getChild(1).getText()
+            if op in ('&&', '||'):
+                # Curto-circuito: o operando da direita só é avaliado quando
+                # o da esquerda não decide o resultado.
+                esquerda = self._valor(ctx.expression(0))
+                if esquerda is _VARIAVEL:
+                    return _VARIAVEL
+                if (op == '&&') != bool(esquerda):
+                    return bool(esquerda)
+                direita = self._valor(ctx.expression(1))
+                return _VARIAVEL if direita is _VARIAVEL else bool(direita)
+            if op in OPERACOES:
+                esquerda = self._valor(ctx.expression(0))
+                if esquerda is _VARIAVEL:
+                    return _VARIAVEL
+                direita = self._valor(ctx.expression(1))
+                if direita is _VARIAVEL:
+                    return _VARIAVEL
+                return self._aplicar(OPERACOES[op], esquerda, direita)
+        return _VARIAVEL
+
+    def _aplicar(self, operacao, *operandos):
+        try:
+            valor = operacao(*operandos)
+        except (ArithmeticError, TypeError, ValueError):
+            return _VARIAVEL
+        return valor if type(valor) in _TIPOS_DOBRADOS else _VARIAVEL
+
+    def _macro(self, token):
+        endereco = self.resolucao.enderecos.get(token)
+        if endereco is None or endereco.escopo != MACRO or token not in self.resolucao.leituras_seguras:
+            return _VARIAVEL
+        nome = token.getText()
+        expressao = self._macros.get(nome)
+        if expressao is None or nome in self._em_curso:
+            return _VARIAVEL
+        self._em_curso.add(nome)
+        try:
+            return self._valor(expressao)
+        finally:
+            self._em_curso.discard(nome)
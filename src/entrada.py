@@ -0,0 +1,326 @@
+import codecs
+import re
+import sys
+from itertools import islice
+from operator import length_hint
+
+# Entrada padrão do programa interpretado. scanf e gets leem de um buffer de
+# texto preenchido em blocos grandes de sys.stdin.buffer, e não com um input()
+# por variável: vários valores podem vir na mesma linha (ou um valor por
+# linha), e ler 10^6 inteiros custa algumas dezenas de leituras do sistema.
+#
+# A divisão segue as regras de C: %d, %f e %s pulam os espaços em branco
+# (' ', \t, \n, \v, \f, \r) antes do valor, %c não pula, um espaço no
+# formato pula quantos brancos houver e qualquer outro caractere do formato
+# precisa aparecer na entrada. Uma exceção mantém o comportamento por linhas
+# que o interpretador sempre teve: um gets (ou um %c no início de um scanf)
+# logo depois de um scanf descarta o resto da linha deixada pelo scanf, se
+# ele for só brancos (o '\n' do valor digitado).
+#
+# No caso comum (%d, %f ou %s sem largura nem texto em volta) os valores
+# completos do buffer são separados de uma vez numa fila de tokens, e cada
+# leitura só tira o próximo da fila e o converte; a posição no buffer só é
+# recalculada quando uma leitura caractere a caractere (%c, gets, texto do
+# formato) precisa dela.
+#
+# A saída é descarregada antes de cada leitura do sistema, para que os
+# prompts apareçam antes de o programa esperar pela entrada.
+
+BRANCOS = " \t\n\v\f\r"
+
+LIMITE_BLOCO = 64 * 1024
+
+JANELA_INICIAL = 256
+
+ESPECIFICADOR = re.compile(r"%(\d+)?(hh|h|ll|l|L|z|j|t)?([diufFeEgGcs])")
+
+_BRANCOS = re.compile(r"[ \t\n\v\f\r]*")
+_BRANCO = re.compile(r"[ \t\n\v\f\r]")
+_TOKEN = re.compile(r"[^ \t\n\v\f\r]+")
+_PADROES = {
+    "d": re.compile(r"[ \t\n\v\f\r]*([+-]?[0-9]+)"),
+    "f": re.compile(r"[ \t\n\v\f\r]*([+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)"),
+    "s": re.compile(r"[ \t\n\v\f\r]*([^ \t\n\v\f\r]+)"),
+}
+_CONVERSOES = {"d": int, "f": float, "s": str}
+_TIPOS = {"d": "d", "i": "d", "u": "d", "f": "f", "F": "f", "e": "f", "E": "f", "g": "f", "G": "f",
+          "c": "c", "s": "s"}
+
+
+class ConversaoScanf:
+    # Uma conversão do formato, com o texto do formato que vem antes dela
+    # (prefixo) e, na última, o que vem depois (sufixo).
+    __slots__ = ("prefixo", "tipo", "largura", "sufixo", "ultima", "direta", "converter")
+
+    def __init__(self, prefixo, tipo, largura):
+        self.prefixo = prefixo
+        self.tipo = tipo
+        self.largura = largura
+        self.sufixo = ""
+        self.ultima = False
+        self.converter = _CONVERSOES.get(tipo)
+        self._classificar()
+
+    def _classificar(self):
+        # Direta: pode ser servida pela fila de tokens (brancos antes de
+        # %d/%f/%s não mudam nada, já que a conversão os pula).
+        self.direta = (self.tipo != "c" and self.largura is None and not self.prefixo.strip(BRANCOS)
+                       and not self.sufixo)
+
+    def __repr__(self):
+        return f"%{self.largura or ''}{self.tipo}"
+
+
+class PlanoScanf:
+    __slots__ = ("texto", "conversoes", "erro")
+
+    def __init__(self, texto, conversoes, erro=None):
+        self.texto = texto
+        self.conversoes = conversoes
+        self.erro = erro
+
+    def __repr__(self):
+        return f"scanf({self.texto!r})"
+
+
+def compilar_scanf(texto):
+    # `texto` é o formato já decodificado (escapes de C resolvidos).
+    conversoes = []
+    prefixo = []
+    posicao = 0
+    while True:
+        inicio = texto.find("%", posicao)
+        if inicio < 0:
+            prefixo.append(texto[posicao:])
+            break
+        prefixo.append(texto[posicao:inicio])
+        if texto.startswith("%%", inicio):
+            prefixo.append("%")
+            posicao = inicio + 2
+            continue
+        especificador = ESPECIFICADOR.match(texto, inicio)
+        if especificador is None:
+            erro = f"Erro: Especificador de formato inválido em {texto!r} na posição {inicio} - Verifique o scanf."
+            return PlanoScanf(texto, (), erro)
+        largura, _, conversao = especificador.groups()
+        conversoes.append(ConversaoScanf("".join(prefixo), _TIPOS[conversao], int(largura) if largura else None))
+        prefixo = []
+        posicao = especificador.end()
+    if conversoes:
+        conversoes[-1].sufixo = "".join(prefixo)
+        conversoes[-1].ultima = True
+        conversoes[-1]._classificar()
+    return PlanoScanf(texto, tuple(conversoes))
+
+
+class EntradaBufferizada:
+    def __init__(self, saida=None, fluxo=None, limite=LIMITE_BLOCO):
+        # `fluxo`: um arquivo binário; por padrão, o sys.stdin do momento da
+        # leitura (para respeitar redirecionamentos).
+        self.saida = saida
+        self.fluxo = fluxo
+        self.limite = limite
+        self._texto = ""
+        self._posicao = 0
+        self._fim = False
+        self._fim_de_scanf = False
+        self._decodificador = codecs.getincrementaldecoder("utf-8")("replace")
+        # Tokens separados a partir de _inicio_fila e o iterador que os
+        # entrega.
+        self._tokens = []
+        self._fila = iter(self._tokens)
+        self._inicio_fila = 0
+        self._fim_fila = 0
+        self._janela = JANELA_INICIAL
+
+    def _ler_bloco(self):
+        if self.saida is not None:
+            self.saida.descarregar()
+        fluxo = self.fluxo
+        if fluxo is None:
+            fluxo = getattr(sys.stdin, "buffer", None)
+        if fluxo is not None:
+            bloco = fluxo.read1(self.limite) if hasattr(fluxo, "read1") else fluxo.read(self.limite)
+            texto = self._decodificador.decode(bloco, final=not bloco)
+        else:
+            bloco = texto = sys.stdin.read(self.limite)
+        if not bloco:
+            self._fim = True
+        self._texto = self._texto[self._posicao:] + texto
+        self._posicao = 0
+
+    def _sincronizar(self, devolvidos=0):
+        # Leva _posicao para depois do último token entregue (menos os
+        # `devolvidos`) e esvazia a fila.
+        restantes = length_hint(self._fila) + devolvidos
+        if restantes == 0:
+            if self._tokens:
+                self._posicao = self._fim_fila
+        elif restantes < len(self._tokens):
+            entregues = len(self._tokens) - restantes
+            for encontrado in islice(_TOKEN.finditer(self._texto, self._inicio_fila), entregues - 1, None):
+                self._posicao = encontrado.end()
+                break
+        self._tokens = []
+        self._fila = iter(self._tokens)
+
+    def _encher_fila(self):
+        # Separa os tokens completos de uma janela do buffer (que dobra a cada
+        # vez que a fila se esgota sem leituras por caractere no meio).
+        self._sincronizar()
+        self._garantir_token()
+        texto = self._texto
+        inicio = self._posicao
+        fim = len(texto)
+        limite = min(fim, inicio + self._janela)
+        corte = max(texto.rfind(branco, inicio, limite) for branco in BRANCOS)
+        if limite == fim and self._fim:
+            corte = fim
+        elif corte <= inicio:
+            # Um token maior que a janela: vai até o branco depois dele.
+            encontrado = _BRANCO.search(texto, _BRANCOS.match(texto, inicio).end())
+            corte = encontrado.start() if encontrado is not None else fim
+        self._tokens = _TOKEN.findall(texto, inicio, corte)
+        self._fila = iter(self._tokens)
+        self._inicio_fila = inicio
+        while corte > inicio and texto[corte - 1] in BRANCOS:
+            corte -= 1
+        self._fim_fila = corte
+        self._janela = min(2 * self._janela, self.limite)
+        return bool(self._tokens)
+
+    def _token(self, conversao):
+        token = next(self._fila, None)
+        if token is None:
+            if not self._encher_fila():
+                return self._valor(conversao)
+            token = next(self._fila)
+        converter = conversao.converter
+        if converter is str:
+            return token
+        if token.isascii() and "_" not in token:
+            try:
+                return converter(token)
+            except ValueError:
+                pass
+        # Algo como "12abc" em %d: como em C, a conversão lê só o prefixo.
+        self._sincronizar(devolvidos=1)
+        self._janela = JANELA_INICIAL
+        return self._valor(conversao)
+
+    def _garantir_token(self):
+        # Garante que o próximo valor (depois dos brancos) está inteiro no
+        # buffer: há um branco depois dele ou a entrada acabou.
+        while not self._fim:
+            inicio = _BRANCOS.match(self._texto, self._posicao).end()
+            if inicio < len(self._texto) and _BRANCO.search(self._texto, inicio):
+                return
+            self._ler_bloco()
+
+    def _garantir(self, quantidade):
+        while not self._fim and len(self._texto) - self._posicao < quantidade:
+            self._ler_bloco()
+        return len(self._texto) - self._posicao >= quantidade
+
+    def _pular_brancos(self):
+        while True:
+            self._posicao = _BRANCOS.match(self._texto, self._posicao).end()
+            if self._posicao < len(self._texto) or not self._garantir(1):
+                return
+
+    def _descartar_fim_de_linha(self):
+        if not self._fim_de_scanf:
+            return
+        self._fim_de_scanf = False
+        while True:
+            fim = self._texto.find("\n", self._posicao)
+            if fim >= 0 or self._fim:
+                break
+            self._ler_bloco()
+        resto = self._texto[self._posicao:] if fim < 0 else self._texto[self._posicao:fim]
+        if not resto.strip(BRANCOS):
+            self._posicao += len(resto) + (fim >= 0)
+
+    def _casar_formato(self, texto):
+        for caractere in texto:
+            if caractere in BRANCOS:
+                self._pular_brancos()
+            elif self._garantir(1) and self._texto[self._posicao] == caractere:
+                self._posicao += 1
+            else:
+                encontrado = self._texto[self._posicao:self._posicao + 10] if self._garantir(1) else "fim da entrada"
+                raise Exception(f"Erro: Esperado '{caractere}' na entrada do scanf, mas foi encontrado '{encontrado}'.")
+
+    def _valor(self, conversao):
+        if conversao.tipo == "c":
+            if not self._garantir(1):
+                raise Exception("Erro: Fim da entrada ao ler %c no scanf.")
+            caractere = self._texto[self._posicao]
+            self._posicao += 1
+            return caractere
+        padrao = _PADROES[conversao.tipo]
+        encontrado = padrao.match(self._texto, self._posicao)
+        if (encontrado is None or encontrado.end() == len(self._texto)) and not self._fim:
+            # O valor pode continuar no próximo bloco.
+            self._garantir_token()
+            encontrado = padrao.match(self._texto, self._posicao)
+        if encontrado is None:
+            token = _PADROES["s"].match(self._texto, self._posicao)
+            if token is None:
+                raise Exception(f"Erro: Fim da entrada ao ler {conversao!r} no scanf.")
+            raise Exception(f"Erro: Valor '{token.group(1)}' incompatível com {conversao!r} no scanf.")
+        inicio, fim = encontrado.span(1)
+        if conversao.largura is not None and fim - inicio > conversao.largura:
+            fim = inicio + conversao.largura
+        self._posicao = fim
+        try:
+            return _CONVERSOES[conversao.tipo](self._texto[inicio:fim])
+        except ValueError:
+            raise Exception(f"Erro: Valor '{self._texto[inicio:fim]}' incompatível com {conversao!r} no scanf.")
+
+    def ler(self, conversao, quantidade=None):
+        # Lê o valor de uma conversão (ou `quantidade` valores seguidos, para
+        # preencher um array) com o texto do formato em volta dela.
+        if conversao.direta:
+            if quantidade is None:
+                valor = self._token(conversao)
+            else:
+                valor = [self._token(conversao) for _ in range(quantidade)]
+            self._fim_de_scanf = conversao.ultima
+            return valor
+        self._sincronizar()
+        self._janela = JANELA_INICIAL
+        if conversao.prefixo or conversao.tipo == "c":
+            if conversao.tipo == "c" and not conversao.prefixo:
+                self._descartar_fim_de_linha()
+            self._casar_formato(conversao.prefixo)
+        self._fim_de_scanf = False
+        if quantidade is None:
+            valor = self._valor(conversao)
+        else:
+            valor = [self._valor(conversao) for _ in range(quantidade)]
+        if conversao.ultima:
+            if conversao.sufixo:
+                self._casar_formato(conversao.sufixo)
+            self._fim_de_scanf = True
+        return valor
+
+    def linha(self):
+        # Uma linha inteira (gets), sem o '\n'; None no fim da entrada.
+        self._sincronizar()
+        self._janela = JANELA_INICIAL
+        self._descartar_fim_de_linha()
+        while True:
+            fim = self._texto.find("\n", self._posicao)
+            if fim >= 0 or self._fim:
+                break
+            self._ler_bloco()
+        if fim < 0:
+            if self._posicao >= len(self._texto):
+                return None
+            fim = len(self._texto)
+        linha = self._texto[self._posicao:fim]
+        self._posicao = fim + 1
+        if linha.endswith("\r"):
+            linha = linha[:-1]
+        return linha
@@ -0,0 +1,138 @@
+from collections import namedtuple
+
+from antlr4.tree.Tree import TerminalNode
+
+from CParser import CParser
+from resolvedor import LOCAL
+
+# Expansão em linha (inlining) das funções folha pequenas, executada depois
+# da dobra de constantes. Uma função é expandida nos pontos de chamada quando
+#
+#   o corpo é um único `return expressão;`;
+#   a expressão não chama nenhuma função (a função é folha, então nunca é
+#   recursiva) e tem no máximo `limite` nós de expressão;
+#   é a única definição com esse nome e a chamada passa o número certo de
+#   argumentos (as demais continuam chamadas, que reportam o erro).
+#
+# Só as chamadas dentro de funções são expandidas. Os motores compilados
+# rebaixam a chamada com a mesma semântica dela: os argumentos são avaliados
+# uma vez, em ordem, e guardados em slots extras do quadro de quem chama (um
+# argumento None deixa o slot vazio, como no parâmetro); a expressão do
+# return é compilada lendo os parâmetros desses slots; e o resultado None
+# vira o valor padrão do tipo da função (retorno_padrao), como no fim da
+# chamada. Um argumento que é leitura segura de variável local
+# (resolucao.leituras_seguras) dispensa o slot extra: o parâmetro lê direto a
+# variável de quem chama, que nenhuma outra chamada pode alterar.
+
+# Número máximo de nós de expressão do return de uma função expandida.
+LIMITE_PADRAO = 16
+
+# Chamada expandida: `funcao` é o nome da função chamada, `corpo` a
+# expressão do seu return, `escopo` o EscopoFuncao dela (os parâmetros são os
+# slots 0..n-1), `diretos` diz, por argumento, se ele é lido direto da
+# variável local de quem chama e `tipado` se o corpo tem representação
+# conhecida (nunca produz None). `chamador`, `linha` e `tamanho` vão para o
+# relatório.
+Expandida = namedtuple("Expandida", ["funcao", "corpo", "escopo", "tipo", "diretos", "tipado",
+                                     "chamador", "linha", "tamanho"])
+
+
+def tamanho(ctx):
+    # Número de nós de expressão de `ctx`.
+    if isinstance(ctx, TerminalNode):
+        return 0
+    total = 1 if isinstance(ctx, CParser.ExpressionContext) else 0
+    for i in range(ctx.getChildCount()):
+        total += tamanho(ctx.getChild(i))
+    return total
+
+
+def _chama_funcao(ctx):
+    if isinstance(ctx, TerminalNode):
+        return False
+    if isinstance(ctx, CParser.FunctionCallContext):
+        return True
+    return any(_chama_funcao(ctx.getChild(i)) for i in range(ctx.getChildCount()))
+
+
+class Expansao:
+    def __init__(self, resolucao, limite=LIMITE_PADRAO):
+        self.resolucao = resolucao
+        self.limite = limite
+        # nome -> (ctx da definição, expressão do return, tamanho).
+        self._candidatas = {}
+        self._chamador = None
+
+    def analisar(self, tree):
+        definicoes = {}
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                definicoes.setdefault(filho.Identifier().getText(), []).append(filho)
+        for nome, ctxs in definicoes.items():
+            if len(ctxs) == 1:
+                corpo = self._corpo_expansivel(ctxs[0])
+                if corpo is not None:
+                    self._candidatas[nome] = (ctxs[0], corpo, tamanho(corpo))
+        if not self._candidatas:
+            return
+        for nome, ctxs in definicoes.items():
+            self._chamador = nome
+            for ctx in ctxs:
+                self._percorrer(ctx.block())
+        self._chamador = None
+
+    def _corpo_expansivel(self, ctx):
+        comandos = ctx.block().statement()
+        if len(comandos) != 1 or comandos[0].getChild(0).getText() != 'return':
+            return None
+        expressao = comandos[0].expression()
+        if expressao is None or _chama_funcao(expressao) or tamanho(expressao) > self.limite:
+            return None
+        return expressao
+
+    def _percorrer(self, ctx):
+        if isinstance(ctx, TerminalNode):
+            return
+        if isinstance(ctx, CParser.FunctionCallContext):
+            self._chamada(ctx)
+        for i in range(ctx.getChildCount()):
+            self._percorrer(ctx.getChild(i))
+
+    def _chamada(self, ctx):
+        nome = ctx.Identifier().getText()
+        if nome not in self._candidatas:
+            return
+        definicao, corpo, n_nos = self._candidatas[nome]
+        escopo = self.resolucao.funcoes[nome]
+        argumentos = ctx.argumentList().expression() if ctx.argumentList() is not None else []
+        if len(argumentos) != escopo.n_parametros:
+            return
+        self.resolucao.expansoes[ctx] = Expandida(
+            nome, corpo, escopo, definicao.type_().getText(),
+            tuple(self._direto(argumento) for argumento in argumentos),
+            corpo in self.resolucao.tipos_expressoes,
+            self._chamador, ctx.start.line, n_nos)
+
+    def _direto(self, ctx):
+        if ctx.getChildCount() != 1 or ctx.Identifier() is None:
+            return False
+        token = ctx.Identifier()
+        endereco = self.resolucao.enderecos.get(token)
+        return endereco is not None and endereco.escopo == LOCAL and token in self.resolucao.leituras_seguras
+
+
+def _nos(n):
+    return f"{n} nó" if n == 1 else f"{n} nós"
+
+
+def relatorio(resolucao, limite):
+    # Texto do --inline-report: as chamadas expandidas, na ordem do fonte.
+    expandidas = sorted(resolucao.expansoes.values(), key=lambda e: (e.linha, e.chamador, e.funcao))
+    if limite <= 0:
+        return "Expansão em linha desativada."
+    linhas = [f"Expansão em linha (até {_nos(limite)}): {len(expandidas)} "
+              + ("chamada expandida" if len(expandidas) == 1 else "chamadas expandidas")]
+    for e in expandidas:
+        linhas.append(f"  linha {e.linha}, em {e.chamador}: {e.funcao} ({_nos(e.tamanho)})")
+    return "\n".join(linhas)
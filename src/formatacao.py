@@ -0,0 +1,178 @@
+import re
+
+from vetores import VetorChar
+
+# Formatação do printf. O literal de formato de cada printf é compilado uma
+# única vez (por ponto de chamada) num PlanoPrintf: uma string de formato do
+# Python, com os trechos literais já escapados, e um conversor por
+# especificador, que leva o argumento ao tipo que a conversão de C espera
+# (%d de um float trunca, %c de um int é o caractere, %s para no '\0', %x de
+# um negativo usa o complemento de dois). Aplicar o plano é só converter os
+# argumentos e fazer uma única operação '%'.
+
+ESPECIFICADOR = re.compile(r"%([-+ #0]*)(\d+)?(?:\.(\d*))?(hh|h|ll|l|L|z|j|t)?([diuoxXfFeEgGcs%])")
+
+MASCARAS = {None: 0xFFFFFFFF, "hh": 0xFF, "h": 0xFFFF, "l": 0xFFFFFFFFFFFFFFFF, "ll": 0xFFFFFFFFFFFFFFFF,
+            "L": 0xFFFFFFFFFFFFFFFF, "z": 0xFFFFFFFFFFFFFFFF, "j": 0xFFFFFFFFFFFFFFFF, "t": 0xFFFFFFFFFFFFFFFF}
+
+
+def decodificar_literal(texto):
+    # Texto de um StringLiteral (com as aspas) -> valor, com os escapes de C.
+    return bytes(texto.strip('"'), "utf-8").decode("unicode_escape")
+
+
+def texto_c(valor):
+    # String de C: um array de char (VetorChar ou lista) ou str, até o
+    # primeiro '\0'. Numa lista, uma posição ainda não inicializada (None)
+    # também encerra a string.
+    if type(valor) is VetorChar:
+        return valor.texto()
+    if isinstance(valor, list):
+        try:
+            texto = "".join(valor)
+        except TypeError:
+            texto = None
+        if texto is not None and len(texto) == len(valor):
+            fim = texto.find("\0")
+            return texto if fim < 0 else texto[:fim]
+        caracteres = []
+        for ch in valor:
+            if ch is None or ch == "\0":
+                break
+            if not isinstance(ch, str) or len(ch) != 1:
+                return None
+            caracteres.append(ch)
+        return "".join(caracteres)
+    if not isinstance(valor, str):
+        return None
+    fim = valor.find("\0")
+    return valor if fim < 0 else valor[:fim]
+
+
+def _invalido(valor, conversao):
+    raise Exception(f"Erro: Valor '{valor}' incompatível com %{conversao} - Verifique os argumentos do printf.")
+
+
+def _inteiro(valor):
+    if type(valor) is int:
+        return valor
+    if isinstance(valor, (int, float)):
+        return int(valor)
+    if isinstance(valor, str) and len(valor) == 1:
+        return ord(valor)
+    _invalido(valor, "d")
+
+
+def _sem_sinal(mascara):
+    def converter(valor):
+        return _inteiro(valor) & mascara
+    return converter
+
+
+def _real(valor):
+    if type(valor) is float:
+        return valor
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    _invalido(valor, "f")
+
+
+def _caractere(valor):
+    if isinstance(valor, str) and len(valor) == 1:
+        return valor
+    if isinstance(valor, int):
+        return chr(valor & 0xFF)
+    _invalido(valor, "c")
+
+
+def _texto(valor):
+    texto = texto_c(valor)
+    if texto is None:
+        _invalido(valor, "s")
+    return texto
+
+
+def _conversor(conversao, tamanho):
+    # (tipo, conversor): um argumento exatamente do tipo vai direto para o '%',
+    # sem chamar o conversor (o caso comum).
+    if conversao in "di":
+        return int, _inteiro
+    if conversao in "uoxX":
+        return None, _sem_sinal(MASCARAS[tamanho])
+    if conversao in "fFeEgG":
+        return float, _real
+    if conversao == "c":
+        return None, _caractere
+    return None, _texto
+
+
+class PlanoPrintf:
+    __slots__ = ("texto", "formato", "tipos", "conversores", "direto", "erro")
+
+    def __init__(self, texto, formato, tipos, conversores, erro=None):
+        self.texto = texto
+        self.formato = formato
+        self.tipos = tipos
+        self.conversores = conversores
+        # Só %d/%i e %f/%e/%g: o '%' do Python já trunca um float em %d e
+        # aceita um int em %f, como C; os conversores só entram se ele recusar
+        # algum argumento (um char em %d, por exemplo).
+        self.direto = bool(conversores) and all(tipo is not None for tipo in tipos)
+        self.erro = erro
+
+    def __repr__(self):
+        return f"printf({self.texto!r})"
+
+    def __reduce__(self):
+        # Os conversores são closures; no cache do bytecode o plano é
+        # guardado pelo texto e recompilado na carga.
+        return compilar_printf, (self.texto,)
+
+    def formatar(self, argumentos):
+        conversores = self.conversores
+        if self.erro is not None:
+            raise Exception(self.erro)
+        if len(argumentos) != len(conversores):
+            raise Exception(f"Erro: O formato {self.texto!r} espera {len(conversores)} argumentos, "
+                            f"mas {len(argumentos)} foram passados - Verifique os argumentos do printf.")
+        if not conversores:
+            return self.formato
+        if self.direto:
+            try:
+                return self.formato % tuple(argumentos)
+            except TypeError:
+                pass
+        return self.formato % tuple([valor if type(valor) is tipo else converter(valor)
+                                     for tipo, converter, valor in zip(self.tipos, conversores, argumentos)])
+
+
+def compilar_printf(texto):
+    # `texto` é o formato já decodificado (escapes de C resolvidos).
+    partes = []
+    tipos = []
+    conversores = []
+    posicao = 0
+    while True:
+        inicio = texto.find("%", posicao)
+        if inicio < 0:
+            partes.append(texto[posicao:])
+            break
+        partes.append(texto[posicao:inicio])
+        especificador = ESPECIFICADOR.match(texto, inicio)
+        if especificador is None:
+            erro = f"Erro: Especificador de formato inválido em {texto!r} na posição {inicio} - Verifique os argumentos do printf."
+            return PlanoPrintf(texto, texto, (), (), erro)
+        flags, largura, precisao, tamanho, conversao = especificador.groups()
+        if conversao == "%":
+            partes.append("%%")
+        else:
+            tipo, converter = _conversor(conversao, tamanho)
+            tipos.append(tipo)
+            conversores.append(converter)
+            python = {"i": "d", "u": "d"}.get(conversao, conversao)
+            partes.append("%" + flags + (largura or "") + ("." + precisao if precisao is not None else "") + python)
+        posicao = especificador.end()
+    formato = "".join(partes)
+    if not conversores:
+        formato = formato % ()
+    return PlanoPrintf(texto, formato, tuple(tipos), tuple(conversores))
@@ -0,0 +1,410 @@
+from antlr4.tree.Tree import TerminalNode
+
+from CParser import CParser
+from cauda import Cauda
+from constantes import Constantes
+from expansao import LIMITE_PADRAO, Expansao
+from limites import Limites
+from pureza import Pureza
+from resolvedor import GLOBAL, LOCAL, MACRO, Endereco
+from tipagem import representacao, resolver_e_tipar
+
+# Análise de inicialização definida, executada depois da tipagem. Percorre o
+# fluxo de controle de cada função (if/else, laços, switch com fall-through,
+# break e return) e, em cada ponto, calcula dois conjuntos de variáveis:
+#
+#   certas     as que receberam valor em todos os caminhos até ali;
+#   possiveis  as que receberam valor em algum caminho.
+#
+# Uma leitura de variável em `certas` nunca encontra o slot vazio, e os
+# motores compilados a fazem sem a verificação de NAO_INICIALIZADA
+# (resolucao.leituras_seguras). Uma leitura de variável fora de `possiveis`
+# sempre falharia e é reportada antes da execução.
+#
+# Só conta como inicialização uma escrita que nunca deixa o slot vazio: a
+# conversão para int, float, char ou struct recusa None, e os demais valores
+# precisam ter representação garantida pela tipagem (um campo de struct ou a
+# posição de um array de structs ainda podem ser None). Parâmetros estão
+# inicializados quando todo argumento passado a eles tem valor. Globais e
+# macros entram na função já inicializadas quando o nível superior (que roda
+# antes de main e de toda chamada que ele faz) as inicializa e nenhuma
+# escrita do programa pode esvaziá-las de novo.
+
+
+def resolver_e_analisar(tree, limite_expansao=LIMITE_PADRAO):
+    # limite_expansao: tamanho máximo das funções expandidas em linha (0
+    # desativa a expansão).
+    resolucao = resolver_e_tipar(tree)
+    if not resolucao.erros:
+        Inicializacao(resolucao).analisar(tree)
+    if not resolucao.erros:
+        Constantes(resolucao).analisar(tree)
+        Limites(resolucao).analisar(tree)
+        if limite_expansao > 0:
+            Expansao(resolucao, limite_expansao).analisar(tree)
+        Cauda(resolucao).analisar(tree)
+        Pureza(resolucao).analisar(tree)
+    return resolucao
+
+
+def _juntar(a, b):
+    # Estado = (certas, possiveis); None para um ponto inalcançável.
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a[0] & b[0], a[1] | b[1]
+
+
+def _inicializar(estado, chave):
+    return estado[0] | {chave}, estado[1] | {chave}
+
+
+def _talvez_inicializar(estado, chave):
+    return estado[0] - {chave}, estado[1] | {chave}
+
+
+def _esvaziar(estado, chave):
+    return estado[0] - {chave}, estado[1] - {chave}
+
+
+class Inicializacao:
+    def __init__(self, resolucao):
+        self.resolucao = resolucao
+        self.tipos = resolucao.tipos_expressoes
+        self.definicoes = {}
+        self.globais = frozenset(Endereco(GLOBAL, i) for i in range(resolucao.globais.n_locais))
+        self.macros = frozenset(Endereco(MACRO, nome) for nome in resolucao.macros)
+        # Globais com alguma escrita que pode deixar o slot vazio, e, por
+        # função, se cada parâmetro sempre recebe um argumento com valor.
+        self._instaveis = set()
+        self._argumentos = {}
+        # token -> (inicializada em todos os caminhos, em algum caminho,
+        # função da leitura)
+        self._leituras = {}
+        self._estados_chamadas = []
+        self._quebras = []
+        self._escopo = None
+
+    def analisar(self, tree):
+        filhos = [tree.getChild(i) for i in range(tree.getChildCount())]
+        for filho in filhos:
+            if isinstance(filho, CParser.FunctionDefContext):
+                nome = filho.Identifier().getText()
+                self.definicoes[nome] = filho
+                self._argumentos[nome] = [True] * self.resolucao.funcoes[nome].n_parametros
+
+        self._escopo = None
+        for filho in filhos:
+            if isinstance(filho, (CParser.StatementContext, CParser.DirectiveContext)):
+                self._examinar_escritas(filho)
+        for nome, ctx in self.definicoes.items():
+            self._escopo = self.resolucao.funcoes[nome]
+            self._examinar_escritas(ctx.block())
+
+        # Nível superior, na ordem do programa.
+        self._escopo = None
+        estado = (frozenset(), frozenset())
+        for filho in filhos:
+            if isinstance(filho, CParser.StatementContext):
+                estado = self._comando(filho, estado)
+            elif isinstance(filho, CParser.DirectiveContext) and filho.expression() is not None:
+                estado = self._expressao(filho.expression(), estado)
+                estado = _inicializar(estado, Endereco(MACRO, filho.Identifier().getText()))
+        seguras = estado[0] if estado is not None else frozenset()
+        for certas in self._estados_chamadas:
+            seguras &= certas
+        seguras -= self._instaveis
+
+        for nome, ctx in self.definicoes.items():
+            self._escopo = self.resolucao.funcoes[nome]
+            parametros = [Endereco(LOCAL, i) for i in range(self._escopo.n_parametros)]
+            certas = {chave for chave, com_valor in zip(parametros, self._argumentos[nome]) if com_valor}
+            if nome == "main":
+                certas = set()
+            self._comando(ctx.block(), (frozenset(certas) | seguras, frozenset(parametros) | self.globais | self.macros))
+        self._escopo = None
+
+        # Uma macro lida antes do seu #define já é um erro de nome nos
+        # motores; só as leituras de variáveis são diagnosticadas aqui.
+        for token, (certa, possivel, funcao) in self._leituras.items():
+            if certa:
+                self.resolucao.leituras_seguras.add(token)
+            elif not possivel and self.resolucao.enderecos[token].escopo != MACRO:
+                onde = f" (função '{funcao}')" if funcao is not None else ""
+                self.resolucao.erros.append(f"Variável '{token.getText()}' não foi inicializada antes do uso{onde}.")
+
+    # ------------------------------------------------------------------
+    # Escritas e argumentos
+
+    def _chave(self, token):
+        # O endereço léxico identifica a variável: o slot local ou global, ou
+        # a macro, que recebe valor no #define.
+        return self.resolucao.enderecos.get(token)
+
+    def _com_valor(self, ctx):
+        # A expressão nunca produz None: tem representação conhecida, é um
+        # literal ou uma operação (que falharia antes com um operando None).
+        if ctx in self.tipos:
+            return True
+        child_count = ctx.getChildCount()
+        if child_count == 3 and ctx.getChild(0).getText() == '(':
+            return self._com_valor(ctx.getChild(1))
+        if child_count == 2 or (child_count == 3 and ctx.getChild(1).getText() not in ('.', '[')):
+            return True
+        return child_count == 1 and (ctx.Number() is not None or ctx.StringLiteral() is not None
+                                     or ctx.CharLiteral() is not None)
+
+    def _escrita_convertida(self, token, valor):
+        # A conversão para o tipo declarado recusa None nos tipos com
+        # representação; nos demais o valor passa como veio.
+        tipo = self.resolucao.tipo(token, self._escopo) or ""
+        return representacao(tipo) is not None or self._com_valor(valor)
+
+    def _examinar_escritas(self, ctx):
+        if isinstance(ctx, TerminalNode):
+            return
+        if isinstance(ctx, CParser.AssignmentContext) and len(ctx.Identifier()) == 1 and ctx.getChild(1).getText() == '=':
+            chave = self._chave(ctx.Identifier(0))
+            if chave is not None and chave.escopo == GLOBAL and not self._escrita_convertida(ctx.Identifier(0), ctx.expression(0)):
+                self._instaveis.add(chave)
+        elif isinstance(ctx, CParser.ForHeaderAssignmentContext):
+            chave = self._chave(ctx.Identifier())
+            if chave is not None and chave.escopo == GLOBAL and not self._com_valor(ctx.expression()):
+                self._instaveis.add(chave)
+        elif isinstance(ctx, CParser.FunctionCallContext):
+            argumentos = ctx.argumentList().expression() if ctx.argumentList() is not None else []
+            com_valor = self._argumentos.get(ctx.Identifier().getText())
+            if com_valor is not None:
+                for k in range(len(com_valor)):
+                    com_valor[k] = com_valor[k] and k < len(argumentos) and self._com_valor(argumentos[k])
+        for i in range(ctx.getChildCount()):
+            self._examinar_escritas(ctx.getChild(i))
+
+    # ------------------------------------------------------------------
+    # Comandos
+
+    def _ler(self, token, estado):
+        chave = self._chave(token)
+        if chave is None:
+            return
+        funcao = self._escopo.nome if self._escopo is not None else None
+        self._leituras[token] = (chave in estado[0], chave in estado[1], funcao)
+
+    def _comando(self, ctx, estado):
+        if estado is None or isinstance(ctx, TerminalNode):
+            return estado
+
+        if isinstance(ctx, CParser.StatementContext):
+            filho = ctx.getChild(0)
+            if filho.getText() == "return":
+                if ctx.expression() is not None:
+                    self._expressao(ctx.expression(), estado)
+                return None
+            if isinstance(filho, CParser.FunctionCallContext):
+                return self._chamada(filho, estado)
+            return self._comando(filho, estado)
+
+        if isinstance(ctx, CParser.BlockContext):
+            for stmt in ctx.statement():
+                estado = self._comando(stmt, estado)
+            return estado
+
+        if isinstance(ctx, CParser.VarDeclContext):
+            return self._declaracao(ctx, estado)
+
+        if isinstance(ctx, CParser.AssignmentContext):
+            return self._atribuicao(ctx, estado)
+
+        if isinstance(ctx, CParser.ForHeaderAssignmentContext):
+            estado = self._expressao(ctx.expression(), estado)
+            chave = self._chave(ctx.Identifier())
+            if chave is None:
+                return estado
+            if self._com_valor(ctx.expression()):
+                return _inicializar(estado, chave)
+            return _talvez_inicializar(estado, chave)
+
+        if isinstance(ctx, CParser.IfStatementContext):
+            estado = self._expressao(ctx.expression(), estado)
+            entao = self._comando(ctx.statement(0), estado)
+            senao = self._comando(ctx.statement(1), estado) if ctx.statement(1) is not None else estado
+            return _juntar(entao, senao)
+
+        if isinstance(ctx, CParser.WhileStatementContext):
+            return self._laco(estado, ctx.expression(), ctx.statement(), None)
+
+        if isinstance(ctx, CParser.DoWhileStatementContext):
+            return self._faca_enquanto(ctx, estado)
+
+        if isinstance(ctx, CParser.ForStatementContext):
+            partes = [None, None, None]
+            posicao = 0
+            for i in range(2, ctx.getChildCount() - 2):
+                filho = ctx.getChild(i)
+                if filho.getText() == ';':
+                    posicao += 1
+                else:
+                    partes[posicao] = filho
+            inicio, condicao, passo = partes
+            if inicio is not None:
+                estado = self._comando(inicio, estado)
+            return self._laco(estado, condicao, ctx.statement(), passo)
+
+        if isinstance(ctx, CParser.SwitchStatementContext):
+            return self._switch(ctx, estado)
+
+        if isinstance(ctx, CParser.BreakStatementContext):
+            if self._quebras:
+                self._quebras[-1].append(estado)
+            return None
+
+        if isinstance(ctx, CParser.InputOutputStatementContext):
+            return self._entrada_saida(ctx, estado)
+
+        return estado
+
+    def _declaracao(self, ctx, estado):
+        init = ctx.init()
+        if init is not None:
+            for expressao in (init.initializerList().expression() if init.initializerList() is not None
+                              else [init.expression()]):
+                estado = self._expressao(expressao, estado)
+        chave = self._chave(ctx.Identifier())
+        if chave is None:
+            return estado
+        tipo = ctx.type_().getText()
+        # Arrays, structs e unions recebem o objeto na declaração; um escalar
+        # sem inicializador (mesmo redeclarado numa volta do laço) fica vazio.
+        if ctx.arraySize() or tipo.startswith("struct") or tipo.startswith("union"):
+            return _inicializar(estado, chave)
+        if init is None:
+            return _esvaziar(estado, chave)
+        if init.expression() is not None and (representacao(tipo) is not None or self._com_valor(init.expression())):
+            return _inicializar(estado, chave)
+        return _talvez_inicializar(estado, chave)
+
+    def _atribuicao(self, ctx, estado):
+        for expressao in ctx.expression():
+            estado = self._expressao(expressao, estado)
+        token = ctx.Identifier(0)
+        if ctx.getChild(1).getText() != '=':
+            # v[i] = ... e p.campo = ... leem a variável, sem escrever nela.
+            self._ler(token, estado)
+            return estado
+        chave = self._chave(token)
+        if chave is None:
+            return estado
+        if self._escrita_convertida(token, ctx.expression(0)):
+            return _inicializar(estado, chave)
+        return _talvez_inicializar(estado, chave)
+
+    def _entrada_saida(self, ctx, estado):
+        for expressao in ctx.expression():
+            estado = self._expressao(expressao, estado)
+        if ctx.getChild(0).getText() == "gets":
+            chave = self._chave(ctx.Identifier())
+            return _inicializar(estado, chave) if chave is not None else estado
+        for param in ctx.scanfParam():
+            token = param.Identifier()
+            if param.expression() is not None:
+                estado = self._expressao(param.expression(), estado)
+                self._ler(token, estado)
+                continue
+            # O valor lido é convertido para o tipo da variável (ou scanf
+            # falha), então a variável sai inicializada.
+            chave = self._chave(token)
+            if chave is not None:
+                estado = _inicializar(estado, chave)
+        return estado
+
+    def _laco(self, entrada, condicao, corpo, passo):
+        # Ponto fixo no início do laço: junta a entrada com o fim de cada
+        # volta. As leituras ficam registradas com o estado da última volta,
+        # que é o estável.
+        inicio = entrada
+        while True:
+            estado = self._expressao(condicao, inicio) if condicao is not None else inicio
+            self._quebras.append([])
+            fim = self._comando(corpo, estado)
+            quebras = self._quebras.pop()
+            if passo is not None:
+                fim = self._comando(passo, fim)
+            novo = _juntar(entrada, fim)
+            if novo == inicio:
+                break
+            inicio = novo
+        saida = estado if condicao is not None else None
+        for quebra in quebras:
+            saida = _juntar(saida, quebra)
+        return saida
+
+    def _faca_enquanto(self, ctx, entrada):
+        inicio = entrada
+        while True:
+            self._quebras.append([])
+            fim = self._comando(ctx.statement(), inicio)
+            quebras = self._quebras.pop()
+            estado = self._expressao(ctx.expression(), fim) if fim is not None else None
+            novo = _juntar(entrada, estado)
+            if novo == inicio:
+                break
+            inicio = novo
+        saida = estado
+        for quebra in quebras:
+            saida = _juntar(saida, quebra)
+        return saida
+
+    def _switch(self, ctx, estado):
+        # Cada bloco começa no salto do switch ou no fall-through do bloco
+        # anterior; sem default, o switch também pode não executar nenhum.
+        estado = self._expressao(ctx.expression(), estado)
+        blocos = [ctx.getChild(i) for i in range(ctx.getChildCount())
+                  if isinstance(ctx.getChild(i), (CParser.CaseBlockContext, CParser.DefaultBlockContext))]
+        for bloco in blocos:
+            if isinstance(bloco, CParser.CaseBlockContext):
+                estado = self._expressao(bloco.caseLabel().expression(), estado)
+        tem_padrao = any(isinstance(bloco, CParser.DefaultBlockContext) for bloco in blocos)
+
+        self._quebras.append([])
+        anterior = None
+        for bloco in blocos:
+            atual = _juntar(estado, anterior)
+            for stmt in bloco.statement():
+                atual = self._comando(stmt, atual)
+            if bloco.breakStatement() is not None:
+                self._quebras[-1].append(atual)
+                atual = None
+            anterior = atual
+        saida = _juntar(anterior, None if tem_padrao else estado)
+        for quebra in self._quebras.pop():
+            saida = _juntar(saida, quebra)
+        return saida
+
+    # ------------------------------------------------------------------
+    # Expressões
+
+    def _chamada(self, ctx, estado):
+        if ctx.argumentList() is not None:
+            for argumento in ctx.argumentList().expression():
+                estado = self._expressao(argumento, estado)
+        if self._escopo is None:
+            self._estados_chamadas.append(estado[0])
+        # A função chamada pode escrever em qualquer global, mas só esvazia
+        # as instáveis.
+        return estado[0] - self._instaveis, estado[1] | self.globais
+
+    def _expressao(self, ctx, estado):
+        if estado is None:
+            return None
+        if isinstance(ctx, TerminalNode):
+            return estado
+        if isinstance(ctx, CParser.FunctionCallContext):
+            return self._chamada(ctx, estado)
+        if isinstance(ctx, CParser.ExpressionContext):
+            for i in range(ctx.getChildCount()):
+                estado = self._expressao(ctx.getChild(i), estado)
+            primeiro = ctx.getChild(0)
+            if isinstance(primeiro, TerminalNode) and primeiro.getSymbol().type == CParser.Identifier:
+                self._ler(primeiro, estado)
+        return estado
@@ -1,18 +1,56 @@
 from CVisitor import CVisitor
 from CParser import CParser
 from tabela_simbolos import TabelaSimbolos
-
-class BreakException(Exception):
-    pass
-
-class ReturnException(Exception):
-    def __init__(self, value):
-        self.value = value
+from saida import SaidaBufferizada
+from entrada import EntradaBufferizada, compilar_scanf
+from formatacao import compilar_printf, decodificar_literal, texto_c
+from vetores import ajustar, armazenar, codificar, novo_vetor, preencher, vetor_de
+from registros import Registro, Uniao, nome_struct
+from resolvedor import valor_constante
+from pureza import AUSENTE
+
+class SinalConclusao:
+    # Resultado de um comando que encerra o fluxo normal de execução. Os
+    # comandos devolvem None ao terminar normalmente, ou um destes sinais,
+    # que blocos, laços e chamadas verificam (sem lançar exceções).
+    def __init__(self, nome):
+        self.nome = nome
+
+    def __repr__(self):
+        return f"<{self.nome}>"
+
+RETORNO = SinalConclusao("return")
+INTERROMPER = SinalConclusao("break")
+
+def retorno_padrao(tipo_funcao):
+    if tipo_funcao == "int":
+        return 0
+    elif tipo_funcao in ["float", "double"]:
+        return 0.0
+    elif tipo_funcao == "char":
+        return '\0'
+    return None
+
+TIPOS_ENTRADA = {"int", "float", "double", "char", "short", "long", "unsigned", "unsigned int", "unsigned long",
+                 "long long"}
 
 class Interpretador(CVisitor):
-    def __init__(self):
+    def __init__(self, saida=None, entrada=None):
         self.tabela_simbolos = TabelaSimbolos()
+        self.saida = saida if saida is not None else SaidaBufferizada()
+        self.entrada = entrada if entrada is not None else EntradaBufferizada(self.saida)
         self.funcoes = {}  
+        self.valor_retorno = None
+        # Funções puras memorizadas (--memoize): nome -> CacheLRU.
+        self.memorizadas = {}
+        self._tabelas_switch = {}
+        self._planos_printf = {}
+        self._planos_scanf = {}
+        self._literais = {}
+
+    def shouldVisitNextChild(self, node, currentResult):
+        # Um return ou break interrompe o bloco que está sendo visitado.
+        return currentResult is not RETORNO and currentResult is not INTERROMPER
 
     def visitInitializerList(self, ctx):
         valores = []
@@ -42,7 +80,8 @@ class Interpretador(CVisitor):
                 value = self.visit(expr)
         else:
             value = None
-        raise ReturnException(value)
+        self.valor_retorno = value
+        return RETORNO
 
     def visitFunctionDef(self, ctx):
         tipo = ctx.type_().getText()         
@@ -74,11 +113,19 @@ class Interpretador(CVisitor):
         
         if len(param_names) != len(arg_values):
             raise Exception(f"Função '{nome}' espera {len(param_names)} parâmetros, mas {len(arg_values)} foram passados.")
+
+        cache = self.memorizadas.get(nome)
+        chave = cache.chave(arg_values) if cache is not None else None
+        if chave is not None:
+            valor = cache.procurar(chave)
+            if valor is not AUSENTE:
+                return valor
         
         old_tabela = self.tabela_simbolos
         self.tabela_simbolos = TabelaSimbolos(parent=old_tabela)
         self.tabela_simbolos.structs = old_tabela.structs
         self.tabela_simbolos.unions = old_tabela.unions
+        self.tabela_simbolos.macros = old_tabela.macros
         
         param_types = []
         if funcDefCtx.paramList() is not None:
@@ -92,31 +139,26 @@ class Interpretador(CVisitor):
             param_type = param_types[i] if i < len(param_types) else "int"
             self.tabela_simbolos.adicionar_variavel(param, param_type, arg_values[i])
 
-        try:
-            self.visit(funcDefCtx.block())
-            ret_value = None  
-        except ReturnException as re:
-            ret_value = re.value
+        if self.visit(funcDefCtx.block()) is RETORNO:
+            ret_value = self.valor_retorno
+        else:
+            ret_value = None
         
         tipo_funcao = funcDefCtx.type_().getText()
-        if ret_value is None and tipo_funcao != "void":
-            if tipo_funcao == "int":
-                ret_value = 0
-            elif tipo_funcao in ["float", "double"]:
-                ret_value = 0.0
-            elif tipo_funcao == "char":
-                ret_value = '\0'
-            else:
-                ret_value = None  
+        if ret_value is None:
+            ret_value = retorno_padrao(tipo_funcao)
         
         self.tabela_simbolos = old_tabela
+        if chave is not None:
+            cache.guardar(chave, ret_value)
         return ret_value
 
     def visitDirective(self, ctx):
         directive_type = ctx.getChild(0).getText()  
         
-        if directive_type == '#include':
-            included_file = ctx.IncludeFile().getText()  
+        if ctx.IncludeFile() is not None:
+            # O token traz a diretiva inteira: #include <arquivo>.
+            included_file = directive_type[len('#include'):].strip()
             included_file = included_file.strip('<>"')   
 
         elif directive_type == '#define':
@@ -167,11 +209,13 @@ class Interpretador(CVisitor):
                 tam_array = int(size_text)
 
         valor_inicial = None
-        inicializada = False
         if ctx.init():
             valor_inicial = self.visit(ctx.init())
-            inicializada = True
 
+        tipo_var, valor = self._valor_declarado(tipo, nome, is_array, tam_array, valor_inicial, ctx.init() is not None)
+        self.tabela_simbolos.adicionar_variavel(nome, tipo_var, valor)
+
+    def _valor_declarado(self, tipo, nome, is_array, tam_array, valor_inicial, tem_init):
         if is_array:
             tipo_array = tipo + "[]"
 
@@ -179,10 +223,12 @@ class Interpretador(CVisitor):
                 if tam_array is not None:
                     if len(valor_inicial) > tam_array:
                         raise Exception(f"A string fornecida para '{nome}' é maior que o tamanho do array ({tam_array}).")
-                    array_val = list(valor_inicial) + ['\0'] * (tam_array - len(valor_inicial))
+                    array_val = novo_vetor(tipo, tam_array)
+                    array_val[:len(valor_inicial)] = codificar(valor_inicial)
                 else:
                     tam_array = len(valor_inicial) + 1
-                    array_val = list(valor_inicial) + ['\0']
+                    array_val = novo_vetor(tipo, tam_array)
+                    array_val[:-1] = codificar(valor_inicial)
             elif valor_inicial is not None:
                 if isinstance(valor_inicial, list):
                     if tam_array is not None and len(valor_inicial) != tam_array:
@@ -192,62 +238,51 @@ class Interpretador(CVisitor):
                         )
                     if tam_array is None:
                         tam_array = len(valor_inicial)
-                    array_val = []
-                    for i, elem in enumerate(valor_inicial):
-                        array_val.append(self._verificar_tipo_e_converter(tipo, elem, f"{nome}[{i}]"))
+                    array_val = vetor_de(tipo, [self._verificar_tipo_e_converter(tipo, elem, f"{nome}[{i}]")
+                                                for i, elem in enumerate(valor_inicial)])
                 else:
                     if tam_array is None:
                         raise Exception(f"Array '{nome}' sem tamanho definido deve ser inicializado com uma lista de valores.")
                     valor_convertido = self._verificar_tipo_e_converter(tipo, valor_inicial, f"{nome}[all]")
-                    array_val = [valor_convertido for _ in range(tam_array)]
+                    array_val = vetor_de(tipo, [valor_convertido] * tam_array)
             else:
                 if tam_array is None:
                     raise Exception(f"Array '{nome}' sem tamanho definido deve ser inicializado.")
-                array_val = [None] * tam_array
+                array_val = novo_vetor(tipo, tam_array)
 
-            self.tabela_simbolos.adicionar_variavel(nome, tipo_array, array_val)
-            status = "inicializada" if inicializada else "não inicializada"
+            return tipo_array, array_val
 
         elif tipo.startswith("struct"):
-            nome_struct = tipo[len("struct"):].strip()
-            definicao_struct = self.tabela_simbolos.obter_struct(nome_struct)
-            if definicao_struct is None:
-                raise Exception(f"Struct '{nome_struct}' não foi definida antes de criar '{nome}'.")
-            campos_iniciais = {}
-            for campo, tipo_campo in definicao_struct.items():
-                campos_iniciais[campo] = {"tipo": tipo_campo, "valor": None}
-            struct_valor = {"__struct_name__": nome_struct, "campos": campos_iniciais}
-            inicializada = True  
-            self.tabela_simbolos.adicionar_variavel(nome, tipo, struct_valor)
-            status = "inicializada"
+            classe = self.tabela_simbolos.obter_struct(nome_struct(tipo))
+            if classe is None:
+                raise Exception(f"Struct '{nome_struct(tipo)}' não foi definida antes de criar '{nome}'.")
+            return tipo, classe()
 
         elif tipo.startswith("union"):
             nome_union = tipo[len("union"):].strip()
-            definicao_union = self.tabela_simbolos.obter_union(nome_union)
-            if definicao_union is None:
+            classe = self.tabela_simbolos.obter_union(nome_union)
+            if classe is None:
                 raise Exception(f"Union '{nome_union}' não foi definida antes de criar '{nome}'.")
-            campos_iniciais = {}
-            for campo, tipo_campo in definicao_union.items():
-                campos_iniciais[campo] = {"tipo": tipo_campo, "valor": None}
-            union_val = {"__union_name__": nome_union, "active_field": None, "fields": campos_iniciais}
-            if ctx.init():
+            if tem_init:
                 raise Exception("Inicialização de union não suportada diretamente; use a atribuição de campo (ex.: u.campo = valor).")
-            self.tabela_simbolos.adicionar_variavel(nome, tipo, union_val)
+            return tipo, classe()
         else:
             valor = None
             if valor_inicial is not None:
                 valor = self._verificar_tipo_e_converter(tipo, valor_inicial, nome)
-                inicializada = True
-            self.tabela_simbolos.adicionar_variavel(nome, tipo, valor)
-            status = "inicializada" if inicializada else "não inicializada"
+            return tipo, valor
+
+    def _truncar(self, valor, nome_alvo):
+        # float atribuído a uma variável inteira.
+        self.saida.escrever(f"Aviso: Conversão implícita de FLOAT para INT ao atribuir '{valor}' à '{nome_alvo}'.\n")
+        return int(valor)
 
     def _verificar_tipo_e_converter(self, tipo_variavel, valor, nome_alvo):
         if tipo_variavel == "int":
             if isinstance(valor, int):
                 return valor
             elif isinstance(valor, float):
-                print(f"Aviso: Conversão implícita de FLOAT para INT ao atribuir '{valor}' à '{nome_alvo}'.")
-                return int(valor)
+                return self._truncar(valor, nome_alvo)
             else:
                 raise Exception(f"Erro: Valor '{valor}' incompatível com o tipo INT de '{nome_alvo}'.")
 
@@ -267,13 +302,14 @@ class Interpretador(CVisitor):
             if isinstance(valor, int):
                 return valor
             elif isinstance(valor, float):
-                print(f"Aviso: Conversão implícita de FLOAT para INT ao atribuir '{valor}' à '{nome_alvo}'.")
-                return int(valor)
+                return self._truncar(valor, nome_alvo)
             else:
                 raise Exception(f"Erro: Valor '{valor}' incompatível com o tipo {tipo_variavel.upper()} de '{nome_alvo}'.")
 
         elif tipo_variavel.startswith("struct"):
-            if isinstance(valor, dict) and "campos" in valor:
+            if isinstance(valor, Registro):
+                if valor.__struct__ != nome_struct(tipo_variavel):
+                    raise Exception(f"Erro: Struct '{valor.__struct__}' incompatível com o tipo struct {nome_struct(tipo_variavel)} de '{nome_alvo}'.")
                 return valor
             else:
                 raise Exception(f"Erro: Tentando atribuir valor não-struct a um struct '{nome_alvo}'.")
@@ -309,7 +345,10 @@ class Interpretador(CVisitor):
 
             tipo_base = arr_var["tipo"][:-2]
             valor_convertido = self._verificar_tipo_e_converter(tipo_base, valor, f"{array_name}[{index_value}]")
-            array_data[index_value] = valor_convertido
+            try:
+                array_data[index_value] = valor_convertido
+            except OverflowError:
+                array_data[index_value] = ajustar(array_data, valor_convertido)
             self.tabela_simbolos.atualizar_variavel(array_name, array_data)
             return
 
@@ -339,40 +378,17 @@ class Interpretador(CVisitor):
 
             if tipo_variavel.startswith("struct"):
                 struct_value = variavel["valor"]
-                if not isinstance(struct_value, dict) or "campos" not in struct_value:
+                if not isinstance(struct_value, Registro):
                     raise Exception(f"Tentando acessar campo de algo que não é struct: '{nome_var}'.")
-                campos = struct_value["campos"]
-                for idx in range(1, len(identifiers)):
-                    nome_campo = identifiers[idx]
-                    if idx == len(identifiers) - 1:
-                        if nome_campo not in campos:
-                            raise Exception(f"O campo '{nome_campo}' não existe na struct '{struct_value['__struct_name__']}'.")
-                        tipo_campo = campos[nome_campo]["tipo"]
-                        valor_convertido = self._verificar_tipo_e_converter(tipo_campo, valor, f"{nome_var}.{nome_campo}")
-                        campos[nome_campo]["valor"] = valor_convertido
-                    else:
-                        if nome_campo not in campos:
-                            raise Exception(f"O campo '{nome_campo}' não existe na struct '{struct_value['__struct_name__']}'.")
-                        subvalor = campos[nome_campo]["valor"]
-                        if not (isinstance(subvalor, dict) and "campos" in subvalor):
-                            raise Exception(f"O campo '{nome_campo}' não é um sub-struct.")
-                        struct_value = subvalor
-                        campos = subvalor["campos"]
+                self._escrever_campo(struct_value, valor, tuple(identifiers[1:-1]), identifiers[-1], nome_var)
 
             elif tipo_variavel.startswith("union"):
                 union_value = variavel["valor"]
-                if not (isinstance(union_value, dict) and "fields" in union_value and "active_field" in union_value):
+                if not isinstance(union_value, Uniao):
                     raise Exception(f"Tentando acessar campo de algo que não é union: '{nome_var}'.")
                 if len(identifiers) != 2:
                     raise Exception("Acesso a sub-campos de union não suportado.")
-                nome_campo = identifiers[1]
-                fields = union_value["fields"]
-                if nome_campo not in fields:
-                    raise Exception(f"O campo '{nome_campo}' não existe na union '{union_value['__union_name__']}'.")
-                tipo_campo = fields[nome_campo]["tipo"]
-                valor_convertido = self._verificar_tipo_e_converter(tipo_campo, valor, f"{nome_var}.{nome_campo}")
-                fields[nome_campo]["valor"] = valor_convertido
-                union_value["active_field"] = nome_campo
+                self._escrever_campo(union_value, valor, (), identifiers[1], nome_var)
 
             else:
                 raise Exception("Atribuição inválida: acesso a campo apenas para structs e unions.")
@@ -391,28 +407,15 @@ class Interpretador(CVisitor):
             return self.tabela_simbolos.obter_variavel(ident, verificar_inicializacao=True)["valor"]
 
         if child_count == 3 and ctx.getChild(1).getText() == '.':
-            left_value = self.visit(ctx.getChild(0))
-            field_name = ctx.getChild(2).getText()
-            if isinstance(left_value, dict):
-                if "campos" in left_value:
-                    campos = left_value["campos"]
-                    if field_name not in campos:
-                        raise Exception(f"O campo '{field_name}' não existe na struct '{left_value['__struct_name__']}'.")
-                    return campos[field_name]["valor"]
-                elif "fields" in left_value and "active_field" in left_value:
-                    if left_value["active_field"] is None:
-                        raise Exception(f"Union '{left_value['__union_name__']}' não foi inicializada (nenhum campo atribuído).")
-                    if field_name != left_value["active_field"]:
-                        raise Exception(f"Tentando acessar o campo '{field_name}' de union '{left_value['__union_name__']}' que não é o campo ativo.")
-                    return left_value["fields"][field_name]["valor"]
-                else:
-                    raise Exception(f"Tentando acessar campo '{field_name}' de algo que não é struct ou union.")
-            else:
-                raise Exception("Operação de acesso a campo em valor não estruturado.")
+            return self._ler_campo(self.visit(ctx.getChild(0)), ctx.getChild(2).getText())
 
         if child_count == 3:
             op = ctx.getChild(1).getText()
-            if op in ['+', '-', '*', '/', '%', '&&', '||', '>', '<', '>=', '<=', '==', '!=']:
+            if op == '&&' or op == '||':
+                # Avaliação em curto-circuito: o operando da direita só é
+                # avaliado quando o da esquerda não decide o resultado.
+                return bool(self._avaliar_condicao(ctx))
+            if op in ['+', '-', '*', '/', '%', '>', '<', '>=', '<=', '==', '!=']:
                 left = self.visit(ctx.expression(0))
                 right = self.visit(ctx.expression(1))
                 if op == '+':
@@ -425,10 +428,6 @@ class Interpretador(CVisitor):
                     return left / right
                 elif op == '%':
                     return left % right
-                elif op == '&&':
-                    return bool(left and right)
-                elif op == '||':
-                    return bool(left or right)
                 elif op == '>':
                     return left > right
                 elif op == '<':
@@ -456,16 +455,25 @@ class Interpretador(CVisitor):
                 raise Exception(f"Índice {index_value} fora dos limites do array '{array_name}'.")
             return array_data[index_value]
 
+        # Literais: convertidos do texto do token uma vez por nó.
         if ctx.Number():
-            valor = ctx.Number().getText()
-            return float(valor) if '.' in valor else int(valor)
+            literal = self._literais.get(ctx)
+            if literal is None:
+                texto = ctx.Number().getText()
+                literal = self._literais[ctx] = float(texto) if '.' in texto else int(texto)
+            return literal
 
         if ctx.StringLiteral():
-            s = ctx.StringLiteral().getText().strip('"')
-            return bytes(s, "utf-8").decode("unicode_escape")
+            literal = self._literais.get(ctx)
+            if literal is None:
+                literal = self._literais[ctx] = decodificar_literal(ctx.StringLiteral().getText())
+            return literal
 
         if ctx.CharLiteral():
-            return ctx.CharLiteral().getText().strip("'")
+            literal = self._literais.get(ctx)
+            if literal is None:
+                literal = self._literais[ctx] = ctx.CharLiteral().getText().strip("'")
+            return literal
 
         if child_count == 3 and ctx.getChild(0).getText() == '(' and ctx.getChild(2).getText() == ')':
             return self.visit(ctx.getChild(1))
@@ -481,59 +489,115 @@ class Interpretador(CVisitor):
             return self.tabela_simbolos.obter_variavel(ctx.Identifier().getText(), verificar_inicializacao=True)["valor"]
         return None
 
+    def _avaliar_condicao(self, ctx):
+        # Condição de if/while/for: && e || viram desvios diretos, sem criar
+        # o bool intermediário de cada operação.
+        if ctx.getChildCount() == 3:
+            op = ctx.getChild(1).getText()
+            if op == '&&':
+                return self._avaliar_condicao(ctx.expression(0)) and self._avaliar_condicao(ctx.expression(1))
+            if op == '||':
+                return self._avaliar_condicao(ctx.expression(0)) or self._avaliar_condicao(ctx.expression(1))
+            if ctx.getChild(0).getText() == '(':
+                return self._avaliar_condicao(ctx.getChild(1))
+        return self.visit(ctx)
+
     def visitIfStatement(self, ctx):
-        condicao = self.visit(ctx.expression()) 
+        condicao = self._avaliar_condicao(ctx.expression()) 
 
         if condicao:
-            self.visit(ctx.statement(0))
+            return self.visit(ctx.statement(0))
         elif ctx.statement(1):
-            self.visit(ctx.statement(1))
+            return self.visit(ctx.statement(1))
+
+    def _tabela_switch(self, ctx):
+        # Montada uma vez por switch: os comandos de todos os blocos numa só
+        # lista (o break de um bloco entra como comando), o índice de entrada
+        # de cada rótulo constante e os rótulos que precisam ser avaliados.
+        tabela = self._tabelas_switch.get(ctx)
+        if tabela is not None:
+            return tabela
+
+        def macro(token):
+            valor = self.tabela_simbolos.obter_macro(token.getText())
+            return (True, valor) if valor is not None else (False, None)
+
+        comandos = []
+        entradas = {}
+        nao_constantes = []
+        inicio_padrao = None
+        for i in range(ctx.getChildCount()):
+            bloco = ctx.getChild(i)
+            if isinstance(bloco, CParser.CaseBlockContext):
+                rotulo = bloco.caseLabel().expression()
+                constante, valor = valor_constante(rotulo, macro)
+                if not constante:
+                    nao_constantes.append((rotulo, len(comandos)))
+                elif valor not in entradas:
+                    entradas[valor] = len(comandos)
+            elif isinstance(bloco, CParser.DefaultBlockContext):
+                if inicio_padrao is None:
+                    inicio_padrao = len(comandos)
+            else:
+                continue
+            comandos.extend(bloco.statement())
+            if bloco.breakStatement() is not None:
+                comandos.append(bloco.breakStatement())
+
+        tabela = (comandos, entradas, nao_constantes, inicio_padrao)
+        self._tabelas_switch[ctx] = tabela
+        return tabela
 
     def visitSwitchStatement(self, ctx):
+        # Semântica de C: salta para o case correspondente (ou o default) e
+        # segue pelos blocos seguintes até um break.
+        comandos, entradas, nao_constantes, inicio_padrao = self._tabela_switch(ctx)
         valor_switch = self.visit(ctx.expression()) 
 
-        caso_executado = False
-
-        for case in ctx.caseBlock():
-            case_expr = self.visit(case.caseLabel().expression())  
-            if valor_switch == case_expr:
-                caso_executado = True  
-
-                try:
-                    for stmt in case.statement():
-                        self.visit(stmt)
-                except BreakException:
-                    return  
+        inicio = entradas.get(valor_switch)
+        if inicio is None:
+            for rotulo, indice in nao_constantes:
+                if valor_switch == self.visit(rotulo):
+                    inicio = indice
+                    break
+            else:
+                inicio = inicio_padrao
+            if inicio is None:
+                return None
 
-        if not caso_executado:
-            for default in ctx.defaultBlock():
-                for stmt in default.statement():
-                    self.visit(stmt)
+        for i in range(inicio, len(comandos)):
+            sinal = self.visit(comandos[i])
+            if sinal is INTERROMPER:
+                return None
+            if sinal is RETORNO:
+                return sinal
 
     def visitWhileStatement(self, ctx):
 
         while True:
-            condicao = self.visit(ctx.expression())  
+            condicao = self._avaliar_condicao(ctx.expression())  
 
             if not condicao:  
                 break
 
-            try:
-                self.visit(ctx.statement())
-            except BreakException:
+            sinal = self.visit(ctx.statement())
+            if sinal is INTERROMPER:
                 break
+            if sinal is RETORNO:
+                return sinal
 
     def visitBreakStatement(self, ctx):
-        raise BreakException()
+        return INTERROMPER
 
     def visitDoWhileStatement(self, ctx):
         while True:
-            try:
-                self.visit(ctx.statement())
-            except BreakException:
+            sinal = self.visit(ctx.statement())
+            if sinal is INTERROMPER:
                 break
+            if sinal is RETORNO:
+                return sinal
 
-            condicao = self.visit(ctx.expression())
+            condicao = self._avaliar_condicao(ctx.expression())
 
             if not condicao:
                 break
@@ -554,7 +618,7 @@ class Interpretador(CVisitor):
                 self.visit(inits)
         
         if ctx.expression() is not None:
-            condition = self.visit(ctx.expression())
+            condition = self._avaliar_condicao(ctx.expression())
         else:
             condition = True  
 
@@ -565,16 +629,17 @@ class Interpretador(CVisitor):
                 update_assignment = headers[1]
         
         while condition:
-            try:
-                self.visit(ctx.statement())
-            except BreakException:
+            sinal = self.visit(ctx.statement())
+            if sinal is INTERROMPER:
                 break
+            if sinal is RETORNO:
+                return sinal
 
             if update_assignment is not None:
                 self.visit(update_assignment)
 
             if ctx.expression() is not None:
-                condition = self.visit(ctx.expression())
+                condition = self._avaliar_condicao(ctx.expression())
             else:
                 condition = True
 
@@ -582,83 +647,39 @@ class Interpretador(CVisitor):
         comando = ctx.getChild(0).getText()
         
         if comando == "printf":
-            string_literal = ctx.StringLiteral()
-            if string_literal is None:
-                raise Exception("Erro: Nenhum literal de string encontrado no printf.")
-            
-            formato = string_literal.getText().strip('"')
-            formato = bytes(formato, "utf-8").decode("unicode_escape")
-            
+            # O formato de cada printf é compilado na primeira execução.
+            plano = self._planos_printf.get(ctx)
+            if plano is None:
+                string_literal = ctx.StringLiteral()
+                if string_literal is None:
+                    raise Exception("Erro: Nenhum literal de string encontrado no printf.")
+                plano = self._planos_printf[ctx] = compilar_printf(decodificar_literal(string_literal.getText()))
+
             argumentos = [self.visit(expr_ctx) for expr_ctx in ctx.expression()]
-            for i, arg in enumerate(argumentos):
-                if isinstance(arg, list) and len(arg) > 0 and all(isinstance(ch, str) and len(ch) == 1 for ch in arg):
-                    argumentos[i] = "".join(arg)
-            try:
-                mensagem = formato % tuple(argumentos)
-            except TypeError as e:
-                raise Exception(f"Erro: {e} - Verifique os argumentos do printf.")
-            
-            print(mensagem, end="")
+            self.saida.escrever(plano.formatar(argumentos))
         
         elif comando == "scanf":
-            string_literal = ctx.StringLiteral()
-            if string_literal is None:
-                raise Exception("Erro: Nenhum literal de string encontrado no scanf.")
-            
-            formato = string_literal.getText().strip('"')
-            num_especificadores = len(formato.split("%")) - 1
+            plano = self._planos_scanf.get(ctx)
+            if plano is None:
+                string_literal = ctx.StringLiteral()
+                if string_literal is None:
+                    raise Exception("Erro: Nenhum literal de string encontrado no scanf.")
+                plano = self._planos_scanf[ctx] = compilar_scanf(decodificar_literal(string_literal.getText()))
+            if plano.erro is not None:
+                raise Exception(plano.erro)
+
             parametros = ctx.scanfParam()
             if not isinstance(parametros, list):
                 parametros = [parametros]
-            if len(parametros) != num_especificadores:
+            if len(parametros) != len(plano.conversoes):
                 raise Exception("Erro: Número de variáveis não corresponde ao formato.")
             
-            for param in parametros:
+            for conversao, param in zip(plano.conversoes, parametros):
                 if param.getChildCount() == 1:
                     nome = param.getChild(0).getText()
                     var = self.tabela_simbolos.obter_variavel(nome, verificar_inicializacao=False)
-                    tipo = var["tipo"]
-                    if tipo.endswith("[]"):
-                        base_tipo = tipo[:-2]
-                        tamanho = len(var["valor"])
-                        if base_tipo == "char":
-                            entrada = input()
-                            if len(entrada) > tamanho:
-                                raise Exception(f"A string digitada excede o tamanho do array '{nome}'.")
-                            novo_valor = list(entrada) + ['\0'] * (tamanho - len(entrada))
-                            self.tabela_simbolos.atualizar_variavel(nome, novo_valor)
-                        else:
-                            entrada = input()
-                            tokens = entrada.split()
-                            if len(tokens) != tamanho:
-                                raise Exception(f"Erro: Esperados {tamanho} valores para o array '{nome}', mas foram recebidos {len(tokens)}.")
-                            novo_array = []
-                            for j, token in enumerate(tokens):
-                                try:
-                                    if base_tipo == "int":
-                                        valor_elem = int(token)
-                                    elif base_tipo in ["float", "double"]:
-                                        valor_elem = float(token)
-                                    else:
-                                        raise Exception(f"Tipo '{base_tipo}' não suportado para entrada.")
-                                except ValueError:
-                                    raise Exception(f"Erro: Valor '{token}' incompatível com o tipo '{base_tipo}'.")
-                                novo_array.append(valor_elem)
-                            self.tabela_simbolos.atualizar_variavel(nome, novo_array)
-                    else:
-                        entrada = input()
-                        try:
-                            if tipo == "int":
-                                valor = int(entrada)
-                            elif tipo in ["float", "double"]:
-                                valor = float(entrada)
-                            elif tipo == "char":
-                                valor = entrada[0]
-                            else:
-                                raise Exception(f"Tipo '{tipo}' não suportado para entrada.")
-                            self.tabela_simbolos.atualizar_variavel(nome, valor)
-                        except ValueError:
-                            raise Exception(f"Erro: Valor '{entrada}' incompatível com o tipo '{tipo}'.")
+                    valor = self._ler_scanf(conversao, var["tipo"], var["valor"], nome)
+                    self.tabela_simbolos.atualizar_variavel(nome, valor)
                 else:
                     nome = param.getChild(0).getText()
                     var = self.tabela_simbolos.obter_variavel(nome, verificar_inicializacao=False)
@@ -667,24 +688,12 @@ class Interpretador(CVisitor):
                         raise Exception(f"Variável '{nome}' não é um array, mas foi usada com indexação no scanf.")
                     index_expr = param.getChild(2)
                     index_value = self.visit(index_expr)
-                    base_tipo = tipo[:-2]
-                    entrada = input()
-                    try:
-                        if base_tipo == "int":
-                            valor = int(entrada)
-                        elif base_tipo in ["float", "double"]:
-                            valor = float(entrada)
-                        elif base_tipo == "char":
-                            valor = entrada[0]
-                        else:
-                            raise Exception(f"Tipo '{base_tipo}' não suportado para entrada.")
-                        array_data = var["valor"]
-                        if index_value < 0 or index_value >= len(array_data):
-                            raise Exception(f"Índice {index_value} fora dos limites do array '{nome}'.")
-                        array_data[index_value] = valor
-                        self.tabela_simbolos.atualizar_variavel(nome, array_data)
-                    except ValueError:
-                        raise Exception(f"Erro: Valor '{entrada}' incompatível com o tipo '{base_tipo}'.")
+                    valor = self._ler_scanf_elemento(conversao, tipo[:-2], nome)
+                    array_data = var["valor"]
+                    if index_value < 0 or index_value >= len(array_data):
+                        raise Exception(f"Índice {index_value} fora dos limites do array '{nome}'.")
+                    armazenar(array_data, index_value, valor)
+                    self.tabela_simbolos.atualizar_variavel(nome, array_data)
         
         elif comando == "gets":
             ids = ctx.Identifier()
@@ -693,20 +702,101 @@ class Interpretador(CVisitor):
             else:
                 nome = ids.getText()
             var = self.tabela_simbolos.obter_variavel(nome, verificar_inicializacao=False)
-            if not var["tipo"].endswith("[]") or not var["tipo"].startswith("char"):
-                raise Exception(f"Erro: Variável '{nome}' não é um array de char para o comando gets.")
-            entrada = input()
-            tamanho = len(var["valor"])
-            if len(entrada) > tamanho:
-                entrada = entrada[:tamanho]
-            else:
-                entrada = entrada + '\0' * (tamanho - len(entrada))
-            self.tabela_simbolos.atualizar_variavel(nome, list(entrada))
+            self.tabela_simbolos.atualizar_variavel(nome, self._ler_gets(var["tipo"], var["valor"], nome))
         
         elif comando == "puts":
-            s = self.visit(ctx.expression(0))
-            if isinstance(s, list) and len(s) > 0 and all(isinstance(ch, str) and len(ch)==1 for ch in s):
-                s = "".join(s)
-            if not isinstance(s, str):
-                raise Exception("Erro: Valor passado para puts não é uma string.")
-            print(s)
+            if ctx.expression(0) is not None:
+                s = self.visit(ctx.expression(0))
+            else:
+                s = self._literais.get(ctx)
+                if s is None:
+                    s = self._literais[ctx] = decodificar_literal(ctx.StringLiteral().getText())
+            self.saida.escrever(self._texto_puts(s) + "\n")
+
+    def _texto_puts(self, s):
+        texto = texto_c(s)
+        if texto is None:
+            raise Exception("Erro: Valor passado para puts não é uma string.")
+        return texto
+
+    def _ler_scanf(self, conversao, tipo, valor_atual, nome):
+        if tipo.endswith("[]"):
+            base_tipo = tipo[:-2]
+            tamanho = len(valor_atual)
+            if base_tipo == "char":
+                entrada = self.entrada.ler(conversao)
+                if not isinstance(entrada, str):
+                    raise Exception(f"Erro: Valor '{entrada}' incompatível com o array de char '{nome}'.")
+                if len(entrada) > tamanho:
+                    raise Exception(f"A string digitada excede o tamanho do array '{nome}'.")
+                preencher(valor_atual, entrada + '\0' * (tamanho - len(entrada)))
+                return valor_atual
+            if base_tipo not in ["int", "float", "double"]:
+                raise Exception(f"Tipo '{base_tipo}' não suportado para entrada.")
+            # Um único especificador preenche o array inteiro, um valor por
+            # posição.
+            valores = self.entrada.ler(conversao, tamanho)
+            preencher(valor_atual, [self._valor_lido(base_tipo, valor, f"{nome}[{j}]") for j, valor in enumerate(valores)])
+            return valor_atual
+        return self._valor_lido(tipo, self.entrada.ler(conversao), nome)
+
+    def _ler_scanf_elemento(self, conversao, tipo, nome):
+        return self._valor_lido(tipo, self.entrada.ler(conversao), nome)
+
+    def _valor_lido(self, tipo, valor, nome):
+        if type(valor) is int and tipo == "int":
+            return valor
+        if tipo not in TIPOS_ENTRADA:
+            raise Exception(f"Tipo '{tipo}' não suportado para entrada.")
+        return self._verificar_tipo_e_converter(tipo, valor, nome)
+
+    def _ler_gets(self, tipo, valor_atual, nome):
+        if not tipo.endswith("[]") or not tipo.startswith("char"):
+            raise Exception(f"Erro: Variável '{nome}' não é um array de char para o comando gets.")
+        entrada = self.entrada.linha()
+        if entrada is None:
+            raise Exception(f"Erro: Fim da entrada ao ler '{nome}' com gets.")
+        tamanho = len(valor_atual)
+        if len(entrada) > tamanho:
+            entrada = entrada[:tamanho]
+        else:
+            entrada = entrada + '\0' * (tamanho - len(entrada))
+        preencher(valor_atual, entrada)
+        return valor_atual
+
+    def _ler_campo(self, left_value, field_name):
+        if isinstance(left_value, Registro):
+            if field_name not in left_value.__tipos__:
+                raise Exception(f"O campo '{field_name}' não existe na struct '{left_value.__struct__}'.")
+            return getattr(left_value, field_name)
+        if isinstance(left_value, Uniao):
+            return left_value.ler(field_name)
+        raise Exception("Operação de acesso a campo em valor não estruturado.")
+
+    def _ler_caminho(self, registro, campos):
+        for campo in campos:
+            registro = self._ler_campo(registro, campo)
+        return registro
+
+    def _escrever_campo(self, registro, valor, caminho, nome_campo, nome_var):
+        converter = self._verificar_tipo_e_converter
+        if isinstance(registro, Uniao):
+            tipos = registro.__tipos__
+            if nome_campo not in tipos:
+                raise Exception(f"O campo '{nome_campo}' não existe na union '{registro.__uniao__}'.")
+            registro.escrever(nome_campo, converter(tipos[nome_campo], valor, f"{nome_var}.{nome_campo}"))
+            return
+        if not isinstance(registro, Registro):
+            raise Exception(f"Tentando acessar campo de algo que não é struct: '{nome_var}'.")
+
+        for campo in caminho:
+            if campo not in registro.__tipos__:
+                raise Exception(f"O campo '{campo}' não existe na struct '{registro.__struct__}'.")
+            subvalor = getattr(registro, campo)
+            if not isinstance(subvalor, Registro):
+                raise Exception(f"O campo '{campo}' não é um sub-struct.")
+            registro = subvalor
+        tipos = registro.__tipos__
+        if nome_campo not in tipos:
+            raise Exception(f"O campo '{nome_campo}' não existe na struct '{registro.__struct__}'.")
+        setattr(registro, nome_campo, converter(tipos[nome_campo], valor, f"{nome_var}.{nome_campo}"))
@@ -0,0 +1,279 @@
+from collections import namedtuple
+
+from antlr4.tree.Tree import TerminalNode
+
+from CParser import CParser
+from formatacao import decodificar_literal
+from resolvedor import GLOBAL, LOCAL, macros_constantes, valor_constante
+from tipagem import INTEIRO, representacao
+
+# Análise de faixa dos laços contados, executada depois da análise de
+# inicialização. Reconhece
+#
+#   for (i = A; i < N; i = i + 1) corpo        (também i <= N e int i = A)
+#   i = A; while (i < N) { ...; i = i + 1; }
+#
+# com i local inteira que o corpo não escreve, A constante e N constante
+# (literal ou macro) ou variável local que o corpo não escreve. Dentro do
+# corpo, i percorre [A, N), então um acesso v[i + c] (c constante) está nos
+# limites se A + c >= 0 e N + c <= len(v). Esses acessos vão para
+# resolucao.indices_garantidos e os motores compilados os fazem sem a
+# verificação de índice.
+#
+# Quando len(v) é conhecido na compilação (array local declarado com tamanho,
+# que nunca é trocado por inteiro) e N é constante, a condição é provada aqui.
+# Senão ela vira uma Guarda do laço (resolucao.guardas): os motores testam
+# todas as guardas uma vez, antes da primeira volta, e escolhem entre o corpo
+# sem verificações e o corpo original, que reporta o erro no acesso como
+# antes.
+
+# vetores.comporta(v, limite, acrescimo) para cada guarda; `vetor` e `limite`
+# (se não for um int) são tokens de Identifier lidos no início do laço.
+Guarda = namedtuple("Guarda", ["vetor", "limite", "acrescimo"])
+
+
+class Limites:
+    def __init__(self, resolucao):
+        self.resolucao = resolucao
+        self.macro = macros_constantes(resolucao.macros)
+        self._escopo = None
+        self._tamanhos = {}
+        # Globais que recebem uma atribuição direta em algum ponto do
+        # programa: um array global trocado por outro pode mudar de tamanho.
+        self._globais_reescritas = set()
+
+    def analisar(self, tree):
+        definicoes = []
+        declaracoes_globais = []
+        self._escopo = None
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                definicoes.append(filho)
+            elif isinstance(filho, CParser.StatementContext):
+                self._globais_reescritas |= self._escritas(filho, declaracoes=False)
+                if isinstance(filho.getChild(0), CParser.VarDeclContext):
+                    declaracoes_globais.append(filho.getChild(0))
+        for ctx in definicoes:
+            self._escopo = self.resolucao.funcoes[ctx.Identifier().getText()]
+            self._globais_reescritas |= {chave for chave in self._escritas(ctx.block(), declaracoes=False)
+                                         if chave.escopo == GLOBAL}
+
+        self._escopo = None
+        for ctx in declaracoes_globais:
+            self._registrar_tamanho(ctx, self._globais_reescritas)
+        tamanhos_globais = self._tamanhos
+        for ctx in definicoes:
+            self._escopo = self.resolucao.funcoes[ctx.Identifier().getText()]
+            self._tamanhos = dict(tamanhos_globais)
+            self._percorrer(ctx.block(), self._escritas(ctx.block(), declaracoes=False))
+        self._escopo = None
+
+    # ------------------------------------------------------------------
+    # Reconhecimento dos laços
+
+    def _percorrer(self, ctx, reescritas):
+        if isinstance(ctx, TerminalNode):
+            return
+        if isinstance(ctx, CParser.VarDeclContext):
+            self._registrar_tamanho(ctx, reescritas)
+        elif isinstance(ctx, CParser.ForStatementContext):
+            self._laco_for(ctx)
+        elif isinstance(ctx, CParser.BlockContext):
+            anterior = None
+            for comando in ctx.statement():
+                if anterior is not None and isinstance(comando.getChild(0), CParser.WhileStatementContext):
+                    self._laco_while(anterior.getChild(0), comando.getChild(0))
+                self._percorrer(comando, reescritas)
+                anterior = comando
+            return
+        for i in range(ctx.getChildCount()):
+            self._percorrer(ctx.getChild(i), reescritas)
+
+    def _laco_for(self, ctx):
+        partes = [None, None, None]
+        posicao = 0
+        for i in range(2, ctx.getChildCount() - 2):
+            filho = ctx.getChild(i)
+            if filho.getText() == ';':
+                posicao += 1
+            else:
+                partes[posicao] = filho
+        inicio, condicao, passo = partes
+        if inicio is None or condicao is None or passo is None:
+            return
+        if isinstance(inicio, CParser.VarDeclContext):
+            if inicio.arraySize() or inicio.init() is None or inicio.init().expression() is None:
+                return
+            token, valor_inicial = inicio.Identifier(), inicio.init().expression()
+        else:
+            token, valor_inicial = inicio.Identifier(), inicio.expression()
+        chave = self._variavel_inteira(token)
+        if chave is None or not self._incremento(passo.Identifier(), passo.expression(), chave):
+            return
+        self._laco(ctx, chave, valor_inicial, condicao, ctx.statement(), None)
+
+    def _laco_while(self, inicio, ctx):
+        # i = A; imediatamente antes do while, e i = i + 1; como último
+        # comando do corpo: o corpo todo roda com i dentro da faixa.
+        if not isinstance(inicio, CParser.AssignmentContext) or len(inicio.Identifier()) != 1 or inicio.getChild(1).getText() != '=':
+            return
+        chave = self._variavel_inteira(inicio.Identifier(0))
+        corpo = ctx.statement().getChild(0)
+        if chave is None or not isinstance(corpo, CParser.BlockContext) or not corpo.statement():
+            return
+        ultimo = corpo.statement()[-1].getChild(0)
+        if (not isinstance(ultimo, CParser.AssignmentContext) or len(ultimo.Identifier()) != 1
+                or ultimo.getChild(1).getText() != '='
+                or not self._incremento(ultimo.Identifier(0), ultimo.expression(0), chave)):
+            return
+        self._laco(ctx, chave, inicio.expression(0), ctx.expression(), corpo, ultimo)
+
+    def _laco(self, laco, chave, valor_inicial, condicao, corpo, incremento):
+        constante, inicio = self._constante(valor_inicial)
+        if not constante or condicao.getChildCount() != 3 or condicao.getChild(1).getText() not in ('<', '<='):
+            return
+        if self._chave(self._identificador(condicao.expression(0))) != chave:
+            return
+        acrescimo_limite = 1 if condicao.getChild(1).getText() == '<=' else 0
+
+        escritas = self._escritas(corpo, ignorar=incremento)
+        if chave in escritas:
+            return
+        constante, limite = self._constante(condicao.expression(1))
+        if not constante:
+            limite = self._identificador(condicao.expression(1))
+            chave_limite = self._chave(limite)
+            if chave_limite is None or chave_limite.escopo != LOCAL or chave_limite in escritas or chave_limite == chave:
+                return
+
+        guardas = []
+        for acesso, token, indice in self._acessos(corpo):
+            deslocamento = self._deslocamento(indice, chave)
+            if deslocamento is None or inicio + deslocamento < 0:
+                continue
+            chave_vetor = self._chave(token)
+            if (chave_vetor is None or chave_vetor in escritas or chave_vetor in self._globais_reescritas
+                    or not self.resolucao.tipo(token, self._escopo).endswith("[]")):
+                continue
+            acrescimo = deslocamento + acrescimo_limite
+            tamanho = self._tamanhos.get(chave_vetor)
+            if constante and tamanho is not None and token in self.resolucao.leituras_seguras:
+                if limite + acrescimo > tamanho:
+                    continue
+            else:
+                guardas.append(Guarda(token, limite, acrescimo))
+            self.resolucao.indices_garantidos[acesso] = laco
+        if guardas:
+            # Uma guarda por array, limite e acréscimo.
+            unicas = {}
+            for guarda in guardas:
+                unicas.setdefault((self._chave(guarda.vetor), self._chave(guarda.limite) if not constante else guarda.limite,
+                                   guarda.acrescimo), guarda)
+            self.resolucao.guardas[laco] = tuple(unicas.values())
+
+    def _registrar_tamanho(self, ctx, reescritas):
+        # Tamanho fixo de um array declarado com tamanho (ou inicializador) e
+        # nunca atribuído por inteiro.
+        chave = self._chave(ctx.Identifier())
+        if chave is None or chave in reescritas or not ctx.arraySize():
+            return
+        if ctx.arraySize().Number() is not None:
+            self._tamanhos[chave] = int(ctx.arraySize().Number().getText())
+            return
+        init = ctx.init()
+        if init is None:
+            return
+        if init.initializerList() is not None:
+            self._tamanhos[chave] = len(init.initializerList().expression())
+        elif ctx.type_().getText() == "char" and init.expression().StringLiteral() is not None:
+            self._tamanhos[chave] = len(decodificar_literal(init.expression().StringLiteral().getText())) + 1
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+
+    def _chave(self, token):
+        if token is None:
+            return None
+        # O endereço léxico; locais só são comparadas dentro da mesma função.
+        endereco = self.resolucao.enderecos.get(token)
+        if endereco is None or endereco.escopo not in (GLOBAL, LOCAL):
+            return None
+        return endereco
+
+    def _variavel_inteira(self, token):
+        chave = self._chave(token)
+        if chave is None or chave.escopo != LOCAL or representacao(self.resolucao.tipo(token, self._escopo) or "") != INTEIRO:
+            return None
+        return chave
+
+    def _identificador(self, ctx):
+        while ctx.getChildCount() == 3 and ctx.getChild(0).getText() == '(':
+            ctx = ctx.getChild(1)
+        if ctx.getChildCount() == 1 and ctx.Identifier() is not None:
+            return ctx.Identifier()
+        return None
+
+    def _constante(self, ctx):
+        constante, valor = valor_constante(ctx, self.macro)
+        if constante and type(valor) is int:
+            return True, valor
+        return False, None
+
+    def _incremento(self, token, valor, chave):
+        # i = i + 1 ou i = 1 + i
+        if self._chave(token) != chave or valor.getChildCount() != 3 or valor.getChild(1).getText() != '+':
+            return False
+        esquerda, direita = valor.expression(0), valor.expression(1)
+        if self._chave(self._identificador(esquerda)) == chave:
+            return self._constante(direita) == (True, 1)
+        return self._chave(self._identificador(direita)) == chave and self._constante(esquerda) == (True, 1)
+
+    def _deslocamento(self, indice, chave):
+        # c para um índice i, i + c, c + i ou i - c; None para os demais.
+        if self._chave(self._identificador(indice)) == chave:
+            return 0
+        while indice.getChildCount() == 3 and indice.getChild(0).getText() == '(':
+            indice = indice.getChild(1)
+        if indice.getChildCount() != 3 or indice.getChild(1).getText() not in ('+', '-'):
+            return None
+        esquerda, direita = indice.expression(0), indice.expression(1)
+        if self._chave(self._identificador(esquerda)) == chave:
+            constante, c = self._constante(direita)
+            if constante:
+                return c if indice.getChild(1).getText() == '+' else -c
+        elif indice.getChild(1).getText() == '+' and self._chave(self._identificador(direita)) == chave:
+            constante, c = self._constante(esquerda)
+            if constante:
+                return c
+        return None
+
+    def _acessos(self, ctx):
+        # (acesso, token do array, expressão do índice) de cada v[índice]
+        # lido ou atribuído em `ctx`.
+        if isinstance(ctx, TerminalNode):
+            return
+        if isinstance(ctx, CParser.ExpressionContext) and ctx.getChildCount() == 4 and ctx.getChild(1).getText() == '[':
+            yield ctx, ctx.getChild(0), ctx.getChild(2)
+        elif isinstance(ctx, CParser.AssignmentContext) and ctx.getChild(1).getText() == '[':
+            yield ctx, ctx.getChild(0), ctx.getChild(2)
+        for i in range(ctx.getChildCount()):
+            yield from self._acessos(ctx.getChild(i))
+
+    def _escritas(self, ctx, ignorar=None, declaracoes=True):
+        # Variáveis escritas por inteiro em `ctx` (atribuição, cabeçalho do
+        # for, scanf e, com `declaracoes`, declaração), exceto pelo comando
+        # `ignorar`.
+        escritas = set()
+        if isinstance(ctx, TerminalNode) or ctx is ignorar:
+            return escritas
+        if isinstance(ctx, CParser.AssignmentContext) and len(ctx.Identifier()) == 1 and ctx.getChild(1).getText() == '=':
+            escritas.add(self._chave(ctx.Identifier(0)))
+        elif isinstance(ctx, CParser.ForHeaderAssignmentContext) or (declaracoes and isinstance(ctx, CParser.VarDeclContext)):
+            escritas.add(self._chave(ctx.Identifier()))
+        elif isinstance(ctx, CParser.ScanfParamContext) and ctx.expression() is None:
+            escritas.add(self._chave(ctx.Identifier()))
+        for i in range(ctx.getChildCount()):
+            escritas |= self._escritas(ctx.getChild(i), ignorar, declaracoes)
+        escritas.discard(None)
+        return escritas
@@ -1,58 +1,251 @@
-import sys
-import os
-
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../gramatica")))
-
-from CLexer import CLexer
-from CParser import CParser
-from antlr4 import FileStream, CommonTokenStream
-from interpretador import Interpretador, ReturnException  
-
-def verifica_main(tree):
-    for i in range(tree.getChildCount()):
-        child = tree.getChild(i)
-        if child.__class__.__name__ == "FunctionDefContext":
-            tipo = child.getChild(0).getText()  
-            nome = child.getChild(1).getText()  
-            if nome == "main":
-                return True
-    return False
-
-def main(argv):
-    if len(argv) < 2:
-        print("Uso: python main.py <source_file.c>")
-        return
-
-    input_file = argv[1]
-    input_stream = FileStream(input_file, encoding='utf-8')
-    lexer = CLexer(input_stream)
-    stream = CommonTokenStream(lexer)
-    parser = CParser(stream)
-    tree = parser.program()
-
-    #print("\n=== Árvore de Análise Sintática ===")
-    #print(tree.toStringTree(recog=parser))
-
-    if not verifica_main(tree):
-        print("Erro: O código não possui a função main(). Execução interrompida.")
-        return
-
-    interpretador = Interpretador()
-    interpretador.visit(tree)  # Registra definições, variáveis, etc.
-    
-    if "main" in interpretador.funcoes:
-        print("Executando a função main:")
-        mainDefCtx = interpretador.funcoes["main"]
-        try:
-            interpretador.visit(mainDefCtx.block())
-        except ReturnException:
-            pass
-    else:
-        print("Erro: Função main não definida.")
-
-    #print("\nTabela de Símbolos:")
-    #for nome, props in interpretador.tabela_simbolos.variaveis.items():
-        #print(f"{nome}: {props}")
-
-if __name__ == "__main__":
-    main(sys.argv)
+import sys
+import os
+import argparse
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../gramatica")))
+
+from CLexer import CLexer
+from CParser import CParser
+from antlr4 import FileStream, CommonTokenStream, PredictionMode
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from interpretador import Interpretador
+from motor_closures import MotorClosures
+from inicializacao import resolver_e_analisar
+from expansao import LIMITE_PADRAO, relatorio as relatorio_expansao
+from maquina_virtual import CompiladorBytecode, MaquinaVirtual, desmontar_programa, LIMITE_PILHA_PADRAO
+from transpilador import Transpilador, ProgramaPython
+from cache_programas import CacheProgramas, VERSOES_MOTOR
+from pureza import CAPACIDADE_PADRAO, Memorizacao
+from saida import SaidaBufferizada, MODOS as MODOS_BUFFER
+
+MOTORES = ["visitor", "closure", "bytecode", "python"]
+
+def verifica_main(tree):
+    for i in range(tree.getChildCount()):
+        child = tree.getChild(i)
+        if child.__class__.__name__ == "FunctionDefContext":
+            tipo = child.getChild(0).getText()  
+            nome = child.getChild(1).getText()  
+            if nome == "main":
+                return True
+    return False
+
+def resolver_nomes(tree, limite_expansao=LIMITE_PADRAO, relatorio=False):
+    # Os motores compilados usam escopo léxico: nomes não declarados,
+    # conversões de tipo que sempre falhariam e leituras de variáveis que
+    # nunca receberam valor são reportados aqui, antes de qualquer comando do
+    # programa ser executado. Com `relatorio`, as chamadas expandidas em
+    # linha são listadas em stderr.
+    resolucao = resolver_e_analisar(tree, limite_expansao)
+    if resolucao.erros:
+        for erro in dict.fromkeys(resolucao.erros):
+            print(f"Erro: {erro}")
+        print("Execução interrompida.")
+        return None
+    if relatorio:
+        print(relatorio_expansao(resolucao, limite_expansao), file=sys.stderr)
+    return resolucao
+
+def analisar_fluxo(input_stream):
+    # Análise em dois estágios: primeiro em modo SLL, que decide cada
+    # escolha sem o contexto completo da pilha de regras e é bem mais
+    # rápido, abandonando no primeiro erro (BailErrorStrategy). Só se ele
+    # falhar, por erro no fonte ou por uma decisão que o SLL não resolve, o
+    # fonte é reanalisado em LL, com a recuperação e as mensagens de erro
+    # normais. Com erro de sintaxe devolve None: a árvore recuperada tem nós
+    # incompletos, que as análises da carga e os motores não tratam.
+    lexer = CLexer(input_stream)
+    stream = CommonTokenStream(lexer)
+    parser = CParser(stream)
+    parser._interp.predictionMode = PredictionMode.SLL
+    parser._errHandler = BailErrorStrategy()
+    parser.removeErrorListeners()
+    try:
+        return parser.program()
+    except ParseCancellationException:
+        parser._interp.predictionMode = PredictionMode.LL
+        parser._errHandler = DefaultErrorStrategy()
+        parser.addErrorListener(ConsoleErrorListener.INSTANCE)
+        parser.reset()
+        tree = parser.program()
+        return tree if parser.getNumberOfSyntaxErrors() == 0 else None
+
+def analisar(input_file):
+    return analisar_fluxo(FileStream(input_file, encoding='utf-8'))
+
+def compilar_com_cache(input_file, cache, motor, compilar, limite_expansao=LIMITE_PADRAO, relatorio=False):
+    # Devolve a forma rebaixada do programa (bytecode ou código Python),
+    # lida do cache quando o fonte, a gramática, o motor e o limite da
+    # expansão em linha não mudaram; numa falha analisa o fonte, verifica
+    # main, os nomes e os tipos e chama compilar(tree, resolucao).
+    with open(input_file, encoding='utf-8') as f:
+        fonte_c = f.read()
+    versao = f"{VERSOES_MOTOR[motor]}-e{limite_expansao}"
+    programa = cache.carregar(fonte_c, motor, versao)
+    if programa is not None:
+        return programa
+
+    inicio = time.perf_counter()
+    tree = analisar(input_file)
+    if tree is None:
+        print("Execução interrompida.")
+        return None
+    if not verifica_main(tree):
+        print("Erro: O código não possui a função main(). Execução interrompida.")
+        return None
+    resolucao = resolver_nomes(tree, limite_expansao, relatorio)
+    if resolucao is None:
+        return None
+    programa = compilar(tree, resolucao)
+    cache.tempo_geracao += time.perf_counter() - inicio
+    cache.salvar(fonte_c, motor, versao, programa)
+    return programa
+
+# preparar_python e preparar_bytecode devolvem (inicializar, executar_main)
+# do programa pronto, ou None se a análise ou a resolução de nomes falhar.
+
+def preparar_python(input_file, cache, interpretador, limite_expansao=LIMITE_PADRAO, relatorio=False,
+                    memorizacao=None):
+    fonte_py = compilar_com_cache(input_file, cache, "python",
+                                  Transpilador(os.path.basename(input_file)).transpilar,
+                                  limite_expansao, relatorio)
+    if fonte_py is None:
+        return None
+    programa = ProgramaPython(fonte_py, input_file, interpretador, memorizacao)
+    return programa.inicializar, programa.executar_main
+
+def preparar_bytecode(input_file, cache, interpretador, limite_expansao=LIMITE_PADRAO, relatorio=False,
+                      limite_pilha=LIMITE_PILHA_PADRAO, memorizacao=None):
+    programa = compilar_com_cache(input_file, cache, "bytecode",
+                                  lambda tree, resolucao: CompiladorBytecode().compilar(tree, resolucao),
+                                  limite_expansao, relatorio)
+    if programa is None:
+        return None
+    vm = MaquinaVirtual(programa, interpretador, limite_pilha, memorizacao)
+    return vm.inicializar, vm.executar_main
+
+def main(argv):
+    if len(argv) < 2:
+        print("Uso: python main.py <source_file.c> [--engine=visitor|closure|bytecode|python] [--disassemble [FUNCAO ...]] [--no-cache] [--clear-cache] [--cache-stats] [--buffer=full|line|unbuffered] [--inline=N] [--inline-report] [--stack-size=MB] [--memoize[=N]]")
+        return
+
+    arg_parser = argparse.ArgumentParser(prog="main.py")
+    arg_parser.add_argument("source_file")
+    arg_parser.add_argument("--engine", choices=MOTORES, default="visitor",
+                            help="motor de execução: visitor (referência), closure (árvore pré-compilada) bytecode (máquina virtual de pilha) ou python (transpilado para Python)")
+    arg_parser.add_argument("--disassemble", nargs="*", metavar="FUNCAO",
+                            help="mostra o bytecode das funções indicadas (ou de todas) em vez de executar o programa")
+    arg_parser.add_argument("--no-cache", action="store_true",
+                            help="não lê nem grava o programa compilado no cache do usuário (motores bytecode e python)")
+    arg_parser.add_argument("--clear-cache", action="store_true",
+                            help="apaga o cache do usuário ($XDG_CACHE_HOME/intercptor ou ~/.cache/intercptor) antes de executar")
+    arg_parser.add_argument("--cache-stats", action="store_true",
+                            help="mostra em stderr se houve acerto no cache, o tempo de carga e os totais acumulados")
+    arg_parser.add_argument("--buffer", choices=MODOS_BUFFER, default=None,
+                            help="buffer da saída do programa, como em C: full (completo), line (por linha) ou unbuffered; "
+                                 "o padrão é line num terminal e full em arquivo ou pipe")
+    arg_parser.add_argument("--inline", type=int, default=LIMITE_PADRAO, metavar="N",
+                            help=f"expande em linha as funções folha cujo return tem até N nós de expressão "
+                                 f"(motores compilados; 0 desativa; padrão {LIMITE_PADRAO})")
+    arg_parser.add_argument("--inline-report", action="store_true",
+                            help="lista em stderr as chamadas expandidas em linha (não lê o programa do cache)")
+    arg_parser.add_argument("--stack-size", type=int, default=LIMITE_PILHA_PADRAO, metavar="MB",
+                            help=f"memória máxima das chamadas em andamento no motor bytecode, que guarda a pilha de "
+                                 f"chamadas fora da pilha do Python (padrão {LIMITE_PILHA_PADRAO} MB)")
+    arg_parser.add_argument("--memoize", type=int, nargs="?", const=CAPACIDADE_PADRAO, default=None, metavar="N",
+                            help=f"guarda os resultados das funções puras num cache LRU de até N valores por função "
+                                 f"(padrão {CAPACIDADE_PADRAO}) e mostra em stderr, ao fim, os acertos e falhas de cada uma")
+    args = arg_parser.parse_args(argv[1:])
+
+    # A saída do programa é descarregada ao fim, mesmo se a execução falhar,
+    # e só depois vem o relatório da memorização.
+    saida = SaidaBufferizada(args.buffer)
+    memorizacao = Memorizacao(args.memoize) if args.memoize is not None else None
+    try:
+        executar(args, saida, memorizacao)
+    finally:
+        saida.descarregar()
+        if memorizacao is not None:
+            print(memorizacao.relatorio(), file=sys.stderr)
+
+def executar(args, saida, memorizacao=None):
+    input_file = args.source_file
+    # O relatório da expansão sai da análise, que o cache pularia.
+    cache = CacheProgramas(ativo=not (args.no_cache or args.inline_report), estatisticas=args.cache_stats)
+    if args.clear_cache:
+        cache.limpar()
+
+    if args.engine in ("python", "bytecode") and args.disassemble is None:
+        if args.engine == "python":
+            etapas = preparar_python(input_file, cache, Interpretador(saida), args.inline, args.inline_report,
+                                     memorizacao)
+        else:
+            etapas = preparar_bytecode(input_file, cache, Interpretador(saida), args.inline, args.inline_report,
+                                       args.stack_size, memorizacao)
+        if args.cache_stats:
+            print(cache.resumo(), file=sys.stderr)
+        if etapas is None:
+            return
+        inicializar, executar_main = etapas
+        inicializar()
+        saida.escrever("Executando a função main:\n")
+        executar_main()
+        return
+
+    tree = analisar(input_file)
+    if tree is None:
+        print("Execução interrompida.")
+        return
+
+    #print("\n=== Árvore de Análise Sintática ===")
+    #print(tree.toStringTree(recog=parser))
+
+    if not verifica_main(tree):
+        print("Erro: O código não possui a função main(). Execução interrompida.")
+        return
+
+    if args.disassemble is not None:
+        resolucao = resolver_nomes(tree, args.inline, args.inline_report)
+        if resolucao is None:
+            return
+        programa = CompiladorBytecode().compilar(tree, resolucao)
+        print(desmontar_programa(programa, args.disassemble))
+        return
+
+    resolucao = None
+    if args.engine != "visitor":
+        resolucao = resolver_nomes(tree, args.inline, args.inline_report)
+        if resolucao is None:
+            return
+
+    interpretador = Interpretador(saida)
+    if memorizacao is not None and args.engine == "visitor":
+        # O visitor reporta os erros na execução; a análise aqui só decide
+        # quais funções são puras.
+        analise = resolver_e_analisar(tree, 0)
+        if not analise.erros:
+            for nome in analise.memorizaveis:
+                interpretador.memorizadas[nome] = memorizacao.cache(nome)
+    interpretador.visit(tree)  # Registra definições, variáveis, etc.
+    
+    if "main" in interpretador.funcoes:
+        if args.engine == "closure":
+            motor = MotorClosures(interpretador, resolucao, memorizacao)
+            saida.escrever("Executando a função main:\n")
+            motor.executar_main()
+            return
+        saida.escrever("Executando a função main:\n")
+        mainDefCtx = interpretador.funcoes["main"]
+        interpretador.visit(mainDefCtx.block())
+    else:
+        saida.escrever("Erro: Função main não definida.\n")
+
+    #print("\nTabela de Símbolos:")
+    #for nome, props in interpretador.tabela_simbolos.variaveis.items():
+        #print(f"{nome}: {props}")
+
+if __name__ == "__main__":
+    main(sys.argv)
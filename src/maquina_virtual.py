@@ -0,0 +1,1357 @@
+from array import array
+
+from CParser import CParser
+from interpretador import Interpretador, retorno_padrao
+from formatacao import compilar_printf, decodificar_literal
+from entrada import compilar_scanf
+from vetores import ajustar, armazenar, comporta
+from registros import Registro, Uniao, cadeia_de_campos, leitor_de_caminho, tipo_do_caminho
+from resolvedor import NAO_INICIALIZADA, valor_constante, macros_constantes
+from inicializacao import resolver_e_analisar
+from pureza import AUSENTE
+from tipagem import IDENTIDADE, PARA_INTEIRO, PARA_REAL, conversao
+
+# Compilador da árvore sintática (CParser.ProgramContext) para um bytecode
+# de pilha e a máquina virtual que o executa.
+#
+# Cada função vira um vetor de inteiros no formato [opcode, operando, ...]
+# (toda instrução ocupa duas posições) e os valores que não cabem no
+# operando ficam no pool de constantes do programa. Os nomes são resolvidos
+# na compilação: variáveis locais e globais viram índices de slots.
+#
+# A execução não usa a pilha do Python para o programa C: as expressões são
+# avaliadas na pilha de operandos e uma chamada empilha o quadro de quem
+# chama numa lista de quadros, no mesmo laço de despacho. A profundidade da
+# recursão só é limitada pela memória estimada dos quadros (limite_pilha).
+
+CONST = 0
+CARREGAR_LOCAL = 1
+ARMAZENAR_LOCAL = 2
+CARREGAR_GLOBAL = 3
+ARMAZENAR_GLOBAL = 4
+CONVERTER = 5
+SOMAR = 6
+SUBTRAIR = 7
+MULTIPLICAR = 8
+DIVIDIR = 9
+RESTO = 10
+MENOR = 11
+MENOR_IGUAL = 12
+MAIOR = 13
+MAIOR_IGUAL = 14
+IGUAL = 15
+DIFERENTE = 16
+SALTAR_SE_NAO_MENOR = 17
+SALTAR_SE_NAO_MENOR_IGUAL = 18
+NEGATIVO = 19
+NAO = 20
+SALTAR = 21
+SALTAR_SE_FALSO = 22
+SALTAR_SE_VERDADEIRO = 23
+CHAMAR = 24
+RETORNAR = 25
+DESCARTAR = 26
+DECLARAR_LOCAL = 27
+DECLARAR_GLOBAL = 28
+CRIAR_LISTA = 29
+CARREGAR_ELEMENTO = 30
+ARMAZENAR_ELEMENTO = 31
+CARREGAR_CAMPO = 32
+ARMAZENAR_CAMPO = 33
+PRINTF = 34
+PUTS = 35
+LER_SCANF = 36
+LER_SCANF_ELEMENTO = 37
+LER_GETS = 38
+ERRO = 39
+SALTAR_SE_NAO_MAIOR = 40
+SALTAR_SE_NAO_MAIOR_IGUAL = 41
+SALTAR_SE_NAO_IGUAL = 42
+SALTAR_SE_NAO_DIFERENTE = 43
+SALTAR_TABELA = 44
+CARREGAR_CAMINHO = 45
+ARMAZENAR_CAMINHO = 46
+CONVERTER_REAL = 47
+TRUNCAR = 48
+CARREGAR_LOCAL_VERIFICADO = 49
+CARREGAR_GLOBAL_VERIFICADO = 50
+GUARDA_LACO = 51
+CARREGAR_ELEMENTO_DIRETO = 52
+ARMAZENAR_ELEMENTO_DIRETO = 53
+ARMAZENAR_ARGUMENTO = 54
+VALOR_PADRAO = 55
+REINICIAR = 56
+
+NOMES_OPCODES = {
+    valor: nome for nome, valor in list(globals().items())
+    if nome.isupper() and isinstance(valor, int)
+}
+
+OPERADORES_BINARIOS = {
+    '+': SOMAR, '-': SUBTRAIR, '*': MULTIPLICAR, '/': DIVIDIR, '%': RESTO,
+    '<': MENOR, '<=': MENOR_IGUAL, '>': MAIOR, '>=': MAIOR_IGUAL,
+    '==': IGUAL, '!=': DIFERENTE,
+}
+
+# Comparação e desvio numa só instrução: salta se a comparação for falsa.
+SALTOS_COMPARACAO = {
+    '<': SALTAR_SE_NAO_MENOR, '<=': SALTAR_SE_NAO_MENOR_IGUAL,
+    '>': SALTAR_SE_NAO_MAIOR, '>=': SALTAR_SE_NAO_MAIOR_IGUAL,
+    '==': SALTAR_SE_NAO_IGUAL, '!=': SALTAR_SE_NAO_DIFERENTE,
+}
+
+SALTOS = (SALTAR, SALTAR_SE_FALSO, SALTAR_SE_VERDADEIRO) + tuple(SALTOS_COMPARACAO.values())
+
+# Limite padrão da memória dos quadros de chamadas em andamento, em MB.
+LIMITE_PILHA_PADRAO = 256
+
+# Estimativa dos bytes de um quadro: a tupla guardada na lista de quadros e a
+# lista de locais (mais um ponteiro por slot).
+CUSTO_QUADRO = 200
+CUSTO_SLOT = 8
+
+
+class FuncaoBytecode:
+    def __init__(self, nome, tipo, parametros, tipos_parametros):
+        self.nome = nome
+        self.tipo = tipo
+        self.parametros = parametros
+        self.tipos_parametros = tipos_parametros
+        self.retorno_padrao = retorno_padrao(tipo)
+        self.nomes_locais = list(parametros)
+        self.tipos_locais = list(tipos_parametros)
+        self.codigo = array('i')
+        # Função pura que --memoize memoriza (pureza.py).
+        self.memorizavel = False
+
+    @property
+    def n_locais(self):
+        return len(self.nomes_locais)
+
+
+class ProgramaBytecode:
+    def __init__(self):
+        self.constantes = []
+        self.funcoes = []
+        self.indices_funcoes = {}
+        self.nomes_globais = []
+        self.tipos_globais = []
+        self.structs = {}
+        self.unions = {}
+        self.inicializacao = FuncaoBytecode("<global>", "void", [], [])
+
+    def funcao(self, nome):
+        return self.funcoes[self.indices_funcoes[nome]]
+
+
+class CompiladorBytecode:
+    def __init__(self):
+        self.programa = ProgramaBytecode()
+        self._indices_constantes = {}
+        self._macros = {}
+        self._expressoes_macros = {}
+        self._funcao = None
+        self._globais = {}
+        self._locais = {}
+        self._quebras = []
+        self._tipos = {}
+        self._seguras = set()
+        self._garantidos = {}
+        self._guardas = {}
+        self._lacos_rapidos = set()
+        self._dobradas = {}
+
+    def compilar(self, tree, resolucao=None):
+        # `resolucao` (de inicializacao.resolver_e_analisar) dá o tipo
+        # estático das expressões, que decide a conversão de cada atribuição,
+        # e as leituras de variáveis que dispensam a verificação de slot vazio,
+        # a análise de faixa, os acessos a array que dispensam a de índice, e
+        # a dobra de constantes, as expressões já calculadas na carga.
+        programa = self.programa
+        if resolucao is None:
+            resolucao = resolver_e_analisar(tree)
+        self._tipos = resolucao.tipos_expressoes
+        self._seguras = resolucao.leituras_seguras
+        self._garantidos = resolucao.indices_garantidos
+        self._guardas = resolucao.guardas
+        self._dobradas = resolucao.constantes
+        self._expansoes = resolucao.expansoes
+        self._caudas = resolucao.caudas
+
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                nome = filho.Identifier().getText()
+                parametros = []
+                tipos_parametros = []
+                if filho.paramList() is not None:
+                    parametros = [token.getText() for token in filho.paramList().Identifier()]
+                    tipos_parametros = [t.getText() for t in filho.paramList().type_()]
+                funcao = FuncaoBytecode(nome, filho.type_().getText(), parametros, tipos_parametros)
+                funcao.memorizavel = nome in resolucao.memorizaveis
+                if nome in programa.indices_funcoes:
+                    programa.funcoes[programa.indices_funcoes[nome]] = funcao
+                else:
+                    programa.indices_funcoes[nome] = len(programa.funcoes)
+                    programa.funcoes.append(funcao)
+            elif isinstance(filho, CParser.StructDefContext):
+                programa.structs[filho.Identifier().getText()] = self._campos(filho, "struct")
+            elif isinstance(filho, CParser.UnionDefContext):
+                programa.unions[filho.Identifier().getText()] = self._campos(filho, "union")
+
+        self._iniciar_funcao(programa.inicializacao)
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.StatementContext):
+                self._compilar_statement(filho)
+            elif isinstance(filho, CParser.DirectiveContext):
+                self._compilar_diretiva(filho)
+        self._emitir(CONST, self._constante(None))
+        self._emitir(RETORNAR)
+
+        # Como em interpretador.funcoes, a última definição com o mesmo nome prevalece.
+        definicoes = {}
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                definicoes[filho.Identifier().getText()] = filho
+        for nome, ctx in definicoes.items():
+            self._iniciar_funcao(programa.funcao(nome))
+            self._compilar_bloco(ctx.block())
+            self._emitir(CONST, self._constante(None))
+            self._emitir(RETORNAR)
+
+        return programa
+
+    def _campos(self, ctx, tipo_registro):
+        campos = {}
+        nome_registro = ctx.Identifier().getText()
+        for vd in ctx.varDecl():
+            nome_campo = vd.Identifier().getText()
+            if nome_campo in campos:
+                raise Exception(f"Campo '{nome_campo}' duplicado na {tipo_registro} '{nome_registro}'.")
+            campos[nome_campo] = vd.type_().getText()
+        return campos
+
+    def _iniciar_funcao(self, funcao):
+        self._funcao = funcao
+        self._locais = {nome: i for i, nome in enumerate(funcao.nomes_locais)}
+        self._declarados = set(funcao.nomes_locais)
+        self._quebras = []
+
+    # ------------------------------------------------------------------
+    # Emissão
+    # ------------------------------------------------------------------
+
+    def _emitir(self, opcode, operando=0):
+        codigo = self._funcao.codigo
+        codigo.append(opcode)
+        codigo.append(operando)
+        return len(codigo) - 2
+
+    def _posicao(self):
+        return len(self._funcao.codigo)
+
+    def _corrigir_salto(self, posicao, alvo=None):
+        self._funcao.codigo[posicao + 1] = self._posicao() if alvo is None else alvo
+
+    def _constante(self, valor):
+        chave = (type(valor), valor) if not isinstance(valor, (list, dict)) else None
+        if chave is not None and chave in self._indices_constantes:
+            return self._indices_constantes[chave]
+        self.programa.constantes.append(valor)
+        indice = len(self.programa.constantes) - 1
+        if chave is not None:
+            self._indices_constantes[chave] = indice
+        return indice
+
+    def _erro(self, mensagem):
+        self._emitir(ERRO, self._constante(mensagem))
+
+    def _local_temporario(self, prefixo):
+        nome = f"${prefixo}{len(self._funcao.nomes_locais)}"
+        self._locais[nome] = len(self._funcao.nomes_locais)
+        self._funcao.nomes_locais.append(nome)
+        self._funcao.tipos_locais.append(None)
+        return self._locais[nome]
+
+    # ------------------------------------------------------------------
+    # Resolução de nomes
+    # ------------------------------------------------------------------
+
+    def _em_escopo_global(self):
+        return self._funcao is self.programa.inicializacao
+
+    def _resolver(self, nome):
+        if not self._em_escopo_global() and nome in self._locais:
+            return False, self._locais[nome], self._funcao.tipos_locais[self._locais[nome]]
+        if nome in self._globais:
+            indice = self._globais[nome]
+            return True, indice, self.programa.tipos_globais[indice]
+        return None
+
+    def _declarar(self, nome, tipo):
+        if self._em_escopo_global():
+            nomes, tipos, indices = self.programa.nomes_globais, self.programa.tipos_globais, self._globais
+            declarados = indices
+        else:
+            nomes, tipos, indices = self._funcao.nomes_locais, self._funcao.tipos_locais, self._locais
+            declarados = self._declarados
+        if nome in declarados:
+            self._erro(f"Variável '{nome}' já foi declarada.")
+        if not self._em_escopo_global():
+            self._declarados.add(nome)
+        if nome not in indices:
+            indices[nome] = len(nomes)
+            nomes.append(nome)
+            tipos.append(tipo)
+        return indices[nome]
+
+    def _carregar(self, eh_global, indice, token):
+        # CARREGAR_LOCAL/CARREGAR_GLOBAL leem o slot direto; as variantes
+        # _VERIFICADO ficam para as leituras que a análise de inicialização
+        # não garante.
+        if token in self._seguras:
+            self._emitir(CARREGAR_GLOBAL if eh_global else CARREGAR_LOCAL, indice)
+        else:
+            self._emitir(CARREGAR_GLOBAL_VERIFICADO if eh_global else CARREGAR_LOCAL_VERIFICADO, indice)
+
+    def _carregar_variavel(self, token):
+        nome = token.getText()
+        local = not self._em_escopo_global() and nome in self._locais
+        if nome in self._macros and not local:
+            self._carregar(True, self._macros[nome], token)
+            return
+        endereco = self._resolver(nome)
+        if endereco is None:
+            self._erro(f"Variável '{nome}' não foi declarada.")
+            return
+        eh_global, indice, _ = endereco
+        self._carregar(eh_global, indice, token)
+
+    def _tipo_variavel(self, nome):
+        # Tipo declarado de um identificador usado numa expressão ("" para
+        # #define ou nome não declarado), como em _carregar_variavel.
+        local = not self._em_escopo_global() and nome in self._locais
+        endereco = self._resolver(nome)
+        if (nome in self._macros and not local) or endereco is None:
+            return ""
+        return endereco[2] or ""
+
+    def _armazenar_variavel(self, eh_global, indice):
+        self._emitir(ARMAZENAR_GLOBAL if eh_global else ARMAZENAR_LOCAL, indice)
+
+    def _emitir_conversao(self, tipo, ctx, nome_alvo):
+        # Converte o valor no topo da pilha (o da expressão `ctx`) para `tipo`
+        # com a conversão escolhida pela tipagem. Devolve o tipo que ainda
+        # precisa da verificação completa, ou None se o valor já está
+        # convertido; com nome_alvo None (rótulo só conhecido na execução),
+        # o truncamento fica para a verificação completa.
+        modo = conversao(tipo, self._tipos.get(ctx))
+        if modo == IDENTIDADE:
+            return None
+        if modo == PARA_REAL:
+            self._emitir(CONVERTER_REAL)
+            return None
+        if modo == PARA_INTEIRO and nome_alvo is not None:
+            self._emitir(TRUNCAR, self._constante(nome_alvo))
+            return None
+        return tipo
+
+    # ------------------------------------------------------------------
+    # Comandos
+    # ------------------------------------------------------------------
+
+    def _compilar_diretiva(self, ctx):
+        if ctx.getChild(0).getText() != '#define':
+            return
+        nome = ctx.Identifier().getText()
+        self._expressoes_macros[nome] = ctx.expression()
+        if nome not in self._macros:
+            self._macros[nome] = len(self.programa.nomes_globais)
+            self.programa.nomes_globais.append("#" + nome)
+            self.programa.tipos_globais.append(None)
+        if ctx.expression() is not None:
+            self._compilar_expressao(ctx.expression())
+        else:
+            self._emitir(CONST, self._constante(None))
+        self._emitir(ARMAZENAR_GLOBAL, self._macros[nome])
+
+    def _compilar_bloco(self, ctx):
+        for stmt in ctx.statement():
+            self._compilar_statement(stmt)
+
+    def _compilar_statement(self, ctx):
+        filho = ctx.getChild(0)
+
+        if isinstance(filho, CParser.VarDeclContext):
+            self._compilar_var_decl(filho)
+        elif isinstance(filho, CParser.AssignmentContext):
+            self._compilar_assignment(filho)
+        elif isinstance(filho, CParser.IfStatementContext):
+            self._compilar_if(filho)
+        elif isinstance(filho, CParser.WhileStatementContext):
+            self._compilar_while(filho)
+        elif isinstance(filho, CParser.DoWhileStatementContext):
+            self._compilar_do_while(filho)
+        elif isinstance(filho, CParser.ForStatementContext):
+            self._compilar_for(filho)
+        elif isinstance(filho, CParser.SwitchStatementContext):
+            self._compilar_switch(filho)
+        elif isinstance(filho, CParser.FunctionCallContext):
+            self._compilar_chamada(filho)
+            self._emitir(DESCARTAR)
+        elif isinstance(filho, CParser.InputOutputStatementContext):
+            self._compilar_entrada_saida(filho)
+        elif isinstance(filho, CParser.BlockContext):
+            self._compilar_bloco(filho)
+        elif isinstance(filho, CParser.BreakStatementContext):
+            if not self._quebras:
+                self._erro("Comando 'break' fora de um laço ou switch.")
+            else:
+                self._quebras[-1].append(self._emitir(SALTAR))
+        elif ctx in self._caudas:
+            # return f(argumentos) dentro de f: os argumentos ficam na pilha e
+            # REINICIAR os faz parâmetros e volta ao início da função.
+            for expr in self._caudas[ctx].argumentos:
+                self._compilar_expressao(expr)
+            self._emitir(REINICIAR, len(self._caudas[ctx].argumentos))
+        elif filho.getText() == "return":
+            if ctx.expression() is not None:
+                self._compilar_expressao(ctx.expression())
+            else:
+                self._emitir(CONST, self._constante(None))
+            self._emitir(RETORNAR)
+
+    def _compilar_var_decl(self, ctx):
+        tipo = ctx.type_().getText()
+        nome = ctx.Identifier().getText()
+
+        is_array = False
+        tam_array = None
+        if ctx.arraySize():
+            is_array = True
+            if ctx.arraySize().Number() is not None:
+                tam_array = int(ctx.arraySize().Number().getText())
+
+        tem_init = ctx.init() is not None
+        if tem_init:
+            init = ctx.init()
+            if init.initializerList() is not None:
+                elementos = init.initializerList().expression()
+                for elem in elementos:
+                    self._compilar_expressao(elem)
+                self._emitir(CRIAR_LISTA, len(elementos))
+            else:
+                self._compilar_expressao(init.expression())
+        else:
+            self._emitir(CONST, self._constante(None))
+
+        eh_global = self._em_escopo_global()
+        if (tem_init and not is_array and ctx.init().expression() is not None
+                and not tipo.startswith("struct") and not tipo.startswith("union")
+                and conversao(tipo, self._tipos.get(ctx.init().expression())) in (IDENTIDADE, PARA_REAL, PARA_INTEIRO)):
+            # Escalar com inicializador já tipado: convertido aqui e guardado
+            # direto no slot, sem passar por _valor_declarado.
+            self._emitir_conversao(tipo, ctx.init().expression(), nome)
+            self._armazenar_variavel(eh_global, self._declarar(nome, tipo))
+            return
+        indice = self._declarar(nome, tipo + "[]" if is_array else tipo)
+        declaracao = self._constante((indice, tipo, nome, is_array, tam_array, tem_init))
+        self._emitir(DECLARAR_GLOBAL if eh_global else DECLARAR_LOCAL, declaracao)
+
+    def _compilar_assignment(self, ctx):
+        if (ctx.getChildCount() >= 6
+                and ctx.getChild(1).getText() == '['
+                and ctx.getChild(3).getText() == ']'
+                and ctx.getChild(4).getText() == '='):
+            array_name = ctx.getChild(0).getText()
+            self._compilar_expressao(ctx.getChild(2))
+            self._compilar_expressao(ctx.getChild(5))
+            endereco = self._resolver(array_name)
+            if endereco is None:
+                self._erro(f"Variável '{array_name}' não foi declarada.")
+                return
+            eh_global, indice, tipo = endereco
+            if tipo is None or not tipo.endswith("[]"):
+                self._erro(f"Variável '{array_name}' não é um array, mas foi usada como array.")
+                return
+            # A conversão especializada vem antes de empilhar o array, com o
+            # valor no topo; tipo_base None: nada a verificar no armazenamento.
+            tipo_base = self._emitir_conversao(tipo[:-2], ctx.getChild(5), None)
+            self._carregar(eh_global, indice, ctx.getChild(0))
+            if tipo_base is None and self._indice_garantido(ctx):
+                self._emitir(ARMAZENAR_ELEMENTO_DIRETO)
+            else:
+                self._emitir(ARMAZENAR_ELEMENTO, self._constante((tipo_base, array_name)))
+            return
+
+        identifiers = [token.getText() for token in ctx.Identifier()]
+        nome_var = identifiers[0]
+        self._compilar_expressao(ctx.expression(0))
+        endereco = self._resolver(nome_var)
+        if endereco is None:
+            self._erro(f"Variável '{nome_var}' não foi declarada.")
+            return
+        eh_global, indice, tipo = endereco
+
+        if len(identifiers) == 1:
+            if tipo.startswith("union"):
+                self._erro("Atribuição direta de union não permitida; use a atribuição de campo (ex.: u.campo = valor).")
+                return
+            tipo_convertido = self._emitir_conversao(tipo, ctx.expression(0), nome_var)
+            if tipo_convertido is not None:
+                self._emitir(CONVERTER, self._constante((tipo_convertido, nome_var)))
+            self._armazenar_variavel(eh_global, indice)
+            return
+
+        if not (tipo.startswith("struct") or tipo.startswith("union")):
+            self._erro("Atribuição inválida: acesso a campo apenas para structs e unions.")
+            return
+        if tipo.startswith("union") and len(identifiers) != 2:
+            self._erro("Acesso a sub-campos de union não suportado.")
+            return
+        caminho = tuple(identifiers[1:-1])
+        tipo_campo = tipo_do_caminho(self.programa.structs, tipo, identifiers[1:])
+        if tipo_campo is not None:
+            # Campo resolvido na compilação: tipo conhecido e caminho num
+            # attrgetter; o tipo só vai na constante se o valor ainda precisa
+            # da verificação completa.
+            rotulo = f"{nome_var}.{identifiers[-1]}"
+            tipo_campo = self._emitir_conversao(tipo_campo, ctx.expression(0), rotulo)
+            self._carregar(eh_global, indice, ctx.Identifier(0))
+            obter = leitor_de_caminho(caminho) if caminho else None
+            self._emitir(ARMAZENAR_CAMINHO, self._constante((obter, caminho, identifiers[-1], tipo_campo, nome_var, rotulo)))
+            return
+        self._carregar(eh_global, indice, ctx.Identifier(0))
+        self._emitir(ARMAZENAR_CAMPO, self._constante((caminho, identifiers[-1], nome_var)))
+
+    def _compilar_if(self, ctx):
+        saltos_senao = []
+        self._compilar_condicao(ctx.expression(), saltos_senao)
+        self._compilar_statement(ctx.statement(0))
+        if ctx.statement(1) is None:
+            for salto in saltos_senao:
+                self._corrigir_salto(salto)
+            return
+        salto_fim = self._emitir(SALTAR)
+        for salto in saltos_senao:
+            self._corrigir_salto(salto)
+        self._compilar_statement(ctx.statement(1))
+        self._corrigir_salto(salto_fim)
+
+    def _laco(self, corpo):
+        self._quebras.append([])
+        corpo()
+        for salto in self._quebras.pop():
+            self._corrigir_salto(salto)
+
+    def _laco_guardado(self, laco, corpo):
+        # Laço com guardas (limites.py): emitido duas vezes. GUARDA_LACO testa
+        # as guardas na entrada; se valem, roda a cópia cujos acessos
+        # garantidos não verificam o índice, senão a cópia original.
+        guardas = self._guardas.get(laco)
+        descricao = []
+        for guarda in guardas or ():
+            vetor = self._resolver(guarda.vetor.getText())
+            if type(guarda.limite) is int:
+                limite = (None, guarda.limite)
+            else:
+                limite = self._resolver(guarda.limite.getText())
+            if vetor is None or limite is None:
+                guardas = None
+                break
+            descricao.append((vetor[0], vetor[1], limite[0], limite[1], guarda.acrescimo))
+        if not guardas:
+            self._laco(corpo)
+            return
+
+        self._emitir(GUARDA_LACO, self._constante(tuple(descricao)))
+        salto_verificado = self._emitir(SALTAR_SE_FALSO)
+        declarados = set(self._declarados)
+        self._lacos_rapidos.add(laco)
+        self._laco(corpo)
+        self._lacos_rapidos.discard(laco)
+        salto_fim = self._emitir(SALTAR)
+        self._corrigir_salto(salto_verificado)
+        # As declarações do corpo são compiladas de novo na segunda cópia.
+        self._declarados = declarados
+        self._laco(corpo)
+        self._corrigir_salto(salto_fim)
+
+    def _indice_garantido(self, acesso):
+        laco = self._garantidos.get(acesso)
+        return laco is not None and (laco not in self._guardas or laco in self._lacos_rapidos)
+
+    def _compilar_while(self, ctx):
+        def corpo():
+            inicio = self._posicao()
+            self._compilar_condicao(ctx.expression(), self._quebras[-1])
+            self._compilar_statement(ctx.statement())
+            self._emitir(SALTAR, inicio)
+        self._laco_guardado(ctx, corpo)
+
+    def _compilar_do_while(self, ctx):
+        def corpo():
+            inicio = self._posicao()
+            self._compilar_statement(ctx.statement())
+            saltos_inicio = []
+            self._compilar_condicao_verdadeira(ctx.expression(), saltos_inicio)
+            for salto in saltos_inicio:
+                self._corrigir_salto(salto, inicio)
+        self._laco(corpo)
+
+    def _compilar_for_header(self, ctx):
+        nome = ctx.Identifier().getText()
+        self._compilar_expressao(ctx.expression())
+        endereco = self._resolver(nome)
+        if endereco is None:
+            self._erro(f"Variável '{nome}' não foi declarada.")
+            return
+        self._armazenar_variavel(endereco[0], endereco[1])
+
+    def _compilar_for(self, ctx):
+        partes = [None, None, None]
+        posicao = 0
+        for i in range(2, ctx.getChildCount() - 2):
+            filho = ctx.getChild(i)
+            if filho.getText() == ';':
+                posicao += 1
+            else:
+                partes[posicao] = filho
+        inicio, condicao, passo = partes
+
+        if isinstance(inicio, CParser.VarDeclContext):
+            self._compilar_var_decl(inicio)
+        elif inicio is not None:
+            self._compilar_for_header(inicio)
+
+        def corpo():
+            topo = self._posicao()
+            if condicao is not None:
+                self._compilar_condicao(condicao, self._quebras[-1])
+            self._compilar_statement(ctx.statement())
+            if passo is not None:
+                self._compilar_for_header(passo)
+            self._emitir(SALTAR, topo)
+        self._laco_guardado(ctx, corpo)
+
+    def _rotulo_constante(self, ctx):
+        if ctx in self._dobradas:
+            return True, self._dobradas[ctx]
+        macro = macros_constantes(self._expressoes_macros)
+
+        def macro_visivel(token):
+            if not self._em_escopo_global() and token.getText() in self._locais:
+                return False, None
+            return macro(token)
+        return valor_constante(ctx, macro_visivel)
+
+    def _compilar_switch(self, ctx):
+        # SALTAR_TABELA consulta um dicionário {rótulo constante: pc} montado
+        # na compilação e salta direto para o bloco; os blocos são emitidos
+        # em sequência, então um bloco sem break continua no seguinte
+        # (fall-through de C). Rótulos não constantes são comparados em
+        # ordem quando o valor não está na tabela.
+        blocos = [ctx.getChild(i) for i in range(ctx.getChildCount())
+                  if isinstance(ctx.getChild(i), (CParser.CaseBlockContext, CParser.DefaultBlockContext))]
+        constantes = []
+        nao_constantes = []
+        for bloco in blocos:
+            if isinstance(bloco, CParser.CaseBlockContext):
+                constante, valor = self._rotulo_constante(bloco.caseLabel().expression())
+                (constantes if constante else nao_constantes).append((bloco, valor))
+
+        def corpo():
+            self._compilar_expressao(ctx.expression())
+            if nao_constantes:
+                valor = self._local_temporario("switch")
+                self._emitir(ARMAZENAR_LOCAL, valor)
+                self._emitir(CARREGAR_LOCAL, valor)
+
+            # [rótulos, pc se o valor não estiver na tabela]
+            tabela = [{}, 0]
+            self._emitir(SALTAR_TABELA, self._constante(tabela))
+            tabela[1] = self._posicao()
+
+            saltos_reserva = []
+            for bloco, _ in nao_constantes:
+                self._emitir(CARREGAR_LOCAL, valor)
+                self._compilar_expressao(bloco.caseLabel().expression())
+                proximo = self._emitir(SALTAR_SE_NAO_IGUAL)
+                saltos_reserva.append((bloco, self._emitir(SALTAR)))
+                self._corrigir_salto(proximo)
+            salto_padrao = self._emitir(SALTAR)
+
+            inicios = {}
+            tem_padrao = False
+            for bloco in blocos:
+                inicios[bloco] = self._posicao()
+                if isinstance(bloco, CParser.DefaultBlockContext) and not tem_padrao:
+                    tem_padrao = True
+                    self._corrigir_salto(salto_padrao)
+                for stmt in bloco.statement():
+                    self._compilar_statement(stmt)
+                if bloco.breakStatement() is not None:
+                    self._quebras[-1].append(self._emitir(SALTAR))
+            if not tem_padrao:
+                self._quebras[-1].append(salto_padrao)
+
+            for bloco, valor in reversed(constantes):
+                tabela[0][valor] = inicios[bloco]
+            for bloco, salto in saltos_reserva:
+                self._corrigir_salto(salto, inicios[bloco])
+        self._laco(corpo)
+
+    def _compilar_entrada_saida(self, ctx):
+        comando = ctx.getChild(0).getText()
+
+        if comando == "printf":
+            plano = compilar_printf(decodificar_literal(ctx.StringLiteral().getText()))
+            argumentos = ctx.expression()
+            for expr in argumentos:
+                self._compilar_expressao(expr)
+            self._emitir(PRINTF, self._constante((plano, len(argumentos))))
+
+        elif comando == "scanf":
+            plano = compilar_scanf(decodificar_literal(ctx.StringLiteral().getText()))
+            parametros = ctx.scanfParam()
+            if plano.erro is not None:
+                self._erro(plano.erro)
+                return
+            if len(parametros) != len(plano.conversoes):
+                self._erro("Erro: Número de variáveis não corresponde ao formato.")
+                return
+            for especificador, param in zip(plano.conversoes, parametros):
+                nome = param.Identifier().getText()
+                endereco = self._resolver(nome)
+                if endereco is None:
+                    self._erro(f"Variável '{nome}' não foi declarada.")
+                    continue
+                if param.expression() is None:
+                    self._emitir(LER_SCANF, self._constante(endereco + (nome, especificador)))
+                    continue
+                if not endereco[2].endswith("[]"):
+                    self._erro(f"Variável '{nome}' não é um array, mas foi usada com indexação no scanf.")
+                    continue
+                self._compilar_expressao(param.expression())
+                self._emitir(LER_SCANF_ELEMENTO, self._constante(endereco + (nome, especificador)))
+
+        elif comando == "gets":
+            nome = ctx.Identifier().getText()
+            endereco = self._resolver(nome)
+            if endereco is None:
+                self._erro(f"Variável '{nome}' não foi declarada.")
+                return
+            self._emitir(LER_GETS, self._constante(endereco + (nome, None)))
+
+        else:
+            if ctx.expression(0) is not None:
+                self._compilar_expressao(ctx.expression(0))
+            else:
+                self._emitir(CONST, self._constante(decodificar_literal(ctx.StringLiteral().getText())))
+            self._emitir(PUTS)
+
+    def _compilar_chamada(self, ctx):
+        nome = ctx.Identifier().getText()
+        if nome not in self.programa.indices_funcoes:
+            self._erro(f"Função '{nome}' não foi definida.")
+            return
+        indice = self.programa.indices_funcoes[nome]
+        funcao = self.programa.funcoes[indice]
+
+        argumentos = []
+        if ctx.argumentList() is not None:
+            argumentos = ctx.argumentList().expression()
+        expandida = self._expansoes.get(ctx)
+        if expandida is not None:
+            self._compilar_expansao(expandida, argumentos)
+            return
+        for expr in argumentos:
+            self._compilar_expressao(expr)
+        if len(argumentos) != len(funcao.parametros):
+            self._erro(f"Função '{nome}' espera {len(funcao.parametros)} parâmetros, mas {len(argumentos)} foram passados.")
+            return
+        self._emitir(CHAMAR, indice)
+
+    def _compilar_expansao(self, expandida, argumentos):
+        # Chamada de função folha expandida em linha (expansao.py): os
+        # argumentos ficam na pilha até o último ser avaliado (outra expansão
+        # da mesma função num argumento usa os mesmos slots) e vão para locais
+        # extras com ARMAZENAR_ARGUMENTO; o return da função é compilado com
+        # os parâmetros ligados a esses locais.
+        parametros = {}
+        pendentes = []
+        for k, (argumento, direto) in enumerate(zip(argumentos, expandida.diretos)):
+            nome, tipo = expandida.escopo.nomes[k], expandida.escopo.tipos[k]
+            if direto:
+                indice = self._locais.get(argumento.Identifier().getText())
+                if indice is not None and self._funcao.tipos_locais[indice] == tipo:
+                    parametros[nome] = indice
+                    continue
+            chave = f"${expandida.funcao}.{nome}"
+            if chave not in self._locais:
+                self._locais[chave] = len(self._funcao.nomes_locais)
+                self._funcao.nomes_locais.append(nome)
+                self._funcao.tipos_locais.append(tipo)
+            parametros[nome] = self._locais[chave]
+            pendentes.append(parametros[nome])
+            self._compilar_expressao(argumento)
+        for indice in reversed(pendentes):
+            self._emitir(ARMAZENAR_ARGUMENTO, indice)
+
+        locais = self._locais
+        self._locais = parametros
+        try:
+            self._compilar_expressao(expandida.corpo)
+        finally:
+            self._locais = locais
+        if not expandida.tipado:
+            self._emitir(VALOR_PADRAO, self._constante(retorno_padrao(expandida.tipo)))
+
+    # ------------------------------------------------------------------
+    # Condições
+    # ------------------------------------------------------------------
+
+    def _partes_condicao(self, ctx):
+        # (operador, esquerda, direita, ctx) de uma condição binária, sem os
+        # parênteses externos; operador None para as demais expressões.
+        while ctx.getChildCount() == 3 and ctx.getChild(0).getText() == '(':
+            ctx = ctx.getChild(1)
+        if ctx.getChildCount() == 3 and isinstance(ctx.getChild(0), CParser.ExpressionContext):
+            return ctx.getChild(1).getText(), ctx.expression(0), ctx.expression(1), ctx
+        return None, None, None, ctx
+
+    def _compilar_condicao(self, ctx, saltos_falso):
+        # Segue para a próxima instrução se a condição for verdadeira; se for
+        # falsa, salta (os saltos emitidos entram em saltos_falso, para serem
+        # corrigidos por quem chamou). && e || viram desvios em curto-circuito
+        # e comparações usam as instruções de comparar-e-saltar. Uma condição
+        # dobrada na carga vira um salto incondicional ou nada.
+        if ctx in self._dobradas:
+            if not self._dobradas[ctx]:
+                saltos_falso.append(self._emitir(SALTAR))
+            return
+        op, esquerda, direita, ctx = self._partes_condicao(ctx)
+        if op == '&&':
+            self._compilar_condicao(esquerda, saltos_falso)
+            self._compilar_condicao(direita, saltos_falso)
+        elif op == '||':
+            saltos_verdadeiro = []
+            self._compilar_condicao_verdadeira(esquerda, saltos_verdadeiro)
+            self._compilar_condicao(direita, saltos_falso)
+            for salto in saltos_verdadeiro:
+                self._corrigir_salto(salto)
+        elif op in SALTOS_COMPARACAO:
+            self._compilar_expressao(esquerda)
+            self._compilar_expressao(direita)
+            saltos_falso.append(self._emitir(SALTOS_COMPARACAO[op]))
+        else:
+            self._compilar_expressao(ctx)
+            saltos_falso.append(self._emitir(SALTAR_SE_FALSO))
+
+    def _compilar_condicao_verdadeira(self, ctx, saltos_verdadeiro):
+        # Simétrico de _compilar_condicao: salta se a condição for verdadeira.
+        if ctx in self._dobradas:
+            if self._dobradas[ctx]:
+                saltos_verdadeiro.append(self._emitir(SALTAR))
+            return
+        op, esquerda, direita, ctx = self._partes_condicao(ctx)
+        if op == '&&':
+            saltos_falso = []
+            self._compilar_condicao(esquerda, saltos_falso)
+            self._compilar_condicao_verdadeira(direita, saltos_verdadeiro)
+            for salto in saltos_falso:
+                self._corrigir_salto(salto)
+        elif op == '||':
+            self._compilar_condicao_verdadeira(esquerda, saltos_verdadeiro)
+            self._compilar_condicao_verdadeira(direita, saltos_verdadeiro)
+        else:
+            self._compilar_expressao(ctx)
+            saltos_verdadeiro.append(self._emitir(SALTAR_SE_VERDADEIRO))
+
+    # ------------------------------------------------------------------
+    # Expressões
+    # ------------------------------------------------------------------
+
+    def _compilar_expressao(self, ctx):
+        if ctx in self._dobradas:
+            self._emitir(CONST, self._constante(self._dobradas[ctx]))
+            return
+
+        child_count = ctx.getChildCount()
+
+        if child_count == 1 and isinstance(ctx.getChild(0), CParser.FunctionCallContext):
+            self._compilar_chamada(ctx.getChild(0))
+            return
+
+        if child_count == 1 and ctx.Identifier():
+            self._carregar_variavel(ctx.Identifier())
+            return
+
+        if child_count == 3 and ctx.getChild(1).getText() == '.':
+            cadeia = cadeia_de_campos(ctx)
+            if cadeia is not None:
+                nome, campos = cadeia[0].getText(), cadeia[1]
+                if tipo_do_caminho(self.programa.structs, self._tipo_variavel(nome), campos) is not None:
+                    self._carregar_variavel(cadeia[0])
+                    self._emitir(CARREGAR_CAMINHO, self._constante((leitor_de_caminho(campos), tuple(campos))))
+                    return
+            self._compilar_expressao(ctx.getChild(0))
+            self._emitir(CARREGAR_CAMPO, self._constante(ctx.getChild(2).getText()))
+            return
+
+        if child_count == 3 and ctx.getChild(1).getText() in ('&&', '||'):
+            # Valor de && e ||: a condição em curto-circuito escolhe entre as
+            # constantes True e False.
+            saltos_falso = []
+            self._compilar_condicao(ctx, saltos_falso)
+            self._emitir(CONST, self._constante(True))
+            salto_fim = self._emitir(SALTAR)
+            for salto in saltos_falso:
+                self._corrigir_salto(salto)
+            self._emitir(CONST, self._constante(False))
+            self._corrigir_salto(salto_fim)
+            return
+
+        if child_count == 3 and ctx.getChild(1).getText() in OPERADORES_BINARIOS:
+            self._compilar_expressao(ctx.expression(0))
+            self._compilar_expressao(ctx.expression(1))
+            self._emitir(OPERADORES_BINARIOS[ctx.getChild(1).getText()])
+            return
+
+        if (child_count == 4 and ctx.getChild(0).getSymbol() is not None
+                and ctx.getChild(1).getText() == '[' and ctx.getChild(3).getText() == ']'):
+            array_name = ctx.getChild(0).getText()
+            self._compilar_expressao(ctx.getChild(2))
+            endereco = self._resolver(array_name)
+            if endereco is None:
+                self._erro(f"Variável '{array_name}' não foi declarada.")
+                return
+            eh_global, indice, tipo = endereco
+            if tipo is None or not tipo.endswith("[]"):
+                self._erro(f"Variável '{array_name}' não é um array, mas foi usada como array.")
+                return
+            self._carregar(eh_global, indice, ctx.getChild(0))
+            if self._indice_garantido(ctx):
+                self._emitir(CARREGAR_ELEMENTO_DIRETO)
+            else:
+                self._emitir(CARREGAR_ELEMENTO, self._constante(array_name))
+            return
+
+        if ctx.Number():
+            texto = ctx.Number().getText()
+            self._emitir(CONST, self._constante(float(texto) if '.' in texto else int(texto)))
+            return
+
+        if ctx.StringLiteral():
+            self._emitir(CONST, self._constante(decodificar_literal(ctx.StringLiteral().getText())))
+            return
+
+        if ctx.CharLiteral():
+            self._emitir(CONST, self._constante(ctx.CharLiteral().getText().strip("'")))
+            return
+
+        if child_count == 3 and ctx.getChild(0).getText() == '(' and ctx.getChild(2).getText() == ')':
+            self._compilar_expressao(ctx.getChild(1))
+            return
+
+        if child_count == 2 and ctx.getChild(0).getText() in ('-', '!'):
+            self._compilar_expressao(ctx.getChild(1))
+            self._emitir(NEGATIVO if ctx.getChild(0).getText() == '-' else NAO)
+            return
+
+        self._emitir(CONST, self._constante(None))
+
+
+class MaquinaVirtual:
+    def __init__(self, programa, interpretador=None, limite_pilha=LIMITE_PILHA_PADRAO, memorizacao=None):
+        # limite_pilha: MB de quadros de chamadas em andamento (--stack-size);
+        # memorizacao: caches das funções puras com --memoize.
+        self.programa = programa
+        self.limite_pilha = limite_pilha
+        # Índice da função -> CacheLRU, para as memorizadas.
+        self._memorizadas = {}
+        if memorizacao is not None:
+            for indice, funcao in enumerate(programa.funcoes):
+                if funcao.memorizavel:
+                    self._memorizadas[indice] = memorizacao.cache(funcao.nome)
+        self.interp = interpretador if interpretador is not None else Interpretador()
+        for nome, campos in programa.structs.items():
+            self.interp.tabela_simbolos.adicionar_struct(nome, campos)
+        for nome, campos in programa.unions.items():
+            self.interp.tabela_simbolos.adicionar_union(nome, campos)
+        self.globais = [NAO_INICIALIZADA] * len(programa.nomes_globais)
+        self._codigos = {}
+
+    def inicializar(self):
+        self._executar(self.programa.inicializacao, ())
+
+    def executar_main(self):
+        self._executar(self.programa.funcao("main"), ())
+
+    def _nao_inicializada(self, nome):
+        return Exception(f"Erro: Variável '{nome}' não foi inicializada antes do uso.")
+
+    def _guardas_valem(self, guardas, locais, globais):
+        # (global?, slot do array, global? do limite ou None, slot ou valor
+        # do limite, acréscimo) para cada guarda do laço.
+        for vetor_global, vetor, limite_global, limite, acrescimo in guardas:
+            if limite_global is not None:
+                limite = (globais if limite_global else locais)[limite]
+            if not comporta((globais if vetor_global else locais)[vetor], limite, acrescimo):
+                return False
+        return True
+
+    def _executar(self, funcao, argumentos):
+        codigo = self._codigos.get(funcao)
+        if codigo is None:
+            codigo = self._codigos[funcao] = funcao.codigo.tolist()
+
+        programa = self.programa
+        constantes = programa.constantes
+        funcoes = programa.funcoes
+        globais = self.globais
+        interp = self.interp
+        converter = interp._verificar_tipo_e_converter
+        escrever = interp.saida.escrever
+
+        locais = [NAO_INICIALIZADA] * funcao.n_locais
+        for i, valor in enumerate(argumentos):
+            if valor is not None:
+                locais[i] = valor
+
+        # Uma única pilha de operandos para todas as chamadas: `base` é onde
+        # começa a parte da função atual. `quadros` guarda (função, código,
+        # pc de retorno, locais, base, memória) de cada chamada abaixo da
+        # atual, onde memória é o (cache, chave) em que o resultado da
+        # chamada deve ser guardado, ou None.
+        pilha = []
+        push = pilha.append
+        pop = pilha.pop
+        pc = 0
+        base = 0
+        quadros = []
+        memoria = 0
+        limite_memoria = self.limite_pilha * 1024 * 1024
+        codigos = self._codigos
+        memorizadas = self._memorizadas
+        memo = None
+
+        while True:
+            op = codigo[pc]
+            arg = codigo[pc + 1]
+            pc += 2
+
+            if op == CARREGAR_LOCAL:
+                push(locais[arg])
+            elif op == CONST:
+                push(constantes[arg])
+            elif op == ARMAZENAR_LOCAL:
+                locais[arg] = pop()
+            elif op == CONVERTER:
+                tipo, nome = constantes[arg]
+                push(converter(tipo, pop(), nome))
+            elif op == CONVERTER_REAL:
+                push(float(pop()))
+            elif op == TRUNCAR:
+                push(interp._truncar(pop(), constantes[arg]))
+            elif op == SALTAR_SE_FALSO:
+                if not pop():
+                    pc = arg
+            elif op == SALTAR_SE_NAO_MENOR:
+                direita = pop()
+                if not pop() < direita:
+                    pc = arg
+            elif op == SALTAR:
+                pc = arg
+            elif op == SOMAR:
+                direita = pop()
+                push(pop() + direita)
+            elif op == SUBTRAIR:
+                direita = pop()
+                push(pop() - direita)
+            elif op == MENOR:
+                direita = pop()
+                push(pop() < direita)
+            elif op == CARREGAR_GLOBAL:
+                push(globais[arg])
+            elif op == CARREGAR_LOCAL_VERIFICADO:
+                valor = locais[arg]
+                if valor is NAO_INICIALIZADA:
+                    raise self._nao_inicializada(funcao.nomes_locais[arg])
+                push(valor)
+            elif op == CARREGAR_GLOBAL_VERIFICADO:
+                valor = globais[arg]
+                if valor is NAO_INICIALIZADA:
+                    raise self._nao_inicializada(programa.nomes_globais[arg].lstrip("#"))
+                push(valor)
+            elif op == ARMAZENAR_GLOBAL:
+                globais[arg] = pop()
+            elif op == CHAMAR:
+                chamada = funcoes[arg]
+                n = len(chamada.parametros)
+                cache = memorizadas.get(arg) if memorizadas else None
+                if cache is not None:
+                    chave = cache.chave(pilha[len(pilha) - n:])
+                    valor = AUSENTE if chave is None else cache.procurar(chave)
+                    if valor is not AUSENTE:
+                        del pilha[len(pilha) - n:]
+                        push(valor)
+                        continue
+                novos = [NAO_INICIALIZADA] * chamada.n_locais
+                if n:
+                    for i, valor in enumerate(pilha[-n:]):
+                        if valor is not None:
+                            novos[i] = valor
+                    del pilha[-n:]
+                memoria += CUSTO_QUADRO + CUSTO_SLOT * len(novos)
+                if memoria > limite_memoria:
+                    raise Exception(f"Erro: Estouro da pilha de chamadas em '{chamada.nome}' "
+                                    f"(limite de {self.limite_pilha} MB).")
+                quadros.append((funcao, codigo, pc, locais, base, memo))
+                memo = (cache, chave) if cache is not None and chave is not None else None
+                funcao = chamada
+                codigo = codigos.get(chamada)
+                if codigo is None:
+                    codigo = codigos[chamada] = chamada.codigo.tolist()
+                locais = novos
+                base = len(pilha)
+                pc = 0
+            elif op == RETORNAR:
+                valor = pop()
+                if valor is None:
+                    valor = funcao.retorno_padrao
+                if not quadros:
+                    return valor
+                memoria -= CUSTO_QUADRO + CUSTO_SLOT * len(locais)
+                del pilha[base:]
+                if memo is not None:
+                    memo[0].guardar(memo[1], valor)
+                funcao, codigo, pc, locais, base, memo = quadros.pop()
+                push(valor)
+            elif op == ARMAZENAR_ARGUMENTO:
+                valor = pop()
+                locais[arg] = NAO_INICIALIZADA if valor is None else valor
+            elif op == VALOR_PADRAO:
+                if pilha[-1] is None:
+                    pilha[-1] = constantes[arg]
+            elif op == REINICIAR:
+                # Chamada em cauda a si mesma: mesmo quadro, com os argumentos
+                # nos parâmetros e os demais locais vazios.
+                argumentos = [NAO_INICIALIZADA if valor is None else valor for valor in pilha[len(pilha) - arg:]]
+                del pilha[base:]
+                locais[:] = argumentos + [NAO_INICIALIZADA] * (len(locais) - arg)
+                pc = 0
+            elif op == MULTIPLICAR:
+                direita = pop()
+                push(pop() * direita)
+            elif op == DIVIDIR:
+                direita = pop()
+                push(pop() / direita)
+            elif op == RESTO:
+                direita = pop()
+                push(pop() % direita)
+            elif op == MENOR_IGUAL:
+                direita = pop()
+                push(pop() <= direita)
+            elif op == MAIOR:
+                direita = pop()
+                push(pop() > direita)
+            elif op == MAIOR_IGUAL:
+                direita = pop()
+                push(pop() >= direita)
+            elif op == IGUAL:
+                direita = pop()
+                push(pop() == direita)
+            elif op == DIFERENTE:
+                direita = pop()
+                push(pop() != direita)
+            elif op == SALTAR_SE_NAO_MENOR_IGUAL:
+                direita = pop()
+                if not pop() <= direita:
+                    pc = arg
+            elif op == SALTAR_SE_NAO_MAIOR:
+                direita = pop()
+                if not pop() > direita:
+                    pc = arg
+            elif op == SALTAR_SE_NAO_MAIOR_IGUAL:
+                direita = pop()
+                if not pop() >= direita:
+                    pc = arg
+            elif op == SALTAR_SE_NAO_IGUAL:
+                direita = pop()
+                if not pop() == direita:
+                    pc = arg
+            elif op == SALTAR_SE_NAO_DIFERENTE:
+                direita = pop()
+                if not pop() != direita:
+                    pc = arg
+            elif op == SALTAR_SE_VERDADEIRO:
+                if pop():
+                    pc = arg
+            elif op == SALTAR_TABELA:
+                rotulos, pc = constantes[arg]
+                pc = rotulos.get(pop(), pc)
+            elif op == CARREGAR_ELEMENTO_DIRETO:
+                array_data = pop()
+                push(array_data[pop()])
+            elif op == ARMAZENAR_ELEMENTO_DIRETO:
+                array_data = pop()
+                valor = pop()
+                index_value = pop()
+                try:
+                    array_data[index_value] = valor
+                except OverflowError:
+                    array_data[index_value] = ajustar(array_data, valor)
+            elif op == CARREGAR_ELEMENTO:
+                array_data = pop()
+                index_value = pop()
+                if not isinstance(index_value, int):
+                    raise Exception(f"Índice do array '{constantes[arg]}' não é inteiro: {index_value}")
+                if index_value < 0 or index_value >= len(array_data):
+                    raise Exception(f"Índice {index_value} fora dos limites do array '{constantes[arg]}'.")
+                push(array_data[index_value])
+            elif op == ARMAZENAR_ELEMENTO:
+                tipo_base, array_name = constantes[arg]
+                array_data = pop()
+                valor = pop()
+                index_value = pop()
+                if not isinstance(index_value, int):
+                    raise Exception(f"Índice do array '{array_name}' não é inteiro: {index_value}")
+                if index_value < 0 or index_value >= len(array_data):
+                    raise Exception(f"Índice {index_value} fora dos limites do array '{array_name}'.")
+                if tipo_base is not None:
+                    valor = converter(tipo_base, valor, f"{array_name}[{index_value}]")
+                try:
+                    array_data[index_value] = valor
+                except OverflowError:
+                    array_data[index_value] = ajustar(array_data, valor)
+            elif op == DESCARTAR:
+                pop()
+            elif op == GUARDA_LACO:
+                push(self._guardas_valem(constantes[arg], locais, globais))
+            elif op == NEGATIVO:
+                push(-pop())
+            elif op == NAO:
+                push(not pop())
+            elif op == CARREGAR_CAMPO:
+                registro = pop()
+                if isinstance(registro, Uniao):
+                    push(registro.ler(constantes[arg]))
+                else:
+                    push(interp._ler_campo(registro, constantes[arg]))
+            elif op == ARMAZENAR_CAMPO:
+                destino = pop()
+                interp._escrever_campo(destino, pop(), *constantes[arg])
+            elif op == CARREGAR_CAMINHO:
+                obter, campos = constantes[arg]
+                registro = pop()
+                if isinstance(registro, Registro):
+                    try:
+                        push(obter(registro))
+                        continue
+                    except AttributeError:
+                        pass
+                push(interp._ler_caminho(registro, campos))
+            elif op == ARMAZENAR_CAMINHO:
+                obter, caminho, nome_campo, tipo_campo, nome_var, rotulo = constantes[arg]
+                destino = pop()
+                valor = pop()
+                registro = destino
+                if obter is not None and isinstance(destino, Registro):
+                    try:
+                        registro = obter(destino)
+                    except AttributeError:
+                        registro = None
+                # Sub-struct sem valor ou registro de outro tipo: escrita
+                # verificada por nome, que produz o erro.
+                if not isinstance(registro, Registro):
+                    interp._escrever_campo(destino, valor, caminho, nome_campo, nome_var)
+                    continue
+                try:
+                    setattr(registro, nome_campo, valor if tipo_campo is None else converter(tipo_campo, valor, rotulo))
+                except AttributeError:
+                    interp._escrever_campo(destino, valor, caminho, nome_campo, nome_var)
+            elif op == PRINTF:
+                plano, n = constantes[arg]
+                if n:
+                    args = pilha[-n:]
+                    del pilha[-n:]
+                else:
+                    args = []
+                escrever(plano.formatar(args))
+            elif op == PUTS:
+                escrever(interp._texto_puts(pop()) + "\n")
+            elif op == DECLARAR_LOCAL or op == DECLARAR_GLOBAL:
+                indice, tipo, nome, is_array, tam_array, tem_init = constantes[arg]
+                _, valor = interp._valor_declarado(tipo, nome, is_array, tam_array, pop(), tem_init)
+                destino = globais if op == DECLARAR_GLOBAL else locais
+                destino[indice] = NAO_INICIALIZADA if valor is None else valor
+            elif op == CRIAR_LISTA:
+                valores = pilha[-arg:]
+                del pilha[-arg:]
+                push(valores)
+            elif op == LER_SCANF or op == LER_GETS:
+                eh_global, indice, tipo, nome, conversao = constantes[arg]
+                destino = globais if eh_global else locais
+                valor_atual = destino[indice]
+                if op == LER_SCANF:
+                    destino[indice] = interp._ler_scanf(conversao, tipo, valor_atual, nome)
+                else:
+                    destino[indice] = interp._ler_gets(tipo, valor_atual, nome)
+            elif op == LER_SCANF_ELEMENTO:
+                eh_global, indice, tipo, nome, conversao = constantes[arg]
+                index_value = pop()
+                valor = interp._ler_scanf_elemento(conversao, tipo[:-2], nome)
+                array_data = (globais if eh_global else locais)[indice]
+                if index_value < 0 or index_value >= len(array_data):
+                    raise Exception(f"Índice {index_value} fora dos limites do array '{nome}'.")
+                armazenar(array_data, index_value, valor)
+            elif op == ERRO:
+                raise Exception(constantes[arg])
+            else:
+                raise Exception(f"Opcode desconhecido: {op}")
+
+
+def desmontar(programa, funcao):
+    linhas = [f"função {funcao.nome} ({funcao.tipo}), {funcao.n_locais} locais, {len(funcao.codigo) // 2} instruções:"]
+    alvos = {funcao.codigo[i + 1] for i in range(0, len(funcao.codigo), 2) if funcao.codigo[i] in SALTOS}
+    for i in range(0, len(funcao.codigo), 2):
+        if funcao.codigo[i] == SALTAR_TABELA:
+            rotulos, padrao = programa.constantes[funcao.codigo[i + 1]]
+            alvos.update(rotulos.values())
+            alvos.add(padrao)
+    for pc in range(0, len(funcao.codigo), 2):
+        op = funcao.codigo[pc]
+        arg = funcao.codigo[pc + 1]
+        nome_op = NOMES_OPCODES.get(op, f"?{op}")
+
+        if op in (CARREGAR_LOCAL, CARREGAR_LOCAL_VERIFICADO, ARMAZENAR_LOCAL, ARMAZENAR_ARGUMENTO):
+            detalhe = funcao.nomes_locais[arg]
+        elif op in (CARREGAR_GLOBAL, CARREGAR_GLOBAL_VERIFICADO, ARMAZENAR_GLOBAL):
+            detalhe = programa.nomes_globais[arg]
+        elif op == CHAMAR:
+            detalhe = programa.funcoes[arg].nome
+        elif op in SALTOS:
+            detalhe = f"-> {arg}"
+        elif op == SALTAR_TABELA:
+            rotulos, padrao = programa.constantes[arg]
+            casos = ", ".join(f"{valor!r} -> {alvo}" for valor, alvo in rotulos.items())
+            detalhe = f"{{{casos}}} senão -> {padrao}"
+        elif op in (CONST, VALOR_PADRAO, CONVERTER, TRUNCAR, GUARDA_LACO, CARREGAR_ELEMENTO, ARMAZENAR_ELEMENTO, CARREGAR_CAMPO, ARMAZENAR_CAMPO,
+                    CARREGAR_CAMINHO, ARMAZENAR_CAMINHO, PRINTF, DECLARAR_LOCAL, DECLARAR_GLOBAL, LER_SCANF, LER_SCANF_ELEMENTO, LER_GETS, ERRO):
+            detalhe = repr(programa.constantes[arg])
+        else:
+            detalhe = ""
+
+        marca = ">>" if pc in alvos else "  "
+        linhas.append(f"{marca} {pc:5d} {nome_op:22s} {arg:5d}  {detalhe}".rstrip())
+    return "\n".join(linhas)
+
+
+def desmontar_programa(programa, nomes=None):
+    funcoes = [programa.inicializacao] + programa.funcoes
+    if nomes:
+        funcoes = [f for f in funcoes if f.nome in nomes]
+    return "\n\n".join(desmontar(programa, funcao) for funcao in funcoes)
@@ -0,0 +1,1202 @@
+import functools
+import operator
+from struct import error as ErroStruct
+
+from CParser import CParser
+from interpretador import INTERROMPER, RETORNO, SinalConclusao, retorno_padrao
+from formatacao import compilar_printf, decodificar_literal
+from entrada import compilar_scanf
+from vetores import ajustar, armazenar, comporta
+from registros import Registro, Uniao, cadeia_de_campos, leitor_de_caminho, tipo_do_caminho
+from resolvedor import GLOBAL, LOCAL, MACRO, NAO_INICIALIZADA, valor_constante
+from tipagem import IDENTIDADE, PARA_INTEIRO, PARA_REAL, conversao
+
+# Motor de execução que traduz o corpo de cada função, uma única vez, para
+# uma árvore de closures. Toda a decodificação da árvore sintática
+# (getChildCount, getText, tipo do nó) acontece na compilação; a execução
+# apenas chama as closures, passando o quadro de ativação da chamada.
+# Closures de comandos devolvem None ou um sinal de conclusão (RETORNO,
+# INTERROMPER, CAUDA); closures de expressões devolvem o valor calculado.
+# Cada identificador já vem ligado pelo resolvedor a um slot global ou local,
+# então o acesso a variáveis não depende da profundidade da pilha de chamadas.
+
+OPERADORES_BINARIOS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+}
+
+COMPARACOES = ('<', '<=', '>', '>=', '==', '!=')
+
+# Chamada em cauda da função a ela mesma (cauda.py): o quadro já recebeu os
+# novos argumentos e o corpo deve ser executado de novo.
+CAUDA = SinalConclusao("tail call")
+
+
+def _para_real(tipo, valor, nome_alvo):
+    return float(valor)
+
+
+def _nada(quadro):
+    return None
+
+
+def _sequencia(comandos):
+    if not comandos:
+        return _nada
+    if len(comandos) == 1:
+        return comandos[0]
+    comandos = tuple(comandos)
+
+    def executar(quadro):
+        for comando in comandos:
+            sinal = comando(quadro)
+            if sinal is not None:
+                return sinal
+    return executar
+
+
+def _repetir_em_cauda(corpo):
+    # Corpo de uma função com chamadas em cauda a si mesma: cada CAUDA
+    # recomeça o corpo no mesmo quadro, em vez de uma chamada nova.
+    def executar(quadro):
+        sinal = corpo(quadro)
+        while sinal is CAUDA:
+            sinal = corpo(quadro)
+        return sinal
+    return executar
+
+
+class Quadro:
+    # Registro de ativação de uma chamada: os valores das variáveis ficam numa
+    # lista plana indexada pelo slot do resolvedor. Nomes e tipos não são
+    # copiados por chamada; ficam na FuncaoCompilada, compartilhados.
+    # O valor de um return fica em `retorno` e o comando devolve RETORNO.
+    __slots__ = ("funcao", "valores", "retorno")
+
+    def __init__(self, funcao, valores):
+        self.funcao = funcao
+        self.valores = valores
+        self.retorno = None
+
+
+class FuncaoCompilada:
+    def __init__(self, nome, tipo, escopo):
+        self.nome = nome
+        self.tipo = tipo
+        self.nomes_locais = list(escopo.nomes)
+        self.tipos_locais = list(escopo.tipos)
+        self.parametros = escopo.nomes[:escopo.n_parametros]
+        self.tipos_parametros = escopo.tipos[:escopo.n_parametros]
+        self.locais_vazios = [NAO_INICIALIZADA] * (escopo.n_locais - escopo.n_parametros)
+        self.corpo = _nada
+        self.retorno_padrao = retorno_padrao(tipo)
+
+    @property
+    def n_locais(self):
+        return len(self.nomes_locais)
+
+    def temporario(self, nome, tipo):
+        # Slot extra no fim do quadro, que começa vazio em toda chamada.
+        self.nomes_locais.append(nome)
+        self.tipos_locais.append(tipo)
+        self.locais_vazios.append(NAO_INICIALIZADA)
+        return len(self.nomes_locais) - 1
+
+
+class MotorClosures:
+    def __init__(self, interpretador, resolucao, memorizacao=None):
+        # memorizacao: caches das funções puras (pureza.py) com --memoize.
+        self.interp = interpretador
+        self.resolucao = resolucao
+        self.memorizacao = memorizacao
+        self.funcoes = {}
+        self._escopo = None
+        # Laços cujo corpo está sendo compilado na versão para quando as
+        # guardas (limites.py) valem.
+        self._lacos_rapidos = set()
+        # No corpo de uma função expandida em linha (expansao.py): slot do
+        # parâmetro -> slot do quadro de quem chama onde está o argumento.
+        self._traducao = None
+        self._temporarios = {}
+
+        # As globais e macros já foram criadas pela passagem do visitor pelo
+        # nível superior; os valores são copiados para o quadro global.
+        tabela = interpretador.tabela_simbolos
+        valores = []
+        for nome in resolucao.globais.nomes:
+            var = tabela.variaveis.get(nome)
+            valores.append(var["valor"] if var is not None and var["inicializada"] else NAO_INICIALIZADA)
+        self.globais = Quadro(None, valores)
+        self.macros = tabela.macros
+        self.structs = {nome: classe.__tipos__ for nome, classe in tabela.structs.items()}
+        self.unions = tabela.unions
+
+        for nome, ctx in interpretador.funcoes.items():
+            self.funcoes[nome] = FuncaoCompilada(nome, ctx.type_().getText(), resolucao.funcoes[nome])
+        for nome, ctx in interpretador.funcoes.items():
+            self._escopo = resolucao.funcoes[nome]
+            self._temporarios = {}
+            corpo = self._compilar_bloco(ctx.block())
+            if any(cauda.definicao is ctx for cauda in resolucao.caudas.values()):
+                corpo = _repetir_em_cauda(corpo)
+            self.funcoes[nome].corpo = corpo
+        self._escopo = None
+
+    def executar_main(self):
+        main = self.funcoes["main"]
+        main.corpo(Quadro(main, [NAO_INICIALIZADA] * main.n_locais))
+
+    def _invocar(self, funcao, argumentos):
+        if len(funcao.parametros) != len(argumentos):
+            raise Exception(f"Função '{funcao.nome}' espera {len(funcao.parametros)} parâmetros, mas {len(argumentos)} foram passados.")
+
+        valores = argumentos + funcao.locais_vazios
+        if None in argumentos:
+            valores = [NAO_INICIALIZADA if valor is None else valor for valor in valores]
+
+        quadro = Quadro(funcao, valores)
+        if funcao.corpo(quadro) is RETORNO and quadro.retorno is not None:
+            return quadro.retorno
+        return funcao.retorno_padrao
+
+    # ------------------------------------------------------------------
+    # Endereços
+    # ------------------------------------------------------------------
+
+    def _tipo(self, token):
+        return self.resolucao.tipo(token, self._escopo) or ""
+
+    def _slot(self, token):
+        # (lista de valores globais, índice) para uma global ou
+        # (None, índice) para um slot do quadro da chamada.
+        endereco = self.resolucao.endereco(token)
+        if endereco.escopo == GLOBAL:
+            return self.globais.valores, endereco.indice
+        return None, self._indice(token)
+
+    def _indice(self, token):
+        # Slot da variável; no corpo de uma função expandida, o dos
+        # argumentos no quadro de quem chama.
+        endereco = self.resolucao.endereco(token)
+        if self._traducao is not None and endereco.escopo == LOCAL:
+            return self._traducao[endereco.indice]
+        return endereco.indice
+
+    def _valores(self, token):
+        # Closure que devolve a lista de valores onde mora a variável.
+        nome = token.getText()
+        endereco = self.resolucao.endereco(token)
+
+        if endereco.escopo == MACRO:
+            def macro(quadro):
+                raise Exception(f"Variável '{nome}' não foi declarada.")
+            return macro
+
+        if endereco.escopo == GLOBAL:
+            valores_globais = self.globais.valores
+            return lambda quadro: valores_globais
+        return lambda quadro: quadro.valores
+
+    def _leitor(self, token):
+        # Closure de leitura, com a verificação de inicialização só quando a
+        # análise (inicializacao.py) não garante que a variável tem valor.
+        nome = token.getText()
+        valores = self._valores(token)
+        i = self._indice(token)
+        if token in self.resolucao.leituras_seguras:
+            return lambda quadro: valores(quadro)[i]
+
+        def ler(quadro):
+            valor = valores(quadro)[i]
+            if valor is NAO_INICIALIZADA:
+                raise Exception(f"Erro: Variável '{nome}' não foi inicializada antes do uso.")
+            return valor
+        return ler
+
+    # ------------------------------------------------------------------
+    # Comandos
+    # ------------------------------------------------------------------
+
+    def _compilar_bloco(self, ctx):
+        return _sequencia([self._compilar_statement(stmt) for stmt in ctx.statement()])
+
+    def _compilar_statement(self, ctx):
+        filho = ctx.getChild(0)
+
+        if isinstance(filho, CParser.VarDeclContext):
+            return self._compilar_var_decl(filho)
+        if isinstance(filho, CParser.AssignmentContext):
+            return self._compilar_assignment(filho)
+        if isinstance(filho, CParser.IfStatementContext):
+            return self._compilar_if(filho)
+        if isinstance(filho, CParser.WhileStatementContext):
+            return self._compilar_while(filho)
+        if isinstance(filho, CParser.DoWhileStatementContext):
+            return self._compilar_do_while(filho)
+        if isinstance(filho, CParser.ForStatementContext):
+            return self._compilar_for(filho)
+        if isinstance(filho, CParser.SwitchStatementContext):
+            return self._compilar_switch(filho)
+        if isinstance(filho, CParser.FunctionCallContext):
+            return self._compilar_chamada(filho, comando=True)
+        if isinstance(filho, CParser.InputOutputStatementContext):
+            return self._compilar_entrada_saida(filho)
+        if isinstance(filho, CParser.BlockContext):
+            return self._compilar_bloco(filho)
+        if isinstance(filho, CParser.BreakStatementContext):
+            return self._compilar_break()
+        if filho.getText() == "return":
+            return self._compilar_return(ctx)
+        return _nada
+
+    def _compilar_return(self, ctx):
+        if ctx in self.resolucao.caudas:
+            return self._compilar_cauda(self.resolucao.caudas[ctx])
+        if ctx.expression() is None:
+            def retornar(quadro):
+                quadro.retorno = None
+                return RETORNO
+            return retornar
+
+        expr = self._compilar_expressao(ctx.expression())
+
+        def retornar(quadro):
+            quadro.retorno = expr(quadro)
+            return RETORNO
+        return retornar
+
+    def _compilar_cauda(self, cauda):
+        # return f(argumentos) dentro de f: os argumentos, todos avaliados
+        # antes, substituem o conteúdo do quadro (parâmetros seguidos dos
+        # locais vazios) e o corpo recomeça (_repetir_em_cauda).
+        argumentos = tuple(self._compilar_expressao(e) for e in cauda.argumentos)
+        vazios = self.funcoes[self._escopo.nome].locais_vazios
+
+        def reiniciar(quadro):
+            valores = [arg(quadro) for arg in argumentos]
+            if None in valores:
+                valores = [NAO_INICIALIZADA if valor is None else valor for valor in valores]
+            quadro.valores[:] = valores + vazios
+            return CAUDA
+        return reiniciar
+
+    def _compilar_break(self):
+        def interromper(quadro):
+            return INTERROMPER
+        return interromper
+
+    def _conversor(self, tipo_destino, ctx):
+        # Conversão do valor de `ctx` para `tipo_destino`, com a assinatura de
+        # _verificar_tipo_e_converter, escolhida pela tipagem: None quando o
+        # valor já tem a representação do destino.
+        modo = conversao(tipo_destino, self.resolucao.tipos_expressoes.get(ctx))
+        if modo == IDENTIDADE:
+            return None
+        if modo == PARA_REAL:
+            return _para_real
+        if modo == PARA_INTEIRO:
+            truncar = self.interp._truncar
+
+            def para_inteiro(tipo, valor, nome_alvo):
+                return truncar(valor, nome_alvo)
+            return para_inteiro
+        return self.interp._verificar_tipo_e_converter
+
+    def _compilar_var_decl(self, ctx):
+        interp = self.interp
+        tipo = ctx.type_().getText()
+        nome = ctx.Identifier().getText()
+        i = self.resolucao.endereco(ctx.Identifier()).indice
+
+        is_array = False
+        tam_array = None
+        if ctx.arraySize():
+            is_array = True
+            if ctx.arraySize().Number() is not None:
+                tam_array = int(ctx.arraySize().Number().getText())
+
+        tem_init = ctx.init() is not None
+        init = self._compilar_init(ctx.init()) if tem_init else _nada
+
+        if (tem_init and not is_array and ctx.init().expression() is not None
+                and not tipo.startswith("struct") and not tipo.startswith("union")):
+            # Escalar com inicializador: a conversão é a do ponto de
+            # atribuição, sem passar por _valor_declarado.
+            converter = self._conversor(tipo, ctx.init().expression())
+            if converter is None:
+                def declarar_convertido(quadro):
+                    valor = init(quadro)
+                    quadro.valores[i] = NAO_INICIALIZADA if valor is None else valor
+            else:
+                def declarar_convertido(quadro):
+                    quadro.valores[i] = converter(tipo, init(quadro), nome)
+            return declarar_convertido
+
+        def declarar(quadro):
+            valor = interp._valor_declarado(tipo, nome, is_array, tam_array, init(quadro), tem_init)[1]
+            quadro.valores[i] = NAO_INICIALIZADA if valor is None else valor
+        return declarar
+
+    def _compilar_init(self, ctx):
+        if ctx.initializerList() is not None:
+            elementos = tuple(self._compilar_expressao(e) for e in ctx.initializerList().expression())
+
+            def lista(quadro):
+                return [elem(quadro) for elem in elementos]
+            return lista
+        return self._compilar_expressao(ctx.expression())
+
+    def _compilar_assignment(self, ctx):
+        converter = self.interp._verificar_tipo_e_converter
+
+        if (ctx.getChildCount() >= 6
+                and ctx.getChild(1).getText() == '['
+                and ctx.getChild(3).getText() == ']'
+                and ctx.getChild(4).getText() == '='):
+            token = ctx.getChild(0)
+            array_name = token.getText()
+            tipo = self._tipo(token)
+            eh_array = tipo.endswith("[]")
+            ler_array = self._leitor(token)
+            indice = self._compilar_expressao(ctx.getChild(2))
+            valor_expr = self._compilar_expressao(ctx.getChild(5))
+
+            if eh_array and self._conversor(tipo[:-2], ctx.getChild(5)) is None:
+                if self._indice_garantido(ctx):
+                    def atribuir_elemento_garantido(quadro):
+                        index_value = indice(quadro)
+                        armazenar(ler_array(quadro), index_value, valor_expr(quadro))
+                    return atribuir_elemento_garantido
+
+                def atribuir_elemento_direto(quadro):
+                    index_value = indice(quadro)
+                    valor = valor_expr(quadro)
+                    array_data = ler_array(quadro)
+                    if not isinstance(index_value, int):
+                        raise Exception(f"Índice do array '{array_name}' não é inteiro: {index_value}")
+                    if index_value < 0 or index_value >= len(array_data):
+                        raise Exception(f"Índice {index_value} fora dos limites do array '{array_name}'.")
+                    try:
+                        array_data[index_value] = valor
+                    except OverflowError:
+                        array_data[index_value] = ajustar(array_data, valor)
+                return atribuir_elemento_direto
+
+            def atribuir_elemento(quadro):
+                index_value = indice(quadro)
+                valor = valor_expr(quadro)
+                array_data = ler_array(quadro)
+                if not eh_array:
+                    raise Exception(f"Variável '{array_name}' não é um array, mas foi usada como array.")
+                if not isinstance(index_value, int):
+                    raise Exception(f"Índice do array '{array_name}' não é inteiro: {index_value}")
+                if index_value < 0 or index_value >= len(array_data):
+                    raise Exception(f"Índice {index_value} fora dos limites do array '{array_name}'.")
+                valor = converter(tipo[:-2], valor, f"{array_name}[{index_value}]")
+                try:
+                    array_data[index_value] = valor
+                except OverflowError:
+                    array_data[index_value] = ajustar(array_data, valor)
+            return atribuir_elemento
+
+        tokens = ctx.Identifier()
+        identifiers = [token.getText() for token in tokens]
+        valor_expr = self._compilar_expressao(ctx.expression(0))
+        nome_var = identifiers[0]
+        tipo_variavel = self._tipo(tokens[0])
+
+        if len(identifiers) == 1:
+            if tipo_variavel.startswith("union"):
+                def atribuir_union(quadro):
+                    valor_expr(quadro)
+                    raise Exception("Atribuição direta de union não permitida; use a atribuição de campo (ex.: u.campo = valor).")
+                return atribuir_union
+
+            valores_globais, i = self._slot(tokens[0])
+            converter = self._conversor(tipo_variavel, ctx.expression(0))
+            if converter is None:
+                if valores_globais is not None:
+                    def atribuir_global_direto(quadro):
+                        valores_globais[i] = valor_expr(quadro)
+                    return atribuir_global_direto
+
+                def atribuir_direto(quadro):
+                    quadro.valores[i] = valor_expr(quadro)
+                return atribuir_direto
+
+            if valores_globais is not None:
+                def atribuir_global(quadro):
+                    valores_globais[i] = converter(tipo_variavel, valor_expr(quadro), nome_var)
+                return atribuir_global
+
+            def atribuir(quadro):
+                quadro.valores[i] = converter(tipo_variavel, valor_expr(quadro), nome_var)
+            return atribuir
+
+        ler_registro = self._leitor(tokens[0])
+        escrever_campo = self.interp._escrever_campo
+        caminho = tuple(identifiers[1:-1])
+        nome_campo = identifiers[-1]
+
+        if tipo_variavel.startswith("struct"):
+            tipo_campo = tipo_do_caminho(self.structs, tipo_variavel, identifiers[1:])
+            if tipo_campo is not None:
+                converter = self._conversor(tipo_campo, ctx.expression(0))
+                return self._compilar_atribuicao_campo(valor_expr, ler_registro, caminho, nome_campo, tipo_campo, nome_var,
+                                                       converter)
+
+            def atribuir_campo(quadro):
+                valor = valor_expr(quadro)
+                struct_value = ler_registro(quadro)
+                if not isinstance(struct_value, Registro):
+                    raise Exception(f"Tentando acessar campo de algo que não é struct: '{nome_var}'.")
+                escrever_campo(struct_value, valor, caminho, nome_campo, nome_var)
+            return atribuir_campo
+
+        if tipo_variavel.startswith("union"):
+            classe = self._classe_uniao(tipo_variavel)
+            if not caminho and classe is not None and classe.__membros__.get(nome_campo) is not None:
+                converter = self._conversor(classe.__tipos__[nome_campo], ctx.expression(0))
+                return self._compilar_atribuicao_membro(valor_expr, ler_registro, classe, nome_campo, nome_var, converter)
+
+            def atribuir_campo_union(quadro):
+                valor = valor_expr(quadro)
+                union_value = ler_registro(quadro)
+                if not isinstance(union_value, Uniao):
+                    raise Exception(f"Tentando acessar campo de algo que não é union: '{nome_var}'.")
+                if caminho:
+                    raise Exception("Acesso a sub-campos de union não suportado.")
+                escrever_campo(union_value, valor, caminho, nome_campo, nome_var)
+            return atribuir_campo_union
+
+        def atribuir_invalido(quadro):
+            valor_expr(quadro)
+            ler_registro(quadro)
+            raise Exception("Atribuição inválida: acesso a campo apenas para structs e unions.")
+        return atribuir_invalido
+
+    def _classe_uniao(self, tipo):
+        if not tipo.startswith("union"):
+            return None
+        return self.unions.get(tipo[len("union"):].strip())
+
+    def _compilar_atribuicao_membro(self, valor_expr, ler_registro, classe, nome_campo, nome_var, converter):
+        # u.x = valor com u de union conhecida e x escalar: convertido e
+        # empacotado direto no buffer, com o codec do membro resolvido aqui.
+        # `converter` é o da tipagem (None: o valor já é do tipo do membro).
+        escrever_campo = self.interp._escrever_campo
+        membro = classe.__membros__[nome_campo]
+        tipo_campo = membro.tipo
+        empacotar = membro.empacotar
+        caractere = membro.caractere
+        rotulo = f"{nome_var}.{nome_campo}"
+
+        def atribuir_membro(quadro):
+            valor = valor_expr(quadro)
+            uniao = ler_registro(quadro)
+            if type(uniao) is not classe:
+                if not isinstance(uniao, Uniao):
+                    raise Exception(f"Tentando acessar campo de algo que não é union: '{nome_var}'.")
+                escrever_campo(uniao, valor, (), nome_campo, nome_var)
+                return
+            if converter is not None:
+                valor = converter(tipo_campo, valor, rotulo)
+            if caractere:
+                valor = ord(valor)
+            try:
+                empacotar(uniao, 0, valor)
+            except ErroStruct:
+                empacotar(uniao, 0, membro.ajustar(valor))
+            uniao.objeto = None
+            uniao.ativo = nome_campo
+        return atribuir_membro
+
+    def _compilar_atribuicao_campo(self, valor_expr, ler_registro, caminho, nome_campo, tipo_campo, nome_var, converter):
+        # Campo resolvido na compilação: o tipo do campo já é conhecido e o
+        # caminho até o registro de destino é um único attrgetter. Um
+        # sub-struct ainda sem valor cai na escrita verificada por nome, que
+        # produz o erro. `converter` é o da tipagem (None: o valor já é do
+        # tipo do campo).
+        escrever_campo = self.interp._escrever_campo
+        rotulo = f"{nome_var}.{nome_campo}"
+
+        if not caminho:
+            def atribuir_campo(quadro):
+                valor = valor_expr(quadro)
+                registro = ler_registro(quadro)
+                if not isinstance(registro, Registro):
+                    raise Exception(f"Tentando acessar campo de algo que não é struct: '{nome_var}'.")
+                try:
+                    setattr(registro, nome_campo, valor if converter is None else converter(tipo_campo, valor, rotulo))
+                except AttributeError:
+                    escrever_campo(registro, valor, caminho, nome_campo, nome_var)
+            return atribuir_campo
+
+        obter = leitor_de_caminho(caminho)
+
+        def atribuir_caminho(quadro):
+            valor = valor_expr(quadro)
+            struct_value = ler_registro(quadro)
+            if not isinstance(struct_value, Registro):
+                raise Exception(f"Tentando acessar campo de algo que não é struct: '{nome_var}'.")
+            try:
+                registro = obter(struct_value)
+            except AttributeError:
+                registro = None
+            if not isinstance(registro, Registro):
+                escrever_campo(struct_value, valor, caminho, nome_campo, nome_var)
+                return
+            setattr(registro, nome_campo, valor if converter is None else converter(tipo_campo, valor, rotulo))
+        return atribuir_caminho
+
+    def _compilar_if(self, ctx):
+        condicao = self._compilar_condicao(ctx.expression())
+        entao = self._compilar_statement(ctx.statement(0))
+
+        if ctx.statement(1) is None:
+            def se(quadro):
+                if condicao(quadro):
+                    return entao(quadro)
+            return se
+
+        senao = self._compilar_statement(ctx.statement(1))
+
+        def se_senao(quadro):
+            if condicao(quadro):
+                return entao(quadro)
+            return senao(quadro)
+        return se_senao
+
+    def _compilar_corpo_laco(self, laco, ctx):
+        # Closure que, na entrada do laço, escolhe o corpo: sem verificação
+        # de índice nos acessos garantidos quando as guardas do laço valem,
+        # o corpo com verificações (que reporta o erro no acesso) senão.
+        corpo = self._compilar_statement(ctx)
+        guardas = self.resolucao.guardas.get(laco)
+        if guardas is None:
+            return lambda quadro: corpo
+        self._lacos_rapidos.add(laco)
+        rapido = self._compilar_statement(ctx)
+        self._lacos_rapidos.discard(laco)
+
+        def ler_slot(token):
+            valores_globais, i = self._slot(token)
+            if valores_globais is not None:
+                return lambda quadro: valores_globais[i]
+            return lambda quadro: quadro.valores[i]
+
+        testes = []
+        for guarda in guardas:
+            vetor = ler_slot(guarda.vetor)
+            if type(guarda.limite) is int:
+                testes.append(lambda quadro, vetor=vetor, limite=guarda.limite, acrescimo=guarda.acrescimo:
+                              comporta(vetor(quadro), limite, acrescimo))
+            else:
+                testes.append(lambda quadro, vetor=vetor, limite=ler_slot(guarda.limite), acrescimo=guarda.acrescimo:
+                              comporta(vetor(quadro), limite(quadro), acrescimo))
+        testes = tuple(testes)
+
+        def escolher(quadro):
+            for teste in testes:
+                if not teste(quadro):
+                    return corpo
+            return rapido
+        return escolher
+
+    def _indice_garantido(self, acesso):
+        # O acesso v[i] dispensa a verificação de índice: a análise de faixa
+        # o garante e o laço não tem guardas ou este é o corpo compilado para
+        # quando elas valem.
+        laco = self.resolucao.indices_garantidos.get(acesso)
+        return laco is not None and (laco not in self.resolucao.guardas or laco in self._lacos_rapidos)
+
+    def _compilar_while(self, ctx):
+        condicao = self._compilar_condicao(ctx.expression())
+        escolher = self._compilar_corpo_laco(ctx, ctx.statement())
+
+        def enquanto(quadro):
+            corpo = escolher(quadro)
+            while condicao(quadro):
+                sinal = corpo(quadro)
+                if sinal is not None:
+                    if sinal is INTERROMPER:
+                        break
+                    return sinal
+        return enquanto
+
+    def _compilar_do_while(self, ctx):
+        condicao = self._compilar_condicao(ctx.expression())
+        corpo = self._compilar_statement(ctx.statement())
+
+        def faca_enquanto(quadro):
+            while True:
+                sinal = corpo(quadro)
+                if sinal is not None:
+                    if sinal is INTERROMPER:
+                        break
+                    return sinal
+                if not condicao(quadro):
+                    break
+        return faca_enquanto
+
+    def _compilar_for_header(self, ctx):
+        # Como no visitor, a atribuição do cabeçalho do for não converte o
+        # valor para o tipo da variável.
+        valores = self._valores(ctx.Identifier())
+        i = self.resolucao.endereco(ctx.Identifier()).indice
+        expr = self._compilar_expressao(ctx.expression())
+
+        def atualizar(quadro):
+            valor = expr(quadro)
+            valores(quadro)[i] = NAO_INICIALIZADA if valor is None else valor
+        return atualizar
+
+    def _compilar_for(self, ctx):
+        # As partes do cabeçalho são identificadas pela posição em relação
+        # aos ';' do próprio for: inicialização, condição e atualização.
+        partes = [None, None, None]
+        posicao = 0
+        for i in range(2, ctx.getChildCount() - 2):
+            filho = ctx.getChild(i)
+            if filho.getText() == ';':
+                posicao += 1
+            else:
+                partes[posicao] = filho
+
+        inicio, cond_ctx, passo = partes
+        if isinstance(inicio, CParser.VarDeclContext):
+            inicio = self._compilar_var_decl(inicio)
+        elif inicio is not None:
+            inicio = self._compilar_for_header(inicio)
+        else:
+            inicio = _nada
+        condicao = self._compilar_condicao(cond_ctx) if cond_ctx is not None else (lambda quadro: True)
+        passo = self._compilar_for_header(passo) if passo is not None else _nada
+        escolher = self._compilar_corpo_laco(ctx, ctx.statement())
+
+        def para(quadro):
+            inicio(quadro)
+            corpo = escolher(quadro)
+            while condicao(quadro):
+                sinal = corpo(quadro)
+                if sinal is not None:
+                    if sinal is INTERROMPER:
+                        break
+                    return sinal
+                passo(quadro)
+        return para
+
+    def _compilar_switch(self, ctx):
+        # Os comandos de todos os blocos formam uma só lista; cada rótulo
+        # constante é ligado, num dicionário, à sequência que começa no seu
+        # bloco e segue pelos blocos seguintes (fall-through de C) até um
+        # break. Rótulos não constantes são comparados em ordem, como reserva.
+        valor_expr = self._compilar_expressao(ctx.expression())
+        comandos = []
+        inicios = {}
+        nao_constantes = []
+        inicio_padrao = None
+        for i in range(ctx.getChildCount()):
+            bloco = ctx.getChild(i)
+            if isinstance(bloco, CParser.CaseBlockContext):
+                rotulo = bloco.caseLabel().expression()
+                constante, valor = self._valor_constante(rotulo)
+                if not constante:
+                    nao_constantes.append((self._compilar_expressao(rotulo), len(comandos)))
+                elif valor not in inicios:
+                    inicios[valor] = len(comandos)
+            elif isinstance(bloco, CParser.DefaultBlockContext):
+                if inicio_padrao is None:
+                    inicio_padrao = len(comandos)
+            else:
+                continue
+            comandos.extend(self._compilar_statement(stmt) for stmt in bloco.statement())
+            if bloco.breakStatement() is not None:
+                comandos.append(self._compilar_break())
+
+        sequencias = {}
+
+        def sequencia(indice):
+            if indice not in sequencias:
+                sequencias[indice] = _sequencia(comandos[indice:])
+            return sequencias[indice]
+
+        entradas = {valor: sequencia(indice) for valor, indice in inicios.items()}
+        nao_constantes = tuple((rotulo, sequencia(indice)) for rotulo, indice in nao_constantes)
+        padrao = sequencia(inicio_padrao) if inicio_padrao is not None else _nada
+
+        if not nao_constantes:
+            def escolha(quadro):
+                sinal = entradas.get(valor_expr(quadro), padrao)(quadro)
+                if sinal is not None and sinal is not INTERROMPER:
+                    return sinal
+            return escolha
+
+        def escolha_com_reserva(quadro):
+            valor_switch = valor_expr(quadro)
+            corpo = entradas.get(valor_switch)
+            if corpo is None:
+                for rotulo, sequencia_rotulo in nao_constantes:
+                    if valor_switch == rotulo(quadro):
+                        corpo = sequencia_rotulo
+                        break
+                else:
+                    corpo = padrao
+            sinal = corpo(quadro)
+            if sinal is not None and sinal is not INTERROMPER:
+                return sinal
+        return escolha_com_reserva
+
+    def _compilar_entrada_saida(self, ctx):
+        interp = self.interp
+        comando = ctx.getChild(0).getText()
+
+        if comando == "printf":
+            plano = compilar_printf(decodificar_literal(ctx.StringLiteral().getText()))
+            argumentos = tuple(self._compilar_expressao(e) for e in ctx.expression())
+            escrever = interp.saida.escrever
+            formatar = plano.formatar
+
+            if not argumentos and plano.erro is None:
+                texto = plano.formato
+
+                def printf_literal(quadro):
+                    escrever(texto)
+                return printf_literal
+
+            def printf(quadro):
+                escrever(formatar([arg(quadro) for arg in argumentos]))
+            return printf
+
+        if comando == "scanf":
+            plano = compilar_scanf(decodificar_literal(ctx.StringLiteral().getText()))
+            parametros = ctx.scanfParam()
+            if plano.erro is not None or len(parametros) != len(plano.conversoes):
+                mensagem = plano.erro or "Erro: Número de variáveis não corresponde ao formato."
+
+                def scanf_invalido(quadro):
+                    raise Exception(mensagem)
+                return scanf_invalido
+            leituras = tuple(self._compilar_scanf_param(param, conversao)
+                             for conversao, param in zip(plano.conversoes, parametros))
+
+            def scanf(quadro):
+                for ler in leituras:
+                    ler(quadro)
+            return scanf
+
+        if comando == "gets":
+            token = ctx.Identifier()
+            nome = token.getText()
+            tipo = self._tipo(token)
+            valores = self._valores(token)
+            i = self.resolucao.endereco(token).indice
+
+            def gets(quadro):
+                destino = valores(quadro)
+                atual = destino[i]
+                destino[i] = interp._ler_gets(tipo, None if atual is NAO_INICIALIZADA else atual, nome)
+            return gets
+
+        if ctx.expression(0) is not None:
+            texto = self._compilar_expressao(ctx.expression(0))
+        else:
+            literal = decodificar_literal(ctx.StringLiteral().getText())
+            texto = lambda quadro: literal
+
+        escrever = interp.saida.escrever
+
+        def puts(quadro):
+            escrever(interp._texto_puts(texto(quadro)) + "\n")
+        return puts
+
+    def _compilar_scanf_param(self, ctx, conversao):
+        interp = self.interp
+        token = ctx.Identifier()
+        nome = token.getText()
+        tipo = self._tipo(token)
+        valores = self._valores(token)
+        i = self.resolucao.endereco(token).indice
+
+        if ctx.expression() is None:
+            def ler_variavel(quadro):
+                destino = valores(quadro)
+                atual = destino[i]
+                destino[i] = interp._ler_scanf(conversao, tipo, None if atual is NAO_INICIALIZADA else atual, nome)
+            return ler_variavel
+
+        indice = self._compilar_expressao(ctx.expression())
+
+        if not tipo.endswith("[]"):
+            def ler_invalido(quadro):
+                raise Exception(f"Variável '{nome}' não é um array, mas foi usada com indexação no scanf.")
+            return ler_invalido
+
+        tipo_elemento = tipo[:-2]
+
+        def ler_elemento(quadro):
+            array_data = valores(quadro)[i]
+            index_value = indice(quadro)
+            valor = interp._ler_scanf_elemento(conversao, tipo_elemento, nome)
+            if index_value < 0 or index_value >= len(array_data):
+                raise Exception(f"Índice {index_value} fora dos limites do array '{nome}'.")
+            armazenar(array_data, index_value, valor)
+        return ler_elemento
+
+    def _compilar_chamada(self, ctx, comando=False):
+        nome = ctx.Identifier().getText()
+        argumentos = ()
+        if ctx.argumentList() is not None:
+            argumentos = tuple(self._compilar_expressao(e) for e in ctx.argumentList().expression())
+
+        funcao = self.funcoes.get(nome)
+        if funcao is None:
+            def chamada_invalida(quadro):
+                raise Exception(f"Função '{nome}' não foi definida.")
+            return chamada_invalida
+
+        expandida = self.resolucao.expansoes.get(ctx)
+        if expandida is not None:
+            expandir = self._compilar_expansao(ctx, expandida, argumentos)
+            if comando:
+                def expandir_comando(quadro):
+                    expandir(quadro)
+                return expandir_comando
+            return expandir
+
+        invocar = self._invocar
+        if (self.memorizacao is not None and nome in self.resolucao.memorizaveis
+                and len(argumentos) == len(funcao.parametros)):
+            # Função pura com --memoize (pureza.py): a chamada passa pelo
+            # cache dela.
+            cache = self.memorizacao.cache(nome)
+            calcular = functools.partial(invocar, funcao)
+
+            def invocar(funcao, valores):
+                return cache.chamar(calcular, valores)
+
+        if comando:
+            # Chamada usada como comando: o valor de retorno é descartado
+            # para não ser confundido com um sinal de conclusão.
+            def chamar_comando(quadro):
+                invocar(funcao, [arg(quadro) for arg in argumentos])
+            return chamar_comando
+
+        def chamar(quadro):
+            return invocar(funcao, [arg(quadro) for arg in argumentos])
+        return chamar
+
+    def _compilar_expansao(self, ctx, expandida, argumentos):
+        # Chamada de função folha expandida em linha (expansao.py): os
+        # argumentos vão para slots extras do quadro de quem chama, todos
+        # avaliados antes de qualquer um ser guardado (outra expansão da
+        # mesma função num argumento usa os mesmos slots), e o return da
+        # função é compilado lendo os parâmetros desses slots.
+        funcao = self.funcoes[self._escopo.nome]
+        traducao = []
+        pendentes = []
+        for k, (argumento, direto) in enumerate(zip(ctx.argumentList().expression() if argumentos else (),
+                                                    expandida.diretos)):
+            if direto:
+                traducao.append(self._local_seguro(argumento))
+                continue
+            chave = (expandida.funcao, k)
+            if chave not in self._temporarios:
+                self._temporarios[chave] = funcao.temporario(expandida.escopo.nomes[k], expandida.escopo.tipos[k])
+            traducao.append(self._temporarios[chave])
+            pendentes.append((self._temporarios[chave], argumentos[k]))
+
+        escopo, anterior = self._escopo, self._traducao
+        self._escopo, self._traducao = expandida.escopo, traducao
+        try:
+            corpo = self._compilar_expressao(expandida.corpo)
+        finally:
+            self._escopo, self._traducao = escopo, anterior
+
+        if not expandida.tipado:
+            padrao = retorno_padrao(expandida.tipo)
+            calcular = corpo
+
+            def corpo(quadro):
+                valor = calcular(quadro)
+                return padrao if valor is None else valor
+
+        if not pendentes:
+            return corpo
+        if len(pendentes) == 1:
+            (i, argumento), = pendentes
+
+            def expandir(quadro):
+                valor = argumento(quadro)
+                quadro.valores[i] = NAO_INICIALIZADA if valor is None else valor
+                return corpo(quadro)
+            return expandir
+        slots = tuple(i for i, _ in pendentes)
+        argumentos = tuple(argumento for _, argumento in pendentes)
+
+        def expandir(quadro):
+            valores = quadro.valores
+            for i, valor in zip(slots, [argumento(quadro) for argumento in argumentos]):
+                valores[i] = NAO_INICIALIZADA if valor is None else valor
+            return corpo(quadro)
+        return expandir
+
+    # ------------------------------------------------------------------
+    # Expressões
+    # ------------------------------------------------------------------
+
+    def _compilar_expressao(self, ctx):
+        # Expressão dobrada na carga (constantes.py): só devolve o valor.
+        if ctx in self.resolucao.constantes:
+            return self._constante(self.resolucao.constantes[ctx])
+
+        child_count = ctx.getChildCount()
+
+        if child_count == 1 and isinstance(ctx.getChild(0), CParser.FunctionCallContext):
+            return self._compilar_chamada(ctx.getChild(0))
+
+        if child_count == 1 and ctx.Identifier():
+            return self._compilar_identificador(ctx.Identifier())
+
+        if child_count == 3 and ctx.getChild(1).getText() == '.':
+            return self._compilar_campo(ctx)
+
+        if child_count == 3:
+            op = ctx.getChild(1).getText()
+            if op == '&&' or op == '||':
+                condicao = self._compilar_condicao(ctx)
+                return lambda quadro: bool(condicao(quadro))
+            if op in COMPARACOES:
+                return self._compilar_comparacao(op, ctx.expression(0), ctx.expression(1))
+            if op in OPERADORES_BINARIOS:
+                operacao = OPERADORES_BINARIOS[op]
+                i = self._local_seguro(ctx.expression(0))
+                j = self._local_seguro(ctx.expression(1))
+                # Operando que é uma variável local com valor garantido: lido
+                # direto do quadro, sem a closure de leitura.
+                if i is not None and j is not None:
+                    return lambda quadro: operacao(quadro.valores[i], quadro.valores[j])
+                esquerda = self._compilar_expressao(ctx.expression(0))
+                direita = self._compilar_expressao(ctx.expression(1))
+                if i is not None:
+                    return lambda quadro: operacao(quadro.valores[i], direita(quadro))
+                if j is not None:
+                    return lambda quadro: operacao(esquerda(quadro), quadro.valores[j])
+
+                def binaria(quadro):
+                    return operacao(esquerda(quadro), direita(quadro))
+                return binaria
+
+        if (child_count == 4 and ctx.getChild(0).getSymbol() is not None
+                and ctx.getChild(1).getText() == '[' and ctx.getChild(3).getText() == ']'):
+            return self._compilar_indexacao(ctx)
+
+        if ctx.Number():
+            texto = ctx.Number().getText()
+            return self._constante(float(texto) if '.' in texto else int(texto))
+
+        if ctx.StringLiteral():
+            return self._constante(decodificar_literal(ctx.StringLiteral().getText()))
+
+        if ctx.CharLiteral():
+            return self._constante(ctx.CharLiteral().getText().strip("'"))
+
+        if child_count == 3 and ctx.getChild(0).getText() == '(' and ctx.getChild(2).getText() == ')':
+            return self._compilar_expressao(ctx.getChild(1))
+
+        if child_count == 2:
+            operando = self._compilar_expressao(ctx.getChild(1))
+            if ctx.getChild(0).getText() == '!':
+                return lambda quadro: not operando(quadro)
+            if ctx.getChild(0).getText() == '-':
+                return lambda quadro: -operando(quadro)
+
+        return _nada
+
+    def _constante(self, valor):
+        return lambda quadro: valor
+
+    def _valor_constante(self, ctx):
+        # (True, valor) para uma expressão do pool de constantes ou um
+        # literal/macro; (False, None) para as demais.
+        if ctx in self.resolucao.constantes:
+            return True, self.resolucao.constantes[ctx]
+        return valor_constante(ctx, self._macro)
+
+    def _macro(self, token):
+        # Para valor_constante: o identificador é constante se o resolvedor
+        # o ligou a uma macro (já avaliada na passagem pelo nível superior).
+        endereco = self.resolucao.enderecos.get(token)
+        if endereco is not None and endereco.escopo == MACRO:
+            valor = self.macros.get(token.getText())
+            if valor is not None:
+                return True, valor
+        return False, None
+
+    def _compilar_condicao(self, ctx):
+        # Condição de if/while/for: && e || viram o curto-circuito do próprio
+        # Python, sem o bool intermediário de cada operação; o operando da
+        # direita só é avaliado quando o da esquerda não decide o resultado.
+        if ctx.getChildCount() == 3 and ctx not in self.resolucao.constantes:
+            op = ctx.getChild(1).getText()
+            if op == '&&' or op == '||':
+                esquerda = self._compilar_condicao(ctx.expression(0))
+                direita = self._compilar_condicao(ctx.expression(1))
+                if op == '&&':
+                    return lambda quadro: esquerda(quadro) and direita(quadro)
+                return lambda quadro: esquerda(quadro) or direita(quadro)
+            if ctx.getChild(0).getText() == '(':
+                return self._compilar_condicao(ctx.getChild(1))
+        return self._compilar_expressao(ctx)
+
+    def _compilar_comparacao(self, op, esquerda_ctx, direita_ctx):
+        # Cada operador tem sua closure, com o operando constante embutido
+        # quando a direita é um literal ou macro (i < 10, c != 'x', i < N).
+        esquerda = self._compilar_expressao(esquerda_ctx)
+        constante, c = self._valor_constante(direita_ctx)
+        i = self._local_seguro(esquerda_ctx)
+
+        if constante and i is not None:
+            # Variável local com valor garantido contra constante (i < N, o
+            # teste típico de um laço): nenhuma closure chamada.
+            if op == '<':
+                return lambda quadro: quadro.valores[i] < c
+            if op == '<=':
+                return lambda quadro: quadro.valores[i] <= c
+            if op == '>':
+                return lambda quadro: quadro.valores[i] > c
+            if op == '>=':
+                return lambda quadro: quadro.valores[i] >= c
+            if op == '==':
+                return lambda quadro: quadro.valores[i] == c
+            return lambda quadro: quadro.valores[i] != c
+
+        if constante:
+            if op == '<':
+                return lambda quadro: esquerda(quadro) < c
+            if op == '<=':
+                return lambda quadro: esquerda(quadro) <= c
+            if op == '>':
+                return lambda quadro: esquerda(quadro) > c
+            if op == '>=':
+                return lambda quadro: esquerda(quadro) >= c
+            if op == '==':
+                return lambda quadro: esquerda(quadro) == c
+            return lambda quadro: esquerda(quadro) != c
+
+        direita = self._compilar_expressao(direita_ctx)
+        if op == '<':
+            return lambda quadro: esquerda(quadro) < direita(quadro)
+        if op == '<=':
+            return lambda quadro: esquerda(quadro) <= direita(quadro)
+        if op == '>':
+            return lambda quadro: esquerda(quadro) > direita(quadro)
+        if op == '>=':
+            return lambda quadro: esquerda(quadro) >= direita(quadro)
+        if op == '==':
+            return lambda quadro: esquerda(quadro) == direita(quadro)
+        return lambda quadro: esquerda(quadro) != direita(quadro)
+
+    def _local_seguro(self, ctx):
+        # Índice do slot se `ctx` é a leitura de uma variável local que a
+        # análise de inicialização garante ter valor; senão None.
+        if ctx.getChildCount() != 1 or ctx.Identifier() is None:
+            return None
+        token = ctx.Identifier()
+        if token not in self.resolucao.leituras_seguras or self.resolucao.endereco(token).escopo != LOCAL:
+            return None
+        return self._indice(token)
+
+    def _compilar_identificador(self, token):
+        nome = token.getText()
+        endereco = self.resolucao.endereco(token)
+
+        if endereco.escopo == MACRO:
+            return self._constante(self.macros.get(nome))
+
+        valores_globais, i = self._slot(token)
+        if token in self.resolucao.leituras_seguras:
+            if valores_globais is not None:
+                return lambda quadro: valores_globais[i]
+            return lambda quadro: quadro.valores[i]
+        if valores_globais is not None:
+            def ler_global(quadro):
+                valor = valores_globais[i]
+                if valor is NAO_INICIALIZADA:
+                    raise Exception(f"Erro: Variável '{nome}' não foi inicializada antes do uso.")
+                return valor
+            return ler_global
+
+        def ler_local(quadro):
+            valor = quadro.valores[i]
+            if valor is NAO_INICIALIZADA:
+                raise Exception(f"Erro: Variável '{nome}' não foi inicializada antes do uso.")
+            return valor
+        return ler_local
+
+    def _compilar_indexacao(self, ctx):
+        token = ctx.getChild(0)
+        indice = self._compilar_expressao(ctx.getChild(2))
+        array_name = token.getText()
+        eh_array = self._tipo(token).endswith("[]")
+        ler_array = self._leitor(token)
+
+        if eh_array and self._indice_garantido(ctx):
+            i = self._local_seguro(ctx.getChild(2))
+            if i is not None:
+                return lambda quadro: ler_array(quadro)[quadro.valores[i]]
+            return lambda quadro: ler_array(quadro)[indice(quadro)]
+
+        def ler_elemento(quadro):
+            index_value = indice(quadro)
+            array_data = ler_array(quadro)
+            if not eh_array:
+                raise Exception(f"Variável '{array_name}' não é um array, mas foi usada como array.")
+            if not isinstance(index_value, int):
+                raise Exception(f"Índice do array '{array_name}' não é inteiro: {index_value}")
+            if index_value < 0 or index_value >= len(array_data):
+                raise Exception(f"Índice {index_value} fora dos limites do array '{array_name}'.")
+            return array_data[index_value]
+        return ler_elemento
+
+    def _compilar_campo(self, ctx):
+        cadeia = cadeia_de_campos(ctx)
+        if cadeia is not None and tipo_do_caminho(self.structs, self._tipo(cadeia[0]), cadeia[1]) is not None:
+            # p.a.b com p de tipo struct conhecido: um único attrgetter.
+            token, campos = cadeia
+            ler_registro = self._compilar_identificador(token)
+            obter = leitor_de_caminho(campos)
+            ler_caminho = self.interp._ler_caminho
+
+            def caminho(quadro):
+                registro = ler_registro(quadro)
+                if isinstance(registro, Registro):
+                    try:
+                        return obter(registro)
+                    except AttributeError:
+                        pass
+                return ler_caminho(registro, campos)
+            return caminho
+
+        esquerda = self._compilar_expressao(ctx.getChild(0))
+        field_name = ctx.getChild(2).getText()
+        ler_campo = self.interp._ler_campo
+        classe = self._classe_uniao(self._tipo(cadeia[0])) if cadeia is not None and len(cadeia[1]) == 1 else None
+        membro = classe.__membros__.get(field_name) if classe is not None else None
+        if membro is not None and not membro.caractere:
+            # u.x com u de union conhecida e x escalar: um unpack no buffer.
+            desempacotar = membro.desempacotar
+
+            def membro_union(quadro):
+                uniao = esquerda(quadro)
+                if type(uniao) is classe and uniao.objeto is None and uniao.ativo is not None:
+                    return desempacotar(uniao)[0]
+                return ler_campo(uniao, field_name)
+            return membro_union
+
+        def campo(quadro):
+            return ler_campo(esquerda(quadro), field_name)
+        return campo
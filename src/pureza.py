@@ -0,0 +1,206 @@
+from collections import OrderedDict
+
+from antlr4.tree.Tree import TerminalNode
+
+from CParser import CParser
+from resolvedor import GLOBAL, LOCAL, MACRO
+
+# Análise de pureza das funções, executada depois da análise de
+# inicialização, e a memorização (--memoize) das funções puras. Uma função é
+# pura quando o resultado depende só dos argumentos e a chamada não tem
+# efeito visível fora dela:
+#
+#   não tem printf, scanf, gets nem puts;
+#   não escreve em globais nem em campos ou elementos de um parâmetro (uma
+#   struct passada por quem chama);
+#   só lê os próprios parâmetros e locais, sempre depois de receberem valor
+#   (resolucao.leituras_seguras), e macros definidas uma única vez: uma
+#   global pode mudar entre duas chamadas com os mesmos argumentos, e no
+#   visitor um nome sem valor local seria procurado no escopo de quem chama;
+#   só chama funções puras (ponto fixo sobre as chamadas, então a recursão
+#   entre funções puras é pura);
+#   é a única definição com esse nome.
+#
+# Uma função pura é memorizável quando devolve um valor e nenhum parâmetro
+# nem o retorno é struct ou union. Com --memoize, cada motor guarda os
+# resultados dela num CacheLRU, com chave nos valores e nos tipos dos
+# argumentos (1, 1.0 e True são chaves diferentes); só entram no cache
+# resultados escalares, e uma chamada com o número errado de argumentos ou
+# com um argumento que não é escalar é executada sem passar pelo cache.
+
+# Número máximo de resultados guardados por função, por padrão.
+CAPACIDADE_PADRAO = 4096
+
+_TIPOS_CHAVE = frozenset((int, float, bool, str, type(None)))
+_TIPOS_VALOR = frozenset((int, float, bool, str))
+
+# Resultado de CacheLRU.procurar quando a chave não está no cache.
+AUSENTE = object()
+
+
+def _composto(tipo):
+    return tipo.startswith("struct") or tipo.startswith("union")
+
+
+class Pureza:
+    def __init__(self, resolucao):
+        self.resolucao = resolucao
+        self._macros = set()
+        self._escopo = None
+        self._chamadas = None
+
+    def analisar(self, tree):
+        definicoes = {}
+        macros = {}
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                definicoes.setdefault(filho.Identifier().getText(), []).append(filho)
+            elif isinstance(filho, CParser.DirectiveContext) and filho.getChild(0).getText() == '#define':
+                nome = filho.Identifier().getText()
+                macros[nome] = macros.get(nome, 0) + 1
+        self._macros = {nome for nome, n in macros.items() if n == 1}
+
+        chamadas = {}
+        for nome, ctxs in definicoes.items():
+            if len(ctxs) != 1:
+                continue
+            self._escopo = self.resolucao.funcoes[nome]
+            self._chamadas = set()
+            if self._puro(ctxs[0].block()):
+                chamadas[nome] = self._chamadas
+        self._escopo = self._chamadas = None
+
+        # Ponto fixo: sai quem chama uma função que não é pura.
+        puras = set(chamadas)
+        mudou = True
+        while mudou:
+            mudou = False
+            for nome in list(puras):
+                if not chamadas[nome] <= puras:
+                    puras.discard(nome)
+                    mudou = True
+        self.resolucao.puras = puras
+
+        for nome in puras:
+            ctx = definicoes[nome][0]
+            tipo = ctx.type_().getText()
+            tipos = [t.getText() for t in ctx.paramList().type_()] if ctx.paramList() is not None else []
+            if tipo != "void" and not _composto(tipo) and not any(_composto(t) for t in tipos):
+                self.resolucao.memorizaveis.add(nome)
+
+    def _puro(self, ctx):
+        if isinstance(ctx, TerminalNode):
+            return True
+        if isinstance(ctx, CParser.InputOutputStatementContext):
+            return False
+        if isinstance(ctx, CParser.FunctionCallContext):
+            self._chamadas.add(ctx.Identifier().getText())
+        elif isinstance(ctx, (CParser.AssignmentContext, CParser.ForHeaderAssignmentContext)):
+            if not self._escrita_local(ctx):
+                return False
+        elif isinstance(ctx, CParser.ExpressionContext):
+            primeiro = ctx.getChild(0)
+            if (isinstance(primeiro, TerminalNode) and primeiro.getSymbol().type == CParser.Identifier
+                    and not self._leitura_pura(primeiro)):
+                return False
+        return all(self._puro(ctx.getChild(i)) for i in range(ctx.getChildCount()))
+
+    def _escrita_local(self, ctx):
+        endereco = self.resolucao.enderecos.get(ctx.getChild(0))
+        if endereco is None or endereco.escopo != LOCAL:
+            return False
+        # `x = ...` só troca o valor do slot; `p.x = ...` e `p[i] = ...`
+        # alteram o objeto, que num parâmetro é o de quem chama.
+        simples = ctx.getChild(1).getText() == '='
+        return simples or endereco.indice >= self._escopo.n_parametros
+
+    def _leitura_pura(self, token):
+        endereco = self.resolucao.enderecos.get(token)
+        if endereco is None or endereco.escopo == GLOBAL or token not in self.resolucao.leituras_seguras:
+            return False
+        return endereco.escopo != MACRO or token.getText() in self._macros
+
+
+class CacheLRU:
+    # Resultados de uma função memorizada, do menos ao mais usado
+    # recentemente; o menos usado sai quando a capacidade é passada.
+    def __init__(self, nome, capacidade=CAPACIDADE_PADRAO):
+        self.nome = nome
+        self.capacidade = capacidade
+        self.valores = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def chave(self, argumentos):
+        # None quando algum argumento não pode ser chave.
+        tipos = tuple(map(type, argumentos))
+        if not _TIPOS_CHAVE.issuperset(tipos):
+            return None
+        return tuple(argumentos) + tipos
+
+    def procurar(self, chave):
+        valor = self.valores.get(chave, AUSENTE)
+        if valor is AUSENTE:
+            self.falhas += 1
+            return AUSENTE
+        self.valores.move_to_end(chave)
+        self.acertos += 1
+        return valor
+
+    def guardar(self, chave, valor):
+        if type(valor) not in _TIPOS_VALOR:
+            return
+        self.valores[chave] = valor
+        if len(self.valores) > self.capacidade:
+            self.valores.popitem(last=False)
+
+    def chamar(self, calcular, argumentos):
+        # calcular(argumentos) executa a função de fato, numa falha.
+        chave = self.chave(argumentos)
+        if chave is None:
+            return calcular(argumentos)
+        valor = self.procurar(chave)
+        if valor is AUSENTE:
+            valor = calcular(argumentos)
+            self.guardar(chave, valor)
+        return valor
+
+    def envolver(self, funcao):
+        # Versão memorizada de uma função Python com os argumentos posicionais.
+        def calcular(argumentos):
+            return funcao(*argumentos)
+
+        def memorizada(*argumentos):
+            return self.chamar(calcular, argumentos)
+        return memorizada
+
+
+class Memorizacao:
+    # Os caches de uma execução com --memoize, por nome de função.
+    def __init__(self, capacidade=CAPACIDADE_PADRAO):
+        self.capacidade = capacidade
+        self.caches = {}
+
+    def cache(self, nome):
+        if nome not in self.caches:
+            self.caches[nome] = CacheLRU(nome, self.capacidade)
+        return self.caches[nome]
+
+    def relatorio(self):
+        # Texto do fim de uma execução com --memoize: acertos e falhas de
+        # cada função memorizada que foi chamada (as expandidas em linha
+        # não passam pelo cache), em ordem de nome.
+        usados = sorted((nome, cache) for nome, cache in self.caches.items() if cache.acertos or cache.falhas)
+        if not usados:
+            return "Memorização: nenhuma chamada a função pura."
+        linhas = [f"Memorização (até {_contagem(self.capacidade, 'valor', 'valores')} por função):"]
+        for nome, cache in usados:
+            linhas.append(f"  {nome}: {_contagem(cache.acertos, 'acerto', 'acertos')}, "
+                          f"{_contagem(cache.falhas, 'falha', 'falhas')}, "
+                          f"{_contagem(len(cache.valores), 'valor guardado', 'valores guardados')}")
+        return "\n".join(linhas)
+
+
+def _contagem(n, singular, plural):
+    return f"{n} {singular if n == 1 else plural}"
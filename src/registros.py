@@ -0,0 +1,208 @@
+from operator import attrgetter
+from struct import Struct, error as ErroStruct
+
+# Valores de struct e union do programa interpretado. Cada struct declarada
+# ganha, na carga do programa, uma classe própria derivada de Registro, com
+# um slot (__slots__) por campo: o valor fica num objeto de tamanho fixo, sem
+# dicionário por instância nem um dicionário {"tipo", "valor"} por campo, e
+# cada campo é lido e escrito num deslocamento fixo do objeto, resolvido
+# pelo Python na criação da classe.
+#
+# Os motores compilados resolvem na compilação os acessos cuja raiz é uma
+# variável de tipo struct conhecido (p.x, p.a.b): os nomes são validados
+# contra as definições e o caminho inteiro vira um único attrgetter. Um
+# acesso que não se resolve assim (campo de um retorno de função, union...)
+# continua passando por Interpretador._ler_campo, com as verificações por
+# nome.
+#
+# Uma union é um bytearray do tamanho do seu maior membro, compartilhado por
+# todos os membros: cada membro escalar tem um codec (struct.Struct)
+# calculado na definição, e escrever ou ler o membro é um único pack/unpack
+# no início do buffer. Ler um membro diferente do último escrito reinterpreta
+# os bytes, como em C (d.i depois de d.f = 3.14).
+
+
+class Registro:
+    __slots__ = ()
+
+    # Definidos em cada classe gerada: o nome da struct e {campo: tipo}, na
+    # ordem da declaração.
+    __struct__ = None
+    __tipos__ = {}
+
+    def __init__(self):
+        for campo in self.__tipos__:
+            setattr(self, campo, None)
+
+    def __repr__(self):
+        campos = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in self.__tipos__)
+        return f"struct {self.__struct__} {{{campos}}}"
+
+
+def classe_registro(nome, campos):
+    # A classe é criada com o nome "_" porque o Python não aplica name mangling
+    # aos __slots__ (um campo "__x" viraria "_S__x") quando o nome da classe
+    # só tem sublinhados; o nome de verdade é atribuído em seguida.
+    classe = type("_", (Registro,), {"__slots__": tuple(campos)})
+    classe.__name__ = classe.__qualname__ = nome
+    classe.__struct__ = nome
+    classe.__tipos__ = dict(campos)
+    return classe
+
+
+def nome_struct(tipo):
+    return tipo[len("struct"):].strip()
+
+
+def cadeia_de_campos(ctx):
+    # Expressão a.b.c -> (token de 'a', ["b", "c"]); None se a raiz do acesso
+    # não é um identificador.
+    campos = []
+    while ctx.getChildCount() == 3 and ctx.getChild(1).getText() == '.':
+        campos.append(ctx.getChild(2).getText())
+        ctx = ctx.getChild(0)
+    if ctx.getChildCount() != 1 or ctx.Identifier() is None:
+        return None
+    campos.reverse()
+    return ctx.Identifier(), campos
+
+
+def tipo_do_caminho(structs, tipo, campos):
+    # Tipo de tipo.c1.c2... quando toda a cadeia passa por structs definidas
+    # (structs: {nome: {campo: tipo}}) e os campos existem; None caso
+    # contrário, e o acesso fica para a verificação em tempo de execução.
+    for campo in campos:
+        if not tipo.startswith("struct"):
+            return None
+        definicao = structs.get(nome_struct(tipo))
+        if definicao is None or campo not in definicao:
+            return None
+        tipo = definicao[campo]
+    return tipo
+
+
+def leitor_de_caminho(campos):
+    return attrgetter(".".join(campos))
+
+
+# Formato (struct) de cada tipo escalar que pode ser membro de union. char é
+# tratado à parte: o valor é um caractere, guardado pelo seu código.
+FORMATOS_MEMBRO = {
+    "int": "i",
+    "short": "h",
+    "long": "q",
+    "long long": "q",
+    "unsigned": "I",
+    "unsigned int": "I",
+    "unsigned short": "H",
+    "unsigned long": "Q",
+    "unsigned long long": "Q",
+    "unsigned char": "B",
+    "float": "f",
+    "double": "d",
+    "long double": "d",
+}
+
+
+class Membro:
+    # Codec de um membro escalar de union (o mesmo para todos os membros do
+    # mesmo tipo): o Struct do tipo, lido e escrito no início do buffer. Um
+    # char é guardado pelo seu código, em 'B'.
+    __slots__ = ("tipo", "tamanho", "desempacotar", "empacotar", "caractere", "bits", "com_sinal")
+
+    def __init__(self, tipo, formato):
+        codec = Struct(formato)
+        self.tipo = tipo
+        self.tamanho = codec.size
+        self.desempacotar = codec.unpack_from
+        self.empacotar = codec.pack_into
+        self.caractere = tipo == "char"
+        self.bits = codec.size * 8
+        self.com_sinal = formato in "hiq"
+
+    def ajustar(self, valor):
+        # Valor que o Struct recusou: um inteiro fora da faixa é reduzido
+        # módulo 2^bits, como na conversão para um tipo inteiro de C.
+        if self.caractere:
+            raise Exception(f"Erro: Caractere '{chr(valor)}' fora da faixa de char (códigos 0 a 255).")
+        if not isinstance(valor, int):
+            raise Exception(f"Erro: Valor '{valor}' incompatível com o tipo {self.tipo.upper()}.")
+        valor &= (1 << self.bits) - 1
+        if self.com_sinal and valor >= 1 << (self.bits - 1):
+            valor -= 1 << self.bits
+        return valor
+
+
+_MEMBROS = {}
+
+
+def membro(tipo):
+    # Membro do tipo, ou None para os que não são escalares (struct, union),
+    # que a union guarda como objeto.
+    if tipo not in _MEMBROS:
+        formato = "B" if tipo == "char" else FORMATOS_MEMBRO.get(tipo)
+        _MEMBROS[tipo] = Membro(tipo, formato) if formato is not None else None
+    return _MEMBROS[tipo]
+
+
+class Uniao(bytearray):
+    # Os bytes da union; `ativo` é o último membro escrito (None antes da
+    # primeira escrita) e `objeto`, o valor do último membro escrito quando
+    # ele não é escalar (None caso contrário).
+    __slots__ = ("ativo", "objeto")
+
+    # Definidos em cada classe gerada.
+    __uniao__ = None
+    __tipos__ = {}
+    __membros__ = {}
+    __tamanho__ = 0
+
+    def __init__(self):
+        bytearray.__init__(self, self.__tamanho__)
+        self.ativo = None
+        self.objeto = None
+
+    def ler(self, campo):
+        try:
+            membro = self.__membros__[campo]
+        except KeyError:
+            raise Exception(f"O campo '{campo}' não existe na union '{self.__uniao__}'.") from None
+        if self.ativo is None:
+            raise Exception(f"Union '{self.__uniao__}' não foi inicializada (nenhum campo atribuído).")
+        if membro is not None and self.objeto is None:
+            valor = membro.desempacotar(self)[0]
+            return chr(valor) if membro.caractere else valor
+        # Um membro struct/union não tem bytes para reinterpretar.
+        if campo != self.ativo:
+            raise Exception(f"Tentando acessar o campo '{campo}' de union '{self.__uniao__}' que não é o campo ativo.")
+        return self.objeto
+
+    def escrever(self, campo, valor):
+        # `valor` já convertido para o tipo do membro.
+        membro = self.__membros__[campo]
+        if membro is None:
+            self.objeto = valor
+        else:
+            if membro.caractere:
+                valor = ord(valor)
+            try:
+                membro.empacotar(self, 0, valor)
+            except ErroStruct:
+                membro.empacotar(self, 0, membro.ajustar(valor))
+            self.objeto = None
+        self.ativo = campo
+
+    def __repr__(self):
+        return f"union {self.__uniao__} {bytes(self)!r} (ativo: {self.ativo})"
+
+
+def classe_uniao(nome, campos):
+    membros = {campo: membro(tipo) for campo, tipo in campos.items()}
+    tamanho = max([m.tamanho for m in membros.values() if m is not None], default=0)
+    return type(nome, (Uniao,), {
+        "__slots__": (),
+        "__uniao__": nome,
+        "__tipos__": dict(campos),
+        "__membros__": membros,
+        "__tamanho__": tamanho,
+    })
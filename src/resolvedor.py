@@ -0,0 +1,237 @@
+from collections import namedtuple
+
+from antlr4.tree.Tree import TerminalNode
+
+from CParser import CParser
+
+# Passo de resolução de nomes executado antes do programa rodar. Cada uso de
+# Identifier (leitura, atribuição, scanf, gets, declaração) é ligado a um
+# endereço léxico: o tipo de escopo ("global" ou "local") e o índice do slot.
+# Os escopos são os da linguagem C: variáveis globais (declaradas no nível
+# superior), parâmetros e variáveis locais da função; #define é visível em
+# todo o programa. Usos de nomes não declarados viram erros reportados antes
+# da execução.
+
+GLOBAL = "global"
+LOCAL = "local"
+MACRO = "macro"
+
+Endereco = namedtuple("Endereco", ["escopo", "indice"])
+
+
+class _NaoInicializada:
+    def __repr__(self):
+        return "<não inicializada>"
+
+
+# Valor de um slot cuja variável ainda não recebeu valor.
+NAO_INICIALIZADA = _NaoInicializada()
+
+
+def valor_constante(ctx, macro):
+    # (True, valor) se a expressão é constante em tempo de compilação: um
+    # literal numérico ou de caractere, com sinal e parênteses, ou uma macro.
+    # `macro(token)` decide se o identificador é uma macro (o escopo é de
+    # quem chama) e devolve (True, valor) ou (False, None).
+    child_count = ctx.getChildCount()
+    if child_count == 3 and ctx.getChild(0).getText() == '(':
+        return valor_constante(ctx.getChild(1), macro)
+    if child_count == 2 and ctx.getChild(0).getText() == '-':
+        constante, valor = valor_constante(ctx.getChild(1), macro)
+        if constante and isinstance(valor, (int, float)):
+            return True, -valor
+        return False, None
+    if child_count == 1:
+        if ctx.Number():
+            texto = ctx.Number().getText()
+            return True, float(texto) if '.' in texto else int(texto)
+        if ctx.CharLiteral():
+            return True, ctx.CharLiteral().getText().strip("'")
+        if ctx.Identifier():
+            return macro(ctx.Identifier())
+    return False, None
+
+
+def macros_constantes(expressoes):
+    # Função `macro` para valor_constante a partir de {nome: expressão do
+    # #define}; uma macro é constante se a sua expressão for.
+    def macro(token, visitadas=()):
+        nome = token.getText()
+        if nome not in expressoes or nome in visitadas or expressoes[nome] is None:
+            return False, None
+        return valor_constante(expressoes[nome], lambda t: macro(t, visitadas + (nome,)))
+    return macro
+
+
+class EscopoFuncao:
+    def __init__(self, nome, parametros, tipos_parametros):
+        self.nome = nome
+        self.n_parametros = len(parametros)
+        self.nomes = list(parametros)
+        self.tipos = list(tipos_parametros)
+        self.indices = {nome: i for i, nome in enumerate(self.nomes)}
+
+    @property
+    def n_locais(self):
+        return len(self.nomes)
+
+    def declarar(self, nome, tipo):
+        self.indices[nome] = len(self.nomes)
+        self.nomes.append(nome)
+        self.tipos.append(tipo)
+        return self.indices[nome]
+
+
+class Resolucao:
+    def __init__(self):
+        self.globais = EscopoFuncao("<global>", [], [])
+        self.macros = {}
+        self.funcoes = {}
+        self.enderecos = {}
+        self.erros = []
+        # Preenchido pela tipagem (tipagem.py): expressão -> representação.
+        self.tipos_expressoes = {}
+        # Preenchido pela análise de inicialização (inicializacao.py): usos
+        # de Identifier cuja variável sempre já recebeu valor.
+        self.leituras_seguras = set()
+        # Preenchidos pela análise de faixa (limites.py): acesso v[i] -> laço
+        # em que o índice está sempre nos limites, e laço -> guardas que
+        # precisam valer na entrada para isso.
+        self.indices_garantidos = {}
+        self.guardas = {}
+        # Preenchido pela dobra de constantes (constantes.py): expressão ->
+        # valor calculado na carga.
+        self.constantes = {}
+        # Preenchido pela expansão em linha (expansao.py): chamada ->
+        # Expandida.
+        self.expansoes = {}
+        # Preenchido pela análise de chamadas em cauda (cauda.py): return
+        # -> ChamadaCauda.
+        self.caudas = {}
+        # Preenchidos pela análise de pureza (pureza.py): nomes das funções
+        # puras e, entre elas, das que --memoize memoriza.
+        self.puras = set()
+        self.memorizaveis = set()
+
+    def endereco(self, token):
+        return self.enderecos[token]
+
+    def tipo(self, token, escopo_funcao):
+        endereco = self.enderecos[token]
+        if endereco.escopo == GLOBAL:
+            return self.globais.tipos[endereco.indice]
+        if endereco.escopo == LOCAL:
+            return escopo_funcao.tipos[endereco.indice]
+        return None
+
+
+class Resolvedor:
+    def __init__(self):
+        self.resolucao = Resolucao()
+        self._escopo = None
+
+    def resolver(self, tree):
+        resolucao = self.resolucao
+
+        # Globais e macros primeiro: o nível superior inteiro é executado
+        # antes de main, então toda função enxerga todas as globais.
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.DirectiveContext) and filho.getChild(0).getText() == '#define':
+                resolucao.macros[filho.Identifier().getText()] = filho.expression()
+            elif isinstance(filho, CParser.StatementContext) and isinstance(filho.getChild(0), CParser.VarDeclContext):
+                vd = filho.getChild(0)
+                nome = vd.Identifier().getText()
+                if nome in resolucao.globais.indices:
+                    resolucao.erros.append(f"Variável '{nome}' já foi declarada.")
+                    continue
+                resolucao.globais.declarar(nome, self._tipo_declarado(vd))
+
+        self._escopo = None
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.StatementContext):
+                self._percorrer(filho)
+            elif isinstance(filho, CParser.DirectiveContext) and filho.expression() is not None:
+                self._percorrer(filho.expression())
+
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                self._resolver_funcao(filho)
+
+        return resolucao
+
+    def _tipo_declarado(self, ctx):
+        tipo = ctx.type_().getText()
+        return tipo + "[]" if ctx.arraySize() else tipo
+
+    def _resolver_funcao(self, ctx):
+        nome = ctx.Identifier().getText()
+        parametros = []
+        tipos_parametros = []
+        if ctx.paramList() is not None:
+            parametros = [token.getText() for token in ctx.paramList().Identifier()]
+            tipos_parametros = [t.getText() for t in ctx.paramList().type_()]
+        self._escopo = EscopoFuncao(nome, parametros, tipos_parametros)
+        self._declarados = set(parametros)
+        self.resolucao.funcoes[nome] = self._escopo
+        self._percorrer(ctx.block())
+        self._escopo = None
+
+    def _usar(self, token, escrita=False):
+        # Numa escrita o nome de uma macro não é um alvo válido, então só
+        # variáveis locais e globais são consideradas.
+        nome = token.getText()
+        escopo = self._escopo
+        if escopo is not None and nome in escopo.indices:
+            self.resolucao.enderecos[token] = Endereco(LOCAL, escopo.indices[nome])
+        elif nome in self.resolucao.macros and not escrita:
+            self.resolucao.enderecos[token] = Endereco(MACRO, nome)
+        elif nome in self.resolucao.globais.indices:
+            self.resolucao.enderecos[token] = Endereco(GLOBAL, self.resolucao.globais.indices[nome])
+        else:
+            onde = f" (função '{escopo.nome}')" if escopo is not None else ""
+            self.resolucao.erros.append(f"Variável '{nome}' não foi declarada{onde}.")
+
+    def _declarar(self, ctx):
+        token = ctx.Identifier()
+        nome = token.getText()
+        if self._escopo is None:
+            self.resolucao.enderecos[token] = Endereco(GLOBAL, self.resolucao.globais.indices[nome])
+            return
+        if nome in self._declarados:
+            self.resolucao.erros.append(f"Variável '{nome}' já foi declarada (função '{self._escopo.nome}').")
+        self._declarados.add(nome)
+        if nome not in self._escopo.indices:
+            self._escopo.declarar(nome, self._tipo_declarado(ctx))
+        self.resolucao.enderecos[token] = Endereco(LOCAL, self._escopo.indices[nome])
+
+    def _percorrer(self, ctx):
+        if isinstance(ctx, TerminalNode) or isinstance(ctx, CParser.TypeContext):
+            return
+
+        if isinstance(ctx, CParser.VarDeclContext):
+            if ctx.init() is not None:
+                self._percorrer(ctx.init())
+            self._declarar(ctx)
+            return
+
+        if isinstance(ctx, CParser.ExpressionContext):
+            primeiro = ctx.getChild(0)
+            if isinstance(primeiro, TerminalNode) and primeiro.getSymbol().type == CParser.Identifier:
+                self._usar(primeiro)
+
+        elif isinstance(ctx, (CParser.AssignmentContext, CParser.ForHeaderAssignmentContext, CParser.ScanfParamContext)):
+            self._usar(ctx.getChild(0), escrita=True)
+
+        elif isinstance(ctx, CParser.InputOutputStatementContext) and ctx.getChild(0).getText() == "gets":
+            self._usar(ctx.Identifier(), escrita=True)
+
+        elif isinstance(ctx, CParser.FunctionCallContext):
+            if ctx.argumentList() is not None:
+                self._percorrer(ctx.argumentList())
+            return
+
+        for i in range(ctx.getChildCount()):
+            self._percorrer(ctx.getChild(i))
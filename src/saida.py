@@ -0,0 +1,66 @@
+import sys
+
+# Saída padrão do programa interpretado. printf, puts e os avisos do
+# interpretador escrevem aqui em vez de chamar print() a cada comando; o
+# texto é acumulado e enviado ao sys.stdout de uma vez, como o stdout de C:
+#
+#   full        descarrega quando o buffer atinge o limite (e no fim);
+#   line        descarrega também a cada '\n' escrito;
+#   unbuffered  descarrega a cada escrita.
+#
+# O interpretador descarrega o buffer antes de ler a entrada (para que os
+# prompts apareçam) e main.py, ao fim da execução.
+
+COMPLETO = "full"
+LINHA = "line"
+SEM_BUFFER = "unbuffered"
+
+MODOS = [COMPLETO, LINHA, SEM_BUFFER]
+
+LIMITE_BUFFER = 64 * 1024
+
+
+def modo_padrao():
+    # Como na biblioteca C: por linha num terminal, completo em arquivo ou pipe.
+    return LINHA if sys.stdout.isatty() else COMPLETO
+
+
+class SaidaBufferizada:
+    def __init__(self, modo=None, limite=LIMITE_BUFFER):
+        self.modo = modo if modo is not None else modo_padrao()
+        if self.modo not in MODOS:
+            raise Exception(f"Modo de buffer '{self.modo}' inválido; use {', '.join(MODOS)}.")
+        self.limite = limite
+        self._partes = []
+        self._tamanho = 0
+        if self.modo == COMPLETO:
+            self.escrever = self._escrever_completo
+        elif self.modo == LINHA:
+            self.escrever = self._escrever_linha
+        else:
+            self.escrever = self._escrever_sem_buffer
+
+    def _escrever_completo(self, texto):
+        self._partes.append(texto)
+        self._tamanho += len(texto)
+        if self._tamanho >= self.limite:
+            self.descarregar()
+
+    def _escrever_linha(self, texto):
+        self._partes.append(texto)
+        self._tamanho += len(texto)
+        if "\n" in texto or self._tamanho >= self.limite:
+            self.descarregar()
+
+    def _escrever_sem_buffer(self, texto):
+        self._partes.append(texto)
+        self.descarregar()
+
+    def descarregar(self):
+        # O destino é o sys.stdout do momento, para respeitar redirecionamentos
+        # (contextlib.redirect_stdout nos benchmarks).
+        if self._partes:
+            sys.stdout.write("".join(self._partes))
+            self._partes.clear()
+            self._tamanho = 0
+        sys.stdout.flush()
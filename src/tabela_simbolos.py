@@ -1,3 +1,6 @@
+from registros import classe_registro, classe_uniao
+
+
 class TabelaSimbolos:
     def __init__(self, parent=None):
         self.variaveis = {}
@@ -44,7 +47,7 @@ class TabelaSimbolos:
     def adicionar_struct(self, nome_struct, campos):
         if nome_struct in self.structs:
             raise Exception(f"A struct '{nome_struct}' já foi definida.")
-        self.structs[nome_struct] = campos
+        self.structs[nome_struct] = classe_registro(nome_struct, campos)
 
     def obter_struct(self, nome_struct):
         return self.structs.get(nome_struct, None)
@@ -52,7 +55,7 @@ class TabelaSimbolos:
     def adicionar_union(self, nome_union, campos):
         if nome_union in self.unions:
             raise Exception(f"A union '{nome_union}' já foi definida.")
-        self.unions[nome_union] = campos
+        self.unions[nome_union] = classe_uniao(nome_union, campos)
 
     def obter_union(self, nome_union):
         return self.unions.get(nome_union, None)
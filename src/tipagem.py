@@ -0,0 +1,419 @@
+from antlr4.tree.Tree import TerminalNode
+
+from CParser import CParser
+from registros import membro, nome_struct, tipo_do_caminho
+from resolvedor import GLOBAL, LOCAL, MACRO, Resolvedor, macros_constantes
+
+# Passo de tipagem estática, executado depois da resolução de nomes. Para
+# cada expressão calcula a representação que o valor terá em tempo de
+# execução, quando ela é garantida:
+#
+#   "int"       int do Python (inclui o bool das comparações);
+#   "float"     float do Python;
+#   "char"      str de tamanho 1;
+#   "structX"   registro da struct X.
+#
+# As fontes são os literais, as variáveis (as atribuições convertem o valor
+# para o tipo declarado), os elementos de arrays de tipo numérico ou char, os
+# membros escalares de union e os operadores. O que é escrito sem conversão
+# entra no tipo do destino: o valor da atribuição do cabeçalho do for, os
+# argumentos de cada parâmetro e os valores de return de cada função (a
+# chamada não converte nenhum dos dois). Esses tipos dependem uns dos outros
+# e são calculados juntos, por ponto fixo sobre o programa inteiro.
+#
+# Cada ponto de conversão (declaração, atribuição, elemento de array, campo
+# de struct ou union) tem então uma conversão conhecida na compilação: os
+# motores compilados omitem a conversão quando o valor já tem a
+# representação do destino e usam uma única operação (float(), truncamento)
+# quando ela é fixa. Uma conversão que sempre falharia (um char num int, uma
+# struct de outro tipo) é reportada antes da execução.
+
+INTEIRO = "int"
+REAL = "float"
+CARACTERE = "char"
+
+TIPOS_INTEIROS = {"int", "short", "long", "unsigned", "unsigned int", "unsigned long", "long long"}
+TIPOS_REAIS = {"float", "double"}
+
+# Conversão de um ponto de atribuição.
+IDENTIDADE = "identidade"
+PARA_REAL = "para_real"
+PARA_INTEIRO = "para_inteiro"
+VERIFICAR = "verificar"
+INCOMPATIVEL = "incompativel"
+
+
+class _Indefinido:
+    def __repr__(self):
+        return "<indefinido>"
+
+
+# Ainda sem informação no ponto fixo (um parâmetro de função que nenhuma
+# chamada alcançou até aqui).
+INDEFINIDO = _Indefinido()
+
+_NUMERICOS = (INTEIRO, REAL)
+
+
+def representacao(tipo):
+    # Representação garantida pela conversão para o tipo declarado; None para
+    # os tipos que _verificar_tipo_e_converter aceita sem converter.
+    if tipo in TIPOS_INTEIROS:
+        return INTEIRO
+    if tipo in TIPOS_REAIS:
+        return REAL
+    if tipo == "char":
+        return CARACTERE
+    if tipo.startswith("struct"):
+        return tipo
+    return None
+
+
+def conversao(tipo_destino, tipo_valor):
+    destino = representacao(tipo_destino)
+    if destino is None:
+        return IDENTIDADE
+    if tipo_valor is None or tipo_valor is INDEFINIDO:
+        return VERIFICAR
+    if tipo_valor == destino:
+        return IDENTIDADE
+    if destino == REAL and tipo_valor == INTEIRO:
+        return PARA_REAL
+    if destino == INTEIRO and tipo_valor == REAL:
+        return PARA_INTEIRO
+    return INCOMPATIVEL
+
+
+def _juntar(a, b):
+    if a is INDEFINIDO:
+        return b
+    if b is INDEFINIDO or a == b:
+        return a
+    return None
+
+
+def _exibir(tipo):
+    if tipo.startswith("struct"):
+        return f"struct {nome_struct(tipo)}"
+    return tipo.upper()
+
+
+def _representacao_membro(tipo):
+    m = membro(tipo)
+    if m is None:
+        return None
+    if m.caractere:
+        return CARACTERE
+    return REAL if tipo in ("float", "double", "long double") else INTEIRO
+
+
+def _representacao_retorno(tipo):
+    # Valor de retorno_padrao(tipo): o que a função devolve sem return.
+    return {"int": INTEIRO, "float": REAL, "double": REAL, "char": CARACTERE}.get(tipo)
+
+
+def resolver_e_tipar(tree):
+    resolucao = Resolvedor().resolver(tree)
+    if not resolucao.erros:
+        Tipagem(resolucao).tipar(tree)
+    return resolucao
+
+
+class Tipagem:
+    def __init__(self, resolucao):
+        self.resolucao = resolucao
+        self.macro = macros_constantes(resolucao.macros)
+        self.structs = {}
+        self.unions = {}
+        self.definicoes = {}
+        self.retornos = {}
+        self.parametros = {}
+        # Variáveis que recebem uma atribuição direta: um parâmetro atribuído
+        # passa a ter também a representação do tipo declarado, e um array
+        # atribuído por inteiro pode ter sido trocado por qualquer valor. As
+        # escritas do cabeçalho do for não convertem: o tipo de cada variável
+        # escrita ali junta os valores escritos.
+        self._atribuidas = set()
+        self._livres = {}
+        self._escopo = None
+        self._registrar = False
+        self._mudou = False
+
+    def tipar(self, tree):
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                nome = filho.Identifier().getText()
+                self.definicoes[nome] = filho
+                self.retornos[nome] = _representacao_retorno(filho.type_().getText())
+                self.parametros[nome] = [INDEFINIDO] * self.resolucao.funcoes[nome].n_parametros
+            elif isinstance(filho, (CParser.StructDefContext, CParser.UnionDefContext)):
+                campos = {vd.Identifier().getText(): vd.type_().getText() for vd in filho.varDecl()}
+                destino = self.structs if isinstance(filho, CParser.StructDefContext) else self.unions
+                destino[filho.Identifier().getText()] = campos
+
+        self._escopo = None
+        for i in range(tree.getChildCount()):
+            if isinstance(tree.getChild(i), CParser.StatementContext):
+                self._marcar_atribuicoes(tree.getChild(i))
+        for nome, ctx in self.definicoes.items():
+            self._escopo = self.resolucao.funcoes[nome]
+            self._marcar_atribuicoes(ctx.block())
+
+        self._mudou = True
+        while self._mudou:
+            self._mudou = False
+            self._passo(tree)
+        # Último passo, com tudo estável: grava os tipos e os erros.
+        self._registrar = True
+        self._passo(tree)
+
+    def _passo(self, tree):
+        self._escopo = None
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.StatementContext):
+                self._percorrer(filho)
+            elif isinstance(filho, CParser.DirectiveContext) and filho.expression() is not None:
+                self._tipo(filho.expression())
+        for nome, ctx in self.definicoes.items():
+            self._escopo = self.resolucao.funcoes[nome]
+            self._percorrer(ctx.block())
+        self._escopo = None
+
+    def _erro(self, mensagem):
+        if self._registrar:
+            onde = f" (função '{self._escopo.nome}')" if self._escopo is not None else ""
+            self.resolucao.erros.append(f"{mensagem}{onde}.")
+
+    def _chave(self, token):
+        endereco = self.resolucao.enderecos.get(token)
+        if endereco is None or endereco.escopo == MACRO:
+            return None
+        if endereco.escopo == GLOBAL:
+            return endereco
+        return self._escopo.nome, endereco
+
+    def _marcar_atribuicoes(self, ctx):
+        if isinstance(ctx, TerminalNode):
+            return
+        if isinstance(ctx, CParser.AssignmentContext) and len(ctx.Identifier()) == 1 and ctx.getChild(1).getText() == '=':
+            self._atribuidas.add(self._chave(ctx.Identifier(0)))
+        elif isinstance(ctx, CParser.ForHeaderAssignmentContext):
+            self._livres[self._chave(ctx.Identifier())] = INDEFINIDO
+        elif isinstance(ctx, CParser.ScanfParamContext) and ctx.expression() is None:
+            self._atribuidas.add(self._chave(ctx.Identifier()))
+        for i in range(ctx.getChildCount()):
+            self._marcar_atribuicoes(ctx.getChild(i))
+
+    def _tipo_declarado(self, token):
+        return self.resolucao.tipo(token, self._escopo) or ""
+
+    # ------------------------------------------------------------------
+    # Comandos
+
+    def _percorrer(self, ctx):
+        if isinstance(ctx, TerminalNode) or isinstance(ctx, CParser.TypeContext):
+            return
+        if isinstance(ctx, CParser.ExpressionContext):
+            self._tipo(ctx)
+            return
+        if isinstance(ctx, CParser.VarDeclContext):
+            self._declaracao(ctx)
+            return
+        if isinstance(ctx, CParser.AssignmentContext):
+            self._atribuicao(ctx)
+            return
+        if isinstance(ctx, CParser.ForHeaderAssignmentContext):
+            chave = self._chave(ctx.Identifier())
+            novo = _juntar(self._livres[chave], self._tipo(ctx.expression()))
+            if novo != self._livres[chave]:
+                self._livres[chave] = novo
+                self._mudou = True
+            return
+        if isinstance(ctx, CParser.FunctionCallContext):
+            self._chamada(ctx)
+            return
+        if isinstance(ctx, CParser.StatementContext) and ctx.getChild(0).getText() == "return":
+            if ctx.expression() is not None:
+                tipo = self._tipo(ctx.expression())
+                if self._escopo is not None:
+                    self._juntar_retorno(self._escopo.nome, tipo)
+            return
+        for i in range(ctx.getChildCount()):
+            self._percorrer(ctx.getChild(i))
+
+    def _verificar(self, tipo_destino, tipo_valor, alvo):
+        if conversao(tipo_destino, tipo_valor) == INCOMPATIVEL:
+            self._erro(f"Valor do tipo {_exibir(tipo_valor)} incompatível com o tipo {_exibir(tipo_destino)} de '{alvo}'")
+
+    def _declaracao(self, ctx):
+        init = ctx.init()
+        if init is None:
+            return
+        tipo = ctx.type_().getText()
+        nome = ctx.Identifier().getText()
+        if init.initializerList() is not None:
+            for i, elemento in enumerate(init.initializerList().expression()):
+                tipo_elemento = self._tipo(elemento)
+                if ctx.arraySize() and tipo != "char":
+                    self._verificar(tipo, tipo_elemento, f"{nome}[{i}]")
+            return
+        tipo_valor = self._tipo(init.expression())
+        if tipo.startswith("struct") or tipo.startswith("union"):
+            # O inicializador de struct é ignorado e o de union, um erro de
+            # execução: nenhum dos dois é convertido.
+            return
+        if not ctx.arraySize():
+            self._verificar(tipo, tipo_valor, nome)
+        elif tipo != "char":
+            self._verificar(tipo, tipo_valor, f"{nome}[all]")
+
+    def _atribuicao(self, ctx):
+        token = ctx.Identifier(0)
+        nome = token.getText()
+        tipo = self._tipo_declarado(token)
+        if ctx.getChild(1).getText() == '[':
+            self._tipo(ctx.expression(0))
+            tipo_valor = self._tipo(ctx.expression(1))
+            if tipo.endswith("[]"):
+                self._verificar(tipo[:-2], tipo_valor, f"{nome}[]")
+            return
+
+        tipo_valor = self._tipo(ctx.expression(0))
+        campos = [t.getText() for t in ctx.Identifier()[1:]]
+        if not campos:
+            if not tipo.startswith("union"):
+                self._verificar(tipo, tipo_valor, nome)
+        elif tipo.startswith("struct"):
+            tipo_campo = tipo_do_caminho(self.structs, tipo, campos)
+            if tipo_campo is not None:
+                self._verificar(tipo_campo, tipo_valor, f"{nome}.{campos[-1]}")
+        elif tipo.startswith("union") and len(campos) == 1:
+            tipo_campo = self.unions.get(tipo[len("union"):].strip(), {}).get(campos[0])
+            if tipo_campo is not None:
+                self._verificar(tipo_campo, tipo_valor, f"{nome}.{campos[0]}")
+
+    def _chamada(self, ctx):
+        nome = ctx.Identifier().getText()
+        argumentos = ctx.argumentList().expression() if ctx.argumentList() is not None else []
+        tipos = [self._tipo(argumento) for argumento in argumentos]
+        parametros = self.parametros.get(nome)
+        if parametros is None:
+            return None
+        if len(tipos) == len(parametros):
+            for k, tipo in enumerate(tipos):
+                novo = _juntar(parametros[k], tipo)
+                if novo != parametros[k]:
+                    parametros[k] = novo
+                    self._mudou = True
+        return self.retornos[nome]
+
+    def _juntar_retorno(self, nome, tipo):
+        novo = _juntar(self.retornos[nome], tipo)
+        if novo != self.retornos[nome]:
+            self.retornos[nome] = novo
+            self._mudou = True
+
+    # ------------------------------------------------------------------
+    # Expressões
+
+    def _tipo(self, ctx):
+        tipo = self._tipo_expressao(ctx)
+        if self._registrar and tipo is not None and tipo is not INDEFINIDO:
+            self.resolucao.tipos_expressoes[ctx] = tipo
+        return tipo
+
+    def _tipo_expressao(self, ctx):
+        child_count = ctx.getChildCount()
+
+        if child_count == 1:
+            filho = ctx.getChild(0)
+            if isinstance(filho, CParser.FunctionCallContext):
+                return self._chamada(filho)
+            if ctx.Number():
+                return REAL if '.' in ctx.Number().getText() else INTEIRO
+            if ctx.CharLiteral():
+                return CARACTERE
+            if ctx.Identifier():
+                return self._tipo_variavel(ctx.Identifier())
+            return None
+
+        if child_count == 2:
+            tipo = self._tipo(ctx.getChild(1))
+            return tipo if tipo in _NUMERICOS or tipo is INDEFINIDO else None
+
+        if child_count == 3 and ctx.getChild(0).getText() == '(':
+            return self._tipo(ctx.getChild(1))
+
+        if child_count == 3 and ctx.getChild(1).getText() == '.':
+            self._tipo(ctx.getChild(0))
+            return self._tipo_membro(ctx)
+
+        if child_count == 3:
+            op = ctx.getChild(1).getText()
+            esquerda = self._tipo(ctx.expression(0))
+            direita = self._tipo(ctx.expression(1))
+            if op in ('&&', '||', '<', '<=', '>', '>=', '==', '!='):
+                return INTEIRO
+            if esquerda is INDEFINIDO or direita is INDEFINIDO:
+                return INDEFINIDO
+            if esquerda not in _NUMERICOS or direita not in _NUMERICOS:
+                return None
+            if op == '/':
+                return REAL
+            return INTEIRO if esquerda == direita == INTEIRO else REAL
+
+        # Identifier ('[' expression ']')+
+        for indice in ctx.expression():
+            self._tipo(indice)
+        if child_count != 4:
+            return None
+        token = ctx.Identifier()
+        tipo = self._tipo_declarado(token)
+        chave = self._chave(token)
+        if not tipo.endswith("[]") or self._parametro(token) or chave in self._atribuidas or chave in self._livres:
+            return None
+        # Só arrays compactos (array.array, VetorChar) começam zerados; os
+        # demais têm None nas posições ainda não atribuídas.
+        elemento = representacao(tipo[:-2])
+        return elemento if elemento in (INTEIRO, REAL, CARACTERE) else None
+
+    def _parametro(self, token):
+        endereco = self.resolucao.enderecos.get(token)
+        return (endereco is not None and endereco.escopo == LOCAL
+                and endereco.indice < self._escopo.n_parametros)
+
+    def _tipo_variavel(self, token):
+        endereco = self.resolucao.enderecos.get(token)
+        if endereco is None:
+            return None
+        if endereco.escopo == MACRO:
+            constante, valor = self.macro(token)
+            if not constante:
+                return None
+            if isinstance(valor, str):
+                return CARACTERE
+            return REAL if isinstance(valor, float) else INTEIRO
+        chave = self._chave(token)
+        tipo = representacao(self._tipo_declarado(token))
+        if self._parametro(token):
+            argumentos = self.parametros[self._escopo.nome][endereco.indice]
+            tipo = _juntar(argumentos, tipo) if chave in self._atribuidas else argumentos
+        if chave in self._livres:
+            tipo = _juntar(tipo, self._livres[chave])
+        return tipo
+
+    def _tipo_membro(self, ctx):
+        # Só o membro escalar de uma union (u.x, com u declarada aqui) tem
+        # representação garantida: um campo de struct começa como None.
+        if ctx.getChild(0).getChildCount() != 1 or ctx.getChild(0).Identifier() is None:
+            return None
+        token = ctx.getChild(0).Identifier()
+        if self.resolucao.enderecos.get(token) is None or self._parametro(token):
+            return None
+        tipo = self._tipo_declarado(token)
+        if not tipo.startswith("union"):
+            return None
+        tipo_campo = self.unions.get(tipo[len("union"):].strip(), {}).get(ctx.getChild(2).getText())
+        return _representacao_membro(tipo_campo) if tipo_campo is not None else None
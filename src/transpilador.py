@@ -0,0 +1,1008 @@
+import keyword
+import re
+from operator import attrgetter
+from struct import error as ErroStruct
+
+from CParser import CParser
+from interpretador import Interpretador, retorno_padrao
+from resolvedor import valor_constante, macros_constantes
+from formatacao import compilar_printf, decodificar_literal
+from entrada import compilar_scanf
+from vetores import ajustar, armazenar, comporta
+from registros import Registro, Uniao, cadeia_de_campos, membro, tipo_do_caminho
+from tipagem import IDENTIDADE, PARA_INTEIRO, PARA_REAL, conversao
+from inicializacao import resolver_e_analisar
+
+# Backend que traduz o programa C para código-fonte Python e o executa com
+# compile()/exec: cada functionDef vira uma função Python de verdade, com as
+# variáveis locais como variáveis locais do Python e os laços como laços
+# nativos. O Interpretador continua sendo a semântica de referência; aqui ele
+# só fornece as rotinas auxiliares (conversões, declarações, entrada/saída).
+#
+# Prefixos dos nomes gerados: f_ (funções), v_ (locais), g_ (globais) e
+# m_ (#define), para não colidir com palavras reservadas do Python nem com
+# as rotinas auxiliares, que começam com '_'.
+
+OPERADORES_BINARIOS = {
+    '+': '+', '-': '-', '*': '*', '/': '/', '%': '%',
+    '<': '<', '<=': '<=', '>': '>', '>=': '>=', '==': '==', '!=': '!=',
+}
+
+OPERADORES_LOGICOS = {'&&': 'and', '||': 'or'}
+
+
+class _Funcao:
+    def __init__(self, nome, tipo, parametros, tipos_parametros):
+        self.nome = nome
+        self.tipo = tipo
+        self.parametros = parametros
+        self.tipos_parametros = tipos_parametros
+
+
+class Transpilador:
+    def __init__(self, nome_arquivo="<c>"):
+        self.nome_arquivo = nome_arquivo
+        self._funcoes = {}
+        self._globais = {}
+        self._macros = set()
+        self._expressoes_macros = {}
+        self._constantes_modulo = []
+        self._linhas = []
+        self._nivel = 0
+        self._contador = 0
+        self._structs = {}
+        self._unions = {}
+        self._tipos = {}
+        self._garantidos = {}
+        self._guardas = {}
+        self._lacos_rapidos = set()
+        self._dobradas = {}
+        self._expansoes = {}
+        self._caudas = {}
+        self._escopos = {}
+        self._reinicia = False
+        # Função com chamada em cauda dentro de laço ou switch, e quantos
+        # laços Python envolvem o comando atual dentro do corpo.
+        self._reinicia_em_laco = False
+        self._profundidade = 0
+        # Parâmetro -> nome Python do argumento, no corpo de uma função
+        # expandida em linha.
+        self._ligados = {}
+
+    def transpilar(self, tree, resolucao=None):
+        # `resolucao` (de inicializacao.resolver_e_analisar) dá o tipo
+        # estático das expressões, que decide a conversão de cada atribuição,
+        # os acessos a array que dispensam a verificação de índice e as
+        # expressões já calculadas na carga.
+        if resolucao is None:
+            resolucao = resolver_e_analisar(tree)
+        self._tipos = resolucao.tipos_expressoes
+        self._garantidos = resolucao.indices_garantidos
+        self._guardas = resolucao.guardas
+        self._dobradas = resolucao.constantes
+        self._expansoes = resolucao.expansoes
+        self._caudas = resolucao.caudas
+        self._escopos = resolucao.funcoes
+        structs = self._structs
+        unions = self._unions
+        definicoes = {}
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.FunctionDefContext):
+                nome = filho.Identifier().getText()
+                parametros = []
+                tipos_parametros = []
+                if filho.paramList() is not None:
+                    parametros = [token.getText() for token in filho.paramList().Identifier()]
+                    tipos_parametros = [t.getText() for t in filho.paramList().type_()]
+                self._funcoes[nome] = _Funcao(nome, filho.type_().getText(), parametros, tipos_parametros)
+                definicoes[nome] = filho
+            elif isinstance(filho, CParser.StructDefContext):
+                structs[filho.Identifier().getText()] = self._campos(filho, "struct")
+            elif isinstance(filho, CParser.UnionDefContext):
+                unions[filho.Identifier().getText()] = self._campos(filho, "union")
+
+        self._escrever(f"# Gerado por transpilador.py a partir de {self.nome_arquivo}. Não editar.")
+        self._escrever(f"_STRUCTS = {structs!r}")
+        self._escrever(f"_UNIONS = {unions!r}")
+        self._escrever("_registrar(_STRUCTS, _UNIONS)")
+        self._escrever(f"_MEMORIZAVEIS = {tuple(sorted(resolucao.memorizaveis))!r}")
+        posicao_constantes = len(self._linhas)
+        self._escrever("")
+
+        self._iniciar_funcao(None)
+        inicio = len(self._linhas)
+        self._escrever("def _inicializar():")
+        self._nivel += 1
+        for i in range(tree.getChildCount()):
+            filho = tree.getChild(i)
+            if isinstance(filho, CParser.StatementContext):
+                self._statement(filho)
+            elif isinstance(filho, CParser.DirectiveContext):
+                self._diretiva(filho)
+        self._fechar_funcao(inicio)
+
+        for nome, ctx in definicoes.items():
+            self._funcao(self._funcoes[nome], ctx)
+
+        # Tabelas de switch, planos de printf e caminhos de campos, criados uma
+        # vez na carga do módulo.
+        self._linhas[posicao_constantes:posicao_constantes] = self._constantes_modulo
+        return "\n".join(self._linhas) + "\n"
+
+    def _campos(self, ctx, tipo_registro):
+        campos = {}
+        nome_registro = ctx.Identifier().getText()
+        for vd in ctx.varDecl():
+            nome_campo = vd.Identifier().getText()
+            if nome_campo in campos:
+                raise Exception(f"Campo '{nome_campo}' duplicado na {tipo_registro} '{nome_registro}'.")
+            campos[nome_campo] = vd.type_().getText()
+        return campos
+
+    # ------------------------------------------------------------------
+    # Geração
+    # ------------------------------------------------------------------
+
+    def _escrever(self, linha):
+        self._linhas.append("    " * self._nivel + linha)
+
+    def _temporario(self, prefixo):
+        self._contador += 1
+        return f"_{prefixo}{self._contador}"
+
+    def _iniciar_funcao(self, funcao):
+        self._atual = funcao
+        self._locais = {}
+        self._declarados = set()
+        self._parametros = set()
+        self._globais_atribuidas = set()
+        self._reinicia = False
+        self._reinicia_em_laco = False
+        self._profundidade = 0
+        if funcao is not None:
+            self._parametros.update(funcao.parametros)
+            for nome, tipo in zip(funcao.parametros, funcao.tipos_parametros):
+                self._locais[nome] = tipo
+                self._declarados.add(nome)
+
+    def _fechar_funcao(self, inicio):
+        if self._globais_atribuidas:
+            self._linhas.insert(inicio + 1, "    global " + ", ".join(sorted(self._globais_atribuidas)))
+        if not self._linhas[-1].startswith("    " * self._nivel + "return") and self._linhas[-1] != "    " * self._nivel + "continue":
+            padrao = retorno_padrao(self._atual.tipo) if self._atual is not None else None
+            self._escrever(f"return {padrao!r}")
+        self._nivel = 0
+        self._escrever("")
+
+    def _funcao(self, funcao, ctx):
+        self._iniciar_funcao(funcao)
+        inicio = len(self._linhas)
+        parametros = ", ".join("v_" + p for p in funcao.parametros)
+        self._escrever(f"def f_{funcao.nome}({parametros}):")
+        self._nivel += 1
+        # Chamadas em cauda a si mesma (cauda.py) viram `continue` de um
+        # laço em volta do corpo. Dentro de laços e switch, que também são
+        # laços Python, a chamada liga _reiniciar e sai com break; depois de
+        # cada laço, _reiniciar leva ao break do laço de fora ou, no nível do
+        # corpo, ao continue.
+        caudas = [cauda for cauda in self._caudas.values() if cauda.definicao is ctx]
+        self._reinicia = bool(caudas)
+        self._reinicia_em_laco = any(cauda.em_laco for cauda in caudas)
+        if self._reinicia:
+            self._escrever("while True:")
+            self._nivel += 1
+            if self._reinicia_em_laco:
+                self._escrever("_reiniciar = False")
+            escopo = self._escopos[funcao.nome]
+            locais = ", ".join("v_" + nome for nome in escopo.nomes[escopo.n_parametros:])
+            if locais and not all(cauda.limpo for cauda in caudas):
+                # Alguma leitura pode encontrar a variável sem valor: a cada
+                # volta os locais são desligados, como o slot vazio dos
+                # outros motores (ligar antes faz o del nunca falhar).
+                self._escrever(f"{locais.replace(', ', ' = ')} = None")
+                self._escrever(f"del {locais}")
+        self._bloco(ctx.block())
+        self._fechar_funcao(inicio)
+
+    def _em_escopo_global(self):
+        return self._atual is None
+
+    def _resolver(self, nome):
+        if not self._em_escopo_global() and nome in self._locais:
+            return self._ligados.get(nome, "v_" + nome), self._locais[nome]
+        if nome in self._globais:
+            return "g_" + nome, self._globais[nome]
+        return None
+
+    def _alvo(self, nome):
+        endereco = self._resolver(nome)
+        if endereco is not None and endereco[0].startswith("g_"):
+            self._globais_atribuidas.add(endereco[0])
+        return endereco
+
+    def _erro(self, mensagem):
+        return f"_erro({mensagem!r})"
+
+    def _declarar(self, nome, tipo):
+        if self._em_escopo_global():
+            declarados, tabela, prefixo = self._globais, self._globais, "g_"
+        else:
+            declarados, tabela, prefixo = self._declarados, self._locais, "v_"
+        if nome in declarados:
+            self._escrever(self._erro(f"Variável '{nome}' já foi declarada."))
+        if not self._em_escopo_global():
+            self._declarados.add(nome)
+        tabela.setdefault(nome, tipo)
+        if prefixo == "g_":
+            self._globais_atribuidas.add(prefixo + nome)
+        return prefixo + nome
+
+    # ------------------------------------------------------------------
+    # Comandos
+    # ------------------------------------------------------------------
+
+    def _diretiva(self, ctx):
+        if ctx.getChild(0).getText() != '#define':
+            return
+        nome = ctx.Identifier().getText()
+        self._macros.add(nome)
+        self._expressoes_macros[nome] = ctx.expression()
+        self._globais_atribuidas.add("m_" + nome)
+        valor = self._expressao(ctx.expression()) if ctx.expression() is not None else "None"
+        self._escrever(f"m_{nome} = {valor}")
+
+    def _bloco(self, ctx):
+        for stmt in ctx.statement():
+            self._statement(stmt)
+
+    def _corpo(self, ctx):
+        # Corpo de if/laço: garante pelo menos uma linha no bloco Python.
+        self._nivel += 1
+        tamanho = len(self._linhas)
+        self._statement(ctx)
+        if len(self._linhas) == tamanho:
+            self._escrever("pass")
+        self._nivel -= 1
+
+    def _statement(self, ctx):
+        filho = ctx.getChild(0)
+
+        if isinstance(filho, CParser.VarDeclContext):
+            self._var_decl(filho)
+        elif isinstance(filho, CParser.AssignmentContext):
+            self._assignment(filho)
+        elif isinstance(filho, CParser.IfStatementContext):
+            self._escrever(f"if {self._condicao(filho.expression())}:")
+            self._corpo(filho.statement(0))
+            if filho.statement(1) is not None:
+                self._escrever("else:")
+                self._corpo(filho.statement(1))
+        elif isinstance(filho, CParser.WhileStatementContext):
+            def laco():
+                self._escrever(f"while {self._condicao(filho.expression())}:")
+                self._corpo(filho.statement())
+            self._laco_python(lambda: self._laco_guardado(filho, laco))
+        elif isinstance(filho, CParser.DoWhileStatementContext):
+            def laco():
+                self._escrever("while True:")
+                self._corpo(filho.statement())
+                self._nivel += 1
+                self._escrever(f"if not ({self._condicao(filho.expression())}):")
+                self._escrever("    break")
+                self._nivel -= 1
+            self._laco_python(laco)
+        elif isinstance(filho, CParser.ForStatementContext):
+            self._for(filho)
+        elif isinstance(filho, CParser.SwitchStatementContext):
+            self._laco_python(lambda: self._switch(filho))
+        elif isinstance(filho, CParser.FunctionCallContext):
+            self._escrever(self._chamada(filho))
+        elif isinstance(filho, CParser.InputOutputStatementContext):
+            self._entrada_saida(filho)
+        elif isinstance(filho, CParser.BlockContext):
+            self._bloco(filho)
+        elif isinstance(filho, CParser.BreakStatementContext):
+            self._escrever("break")
+        elif filho.getText() == "return":
+            self._return(ctx)
+
+    def _laco_python(self, emitir):
+        self._profundidade += 1
+        emitir()
+        self._profundidade -= 1
+        if self._reinicia_em_laco:
+            self._escrever(f"if _reiniciar: {'break' if self._profundidade else 'continue'}")
+
+    def _return(self, ctx):
+        cauda = self._caudas.get(ctx)
+        if cauda is not None and self._reinicia:
+            # Os argumentos são todos avaliados antes de algum parâmetro mudar.
+            if self._atual.parametros:
+                destinos = ", ".join("v_" + nome for nome in self._atual.parametros)
+                self._escrever(f"{destinos} = {', '.join(self._expressao(e) for e in cauda.argumentos)}")
+            if self._profundidade:
+                self._escrever("_reiniciar = True")
+                self._escrever("break")
+            else:
+                self._escrever("continue")
+            return
+        if ctx.expression() is None:
+            padrao = retorno_padrao(self._atual.tipo) if self._atual is not None else None
+            self._escrever(f"return {padrao!r}")
+            return
+        valor = self._expressao(ctx.expression())
+        padrao = retorno_padrao(self._atual.tipo) if self._atual is not None else None
+        if padrao is None or ctx.expression() in self._tipos:
+            # Um valor tipado nunca é None.
+            self._escrever(f"return {valor}")
+        else:
+            self._escrever(f"return _r if (_r := {valor}) is not None else {padrao!r}")
+
+    def _var_decl(self, ctx):
+        tipo = ctx.type_().getText()
+        nome = ctx.Identifier().getText()
+
+        is_array = False
+        tam_array = None
+        if ctx.arraySize():
+            is_array = True
+            if ctx.arraySize().Number() is not None:
+                tam_array = int(ctx.arraySize().Number().getText())
+
+        tem_init = ctx.init() is not None
+        valor_inicial = "None"
+        if tem_init:
+            init = ctx.init()
+            if init.initializerList() is not None:
+                valor_inicial = "[" + ", ".join(self._expressao(e) for e in init.initializerList().expression()) + "]"
+            else:
+                valor_inicial = self._expressao(init.expression())
+
+        destino = self._declarar(nome, tipo + "[]" if is_array else tipo)
+        if is_array or tipo.startswith("struct") or tipo.startswith("union"):
+            self._escrever(f"{destino} = _decl({tipo!r}, {nome!r}, {is_array!r}, {tam_array!r}, {valor_inicial}, {tem_init!r})")
+        elif tem_init:
+            self._escrever(f"{destino} = {self._convertido(tipo, ctx.init().expression(), valor_inicial, nome)}")
+
+    def _convertido(self, tipo, ctx, valor, rotulo):
+        # Expressão Python do valor de `ctx` (código `valor`) convertido para
+        # `tipo`, com a conversão escolhida pela tipagem.
+        modo = conversao(tipo, self._tipos.get(ctx))
+        if modo == IDENTIDADE:
+            return valor
+        if modo == PARA_REAL:
+            return f"float({valor})"
+        if modo == PARA_INTEIRO:
+            return f"_truncar({valor}, {rotulo!r})"
+        return f"_conv({tipo!r}, {valor}, {rotulo!r})"
+
+    def _assignment(self, ctx):
+        if (ctx.getChildCount() >= 6
+                and ctx.getChild(1).getText() == '['
+                and ctx.getChild(3).getText() == ']'
+                and ctx.getChild(4).getText() == '='):
+            array_name = ctx.getChild(0).getText()
+            indice = self._expressao(ctx.getChild(2))
+            valor = self._expressao(ctx.getChild(5))
+            endereco = self._resolver(array_name)
+            if endereco is None:
+                self._escrever(self._erro(f"Variável '{array_name}' não foi declarada."))
+            elif not endereco[1].endswith("[]"):
+                self._escrever(self._erro(f"Variável '{array_name}' não é um array, mas foi usada como array."))
+            else:
+                tipo_base = endereco[1][:-2]
+                modo = conversao(tipo_base, self._tipos.get(ctx.getChild(5)))
+                if modo == IDENTIDADE:
+                    tipo_base = None
+                elif modo == PARA_REAL:
+                    valor, tipo_base = f"float({valor})", None
+                if tipo_base is None and self._indice_garantido(ctx):
+                    self._escrever(f"_armazenar({endereco[0]}, {indice}, {valor})")
+                else:
+                    self._escrever(f"_escrever({endereco[0]}, {indice}, {valor}, {tipo_base!r}, {array_name!r})")
+            return
+
+        identifiers = [token.getText() for token in ctx.Identifier()]
+        nome_var = identifiers[0]
+        valor = self._expressao(ctx.expression(0))
+        endereco = self._alvo(nome_var) if len(identifiers) == 1 else self._resolver(nome_var)
+        if endereco is None:
+            self._escrever(self._erro(f"Variável '{nome_var}' não foi declarada."))
+            return
+        destino, tipo = endereco
+
+        if len(identifiers) == 1:
+            if tipo.startswith("union"):
+                self._escrever(self._erro("Atribuição direta de union não permitida; use a atribuição de campo (ex.: u.campo = valor)."))
+            else:
+                self._escrever(f"{destino} = {self._convertido(tipo, ctx.expression(0), valor, nome_var)}")
+            return
+
+        if not (tipo.startswith("struct") or tipo.startswith("union")):
+            self._escrever(self._erro("Atribuição inválida: acesso a campo apenas para structs e unions."))
+        elif tipo.startswith("union") and len(identifiers) != 2:
+            self._escrever(self._erro("Acesso a sub-campos de union não suportado."))
+        elif self._membro_escalar(tipo, identifiers[1]):
+            nome_union = tipo[len("union"):].strip()
+            rotulo = f"{nome_var}.{identifiers[1]}"
+            tipo_campo = self._unions[nome_union][identifiers[1]]
+            verificar = conversao(tipo_campo, self._tipos.get(ctx.expression(0))) not in (IDENTIDADE, PARA_REAL, PARA_INTEIRO)
+            if not verificar:
+                valor = self._convertido(tipo_campo, ctx.expression(0), valor, rotulo)
+            escrita = self._temporario("ME")
+            self._constantes_modulo.append(
+                f"{escrita} = _escrita_membro({nome_union!r}, {identifiers[1]!r}, {nome_var!r}, {verificar!r})")
+            self._escrever(f"{escrita}({destino}, {valor})")
+        else:
+            caminho = tuple(identifiers[1:-1])
+            tipo_campo = tipo_do_caminho(self._structs, tipo, identifiers[1:])
+            if tipo_campo is None:
+                self._escrever(f"_escrever_campo({destino}, {valor}, {caminho!r}, {identifiers[-1]!r}, {nome_var!r})")
+            elif not caminho and self._acesso_direto(nome_var, identifiers[1:]):
+                rotulo = f"{nome_var}.{identifiers[-1]}"
+                self._escrever(f"{destino}.{identifiers[-1]} = {self._convertido(tipo_campo, ctx.expression(0), valor, rotulo)}")
+            else:
+                # tipo_verificado None: valor já convertido aqui.
+                rotulo = f"{nome_var}.{identifiers[-1]}"
+                tipo_verificado = tipo_campo
+                if conversao(tipo_campo, self._tipos.get(ctx.expression(0))) in (IDENTIDADE, PARA_REAL, PARA_INTEIRO):
+                    valor, tipo_verificado = self._convertido(tipo_campo, ctx.expression(0), valor, rotulo), None
+                escrita = self._temporario("CE")
+                self._constantes_modulo.append(
+                    f"{escrita} = _escrita_caminho({caminho!r}, {identifiers[-1]!r}, {tipo_verificado!r}, {nome_var!r})")
+                self._escrever(f"{escrita}({destino}, {valor})")
+
+    def _membro_escalar(self, tipo, campo):
+        # u.x com u de uma union definida aqui e x de tipo escalar.
+        if not tipo.startswith("union"):
+            return False
+        campos = self._unions.get(tipo[len("union"):].strip(), {})
+        return campo in campos and membro(campos[campo]) is not None
+
+    def _acesso_direto(self, nome_var, campos):
+        # Campo de struct escrito como atributo Python (p.x) no código gerado:
+        # a variável é uma struct declarada aqui (um parâmetro pode receber
+        # qualquer valor) e os nomes dos campos são atributos válidos.
+        return (nome_var not in self._parametros
+                and all(campo.isidentifier() and not keyword.iskeyword(campo) for campo in campos))
+
+    def _for_header(self, ctx):
+        nome = ctx.Identifier().getText()
+        valor = self._expressao(ctx.expression())
+        endereco = self._alvo(nome)
+        if endereco is None:
+            self._escrever(self._erro(f"Variável '{nome}' não foi declarada."))
+        else:
+            self._escrever(f"{endereco[0]} = {valor}")
+
+    def _for(self, ctx):
+        partes = [None, None, None]
+        posicao = 0
+        for i in range(2, ctx.getChildCount() - 2):
+            filho = ctx.getChild(i)
+            if filho.getText() == ';':
+                posicao += 1
+            else:
+                partes[posicao] = filho
+        inicio, condicao, passo = partes
+
+        if isinstance(inicio, CParser.VarDeclContext):
+            self._var_decl(inicio)
+        elif inicio is not None:
+            self._for_header(inicio)
+
+        def laco():
+            self._escrever(f"while {self._condicao(condicao) if condicao is not None else 'True'}:")
+            self._corpo(ctx.statement())
+            if passo is not None:
+                self._nivel += 1
+                self._for_header(passo)
+                self._nivel -= 1
+        self._laco_python(lambda: self._laco_guardado(ctx, laco))
+
+    def _laco_guardado(self, laco, emitir):
+        # Laço com guardas (limites.py): emitido duas vezes, sob um if que
+        # testa as guardas na entrada. Um nome ainda sem valor na guarda só
+        # leva à cópia com as verificações, que reporta o erro onde o C faria.
+        guardas = self._guardas.get(laco)
+        testes = []
+        for guarda in guardas or ():
+            vetor = self._resolver(guarda.vetor.getText())
+            limite = (repr(guarda.limite),) if type(guarda.limite) is int else self._resolver(guarda.limite.getText())
+            if vetor is None or limite is None:
+                guardas = None
+                break
+            testes.append(f"_comporta({vetor[0]}, {limite[0]}, {guarda.acrescimo})")
+        if not guardas:
+            emitir()
+            return
+
+        rapido = self._temporario("guardas")
+        self._escrever("try:")
+        self._escrever(f"    {rapido} = {' and '.join(testes)}")
+        self._escrever("except NameError:")
+        self._escrever(f"    {rapido} = False")
+        self._escrever(f"if {rapido}:")
+        declarados = set(self._declarados)
+        self._nivel += 1
+        self._lacos_rapidos.add(laco)
+        emitir()
+        self._lacos_rapidos.discard(laco)
+        self._nivel -= 1
+        self._escrever("else:")
+        # As declarações do corpo são geradas de novo na segunda cópia.
+        self._declarados = declarados
+        self._nivel += 1
+        emitir()
+        self._nivel -= 1
+
+    def _indice_garantido(self, acesso):
+        laco = self._garantidos.get(acesso)
+        return laco is not None and (laco not in self._guardas or laco in self._lacos_rapidos)
+
+    def _rotulo_constante(self, ctx):
+        if ctx in self._dobradas:
+            return True, self._dobradas[ctx]
+        macro = macros_constantes(self._expressoes_macros)
+
+        def macro_visivel(token):
+            if not self._em_escopo_global() and token.getText() in self._locais:
+                return False, None
+            return macro(token)
+        return valor_constante(ctx, macro_visivel)
+
+    def _switch(self, ctx):
+        # Os rótulos constantes vão para um dicionário do módulo {rótulo:
+        # índice do bloco}, consultado uma vez; os blocos seguem em ordem,
+        # cada um guardado por "índice <= i", de modo que um bloco sem break
+        # continua no seguinte (fall-through de C). O switch é um laço de uma
+        # só volta, para que o 'break' saia apenas dele.
+        blocos = [ctx.getChild(i) for i in range(ctx.getChildCount())
+                  if isinstance(ctx.getChild(i), (CParser.CaseBlockContext, CParser.DefaultBlockContext))]
+        padrao = len(blocos)
+        for i, bloco in enumerate(blocos):
+            if isinstance(bloco, CParser.DefaultBlockContext):
+                padrao = i
+                break
+        rotulos = {}
+        nao_constantes = []
+        for i, bloco in enumerate(blocos):
+            if isinstance(bloco, CParser.CaseBlockContext):
+                constante, valor = self._rotulo_constante(bloco.caseLabel().expression())
+                if constante:
+                    rotulos.setdefault(valor, i)
+                else:
+                    nao_constantes.append((i, bloco))
+
+        valor = self._temporario("sw")
+        indice = self._temporario("k")
+        tabela = self._temporario("SW")
+        self._constantes_modulo.append(f"{tabela} = {rotulos!r}")
+        self._escrever(f"{valor} = {self._expressao(ctx.expression())}")
+        if not nao_constantes:
+            self._escrever(f"{indice} = {tabela}.get({valor}, {padrao})")
+        else:
+            self._escrever(f"{indice} = {tabela}.get({valor})")
+            self._escrever(f"if {indice} is None:")
+            self._nivel += 1
+            for n, (i, bloco) in enumerate(nao_constantes):
+                rotulo = self._expressao(bloco.caseLabel().expression())
+                self._escrever(f"{'if' if n == 0 else 'elif'} {valor} == {rotulo}:")
+                self._escrever(f"    {indice} = {i}")
+            self._escrever("else:")
+            self._escrever(f"    {indice} = {padrao}")
+            self._nivel -= 1
+
+        self._escrever("while True:")
+        self._nivel += 1
+        for i, bloco in enumerate(blocos):
+            self._escrever(f"if {indice} <= {i}:")
+            self._nivel += 1
+            tamanho = len(self._linhas)
+            for stmt in bloco.statement():
+                self._statement(stmt)
+            if bloco.breakStatement() is not None:
+                self._escrever("break")
+            if len(self._linhas) == tamanho:
+                self._escrever("pass")
+            self._nivel -= 1
+        self._escrever("break")
+        self._nivel -= 1
+
+    def _entrada_saida(self, ctx):
+        comando = ctx.getChild(0).getText()
+
+        if comando == "printf":
+            formato = decodificar_literal(ctx.StringLiteral().getText())
+            plano = compilar_printf(formato)
+            if not ctx.expression() and plano.erro is None:
+                self._escrever(f"_escrever_saida({plano.formato!r})")
+                return
+            nome_plano = self._temporario("PF")
+            self._constantes_modulo.append(f"{nome_plano} = _plano_printf({formato!r})")
+            argumentos = ", ".join(self._expressao(e) for e in ctx.expression())
+            self._escrever(f"_escrever_saida({nome_plano}.formatar([{argumentos}]))")
+
+        elif comando == "scanf":
+            formato = decodificar_literal(ctx.StringLiteral().getText())
+            plano = compilar_scanf(formato)
+            parametros = ctx.scanfParam()
+            if plano.erro is not None:
+                self._escrever(self._erro(plano.erro))
+                return
+            if len(parametros) != len(plano.conversoes):
+                self._escrever(self._erro("Erro: Número de variáveis não corresponde ao formato."))
+                return
+            nome_plano = self._temporario("SC")
+            self._constantes_modulo.append(f"{nome_plano} = _plano_scanf({formato!r}).conversoes")
+            for posicao, param in enumerate(parametros):
+                conversao = f"{nome_plano}[{posicao}]"
+                nome = param.Identifier().getText()
+                endereco = self._alvo(nome)
+                if endereco is None:
+                    self._escrever(self._erro(f"Variável '{nome}' não foi declarada."))
+                    continue
+                destino, tipo = endereco
+                if param.expression() is None:
+                    atual = destino if tipo.endswith("[]") else "None"
+                    self._escrever(f"{destino} = _scanf({conversao}, {tipo!r}, {atual}, {nome!r})")
+                elif not tipo.endswith("[]"):
+                    self._escrever(self._erro(f"Variável '{nome}' não é um array, mas foi usada com indexação no scanf."))
+                else:
+                    indice = self._expressao(param.expression())
+                    self._escrever(f"_scanf_elemento({conversao}, {destino}, {indice}, {tipo[:-2]!r}, {nome!r})")
+
+        elif comando == "gets":
+            nome = ctx.Identifier().getText()
+            endereco = self._alvo(nome)
+            if endereco is None:
+                self._escrever(self._erro(f"Variável '{nome}' não foi declarada."))
+                return
+            self._escrever(f"{endereco[0]} = _gets({endereco[1]!r}, {endereco[0]}, {nome!r})")
+
+        else:
+            if ctx.expression(0) is not None:
+                texto = self._expressao(ctx.expression(0))
+            else:
+                texto = repr(decodificar_literal(ctx.StringLiteral().getText()))
+            self._escrever(f"_puts({texto})")
+
+    def _chamada(self, ctx):
+        nome = ctx.Identifier().getText()
+        if nome not in self._funcoes:
+            return self._erro(f"Função '{nome}' não foi definida.")
+        funcao = self._funcoes[nome]
+        if ctx in self._expansoes:
+            return self._expansao(self._expansoes[ctx], ctx.argumentList().expression() if ctx.argumentList() else [])
+        argumentos = []
+        if ctx.argumentList() is not None:
+            argumentos = [self._expressao(e) for e in ctx.argumentList().expression()]
+        if len(argumentos) != len(funcao.parametros):
+            mensagem = f"Função '{nome}' espera {len(funcao.parametros)} parâmetros, mas {len(argumentos)} foram passados."
+            return f"_erro({mensagem!r}, {', '.join(argumentos)})"
+        return f"f_{nome}({', '.join(argumentos)})"
+
+    def _expansao(self, expandida, argumentos):
+        # Chamada de função folha expandida em linha (expansao.py): cada
+        # argumento vai, em ordem, para uma variável Python própria deste
+        # ponto de chamada (com :=), e o return da função é gerado com os
+        # parâmetros ligados a essas variáveis. Um argumento dobrado na carga
+        # entra no corpo como literal.
+        ligados = {}
+        ligacoes = []
+        for k, (argumento, direto) in enumerate(zip(argumentos, expandida.diretos)):
+            nome, tipo = expandida.escopo.nomes[k], expandida.escopo.tipos[k]
+            if direto and self._locais.get(argumento.Identifier().getText()) == tipo:
+                ligados[nome] = self._resolver(argumento.Identifier().getText())[0]
+                continue
+            if argumento in self._dobradas:
+                ligados[nome] = f"({self._dobradas[argumento]!r})"
+                continue
+            ligados[nome] = self._temporario("a")
+            ligacoes.append(f"({ligados[nome]} := {self._expressao(argumento)}) is {ligados[nome]}")
+
+        estado = self._locais, self._parametros, self._ligados
+        self._locais = dict(zip(expandida.escopo.nomes[:len(argumentos)], expandida.escopo.tipos))
+        self._parametros = set(self._locais)
+        self._ligados = ligados
+        try:
+            valor = self._expressao(expandida.corpo)
+        finally:
+            self._locais, self._parametros, self._ligados = estado
+        padrao = retorno_padrao(expandida.tipo)
+        if padrao is not None and not expandida.tipado:
+            valor = f"(_r if (_r := {valor}) is not None else {padrao!r})"
+        if not ligacoes:
+            return valor
+        # (t := argumento) is t é sempre verdadeiro: o `and` liga os
+        # argumentos em ordem e vale o último operando, sem montar tupla.
+        return f"({' and '.join(ligacoes)} and {valor})"
+
+    # ------------------------------------------------------------------
+    # Expressões
+    # ------------------------------------------------------------------
+
+    def _condicao(self, ctx):
+        # Condição de if/while/for: && e || viram o and/or do Python, que já
+        # fazem curto-circuito, sem o bool() de cada operação.
+        if ctx.getChildCount() == 3 and ctx not in self._dobradas:
+            op = ctx.getChild(1).getText()
+            if op in OPERADORES_LOGICOS:
+                return f"({self._condicao(ctx.expression(0))} {OPERADORES_LOGICOS[op]} {self._condicao(ctx.expression(1))})"
+            if ctx.getChild(0).getText() == '(':
+                return self._condicao(ctx.getChild(1))
+        return self._expressao(ctx)
+
+    def _expressao(self, ctx):
+        # Expressão dobrada na carga (constantes.py): o literal do valor.
+        if ctx in self._dobradas:
+            return repr(self._dobradas[ctx])
+
+        child_count = ctx.getChildCount()
+
+        if child_count == 1 and isinstance(ctx.getChild(0), CParser.FunctionCallContext):
+            return self._chamada(ctx.getChild(0))
+
+        if child_count == 1 and ctx.Identifier():
+            nome = ctx.Identifier().getText()
+            local = not self._em_escopo_global() and nome in self._locais
+            if nome in self._macros and not local:
+                return "m_" + nome
+            endereco = self._resolver(nome)
+            if endereco is None:
+                return self._erro(f"Variável '{nome}' não foi declarada.")
+            return endereco[0]
+
+        if child_count == 3 and ctx.getChild(1).getText() == '.':
+            cadeia = cadeia_de_campos(ctx)
+            if cadeia is not None:
+                nome, campos = cadeia[0].getText(), cadeia[1]
+                local = not self._em_escopo_global() and nome in self._locais
+                endereco = self._resolver(nome) if nome not in self._macros or local else None
+                if endereco is not None and tipo_do_caminho(self._structs, endereco[1], campos) is not None:
+                    if self._acesso_direto(nome, campos):
+                        return endereco[0] + "." + ".".join(campos)
+                    leitura = self._temporario("CL")
+                    self._constantes_modulo.append(f"{leitura} = _caminho({'.'.join(campos)!r})")
+                    return f"{leitura}({endereco[0]})"
+                if endereco is not None and len(campos) == 1 and self._membro_escalar(endereco[1], campos[0]):
+                    leitura = self._temporario("ML")
+                    self._constantes_modulo.append(
+                        f"{leitura} = _leitura_membro({endereco[1][len('union'):].strip()!r}, {campos[0]!r})")
+                    return f"{leitura}({endereco[0]})"
+            return f"_campo({self._expressao(ctx.getChild(0))}, {ctx.getChild(2).getText()!r})"
+
+        if child_count == 3:
+            op = ctx.getChild(1).getText()
+            if op in OPERADORES_BINARIOS:
+                return f"({self._expressao(ctx.expression(0))} {OPERADORES_BINARIOS[op]} {self._expressao(ctx.expression(1))})"
+            if op in OPERADORES_LOGICOS:
+                return f"bool({self._condicao(ctx)})"
+
+        if (child_count == 4 and ctx.getChild(0).getSymbol() is not None
+                and ctx.getChild(1).getText() == '[' and ctx.getChild(3).getText() == ']'):
+            array_name = ctx.getChild(0).getText()
+            indice = self._expressao(ctx.getChild(2))
+            endereco = self._resolver(array_name)
+            if endereco is None:
+                return self._erro(f"Variável '{array_name}' não foi declarada.")
+            if not endereco[1].endswith("[]"):
+                return self._erro(f"Variável '{array_name}' não é um array, mas foi usada como array.")
+            if self._indice_garantido(ctx):
+                return f"{endereco[0]}[{indice}]"
+            return f"_ler({endereco[0]}, {indice}, {array_name!r})"
+
+        if ctx.Number():
+            texto = ctx.Number().getText()
+            return repr(float(texto) if '.' in texto else int(texto))
+
+        if ctx.StringLiteral():
+            return repr(decodificar_literal(ctx.StringLiteral().getText()))
+
+        if ctx.CharLiteral():
+            return repr(ctx.CharLiteral().getText().strip("'"))
+
+        if child_count == 3 and ctx.getChild(0).getText() == '(' and ctx.getChild(2).getText() == ')':
+            return self._expressao(ctx.getChild(1))
+
+        if child_count == 2:
+            if ctx.getChild(0).getText() == '-':
+                return f"(-{self._expressao(ctx.getChild(1))})"
+            if ctx.getChild(0).getText() == '!':
+                return f"(not {self._expressao(ctx.getChild(1))})"
+
+        return "None"
+
+
+def _ambiente(interp):
+    def _erro(mensagem, *argumentos):
+        raise Exception(mensagem)
+
+    def _ler(array_data, index_value, array_name):
+        if not isinstance(index_value, int):
+            raise Exception(f"Índice do array '{array_name}' não é inteiro: {index_value}")
+        if index_value < 0 or index_value >= len(array_data):
+            raise Exception(f"Índice {index_value} fora dos limites do array '{array_name}'.")
+        return array_data[index_value]
+
+    def _escrever(array_data, index_value, valor, tipo_base, array_name):
+        if not isinstance(index_value, int):
+            raise Exception(f"Índice do array '{array_name}' não é inteiro: {index_value}")
+        if index_value < 0 or index_value >= len(array_data):
+            raise Exception(f"Índice {index_value} fora dos limites do array '{array_name}'.")
+        if tipo_base is not None:
+            valor = interp._verificar_tipo_e_converter(tipo_base, valor, f"{array_name}[{index_value}]")
+        try:
+            array_data[index_value] = valor
+        except OverflowError:
+            array_data[index_value] = ajustar(array_data, valor)
+
+    def _decl(tipo, nome, is_array, tam_array, valor_inicial, tem_init):
+        return interp._valor_declarado(tipo, nome, is_array, tam_array, valor_inicial, tem_init)[1]
+
+    escrever = interp.saida.escrever
+
+    def _puts(s):
+        escrever(interp._texto_puts(s) + "\n")
+
+    def _caminho(campos):
+        # Leitura p.a.b resolvida na transpilação (parâmetro de tipo struct):
+        # um attrgetter, com a leitura verificada por nome se falhar.
+        obter = attrgetter(campos)
+        nomes = campos.split(".")
+        ler_caminho = interp._ler_caminho
+
+        def ler(registro):
+            if isinstance(registro, Registro):
+                try:
+                    return obter(registro)
+                except AttributeError:
+                    pass
+            return ler_caminho(registro, nomes)
+        return ler
+
+    def _escrita_caminho(caminho, nome_campo, tipo_campo, nome_var):
+        obter = attrgetter(".".join(caminho)) if caminho else None
+        converter = interp._verificar_tipo_e_converter
+        escrever_campo = interp._escrever_campo
+        rotulo = f"{nome_var}.{nome_campo}"
+
+        def escrita(destino, valor):
+            registro = destino
+            if obter is not None and isinstance(destino, Registro):
+                try:
+                    registro = obter(destino)
+                except AttributeError:
+                    registro = None
+            if isinstance(registro, Registro):
+                try:
+                    setattr(registro, nome_campo, valor if tipo_campo is None else converter(tipo_campo, valor, rotulo))
+                    return
+                except AttributeError:
+                    pass
+            escrever_campo(destino, valor, caminho, nome_campo, nome_var)
+        return escrita
+
+    def _leitura_membro(nome_union, campo):
+        # u.x com u de union e x escalar, resolvido na transpilação: um unpack
+        # no buffer quando u é de fato dessa union, já escrita.
+        classe = interp.tabela_simbolos.obter_union(nome_union)
+        m = classe.__membros__[campo]
+        desempacotar = m.desempacotar
+        caractere = m.caractere
+        ler_campo = interp._ler_campo
+
+        def leitura(uniao):
+            if type(uniao) is classe and uniao.objeto is None and uniao.ativo is not None:
+                valor = desempacotar(uniao)[0]
+                return chr(valor) if caractere else valor
+            return ler_campo(uniao, campo)
+        return leitura
+
+    def _escrita_membro(nome_union, campo, nome_var, verificar):
+        classe = interp.tabela_simbolos.obter_union(nome_union)
+        m = classe.__membros__[campo]
+        tipo_campo = m.tipo
+        empacotar = m.empacotar
+        caractere = m.caractere
+        converter = interp._verificar_tipo_e_converter
+        escrever_campo = interp._escrever_campo
+        rotulo = f"{nome_var}.{campo}"
+
+        def escrita(uniao, valor):
+            if type(uniao) is not classe:
+                if not isinstance(uniao, Uniao):
+                    raise Exception(f"Tentando acessar campo de algo que não é union: '{nome_var}'.")
+                escrever_campo(uniao, valor, (), campo, nome_var)
+                return
+            if verificar:
+                valor = converter(tipo_campo, valor, rotulo)
+            if caractere:
+                valor = ord(valor)
+            try:
+                empacotar(uniao, 0, valor)
+            except ErroStruct:
+                empacotar(uniao, 0, m.ajustar(valor))
+            uniao.objeto = None
+            uniao.ativo = campo
+        return escrita
+
+    def _registrar(structs, unions):
+        for nome, campos in structs.items():
+            interp.tabela_simbolos.adicionar_struct(nome, campos)
+        for nome, campos in unions.items():
+            interp.tabela_simbolos.adicionar_union(nome, campos)
+
+    def _scanf_elemento(conversao, array_data, index_value, tipo, nome):
+        valor = interp._ler_scanf_elemento(conversao, tipo, nome)
+        if index_value < 0 or index_value >= len(array_data):
+            raise Exception(f"Índice {index_value} fora dos limites do array '{nome}'.")
+        armazenar(array_data, index_value, valor)
+
+    return {
+        "__builtins__": __builtins__,
+        "_erro": _erro,
+        "_conv": interp._verificar_tipo_e_converter,
+        "_truncar": interp._truncar,
+        "_decl": _decl,
+        "_ler": _ler,
+        "_escrever": _escrever,
+        "_armazenar": armazenar,
+        "_comporta": comporta,
+        "_campo": interp._ler_campo,
+        "_escrever_campo": interp._escrever_campo,
+        "_caminho": _caminho,
+        "_escrita_caminho": _escrita_caminho,
+        "_leitura_membro": _leitura_membro,
+        "_escrita_membro": _escrita_membro,
+        "_registrar": _registrar,
+        "_escrever_saida": escrever,
+        "_plano_printf": compilar_printf,
+        "_plano_scanf": compilar_scanf,
+        "_puts": _puts,
+        "_scanf": interp._ler_scanf,
+        "_scanf_elemento": _scanf_elemento,
+        "_gets": interp._ler_gets,
+    }
+
+
+class ProgramaPython:
+    def __init__(self, fonte, nome_arquivo="<c>", interpretador=None, memorizacao=None):
+        # memorizacao: caches das funções puras (pureza.py) com --memoize.
+        self.fonte = fonte
+        self.interp = interpretador if interpretador is not None else Interpretador()
+        self.ambiente = _ambiente(self.interp)
+        # As structs e unions são registradas pelo próprio módulo
+        # (_registrar), antes das constantes que dependem das classes.
+        exec(compile(fonte, nome_arquivo + ".py", "exec"), self.ambiente)
+        # As funções chamam umas às outras pelo nome global, então trocar
+        # f_nome pela versão memorizada vale também para a recursão.
+        if memorizacao is not None:
+            for nome in self.ambiente["_MEMORIZAVEIS"]:
+                self.ambiente[f"f_{nome}"] = memorizacao.cache(nome).envolver(self.ambiente[f"f_{nome}"])
+
+    def tem_main(self):
+        return "f_main" in self.ambiente
+
+    def inicializar(self):
+        self._executar(self.ambiente["_inicializar"])
+
+    def executar_main(self):
+        self._executar(self.ambiente["f_main"])
+
+    def _executar(self, funcao):
+        # Variável C lida antes de receber valor = variável Python sem valor.
+        try:
+            funcao()
+        except NameError as e:
+            encontrado = re.search(r"'[vgm]_(\w+)'", str(e))
+            if encontrado is None:
+                raise
+            raise Exception(f"Erro: Variável '{encontrado.group(1)}' não foi inicializada antes do uso.") from None
+        except AttributeError as e:
+            # p.a.b escrito como atributo, com p.a ainda sem valor.
+            if not str(e).startswith("'NoneType' object has no attribute"):
+                raise
+            raise Exception("Operação de acesso a campo em valor não estruturado.") from None
+
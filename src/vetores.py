@@ -0,0 +1,134 @@
+from array import array
+
+# Armazenamento compacto dos arrays do programa interpretado. Em vez de uma
+# lista de objetos Python, um array de tipo numérico é um array.array com o
+# tamanho de elemento de C (4 bytes por int, 8 por double...) e um array de
+# char é um VetorChar, um bytearray (1 byte por caractere). Os elementos
+# continuam sendo lidos e escritos com v[i] e len(v), então os motores
+# indexam e verificam limites como antes; um array recém-declarado começa
+# zerado. Arrays de outros tipos (structs, unions...) continuam listas.
+
+CODIGOS_TIPO = {
+    "int": "i",
+    "short": "h",
+    "long": "q",
+    "long long": "q",
+    "unsigned": "I",
+    "unsigned int": "I",
+    "unsigned long": "Q",
+    "float": "f",
+    "double": "d",
+}
+
+_CARACTERES = [chr(codigo) for codigo in range(256)]
+
+
+class VetorChar(bytearray):
+    # Array de char: guarda o código (0-255) de cada caractere, mas v[i] e a
+    # iteração devolvem o caractere (str de tamanho 1), como os demais
+    # valores char do interpretador. Também guarda a string de C que contém
+    # (o texto até o primeiro '\0', já decodificado), que printf("%s") e puts
+    # reutilizam enquanto o array não for alterado.
+    __slots__ = ("_texto",)
+
+    def __init__(self, *argumentos):
+        bytearray.__init__(self, *argumentos)
+        self._texto = None
+
+    def texto(self):
+        texto = self._texto
+        if texto is None:
+            fim = self.find(0)
+            texto = self._texto = (self if fim < 0 else self[:fim]).decode("latin-1")
+        return texto
+
+    def __getitem__(self, indice):
+        if type(indice) is int:
+            return _CARACTERES[bytearray.__getitem__(self, indice)]
+        return bytearray.__getitem__(self, indice)
+
+    def __setitem__(self, indice, valor):
+        self._texto = None
+        if type(indice) is not int:
+            bytearray.__setitem__(self, indice, valor)
+            return
+        try:
+            bytearray.__setitem__(self, indice, ord(valor))
+        except ValueError:
+            raise Exception(f"Erro: Caractere '{valor}' fora da faixa de char (códigos 0 a 255).")
+
+    def __iter__(self):
+        return map(_CARACTERES.__getitem__, bytearray.__iter__(self))
+
+    def __repr__(self):
+        return f"VetorChar({bytes(self)!r})"
+
+
+def codificar(texto):
+    try:
+        return texto.encode("latin-1")
+    except UnicodeEncodeError as erro:
+        raise Exception(f"Erro: Caractere '{texto[erro.start]}' fora da faixa de char (códigos 0 a 255).")
+
+
+def ajustar(vetor, valor):
+    # Valor inteiro fora da faixa do elemento: reduzido módulo 2^bits, como na
+    # conversão para um tipo inteiro de C.
+    bits = vetor.itemsize * 8
+    valor &= (1 << bits) - 1
+    if vetor.typecode in "hilq" and valor >= 1 << (bits - 1):
+        valor -= 1 << bits
+    return valor
+
+
+def armazenar(vetor, indice, valor):
+    # v[i] = valor, ajustando um inteiro que não cabe no elemento.
+    try:
+        vetor[indice] = valor
+    except OverflowError:
+        vetor[indice] = ajustar(vetor, valor)
+
+
+def comporta(vetor, limite, acrescimo=0):
+    # Guarda de laço (limites.py): `vetor` é mesmo um array e os índices
+    # abaixo de `limite + acrescimo` estão nele. Valores inesperados (slot
+    # vazio, limite float) só fazem o laço seguir pelo corpo com verificações.
+    return type(limite) is int and isinstance(vetor, (array, bytearray, list)) and limite + acrescimo <= len(vetor)
+
+
+def novo_vetor(tipo, tamanho):
+    if tipo == "char":
+        return VetorChar(tamanho)
+    codigo = CODIGOS_TIPO.get(tipo)
+    if codigo is None:
+        return [None] * tamanho
+    return array(codigo, bytes(tamanho * array(codigo).itemsize))
+
+
+def vetor_de(tipo, valores):
+    # `valores` já convertidos para o tipo do elemento.
+    if tipo == "char":
+        return VetorChar(codificar("".join(valores)))
+    codigo = CODIGOS_TIPO.get(tipo)
+    if codigo is None:
+        return list(valores)
+    vetor = array(codigo, bytes(len(valores) * array(codigo).itemsize))
+    preencher(vetor, valores)
+    return vetor
+
+
+def preencher(vetor, valores):
+    # Substitui todo o conteúdo do array (com o mesmo tamanho), numa única
+    # atribuição de fatia.
+    if isinstance(vetor, VetorChar):
+        texto = "".join(valores)
+        vetor[:] = codificar(texto)
+        vetor._texto = texto.partition("\0")[0]
+    elif isinstance(vetor, array):
+        try:
+            vetor[:] = array(vetor.typecode, valores)
+        except OverflowError:
+            vetor[:] = array(vetor.typecode, [ajustar(vetor, valor) if isinstance(valor, int) else valor
+                                              for valor in valores])
+    else:
+        vetor[:] = valores